@@ -17,6 +17,7 @@ from bout_runners.utils.paths import (
     get_default_submitters_config_path,
     get_log_file_directory,
     get_logger_config_path,
+    get_use_wal,
 )
 
 
@@ -208,6 +209,46 @@ def set_submitter_config_path(submitter_config_path: Optional[Path] = None) -> N
     print("")
 
 
+def set_use_wal(use_wal: Optional[bool] = None) -> None:
+    """
+    Set whether the databases are opened with the write-ahead log.
+
+    Parameters
+    ----------
+    use_wal : None or bool
+        Whether to use the write-ahead log
+        If None, the caller will be prompted
+    """
+    config = get_bout_runners_configuration()
+    if not config.has_section("database"):
+        config.add_section("database")
+    if use_wal is None:
+        current_use_wal = get_use_wal()
+        question = (
+            f"Use the write-ahead log for the databases (y/n)?\n"
+            f"The write-ahead log converts the database files, and is ignored on "
+            f"network filesystems\n"
+            f"Empty input will reuse the current setting "
+            f"{'y' if current_use_wal else 'n'}\n"
+        )
+        answer = input(question)
+        print(f"Your answered: '{answer}'")
+        if answer == "":
+            use_wal = current_use_wal
+        else:
+            use_wal = answer.lower().startswith("y")
+    config["database"]["use_wal"] = str(use_wal)
+
+    with get_bout_runners_config_path().open("w") as configfile:
+        config.write(configfile)
+
+    print(f"Setting use_wal to {config['database']['use_wal']}")
+
+    set_up_logger()
+    logging.debug("use_wal set to %s", config["database"]["use_wal"])
+    print("")
+
+
 def check_submitter_config(submitter_config_path: Path, default_path: Path) -> None:
     """
     Check that the submitter configuration file is properly formatted.
@@ -258,3 +299,4 @@ if __name__ == "__main__":
     set_log_file_directory()
     set_bout_directory()
     set_submitter_config_path()
+    set_use_wal()
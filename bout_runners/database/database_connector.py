@@ -3,39 +3,115 @@
 
 import logging
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 
 class DatabaseConnector:
     """
     Class creating the database path and executing sql statements.
 
+    All the DatabaseConnectors of the same database share one connection per thread
+    from a process-wide registry.
+    As sqlite connections can only be used by the thread which created them, a
+    DatabaseConnector used from another thread than the one which created it
+    gets the connection of that thread.
+    The connections are closed when the last DatabaseConnector using them is
+    deleted.
+    The write-ahead log (journal_mode=WAL and synchronous=NORMAL) is only used if
+    asked for, as it persistently converts the database file, and it is never used
+    on network filesystems where sqlite does not support it.
+
     Attributes
     ----------
+    __connections : dict
+        The shared connections on the form
+
+        >>> {(db_path, thread): connection}
+
+    __references : dict
+        The number of DatabaseConnectors using a connection on the form
+
+        >>> {connection: number_of_references}
+
+    __transaction_depths : dict
+        The number of nested transactions of a connection on the form
+
+        >>> {connection: depth}
+
+    __lock : threading.Lock
+        Lock protecting the registry
+    network_filesystems : tuple of str
+        The types of the filesystems where the write-ahead log is not used
     __db_path : None or Path
         Getter variable for db_path
-    __connection : sqlite3.Connection
-        Getter variable for connection
+    __use_wal : bool
+        Getter variable for use_wal
+    __thread_connections : dict
+        The connections used by this object on the form
+
+        >>> {thread: connection}
+
     db_path : Path
         Path to database
+    use_wal : bool
+        Whether the connections are opened with the write-ahead log
     connection : sqlite3.Connection
-        The connection to the database
+        The connection to the database of the current thread
+    in_transaction : bool
+        Whether a transaction is open on the connection of the current thread
 
     Methods
     -------
+    __get_connection(key, use_wal)
+        Return the shared connection to the database, open it if needed
+    is_on_network_filesystem(path)
+        Return whether the path is on a network filesystem
     create_db_path(name, db_root_path)
         Create the database path
     execute_statement(sql_statement, *parameters)
         Execute a statement in the database
+    execute_many(sql_statement, parameters_sequence)
+        Execute a statement in the database once per set of parameters
+    transaction()
+        Context manager which commits the statements executed within it once
 
     Examples
     --------
     >>> database = DatabaseConnector('test')
     >>> database.execute_statement('CREATE TABLE my_table (col INT)')
+
+    Use the write-ahead log for a database on a local filesystem
+
+    >>> database = DatabaseConnector('test', use_wal=True)
+
+    Commit several statements at once
+
+    >>> with database.transaction():
+    ...     database.execute_statement('INSERT INTO my_table (col) VALUES (?)', 1)
+    ...     database.execute_statement('INSERT INTO my_table (col) VALUES (?)', 2)
     """
 
-    def __init__(self, name: str, db_root_path: Path) -> None:
+    __connections: Dict[Tuple[Path, threading.Thread], sqlite3.Connection] = dict()
+    __references: Dict[sqlite3.Connection, int] = dict()
+    __transaction_depths: Dict[sqlite3.Connection, int] = dict()
+    __lock = threading.Lock()
+    network_filesystems = (
+        "nfs",
+        "nfs4",
+        "lustre",
+        "gpfs",
+        "cifs",
+        "smbfs",
+        "smb3",
+        "ceph",
+        "9p",
+        "fuse.sshfs",
+    )
+
+    def __init__(self, name: str, db_root_path: Path, use_wal: bool = False) -> None:
         """
         Set the path to the data base.
 
@@ -45,19 +121,124 @@ class DatabaseConnector:
             Name of the database (excluding .db)
         db_root_path : Path or str or None
             Path to database
+        use_wal : bool
+            Whether to open the connections with the write-ahead log
+            This converts the database file, and only applies to the connections
+            opened by this object, not to shared connections which are already open
         """
         # Set the database path
         logging.info("Start: Making a DatabaseConnector object")
         self.__db_path = self.create_db_path(name, db_root_path)
         logging.debug("db_path set to %s", self.db_path)
 
-        # Open the connection
-        self.__connection = sqlite3.connect(str(self.db_path))
+        # Get the connection of the current thread
+        self.__use_wal = use_wal
+        self.__thread_connections: Dict[threading.Thread, sqlite3.Connection] = dict()
+        _ = self.connection
         logging.info("Done: Making a DatabaseConnector object")
 
     def __del__(self) -> None:
-        """Close the connection."""
-        self.__connection.close()
+        """Close the connections which no other DatabaseConnector is using."""
+        with DatabaseConnector.__lock:
+            for thread, connection in self.__thread_connections.items():
+                DatabaseConnector.__references[connection] -= 1
+                if DatabaseConnector.__references[connection] != 0:
+                    continue
+                DatabaseConnector.__references.pop(connection)
+                DatabaseConnector.__transaction_depths.pop(connection, None)
+                key = (self.__db_path.absolute(), thread)
+                if DatabaseConnector.__connections.get(key) is connection:
+                    DatabaseConnector.__connections.pop(key)
+                # NOTE: The object may be collected by another thread than the
+                #       one owning the connection, which is not allowed to close
+                #       it
+                #       sqlite closes the connection when it is garbage collected
+                if threading.current_thread() is thread:
+                    connection.close()
+
+    @staticmethod
+    def __get_connection(
+        key: Tuple[Path, threading.Thread], use_wal: bool
+    ) -> sqlite3.Connection:
+        """
+        Return the shared connection to the database, open it if needed.
+
+        Parameters
+        ----------
+        key : tuple
+            The path to the database and the current thread
+            The thread object is used rather than its id, as the id of a thread
+            which has finished can be reused by a new thread
+        use_wal : bool
+            Whether to open the connection with the write-ahead log
+
+        Returns
+        -------
+        connection : sqlite3.Connection
+            The connection to the database
+        """
+        with DatabaseConnector.__lock:
+            if key not in DatabaseConnector.__connections:
+                connection = sqlite3.connect(str(key[0]))
+                if use_wal:
+                    if DatabaseConnector.is_on_network_filesystem(key[0]):
+                        logging.warning(
+                            "%s is on a network filesystem, which does not support "
+                            "the write-ahead log. Using the rollback journal",
+                            key[0],
+                        )
+                    else:
+                        # NOTE: The write-ahead log lets readers proceed while
+                        #       writing, and with synchronous=NORMAL it is only
+                        #       synced at checkpoints
+                        # https://www.sqlite.org/wal.html
+                        connection.execute("PRAGMA journal_mode=WAL")
+                        connection.execute("PRAGMA synchronous=NORMAL")
+                DatabaseConnector.__connections[key] = connection
+                DatabaseConnector.__references[connection] = 0
+                logging.debug("Opened a shared connection to %s", key[0])
+            connection = DatabaseConnector.__connections[key]
+            DatabaseConnector.__references[connection] += 1
+            return connection
+
+    @staticmethod
+    def is_on_network_filesystem(path: Path) -> bool:
+        """
+        Return whether the path is on a network filesystem.
+
+        The filesystem is found from the longest mount point in /proc/mounts
+        containing the path
+
+        Parameters
+        ----------
+        path : Path
+            The path to check
+
+        Returns
+        -------
+        bool
+            True if the path is on one of the network_filesystems
+            False if the filesystem cannot be found
+        """
+        path = Path(path).absolute()
+        try:
+            with Path("/proc/mounts").open("r", encoding="utf-8") as mounts:
+                lines = mounts.readlines()
+        except OSError:
+            return False
+        mount_point_length = -1
+        filesystem_type = ""
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 3:
+                continue
+            # NOTE: Spaces in the mount points are escaped as \040
+            mount_point = Path(fields[1].replace("\\040", " "))
+            contains_path = mount_point == path or mount_point in path.parents
+            if contains_path and len(mount_point.parts) > mount_point_length:
+                mount_point_length = len(mount_point.parts)
+                filesystem_type = fields[2]
+        return filesystem_type in DatabaseConnector.network_filesystems
 
     @property
     def db_path(self) -> Path:
@@ -76,22 +257,55 @@ class DatabaseConnector:
         """
         return self.__db_path
 
+    @property
+    def use_wal(self) -> bool:
+        """
+        Get the properties of self.use_wal.
+
+        Returns
+        -------
+        self.__use_wal : bool
+            Whether the connections are opened with the write-ahead log
+        """
+        return self.__use_wal
+
     @property
     def connection(self) -> sqlite3.Connection:
         """
         Get the properties of self.connection.
 
+        The connection of the current thread is opened if needed
+
         Returns
         -------
-        self.__connection : sqlite3.Connection
-            The connection to the database
+        connection : sqlite3.Connection
+            The connection to the database of the current thread
 
         Notes
         -----
         To avoid corrupting data between databases, the setting this parameter
         outside the constructor is disabled
         """
-        return self.__connection
+        thread = threading.current_thread()
+        connection = self.__thread_connections.get(thread, None)
+        if connection is None:
+            connection = self.__get_connection(
+                (self.__db_path.absolute(), thread), self.__use_wal
+            )
+            self.__thread_connections[thread] = connection
+        return connection
+
+    @property
+    def in_transaction(self) -> bool:
+        """
+        Return whether a transaction is open on the connection.
+
+        Returns
+        -------
+        bool
+            True if the statements are committed at the end of a transaction
+        """
+        return DatabaseConnector.__transaction_depths.get(self.connection, 0) > 0
 
     @staticmethod
     def create_db_path(name: Optional[str], db_root_path: Path) -> Path:
@@ -132,7 +346,70 @@ class DatabaseConnector:
             The statement execute
         parameters : tuple
             Parameters used in .execute of the cursor (like )
+
+        Notes
+        -----
+        The statement is committed immediately unless it is executed within a
+        transaction
         """
-        cursor = self.__connection.cursor()
+        cursor = self.connection.cursor()
         cursor.execute(sql_statement, parameters)
-        self.__connection.commit()
+        if not self.in_transaction:
+            self.connection.commit()
+
+    def execute_many(
+        self, sql_statement: str, parameters_sequence: Iterable[Sequence[Any]]
+    ) -> None:
+        """
+        Execute a statement in the database once per set of parameters.
+
+        Parameters
+        ----------
+        sql_statement : str
+            The statement execute
+        parameters_sequence : iterable of tuple
+            Parameters used in .executemany of the cursor
+
+        Notes
+        -----
+        The statements are committed at once unless they are executed within a
+        transaction
+        """
+        cursor = self.connection.cursor()
+        cursor.executemany(sql_statement, parameters_sequence)
+        if not self.in_transaction:
+            self.connection.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator["DatabaseConnector"]:
+        """
+        Commit the statements executed within the context once.
+
+        The transaction is rolled back if an exception is raised within the
+        context.
+        Nested transactions are committed by the outermost transaction.
+
+        Yields
+        ------
+        self : DatabaseConnector
+            The database connector
+
+        Raises
+        ------
+        BaseException
+            Any exception raised within the context, re-raised after the rollback
+        """
+        depths = DatabaseConnector.__transaction_depths
+        connection = self.connection
+        depths[connection] = depths.get(connection, 0) + 1
+        try:
+            yield self
+        except BaseException:
+            depths[connection] -= 1
+            if depths[connection] == 0:
+                connection.rollback()
+                logging.debug("Rolled back the transaction in %s", self.db_path)
+            raise
+        depths[connection] -= 1
+        if depths[connection] == 0:
+            connection.commit()
@@ -3,10 +3,13 @@
 
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from bout_runners.database.database_connector import DatabaseConnector
-from bout_runners.database.database_utils import get_system_info_as_sql_type
+from bout_runners.database.database_utils import (
+    get_fingerprint,
+    get_system_info_as_sql_type,
+)
 
 
 class DatabaseCreator:
@@ -17,13 +20,22 @@ class DatabaseCreator:
     ----------
     db_connector : DatabaseConnector
         The database object to write to
+    run_identity_columns : tuple of str
+        The columns of the run table which identifies the configuration of a run
+    active_statuses : tuple of str
+        The statuses of the runs which have not stopped
+    derived_tables : tuple of str
+        The tables derived from the logs of the runs, which are not part of the
+        metadata of the runs
+    schema_version : int
+        The version of the schema, stored as the user_version of the database
 
     Methods
     -------
     create_all_schema_tables(parameters_as_sql_types)
         Create the all the tables for a schema
     get_create_table_statement(table_name, columns=None,
-    primary_key='id', foreign_keys=None)
+    primary_key='id', foreign_keys=None, nullable_columns=())
         Return a SQL string which can be used to create the table
     _create_single_table(table_str)
         Create a table in the database
@@ -37,6 +49,24 @@ class DatabaseCreator:
         Create a table for each BOUT.settings section and a join table
     _create_run_table()
         Create a table for the metadata_recorder of a run
+    _create_run_indexes()
+        Create the indexes of the run table and the active_runs view
+    _add_fingerprint_columns(tables)
+        Add the fingerprint column and its index to tables
+    create_progress_table()
+        Create the table of the progress samples of the runs if it does not exist
+    create_rank_imbalance_table(timing_columns)
+        Create the table of the load imbalance of the runs if it does not exist
+    get_fingerprint_columns()
+        Return the tables which has a fingerprint column and their content columns
+    get_schema_version()
+        Return the version of the schema of the database
+    needs_upgrade()
+        Return whether the schema was created by an earlier version of bout_runners
+    upgrade_schema()
+        Upgrade a schema created by an earlier version of bout_runners
+    backfill_fingerprints()
+        Fill in the missing fingerprints of the entries in the database
 
     Examples
     --------
@@ -72,6 +102,17 @@ class DatabaseCreator:
     >>> db_creator.create_all_schema_tables(final_parameters_as_sql_types)
     """
 
+    run_identity_columns = (
+        "name",
+        "parameters_id",
+        "file_modification_id",
+        "split_id",
+        "system_info_id",
+    )
+    active_statuses = ("submitted", "created", "running")
+    derived_tables = ("progress", "rank_imbalance")
+    schema_version = 1
+
     def __init__(self, db_connector: DatabaseConnector) -> None:
         """
         Set the database to use.
@@ -106,11 +147,17 @@ class DatabaseCreator:
         """
         # Check if tables are created
         tables = list()
-        tables.append(self._create_system_info_table())
-        tables.append(self._create_split_table())
-        tables.append(self._create_file_modification_table())
-        tables.extend(self._create_parameter_tables(parameters_as_sql_types))
-        tables.append(self._create_run_table())
+        with self.db_connector.transaction():
+            tables.append(self._create_system_info_table())
+            tables.append(self._create_split_table())
+            tables.append(self._create_file_modification_table())
+            tables.extend(self._create_parameter_tables(parameters_as_sql_types))
+            tables.append(self._create_run_table())
+            self._add_fingerprint_columns(tables)
+            self._create_run_indexes()
+            self.db_connector.execute_statement(
+                f"PRAGMA user_version = {self.schema_version}"
+            )
 
         logging.info(
             "Created the following tables in %s: %s", self.db_connector.db_path, tables
@@ -122,6 +169,7 @@ class DatabaseCreator:
         columns: Optional[Dict[str, str]] = None,
         primary_key: str = "id",
         foreign_keys: Optional[Dict[str, Tuple[str, str]]] = None,
+        nullable_columns: Iterable[str] = tuple(),
     ) -> str:
         """
         Return a SQL string which can be used to create the table.
@@ -139,6 +187,9 @@ class DatabaseCreator:
             Dictionary where the key is the column in this table to be used as a
             foreign key and the value is the tuple consisting of (name_of_the_table,
             key_in_table) to refer to
+        nullable_columns : iterable of str
+            Columns which can be NULL in addition to the columns which are not
+            known at submission time
 
         Returns
         -------
@@ -150,7 +201,13 @@ class DatabaseCreator:
         create_statement += f"   {primary_key} INTEGER PRIMARY KEY,\n"
 
         # These are not known during submission time
-        nullable_fields = ("start_time", "stop_time")
+        nullable_fields = (
+            "start_time",
+            "stop_time",
+            "queue_wait_time",
+            "array_task_id",
+            *nullable_columns,
+        )
         if columns is not None:
             for name, sql_type in columns.items():
                 create_statement += f"    {name} {sql_type}"
@@ -339,6 +396,8 @@ class DatabaseCreator:
                 "start_time": "TIMESTAMP",
                 "stop_time": "TIMESTAMP",
                 "latest_status": "TEXT",
+                "queue_wait_time": "REAL",
+                "array_task_id": "TEXT",
             },
             foreign_keys={
                 "file_modification_id": ("file_modification", "id"),
@@ -348,3 +407,330 @@ class DatabaseCreator:
             },
         )
         return self._create_single_table(run_statement)
+
+    def _create_run_indexes(self) -> None:
+        """
+        Create the indexes of the run table and the active_runs view.
+
+        The run table is indexed on the status, the name and the foreign keys.
+        The partial index on the active runs and the active_runs view lets the
+        status of the active runs be polled at a cost which scales with the number
+        of active runs rather than with the number of recorded runs.
+        Existing indexes and views are left untouched
+        """
+        for column in (
+            "latest_status",
+            "name",
+            "parameters_id",
+            "file_modification_id",
+            "split_id",
+            "system_info_id",
+        ):
+            self.db_connector.execute_statement(
+                f"CREATE INDEX IF NOT EXISTS run_{column} ON run({column})"
+            )
+        active_statuses = ", ".join(f"'{status}'" for status in self.active_statuses)
+        self.db_connector.execute_statement(
+            "CREATE INDEX IF NOT EXISTS run_active ON run(latest_status, name)\n"
+            f"WHERE latest_status IN ({active_statuses})"
+        )
+        self.db_connector.execute_statement(
+            "CREATE VIEW IF NOT EXISTS active_runs AS\n"
+            "SELECT id AS run_id, name, latest_status FROM run\n"
+            f"WHERE latest_status IN ({active_statuses})"
+        )
+
+    def _add_fingerprint_columns(self, tables: Iterable[str]) -> None:
+        """
+        Add the fingerprint column and its index to tables.
+
+        The fingerprint is a hash of the content of an entry (see get_fingerprint),
+        which makes it possible to look up an entry from an index rather than
+        comparing every column of every row.
+        The index is unique except for the run table, as a run can be forced to be
+        executed several times with the same configuration
+
+        Parameters
+        ----------
+        tables : iterable of str
+            Name of the tables
+        """
+        for table_name in tables:
+            self.db_connector.execute_statement(
+                f"ALTER TABLE {table_name} ADD COLUMN fingerprint TEXT"
+            )
+            unique = "" if table_name == "run" else "UNIQUE "
+            self.db_connector.execute_statement(
+                f"CREATE {unique}INDEX IF NOT EXISTS {table_name}_fingerprint "
+                f"ON {table_name}(fingerprint)"
+            )
+
+    def create_progress_table(self) -> None:
+        """
+        Create the table of the progress samples of the runs if it does not exist.
+
+        Every sample contains the progress of a running run read from its log, the
+        throughput since the previous sample, and the expected end time if the
+        final simulation time is known
+        """
+        cursor = self.db_connector.connection.cursor()
+        if (
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='progress'"
+            ).fetchone()
+            is not None
+        ):
+            return
+        progress_statement = self.get_create_table_statement(
+            table_name="progress",
+            columns={
+                "sample_time": "TIMESTAMP",
+                "sim_time": "REAL",
+                "number_of_steps": "INTEGER",
+                "rhs_evals": "INTEGER",
+                "wall_time": "REAL",
+                "sim_time_per_second": "REAL",
+                "rhs_evals_per_second": "REAL",
+                "expected_end_time": "TIMESTAMP",
+            },
+            foreign_keys={"run_id": ("run", "id")},
+            # NOTE: The throughput is not known at the first sample, and the end
+            #       time is only known if nout and timestep are recorded
+            nullable_columns=(
+                "sim_time_per_second",
+                "rhs_evals_per_second",
+                "expected_end_time",
+            ),
+        )
+        with self.db_connector.transaction():
+            self._create_single_table(progress_statement)
+            self.db_connector.execute_statement(
+                "CREATE INDEX IF NOT EXISTS progress_run_id "
+                "ON progress(run_id, sample_time)"
+            )
+        logging.info("Created the progress table in %s", self.db_connector.db_path)
+
+    def create_rank_imbalance_table(self, timing_columns: Iterable[str]) -> None:
+        """
+        Create the table of the load imbalance of the runs if it does not exist.
+
+        Every row summarizes the imbalance between the MPI ranks of a run (see
+        RankLogAggregator)
+
+        Parameters
+        ----------
+        timing_columns : iterable of str
+            The names of the timing columns as stored in the table
+        """
+        cursor = self.db_connector.connection.cursor()
+        if (
+            cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name='rank_imbalance'"
+            ).fetchone()
+            is not None
+        ):
+            return
+        statistics_columns: Dict[str, str] = dict()
+        for column in timing_columns:
+            statistics_columns[f"{column}_imbalance"] = "REAL"
+            statistics_columns[f"{column}_max_imbalance"] = "REAL"
+            statistics_columns[f"{column}_slowest_rank"] = "INTEGER"
+        rank_imbalance_statement = self.get_create_table_statement(
+            table_name="rank_imbalance",
+            columns={
+                "recorded_time": "TIMESTAMP",
+                "number_of_ranks": "INTEGER",
+                "number_of_steps": "INTEGER",
+                **statistics_columns,
+            },
+            foreign_keys={"run_id": ("run", "id")},
+            nullable_columns=statistics_columns.keys(),
+        )
+        with self.db_connector.transaction():
+            self._create_single_table(rank_imbalance_statement)
+            self.db_connector.execute_statement(
+                "CREATE INDEX IF NOT EXISTS rank_imbalance_run_id "
+                "ON rank_imbalance(run_id)"
+            )
+        logging.info(
+            "Created the rank_imbalance table in %s", self.db_connector.db_path
+        )
+
+    def get_fingerprint_columns(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Return the tables which has a fingerprint column and their content columns.
+
+        Returns
+        -------
+        fingerprint_columns : dict
+            Dictionary on the form
+
+            >>> {'table_name': ('column_name', ...)}
+
+            where the columns are the columns the fingerprint is computed from
+        """
+        cursor = self.db_connector.connection.cursor()
+        tables = tuple(
+            row[0]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+        )
+        fingerprint_columns: Dict[str, Tuple[str, ...]] = dict()
+        for table_name in tables:
+            columns = tuple(
+                row[1]
+                for row in cursor.execute(f"PRAGMA table_info({table_name})").fetchall()
+            )
+            if "fingerprint" not in columns:
+                continue
+            if table_name == "run":
+                fingerprint_columns[table_name] = self.run_identity_columns
+            else:
+                fingerprint_columns[table_name] = tuple(
+                    column for column in columns if column not in ("id", "fingerprint")
+                )
+        return fingerprint_columns
+
+    def get_schema_version(self) -> int:
+        """
+        Return the version of the schema of the database.
+
+        Returns
+        -------
+        int
+            The user_version of the database, which is 0 for schemas created by
+            versions of bout_runners which did not record it
+        """
+        cursor = self.db_connector.connection.cursor()
+        return int(cursor.execute("PRAGMA user_version").fetchone()[0])
+
+    def needs_upgrade(self) -> bool:
+        """
+        Return whether the schema was created by an earlier version of bout_runners.
+
+        Only the version stored in the database header is read, so this is cheap
+        enough to be called whenever the database is used
+
+        Returns
+        -------
+        bool
+            True if upgrade_schema should be called
+        """
+        return self.get_schema_version() < self.schema_version
+
+    def upgrade_schema(self) -> None:
+        """
+        Upgrade a schema created by an earlier version of bout_runners.
+
+        Nullable columns which have been added to the run table since the schema
+        was created are added to the table.
+        If the tables lacks the fingerprint column, the column is added and the
+        fingerprints of the existing entries are filled in.
+        Missing indexes of the run table and the active_runs view are created.
+        The schema_version is recorded in the database, so that needs_upgrade
+        returns False afterwards.
+        Calling this function on an up to date schema has no effect
+        """
+        run_columns = {"queue_wait_time": "REAL", "array_task_id": "TEXT"}
+        cursor = self.db_connector.connection.cursor()
+        existing_columns = tuple(
+            row[1] for row in cursor.execute("PRAGMA table_info(run)").fetchall()
+        )
+        for column, sql_type in run_columns.items():
+            if column not in existing_columns:
+                logging.info(
+                    "Adding the column %s to the run table in %s",
+                    column,
+                    self.db_connector.db_path,
+                )
+                self.db_connector.execute_statement(
+                    f"ALTER TABLE run ADD COLUMN {column} {sql_type}"
+                )
+
+        tables = tuple(
+            row[0]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+        )
+        fingerprinted = self.get_fingerprint_columns().keys()
+        missing = tuple(
+            table
+            for table in tables
+            if table not in fingerprinted and table not in self.derived_tables
+        )
+        if len(missing) != 0:
+            logging.info(
+                "Adding fingerprints to the tables %s in %s",
+                missing,
+                self.db_connector.db_path,
+            )
+            with self.db_connector.transaction():
+                self._add_fingerprint_columns(missing)
+            self.backfill_fingerprints()
+
+        with self.db_connector.transaction():
+            self._create_run_indexes()
+            self.db_connector.execute_statement(
+                f"PRAGMA user_version = {self.schema_version}"
+            )
+        logging.info(
+            "Upgraded the schema of %s to version %d",
+            self.db_connector.db_path,
+            self.schema_version,
+        )
+
+    def backfill_fingerprints(self) -> int:
+        """
+        Fill in the missing fingerprints of the entries in the database.
+
+        If several entries have the same content, only the first entry is given a
+        fingerprint (except in the run table)
+
+        Returns
+        -------
+        number_of_filled : int
+            The number of entries which were given a fingerprint
+        """
+        number_of_filled = 0
+        cursor = self.db_connector.connection.cursor()
+        with self.db_connector.transaction():
+            for table_name, columns in self.get_fingerprint_columns().items():
+                # NOTE: Protected against SQL injection as the table and column
+                #       names are obtained from the database
+                rows = cursor.execute(
+                    f"SELECT id, {', '.join(columns)} FROM {table_name} "  # nosec
+                    "WHERE fingerprint IS NULL ORDER BY id"
+                ).fetchall()
+                if len(rows) == 0:
+                    continue
+                # NOTE: OR IGNORE leaves duplicates of unique fingerprints empty
+                self.db_connector.execute_many(
+                    f"UPDATE OR IGNORE {table_name} SET fingerprint = ? "  # nosec
+                    "WHERE id = ?",
+                    (
+                        (get_fingerprint(dict(zip(columns, row[1:]))), row[0])
+                        for row in rows
+                    ),
+                )
+                # NOTE: Protected against SQL injection as above
+                number_of_empty = cursor.execute(
+                    f"SELECT COUNT(*) FROM {table_name} "  # nosec
+                    "WHERE fingerprint IS NULL"
+                ).fetchone()[0]
+                number_of_filled += len(rows) - number_of_empty
+                logging.debug(
+                    "Filled in %d fingerprint(s) in %s",
+                    len(rows) - number_of_empty,
+                    table_name,
+                )
+        logging.info(
+            "Filled in %d fingerprint(s) in %s",
+            number_of_filled,
+            self.db_connector.db_path,
+        )
+        return number_of_filled
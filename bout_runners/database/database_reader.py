@@ -1,7 +1,8 @@
 """Module containing the DatabaseReader class."""
 
 
-from typing import Iterable, Mapping, Optional, Union
+import logging
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 from numpy import int64
@@ -17,6 +18,8 @@ class DatabaseReader:
     ----------
     db_connector : DatabaseConnector
         The database object to read from
+    max_variables : int
+        The maximum number of parameters used in one query
 
     Methods
     -------
@@ -26,6 +29,10 @@ class DatabaseReader:
         Return the latest row id
     get_entry_id(table_name, entries_dict)
         Get the id of a table entry
+    get_entry_ids(table_name, rows)
+        Get the ids of several table entries with one query per chunk of rows
+    get_entry_id_from_fingerprint(table_name, fingerprint)
+        Get the id of the latest table entry with the given fingerprint
     check_tables_created()
         Check if the tables is created in the database
 
@@ -85,10 +92,17 @@ class DatabaseReader:
     >>> db_reader.get_entry_id('split', dummy_split_dict)
     1
 
+    >>> db_reader.get_entry_ids('split', (dummy_split_dict,))
+    (1,)
+
     >>> db_reader.check_tables_created()
     True
     """
 
+    # NOTE: Older versions of sqlite limits the number of parameters to 999
+    # https://www.sqlite.org/limits.html#max_variable_number
+    max_variables = 999
+
     def __init__(self, db_connector: DatabaseConnector) -> None:
         """
         Set the database to use.
@@ -173,7 +187,9 @@ class DatabaseReader:
         where_values = list()
         for field, val in entries_dict.items():
             val = f"{val}" if isinstance(val, str) else val
-            where_statements_list.append(f'{" "*7}AND {field}=?')
+            # NOTE: NULL is only matched by IS
+            operator = "=" if val is not None else " IS "
+            where_statements_list.append(f'{" "*7}AND {field}{operator}?')
             where_values.append(val)
         where_statements_list[0] = where_statements_list[0].replace("AND", "WHERE")
         where_statements_str = "\n".join(where_statements_list)
@@ -181,14 +197,108 @@ class DatabaseReader:
         # NOTE: Protection against SQL injection through the use of ? in for-loop above
         query_str = f"SELECT id\nFROM {table_name}\n{where_statements_str}"  # nosec
 
-        table = self.query(query_str, params=where_values)
-        # NOTE: We explicitly cast to int, as sqlite3 will cast
-        #       np.int64 to bytes
-        # pylint: disable=no-member
-        row_id = None if table.empty else int(table.loc[0, "id"])
+        # NOTE: A plain cursor is used as only one integer is fetched
+        row = self.db_connector.connection.execute(query_str, where_values).fetchone()
+        row_id = None if row is None else int(row[0])
 
         return row_id
 
+    def get_entry_ids(
+        self,
+        table_name: str,
+        rows: Sequence[Mapping[str, Union[int, str, float, None]]],
+    ) -> Tuple[Optional[int], ...]:
+        """
+        Get the ids of several table entries with one query per chunk of rows.
+
+        The rows are joined with the table from a VALUES list, so the result is
+        the same as calling get_entry_id for each row.
+        Missing values (None) are matched by NULL.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table to check
+        rows : sequence of dict
+            Dictionaries containing the entries as key value pairs
+            All the dictionaries must have the same keys
+
+        Returns
+        -------
+        row_ids : tuple of int or None
+            The ids of the hits in the order of the rows
+            None is given for the rows which are not found
+
+        Raises
+        ------
+        ValueError
+            If the rows do not have the same keys
+        """
+        if len(rows) == 0:
+            return tuple()
+        keys = tuple(rows[0].keys())
+        if any(tuple(row.keys()) != keys for row in rows):
+            msg = f"All the rows looked up in {table_name} must have the keys {keys}"
+            logging.critical(msg)
+            raise ValueError(msg)
+
+        row_ids: List[Optional[int]] = [None] * len(rows)
+        columns = ", ".join(("row_number",) + keys)
+        conditions = "\n       AND ".join(
+            f"{table_name}.{key} IS lookup.{key}" for key in keys
+        )
+        chunk_size = max(self.max_variables // (len(keys) + 1), 1)
+        placeholders = f"({', '.join('?' * (len(keys) + 1))})"
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            values: List[Union[int, str, float, None]] = list()
+            for row_number, row in enumerate(chunk, start=start):
+                values.append(row_number)
+                values.extend(row.values())
+            # NOTE: Protection against SQL injection through the use of ? for the
+            #       values, the table and column names are not supplied by the user
+            query_str = (
+                f"WITH lookup({columns}) AS "  # nosec
+                f"(VALUES {', '.join([placeholders] * len(chunk))})\n"
+                f"SELECT lookup.row_number, MIN({table_name}.id)\n"
+                f"FROM lookup\n"
+                f"INNER JOIN {table_name}\n"
+                f"    ON {conditions}\n"
+                f"GROUP BY lookup.row_number"
+            )
+            for row_number, row_id in self.db_connector.connection.execute(
+                query_str, values
+            ):
+                row_ids[row_number] = int(row_id)
+
+        return tuple(row_ids)
+
+    def get_entry_id_from_fingerprint(
+        self, table_name: str, fingerprint: str
+    ) -> Optional[int]:
+        """
+        Get the id of the latest table entry with the given fingerprint.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table to check
+        fingerprint : str
+            The fingerprint of the entry (see get_fingerprint)
+
+        Returns
+        -------
+        row_id : int or None
+            The id of the hit
+            If none is found, None is returned
+        """
+        # NOTE: Protection against SQL injection through the use of ?
+        query_str = f"SELECT MAX(id) FROM {table_name} WHERE fingerprint=?"  # nosec
+        row_id = self.db_connector.connection.execute(
+            query_str, (fingerprint,)
+        ).fetchone()[0]
+        return None if row_id is None else int(row_id)
+
     def check_tables_created(self) -> bool:
         """
         Check if the tables is created in the database.
@@ -1,6 +1,8 @@
 """Module containing database utils."""
 
 
+import hashlib
+import json
 import logging
 import platform
 from pathlib import Path
@@ -8,7 +10,7 @@ from pathlib import Path
 # NOTE: subprocess can be vulnerable if shell=True
 #       However, CalledProcessError has no known security vulnerabilities
 from subprocess import CalledProcessError  # nosec
-from typing import Dict
+from typing import Dict, Mapping, Optional, Union
 
 from bout_runners.submitter.local_submitter import LocalSubmitter
 from bout_runners.utils.file_operations import get_modified_time
@@ -129,3 +131,57 @@ def get_system_info() -> Dict[str, str]:
         if not name.startswith("_") and not callable(getattr(sys_info, name))
     }
     return attributes
+
+
+def get_fingerprint(entries_dict: Mapping[str, Union[int, str, float, None]]) -> str:
+    """
+    Return a hash of the content of a table entry.
+
+    The values are canonicalized so that an entry gets the same fingerprint
+    whether it is computed from the python values or from the values read from
+    the database, see the notes.
+
+    Parameters
+    ----------
+    entries_dict : dict
+        Dictionary containing the entries as key value pairs
+
+    Returns
+    -------
+    str
+        The hexadecimal sha256 hash of the entries
+
+    Notes
+    -----
+    Booleans are stored as integers and integral floats can be read back as
+    integers by sqlite, so these are hashed as integers.
+    All other values are hashed as strings, and the order of the keys is
+    irrelevant.
+    """
+
+    def canonicalize(value: Union[int, str, float, None]) -> Optional[str]:
+        """
+        Return the canonical string of a value.
+
+        Parameters
+        ----------
+        value : int or str or float or None
+            The value to canonicalize
+
+        Returns
+        -------
+        None or str
+            The canonical string
+        """
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+
+    canonical = json.dumps(
+        sorted((key, canonicalize(value)) for key, value in entries_dict.items())
+    )
+    return hashlib.sha256(canonical.encode("utf8")).hexdigest()
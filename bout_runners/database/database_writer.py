@@ -25,6 +25,8 @@ class DatabaseWriter:
         Insert to the database
     create_entry(table_name, entries_dict)
         Create a database entry
+    create_entries(table_name, rows)
+        Create several database entries at once and return their ids
 
     Examples
     --------
@@ -238,3 +240,54 @@ class DatabaseWriter:
         values = tuple(entries_dict.values())
         insert_str = self.create_insert_string(tuple(keys), table_name)
         self.insert(insert_str, values)
+
+    def create_entries(
+        self,
+        table_name: str,
+        rows: Sequence[Mapping[str, Union[int, str, float, None]]],
+    ) -> Tuple[int, ...]:
+        """
+        Create several database entries at once and return their ids.
+
+        The rows are inserted with one executemany in a single transaction.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table
+        rows : sequence of dict
+            Dictionaries containing the entries as key value pairs
+            All the dictionaries must have the same keys
+
+        Returns
+        -------
+        entry_ids : tuple of int
+            The ids of the newly created entries in the order of the rows
+
+        Raises
+        ------
+        ValueError
+            If the rows do not have the same keys
+        """
+        if len(rows) == 0:
+            return tuple()
+        keys = tuple(rows[0].keys())
+        if any(tuple(row.keys()) != keys for row in rows):
+            msg = f"All the rows inserted to {table_name} must have the keys {keys}"
+            logging.critical(msg)
+            raise ValueError(msg)
+        insert_str = self.create_insert_string(keys, table_name)
+        with self.db_connector.transaction():
+            self.db_connector.execute_many(
+                insert_str, (tuple(row.values()) for row in rows)
+            )
+            # NOTE: The transaction holds the write lock, so the integer primary
+            #       keys of the new rows are the consecutive ids ending at the
+            #       largest id
+            # NOTE: Protection against SQL injection as the table name is not
+            #       supplied by the user
+            last_id = self.db_connector.connection.execute(
+                f"SELECT MAX(id) FROM {table_name}"  # nosec
+            ).fetchone()[0]
+        logging.debug("Made %d insertions to %s", len(rows), table_name)
+        return tuple(range(last_id - len(rows) + 1, last_id + 1))
@@ -0,0 +1,67 @@
+"""Module for migrating databases created by earlier versions of bout_runners."""
+
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
+
+
+def migrate_database(db_path: Path) -> int:
+    """
+    Upgrade the schema of a database and fill in the missing fingerprints.
+
+    Parameters
+    ----------
+    db_path : Path
+        Path to the database
+
+    Returns
+    -------
+    int
+        The number of entries which were given a fingerprint
+
+    Raises
+    ------
+    FileNotFoundError
+        If the database does not exist
+    """
+    db_path = Path(db_path)
+    if not db_path.is_file():
+        msg = f"No database found at {db_path}"
+        logging.critical(msg)
+        raise FileNotFoundError(msg)
+    logging.info("Start: Migrating %s", db_path)
+    db_connector = DatabaseConnector(name=db_path.stem, db_root_path=db_path.parent)
+    db_creator = DatabaseCreator(db_connector)
+    db_creator.upgrade_schema()
+    number_of_filled = db_creator.backfill_fingerprints()
+    logging.info("Done: Migrating %s", db_path)
+    return number_of_filled
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """
+    Migrate the databases given on the command line.
+
+    Parameters
+    ----------
+    args : None or sequence of str
+        The command line arguments
+        If None, the arguments are read from sys.argv
+    """
+    parser = argparse.ArgumentParser(
+        description="Upgrade databases created by earlier versions of bout_runners "
+        "and fill in the fingerprints of their entries"
+    )
+    parser.add_argument("db_paths", nargs="+", type=Path, help="Path to the databases")
+    for db_path in parser.parse_args(args).db_paths:
+        number_of_filled = migrate_database(db_path)
+        print(f"Filled in {number_of_filled} fingerprint(s) in {db_path}")
+
+
+if __name__ == "__main__":
+    main()
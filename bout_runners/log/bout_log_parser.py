@@ -0,0 +1,406 @@
+"""Module containing the BoutLogParser class."""
+
+
+import logging
+import mmap
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bout_runners.log.local_time import parse_local_time
+
+
+class BoutLogParser:
+    """
+    Class for parsing BOUT++ log files in one pass.
+
+    The log file is memory-mapped and parsed line by line, so that neither the
+    file nor the table of the simulation steps is copied as a string.
+    The simulation steps are parsed directly into preallocated numpy arrays, which
+    are exposed without copying through get_simulation_steps.
+
+    Attributes
+    ----------
+    __log_path : Path
+        Getter variable for log_path
+    __columns : list of str
+        Getter variable for columns
+    __steps : dict of str, np.ndarray
+        The preallocated arrays of the simulation steps
+    __number_of_steps : int
+        Getter variable for number_of_steps
+    __pid : None or int
+        Getter variable for pid
+    __start_time : None or datetime
+        Getter variable for start_time
+    __end_time : None or datetime
+        Getter variable for end_time
+    log_path : Path
+        Path to the log file
+    columns : list of str
+        The column names of the simulation step table
+    number_of_steps : int
+        The number of simulation steps
+    pid : None or int
+        The processor id of the part of the program writing to the log file
+    start_time : None or datetime
+        The time of the execution start (given that it has started)
+    end_time : None or datetime
+        The time of the execution end (given that it has ended)
+    step_pattern : re.Pattern
+        Pattern matching the lines of the simulation steps
+    integer_columns : tuple of str
+        The columns of the simulation step table which are integers
+
+    Methods
+    -------
+    __parse()
+        Parse the log file in one pass
+    __parse_before_table(line)
+        Parse a line before the table of the simulation steps
+    __parse_table_start(line, remaining)
+        Parse a line after the header of the table of the simulation steps
+    __parse_step(line)
+        Parse a line in the table of the simulation steps
+    __parse_metadata(line)
+        Parse the pid, start time or end time from a line
+    __parse_header(line)
+        Set the columns of the simulation steps
+    __allocate(capacity)
+        Allocate the arrays of the simulation steps, or grow them to capacity
+    __append_step(fields)
+        Store a simulation step in the arrays
+    started()
+        Whether or not the execution has started
+    ended()
+        Whether or not the execution has ended
+    get_simulation_steps()
+        Return the simulation steps as a dataframe
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> path = Path().joinpath('path', 'to', 'BOUT.log.0')
+    >>> log_parser = BoutLogParser(path)
+    >>> log_parser.pid
+    1191
+
+    >>> log_parser.get_simulation_steps().loc[:, 'Sim_time'].iloc[-1]
+    10.0
+    """
+
+    step_pattern = re.compile(rb"^\d\.\d{3}e[+-]\d{2}")
+    integer_columns = ("RHS_evals",)
+
+    def __init__(self, log_path: Path) -> None:
+        """
+        Parse the log file.
+
+        Parameters
+        ----------
+        log_path : str or Path
+            Absolute path to log file
+        """
+        self.__log_path = Path(log_path)
+        self.__columns: List[str] = list()
+        self.__steps: Dict[str, np.ndarray] = dict()
+        self.__number_of_steps = 0
+        self.__pid: Optional[int] = None
+        self.__start_time: Optional[datetime] = None
+        self.__end_time: Optional[datetime] = None
+        self.__parse()
+
+    @property
+    def log_path(self) -> Path:
+        """
+        Return the path to the log file.
+
+        Returns
+        -------
+        Path
+            Path to the log file
+        """
+        return self.__log_path
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Return the column names of the simulation step table.
+
+        Returns
+        -------
+        list of str
+            The column names
+            Empty if no table is found
+        """
+        return self.__columns
+
+    @property
+    def number_of_steps(self) -> int:
+        """
+        Return the number of simulation steps.
+
+        Returns
+        -------
+        int
+            The number of simulation steps
+        """
+        return self.__number_of_steps
+
+    @property
+    def pid(self) -> Optional[int]:
+        """
+        Return the pid of the process.
+
+        Returns
+        -------
+        int or None
+            The pid of the process
+        """
+        return self.__pid
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """
+        Return the start time of the process.
+
+        Returns
+        -------
+        datetime or None
+            The start time on date time format
+        """
+        return self.__start_time
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """
+        Return the end time of the process.
+
+        Returns
+        -------
+        datetime or None
+            The end time on date time format
+        """
+        return self.__end_time
+
+    def __parse(self) -> None:
+        """
+        Parse the log file in one pass.
+
+        Only the first table of simulation steps is parsed, and it ends at the
+        first line which is not a simulation step
+        """
+        with self.__log_path.open("rb") as log_file:
+            if self.__log_path.stat().st_size == 0:
+                return
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # The states are "before", "header", "steps" and "after" the table
+                # A line ending a state is parsed again in the next state
+                state = "before"
+                for line in iter(mapped.readline, b""):
+                    if state == "header":
+                        state = self.__parse_table_start(
+                            line, len(mapped) - mapped.tell() + len(line)
+                        )
+                    if state == "steps":
+                        state = self.__parse_step(line)
+                    if state == "before":
+                        state = self.__parse_before_table(line)
+                    elif state == "after":
+                        self.__parse_metadata(line)
+        logging.debug(
+            "Parsed %d simulation steps from %s", self.__number_of_steps, self.log_path
+        )
+
+    def __parse_before_table(self, line: bytes) -> str:
+        """
+        Parse a line before the table of the simulation steps.
+
+        Parameters
+        ----------
+        line : bytes
+            The line to parse
+
+        Returns
+        -------
+        state : str
+            "header" if the line is the header of the table, else "before"
+        """
+        if line.startswith(b"Sim Time  |"):
+            self.__parse_header(line)
+            return "header"
+        self.__parse_metadata(line)
+        return "before"
+
+    def __parse_table_start(self, line: bytes, remaining: int) -> str:
+        """
+        Parse a line after the header of the table of the simulation steps.
+
+        The arrays of the simulation steps are allocated at the first non-empty
+        line
+
+        Parameters
+        ----------
+        line : bytes
+            The line to parse
+        remaining : int
+            The number of bytes from the start of the line to the end of the file
+
+        Returns
+        -------
+        state : str
+            "header" if the line is empty, else "steps"
+        """
+        if line.strip() == b"":
+            return "header"
+        # NOTE: The rows of the table are of similar length, so the number of
+        #       remaining rows can be estimated
+        self.__allocate(max(remaining // max(len(line), 1), 1))
+        return "steps"
+
+    def __parse_step(self, line: bytes) -> str:
+        """
+        Parse a line in the table of the simulation steps.
+
+        Parameters
+        ----------
+        line : bytes
+            The line to parse
+
+        Returns
+        -------
+        state : str
+            "steps" if the line is a simulation step, else "after"
+        """
+        fields = line.split()
+        if self.step_pattern.match(line) is not None and len(fields) == len(
+            self.__columns
+        ):
+            self.__append_step(fields)
+            return "steps"
+        return "after"
+
+    def __parse_metadata(self, line: bytes) -> None:
+        """
+        Parse the pid, start time or end time from a line.
+
+        Parameters
+        ----------
+        line : bytes
+            The line to parse
+        """
+        if line.startswith(b"pid"):
+            match = re.match(rb"^pid:\s*(\d+)\s*$", line)
+            if match is not None:
+                self.__pid = int(match.group(1))
+        elif line.startswith(b"Run started at  : "):
+            self.__start_time = parse_local_time(
+                line[len(b"Run started at  : ") :].decode("utf8").strip()
+            )
+        elif line.startswith(b"Run finished at  : "):
+            self.__end_time = parse_local_time(
+                line[len(b"Run finished at  : ") :].decode("utf8").strip()
+            )
+
+    def __parse_header(self, line: bytes) -> None:
+        """
+        Set the columns of the simulation steps.
+
+        Parameters
+        ----------
+        line : bytes
+            The header of the table of the simulation steps
+        """
+        header = (
+            line.decode("utf8")
+            .replace("|", "")
+            .replace("Sim Time", "Sim_time")
+            .replace("RHS evals", "RHS_evals")
+            .replace("Wall Time", "Wall_time")
+        )
+        self.__columns = header.split()
+
+    def __allocate(self, capacity: int) -> None:
+        """
+        Allocate the arrays of the simulation steps, or grow them to capacity.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of simulation steps the arrays can hold
+        """
+        for column in self.__columns:
+            array = np.empty(
+                capacity,
+                dtype=np.int64 if column in self.integer_columns else np.float64,
+            )
+            if column in self.__steps:
+                array[: self.__number_of_steps] = self.__steps[column][
+                    : self.__number_of_steps
+                ]
+            self.__steps[column] = array
+
+    def __append_step(self, fields: List[bytes]) -> None:
+        """
+        Store a simulation step in the arrays.
+
+        Parameters
+        ----------
+        fields : list of bytes
+            The fields of the line of the simulation step
+        """
+        if self.__number_of_steps == len(self.__steps[self.__columns[0]]):
+            self.__allocate(2 * self.__number_of_steps)
+        for column, field in zip(self.__columns, fields):
+            self.__steps[column][self.__number_of_steps] = (
+                int(field) if column in self.integer_columns else float(field)
+            )
+        self.__number_of_steps += 1
+
+    def started(self) -> bool:
+        """
+        Check whether the run has a start time.
+
+        Returns
+        -------
+        bool
+            True if the start signature is found in the file
+        """
+        return self.__start_time is not None
+
+    def ended(self) -> bool:
+        """
+        Check whether the run has an end time.
+
+        Returns
+        -------
+        bool
+            True if the end signature is found in the file
+        """
+        return self.__end_time is not None
+
+    def get_simulation_steps(self) -> pd.DataFrame:
+        """
+        Return the simulation steps as a dataframe.
+
+        The columns of the dataframe are views of the parsed arrays
+
+        Returns
+        -------
+        simulation_steps : DataFrame
+            Data frame containing details of the simulation steps
+        """
+        if len(self.__columns) == 0:
+            logging.warning("Could not find steps in %s", self.__log_path)
+            return pd.DataFrame()
+        if len(self.__steps) == 0:
+            return pd.DataFrame(columns=self.__columns)
+        steps = {
+            column: self.__steps[column][: self.__number_of_steps]
+            for column in self.__columns
+        }
+        return pd.DataFrame(steps, copy=False)
@@ -0,0 +1,26 @@
+"""Contains the function for parsing the time stamps of the BOUT++ logs."""
+
+
+from datetime import datetime
+
+
+def parse_local_time(time_str: str) -> datetime:
+    """
+    Return the local time of a time string written by BOUT++.
+
+    Parameters
+    ----------
+    time_str : str
+        The time string
+
+    Returns
+    -------
+    time : datetime
+        The local datetime
+    """
+    try:
+        time = datetime.strptime(time_str, "%c")
+    except ValueError:
+        # Observed on CentOS
+        time = datetime.strptime(time_str, "%a %d %b %Y %H:%M:%S %p %Z")
+    return time
@@ -4,12 +4,14 @@
 import logging
 import re
 from datetime import datetime
-from io import StringIO
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
+from bout_runners.log.bout_log_parser import BoutLogParser
+from bout_runners.log.local_time import parse_local_time
+
 
 class LogReader:
     """
@@ -110,41 +112,14 @@ class LogReader:
         """
         Return the simulation steps as a dataframe.
 
+        The log file is parsed in one pass by BoutLogParser
+
         Returns
         -------
         simulation_steps : DataFrame
             Data frame containing details of the simulation steps
         """
-        file_str_list = self.file_str.split("\n")
-        found_line_nr = -1
-        for line_nr, line in enumerate(file_str_list):
-            if line.startswith("Sim Time  |"):
-                found_line_nr = line_nr
-                break
-        if found_line_nr != -1:
-            file_str_list = file_str_list[found_line_nr:]
-            file_str_list[0] = file_str_list[0].replace("|", "")
-            file_str_list[0] = file_str_list[0].replace("Sim Time", "Sim_time")
-            file_str_list[0] = file_str_list[0].replace("RHS evals", "RHS_evals")
-            file_str_list[0] = file_str_list[0].replace("Wall Time", "Wall_time")
-            # Remove blank line
-            file_str_list.pop(1)
-            # Get all the lines which starts with a number
-            pattern = r"^\d\.\d{3}e[+-]\d{2}"
-            # Two header lines
-            found_line_nr = 0
-            for line_nr, line in enumerate(file_str_list[2:]):
-                if re.search(pattern, line) is None:
-                    found_line_nr = line_nr
-                    break
-            # Add two as we enumerate from [2:]
-            file_str_list = file_str_list[: found_line_nr + 2]
-        else:
-            logging.warning("Could not find steps in %s", self.__log_path)
-            return pd.DataFrame()
-        file_str = re.sub(" +", ",", "\n".join(file_str_list))
-        simulation_steps = pd.read_csv(StringIO(file_str))
-        return simulation_steps
+        return BoutLogParser(self.__log_path).get_simulation_steps()
 
     @property
     def start_time(self) -> Optional[datetime]:
@@ -245,10 +220,4 @@ class LogReader:
             logging.critical(msg)
             raise ValueError(msg)
 
-        time_str = match.group(1)
-        try:
-            time = datetime.strptime(time_str, "%c")
-        except ValueError:
-            # Observed on CentOS
-            time = datetime.strptime(time_str, "%a %d %b %Y %H:%M:%S %p %Z")
-        return time
+        return parse_local_time(match.group(1))
@@ -0,0 +1,342 @@
+"""Module containing the RankLogAggregator class."""
+
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from bout_runners.log.bout_log_parser import BoutLogParser
+from bout_runners.utils.process_pools import new_process_pool
+
+Accumulators = Dict[str, np.ndarray]
+
+
+def _new_accumulators(number_of_steps: int, columns: Sequence[str]) -> Accumulators:
+    """
+    Return empty accumulators of the per-step statistics.
+
+    Parameters
+    ----------
+    number_of_steps : int
+        The number of steps the accumulators can hold
+    columns : sequence of str
+        The timing columns
+
+    Returns
+    -------
+    accumulators : dict of str, np.ndarray
+        The number of ranks, the simulation time, and the number of ranks
+        reporting, the sum, the maximum and the rank of the maximum of each timing
+        column for each step
+    """
+    accumulators = {
+        "count": np.zeros(number_of_steps, dtype=np.int64),
+        "Sim_time": np.full(number_of_steps, np.nan),
+    }
+    for column in columns:
+        accumulators[f"{column}_count"] = np.zeros(number_of_steps, dtype=np.int64)
+        accumulators[f"{column}_sum"] = np.zeros(number_of_steps)
+        accumulators[f"{column}_max"] = np.full(number_of_steps, -np.inf)
+        accumulators[f"{column}_rank"] = np.full(number_of_steps, -1, dtype=np.int64)
+    return accumulators
+
+
+def _grow(accumulators: Accumulators, number_of_steps: int) -> Accumulators:
+    """
+    Return the accumulators grown to hold a number of steps.
+
+    Parameters
+    ----------
+    accumulators : dict of str, np.ndarray
+        The accumulators
+    number_of_steps : int
+        The number of steps the accumulators should hold
+
+    Returns
+    -------
+    accumulators : dict of str, np.ndarray
+        The grown accumulators
+    """
+    current = len(accumulators["count"])
+    if number_of_steps <= current:
+        return accumulators
+    columns = [key[:-4] for key in accumulators if key.endswith("_sum")]
+    grown = _new_accumulators(number_of_steps, columns)
+    for key, array in accumulators.items():
+        grown[key][:current] = array
+    return grown
+
+
+def _reduce_rank_logs(
+    log_paths: Sequence[Path], ranks: Sequence[int], columns: Sequence[str]
+) -> Accumulators:
+    """
+    Reduce the step tables of rank logs one file at a time.
+
+    Only the step table of one file is held in memory at the time
+
+    Parameters
+    ----------
+    log_paths : sequence of Path
+        The rank logs
+    ranks : sequence of int
+        The ranks of the logs
+    columns : sequence of str
+        The timing columns
+
+    Returns
+    -------
+    accumulators : dict of str, np.ndarray
+        The accumulated per-step statistics of the logs
+    """
+    accumulators = _new_accumulators(0, columns)
+    for log_path, rank in zip(log_paths, ranks):
+        steps = BoutLogParser(log_path).get_simulation_steps()
+        number_of_steps = len(steps.index)
+        if number_of_steps == 0:
+            continue
+        accumulators = _grow(accumulators, number_of_steps)
+        accumulators["count"][:number_of_steps] += 1
+        sim_time = accumulators["Sim_time"][:number_of_steps]
+        unset = np.isnan(sim_time)
+        sim_time[unset] = steps.loc[:, "Sim_time"].to_numpy()[unset]
+        for column in columns:
+            if column not in steps.columns:
+                continue
+            values = steps.loc[:, column].to_numpy(dtype=np.float64)
+            # NOTE: The mean of a column is only taken over the ranks reporting it
+            accumulators[f"{column}_count"][:number_of_steps] += 1
+            accumulators[f"{column}_sum"][:number_of_steps] += values
+            maximum = accumulators[f"{column}_max"][:number_of_steps]
+            slower = values > maximum
+            maximum[slower] = values[slower]
+            accumulators[f"{column}_rank"][:number_of_steps][slower] = rank
+    return accumulators
+
+
+def _merge(first: Accumulators, second: Accumulators) -> Accumulators:
+    """
+    Merge the accumulators of two sets of ranks.
+
+    Parameters
+    ----------
+    first : dict of str, np.ndarray
+        The accumulators of the first set of ranks
+    second : dict of str, np.ndarray
+        The accumulators of the second set of ranks
+
+    Returns
+    -------
+    merged : dict of str, np.ndarray
+        The accumulators of both sets of ranks
+    """
+    number_of_steps = max(len(first["count"]), len(second["count"]))
+    merged = _grow(first, number_of_steps)
+    second = _grow(second, number_of_steps)
+    merged["count"] += second["count"]
+    unset = np.isnan(merged["Sim_time"])
+    merged["Sim_time"][unset] = second["Sim_time"][unset]
+    for key in merged:
+        if key.endswith("_count") or key.endswith("_sum"):
+            merged[key] += second[key]
+        elif key.endswith("_max"):
+            column = key[:-4]
+            slower = second[key] > merged[key]
+            merged[key][slower] = second[key][slower]
+            merged[f"{column}_rank"][slower] = second[f"{column}_rank"][slower]
+    return merged
+
+
+class RankLogAggregator:
+    """
+    Class for aggregating the logs of all the MPI ranks of a run.
+
+    BOUT++ writes a BOUT.log.<rank> for every rank.
+    The step tables of the rank logs are aligned by the step number, and the
+    maximum, the mean and the slowest rank of each timing column are computed for
+    every step.
+    Every process reducing the logs only holds the step table of one log at the
+    time, so the memory use does not grow with the number of ranks.
+    By default the logs are reduced in the calling process, and if more workers
+    are asked for, the logs are reduced in chunks by a pool of processes which
+    are not forked from the calling process.
+
+    Attributes
+    ----------
+    __statistics : None or DataFrame
+        The per-step statistics, computed on first use
+    run_path : Path
+        Path to the directory of the run
+    max_workers : None or int
+        Number of processes reducing the logs
+    timing_columns : tuple of str
+        The columns of the step tables which are compared between the ranks
+    log_pattern : re.Pattern
+        Pattern matching the names of the rank logs
+
+    Methods
+    -------
+    get_log_paths()
+        Return the rank logs ordered by their rank
+    __aggregate()
+        Reduce the step tables of all the rank logs
+    get_step_statistics()
+        Return the per-step imbalance statistics
+    get_summary()
+        Return the summary of the imbalance of the run
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> aggregator = RankLogAggregator(Path().joinpath('path', 'to', 'run'))
+    >>> aggregator.get_summary()['Calc_imbalance']
+    1.05
+    """
+
+    timing_columns = ("Wall_time", "Calc", "Inv", "Comm", "I/O")
+    log_pattern = re.compile(r"^BOUT\.log\.(\d+)$")
+
+    def __init__(
+        self, run_path: Union[Path, str], max_workers: Optional[int] = 1
+    ) -> None:
+        """
+        Set the path to the run.
+
+        Parameters
+        ----------
+        run_path : Path or str
+            Path to the directory of the run
+        max_workers : None or int
+            Number of processes reducing the logs
+            If 1, the logs are reduced in the calling process
+            If None, the number of processors on the machine will be used
+        """
+        self.run_path = Path(run_path)
+        self.max_workers = max_workers
+        self.__statistics: Optional[pd.DataFrame] = None
+
+    def get_log_paths(self) -> Tuple[Tuple[int, Path], ...]:
+        """
+        Return the rank logs ordered by their rank.
+
+        Returns
+        -------
+        tuple of tuple
+            The rank and the path of each rank log
+        """
+        rank_logs: List[Tuple[int, Path]] = list()
+        for log_path in self.run_path.glob("BOUT.log.*"):
+            match = self.log_pattern.match(log_path.name)
+            if match is not None:
+                rank_logs.append((int(match.group(1)), log_path))
+        return tuple(sorted(rank_logs))
+
+    def __aggregate(self) -> pd.DataFrame:
+        """
+        Reduce the step tables of all the rank logs.
+
+        Returns
+        -------
+        statistics : DataFrame
+            The per-step imbalance statistics
+        """
+        rank_logs = self.get_log_paths()
+        logging.info(
+            "Start: Aggregating %d rank logs in %s", len(rank_logs), self.run_path
+        )
+        ranks = tuple(rank for rank, _ in rank_logs)
+        log_paths = tuple(log_path for _, log_path in rank_logs)
+        if self.max_workers == 1 or len(rank_logs) < 2:
+            accumulators = _reduce_rank_logs(log_paths, ranks, self.timing_columns)
+        else:
+            # NOTE: Every worker gets a few chunks so that slow chunks are
+            #       balanced between the workers
+            max_workers = (
+                self.max_workers if self.max_workers is not None else os.cpu_count()
+            )
+            number_of_chunks = min(len(rank_logs), 4 * (max_workers or 1))
+            chunk_size = -(-len(rank_logs) // number_of_chunks)
+            starts = range(0, len(rank_logs), chunk_size)
+            with new_process_pool(max_workers) as executor:
+                partials = executor.map(
+                    _reduce_rank_logs,
+                    [log_paths[start : start + chunk_size] for start in starts],
+                    [ranks[start : start + chunk_size] for start in starts],
+                    [self.timing_columns] * len(starts),
+                )
+                accumulators = _new_accumulators(0, self.timing_columns)
+                for partial in partials:
+                    accumulators = _merge(accumulators, partial)
+
+        statistics = pd.DataFrame(
+            {
+                "Sim_time": accumulators["Sim_time"],
+                "number_of_ranks": accumulators["count"],
+            }
+        )
+        for column in self.timing_columns:
+            mean = accumulators[f"{column}_sum"] / np.maximum(
+                accumulators[f"{column}_count"], 1
+            )
+            maximum = accumulators[f"{column}_max"]
+            statistics[f"{column}_max"] = maximum
+            statistics[f"{column}_mean"] = mean
+            # NOTE: The imbalance is only defined for positive means
+            with np.errstate(divide="ignore", invalid="ignore"):
+                statistics[f"{column}_imbalance"] = np.where(
+                    mean > 0, maximum / mean, np.nan
+                )
+            statistics[f"{column}_slowest_rank"] = accumulators[f"{column}_rank"]
+        logging.info("Done: Aggregating %d rank logs in %s", len(ranks), self.run_path)
+        return statistics
+
+    def get_step_statistics(self) -> pd.DataFrame:
+        """
+        Return the per-step imbalance statistics.
+
+        Returns
+        -------
+        DataFrame
+            For each step the simulation time, the number of ranks which have
+            written the step, and the maximum, the mean, the imbalance (maximum
+            divided by mean) and the slowest rank of each timing column
+        """
+        if self.__statistics is None:
+            self.__statistics = self.__aggregate()
+        return self.__statistics
+
+    def get_summary(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Return the summary of the imbalance of the run.
+
+        Returns
+        -------
+        summary : dict
+            The number of ranks and steps, and for each timing column the mean and
+            the maximum imbalance over the steps, and the rank which was the
+            slowest in most steps
+        """
+        statistics = self.get_step_statistics()
+        summary: Dict[str, Union[int, float, None]] = {
+            "number_of_ranks": len(self.get_log_paths()),
+            "number_of_steps": len(statistics.index),
+        }
+        for column in self.timing_columns:
+            imbalance = statistics.loc[:, f"{column}_imbalance"].dropna()
+            slowest = statistics.loc[:, f"{column}_slowest_rank"]
+            slowest = slowest[slowest >= 0]
+            summary[f"{column}_imbalance"] = (
+                float(imbalance.mean()) if len(imbalance) != 0 else None
+            )
+            summary[f"{column}_max_imbalance"] = (
+                float(imbalance.max()) if len(imbalance) != 0 else None
+            )
+            summary[f"{column}_slowest_rank"] = (
+                int(slowest.mode().iloc[0]) if len(slowest) != 0 else None
+            )
+        return summary
@@ -0,0 +1,422 @@
+"""Module containing the TailingLogReader class."""
+
+
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from bout_runners.log.local_time import parse_local_time
+
+
+class TailingLogReader:
+    """
+    Class for incrementally reading BOUT++ log files which are being written.
+
+    Contrary to the LogReader, the file is not read into memory.
+    The reader remembers how far into the file it has read, and every call to
+    update() only parses the bytes which have been appended since the previous
+    call.
+    The appended bytes are read in chunks of at most chunk_size bytes, so that
+    the memory use is bounded also when a large log is read for the first time.
+    If the file has been replaced or truncated (for example when a run is
+    restarted), the file is read from the beginning again.
+
+    Attributes
+    ----------
+    __log_path : Path
+        Getter variable for log_path
+    __offset : int
+        Number of bytes read from the file
+    __inode : None or int
+        The inode of the file when it was last read
+    __remainder : bytes
+        The last line read if it was incomplete
+    __in_step_table : bool
+        Whether the latest line parsed was in the table of simulation steps
+    __started : bool
+        Whether the start signature has been found
+    __ended : bool
+        Whether the end signature has been found
+    __pid_exist : bool
+        Whether the pid signature has been found
+    __pid : None or int
+        Getter variable for pid
+    __start_time : None or datetime
+        Getter variable for start_time
+    __end_time : None or datetime
+        Getter variable for end_time
+    __first_sim_time : None or float
+        Getter variable for first_sim_time
+    __last_sim_time : None or float
+        Getter variable for last_sim_time
+    __number_of_steps : int
+        Getter variable for number_of_steps
+    __total_rhs_evals : int
+        Getter variable for total_rhs_evals
+    __total_wall_time : float
+        Getter variable for total_wall_time
+    log_path : Path
+        Path to the log file
+    pid : None or int
+        The processor id of the part of the program writing to the log file
+    start_time : None or datetime
+        The time of the execution start (given that it has started)
+    end_time : None or datetime
+        The time of the execution end (given that it has ended)
+    first_sim_time : None or float
+        The simulation time of the first simulation step written to the log
+    last_sim_time : None or float
+        The simulation time of the last simulation step written to the log
+    number_of_steps : int
+        The number of simulation steps written to the log
+    total_rhs_evals : int
+        The sum of the right hand side evaluations of the simulation steps
+    total_wall_time : float
+        The sum of the wall times of the simulation steps
+    step_pattern : re.Pattern
+        Pattern matching the lines of the simulation steps
+    chunk_size : int
+        Maximum number of bytes read from the file at the time
+
+    Methods
+    -------
+    __reset()
+        Forget everything which has been read
+    __parse_chunk(chunk)
+        Parse the complete lines of a chunk of bytes read from the log
+    __parse_step_line(line)
+        Update the state from a line which may be in the table of simulation steps
+    __parse_line(line)
+        Update the state from a line of the log
+    update()
+        Parse the bytes appended to the log file since the last update
+    started()
+        Whether or not the execution has started
+    ended()
+        Whether or not the execution has ended
+    pid_exist()
+        Whether or not the pid can be found
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> path = Path().joinpath('path', 'to', 'BOUT.log.0')
+    >>> log_reader = TailingLogReader(path)
+    >>> log_reader.started()
+    False
+
+    Some time later
+
+    >>> log_reader.update()
+    >>> log_reader.start_time
+    datetime.datetime(2020, 5, 1, 17, 7, 10)
+
+    >>> log_reader.last_sim_time
+    0.6
+    """
+
+    step_pattern = re.compile(r"^(\d\.\d{3}e[+-]\d{2})\s")
+    chunk_size = 1024 * 1024
+
+    def __init__(self, log_path: Path) -> None:
+        """
+        Set the path and read the log file if it exists.
+
+        Parameters
+        ----------
+        log_path : str or Path
+            Absolute path to log file
+        """
+        self.__log_path = Path(log_path)
+        self.__offset = 0
+        self.__inode: Optional[int] = None
+        self.__remainder = b""
+        self.__in_step_table = False
+        self.__started = False
+        self.__ended = False
+        self.__pid_exist = False
+        self.__pid: Optional[int] = None
+        self.__start_time: Optional[datetime] = None
+        self.__end_time: Optional[datetime] = None
+        self.__first_sim_time: Optional[float] = None
+        self.__last_sim_time: Optional[float] = None
+        self.__number_of_steps = 0
+        self.__total_rhs_evals = 0
+        self.__total_wall_time = 0.0
+        self.update()
+
+    @property
+    def log_path(self) -> Path:
+        """
+        Return the path to the log file.
+
+        Returns
+        -------
+        Path
+            Path to the log file
+        """
+        return self.__log_path
+
+    @property
+    def pid(self) -> Optional[int]:
+        """
+        Return the pid of the process.
+
+        Returns
+        -------
+        int or None
+            The pid of the process
+        """
+        return self.__pid
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """
+        Return the start time of the process.
+
+        Returns
+        -------
+        datetime or None
+            The start time on date time format
+        """
+        return self.__start_time
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """
+        Return the end time of the process.
+
+        Returns
+        -------
+        datetime or None
+            The end time on date time format
+        """
+        return self.__end_time
+
+    @property
+    def first_sim_time(self) -> Optional[float]:
+        """
+        Return the simulation time of the first simulation step written to the log.
+
+        This is different from zero if the run is restarted
+
+        Returns
+        -------
+        float or None
+            The simulation time
+            None if no simulation steps have been written
+        """
+        return self.__first_sim_time
+
+    @property
+    def last_sim_time(self) -> Optional[float]:
+        """
+        Return the simulation time of the last simulation step written to the log.
+
+        Returns
+        -------
+        float or None
+            The simulation time
+            None if no simulation steps have been written
+        """
+        return self.__last_sim_time
+
+    @property
+    def number_of_steps(self) -> int:
+        """
+        Return the number of simulation steps written to the log.
+
+        Returns
+        -------
+        int
+            The number of simulation steps
+        """
+        return self.__number_of_steps
+
+    @property
+    def total_rhs_evals(self) -> int:
+        """
+        Return the sum of the right hand side evaluations of the simulation steps.
+
+        Returns
+        -------
+        int
+            The number of right hand side evaluations
+        """
+        return self.__total_rhs_evals
+
+    @property
+    def total_wall_time(self) -> float:
+        """
+        Return the sum of the wall times of the simulation steps.
+
+        Returns
+        -------
+        float
+            The wall time in seconds
+        """
+        return self.__total_wall_time
+
+    def __reset(self) -> None:
+        """Forget everything which has been read."""
+        self.__offset = 0
+        self.__inode = None
+        self.__remainder = b""
+        self.__in_step_table = False
+        self.__started = False
+        self.__ended = False
+        self.__pid_exist = False
+        self.__pid = None
+        self.__start_time = None
+        self.__end_time = None
+        self.__first_sim_time = None
+        self.__last_sim_time = None
+        self.__number_of_steps = 0
+        self.__total_rhs_evals = 0
+        self.__total_wall_time = 0.0
+
+    def update(self) -> None:
+        """Parse the bytes appended to the log file since the last update."""
+        try:
+            stat = os.stat(self.__log_path)
+        except FileNotFoundError:
+            logging.debug("%s does not exist yet", self.__log_path)
+            return
+        if (self.__inode is not None and stat.st_ino != self.__inode) or (
+            stat.st_size < self.__offset
+        ):
+            logging.debug("%s has been replaced, reading it anew", self.__log_path)
+            self.__reset()
+        self.__inode = stat.st_ino
+        if stat.st_size == self.__offset:
+            return
+
+        number_of_bytes = 0
+        with self.__log_path.open("rb") as log_file:
+            log_file.seek(self.__offset)
+            chunk = log_file.read(self.chunk_size)
+            while len(chunk) != 0:
+                self.__offset += len(chunk)
+                number_of_bytes += len(chunk)
+                self.__parse_chunk(chunk)
+                chunk = log_file.read(self.chunk_size)
+        logging.debug("Parsed %d new bytes of %s", number_of_bytes, self.__log_path)
+
+    def __parse_chunk(self, chunk: bytes) -> None:
+        """
+        Parse the complete lines of a chunk of bytes read from the log.
+
+        The incomplete line at the end of the chunk is kept in the remainder, and
+        is completed by the next chunk
+
+        Parameters
+        ----------
+        chunk : bytes
+            The bytes read from the log
+        """
+        lines = (self.__remainder + chunk).split(b"\n")
+        # The last line is incomplete unless the chunk ended with a newline
+        self.__remainder = lines.pop()
+        for line in lines:
+            self.__parse_line(line.decode("utf8", errors="replace").rstrip("\r"))
+
+    def __parse_step_line(self, line: str) -> bool:
+        """
+        Update the state from a line which may be in the table of simulation steps.
+
+        Parameters
+        ----------
+        line : str
+            The line without the newline
+
+        Returns
+        -------
+        bool
+            True if the line belongs to the table of simulation steps
+        """
+        if line.startswith("Sim Time  |"):
+            self.__in_step_table = True
+            return True
+        if not self.__in_step_table:
+            return False
+        match = self.step_pattern.match(line)
+        if match is not None:
+            self.__last_sim_time = float(match.group(1))
+            if self.__first_sim_time is None:
+                self.__first_sim_time = self.__last_sim_time
+            self.__number_of_steps += 1
+            # The step is followed by the RHS evals and the wall time
+            fields = line.split()
+            if len(fields) > 2:
+                self.__total_rhs_evals += int(fields[1])
+                self.__total_wall_time += float(fields[2])
+            return True
+        if line.strip() == "":
+            # The header of the table is followed by a blank line
+            return True
+        self.__in_step_table = False
+        return False
+
+    def __parse_line(self, line: str) -> None:
+        """
+        Update the state from a line of the log.
+
+        Parameters
+        ----------
+        line : str
+            The line without the newline
+        """
+        if self.__parse_step_line(line):
+            return
+        if line.startswith("pid"):
+            match = re.match(r"^pid\s*:\s*(\d*)\s*$", line)
+            if match is not None:
+                self.__pid_exist = True
+                if match.group(1) != "":
+                    self.__pid = int(match.group(1))
+        elif line.startswith("Run started at"):
+            self.__started = True
+            match = re.match(r"^Run started at  : (.*)", line)
+            if match is not None:
+                self.__start_time = parse_local_time(match.group(1))
+        elif line.startswith("Run finished at"):
+            self.__ended = True
+            match = re.match(r"^Run finished at  : (.*)", line)
+            if match is not None:
+                self.__end_time = parse_local_time(match.group(1))
+
+    def started(self) -> bool:
+        """
+        Check whether the run has a start time.
+
+        Returns
+        -------
+        bool
+            True if the start signature has been found in the file
+        """
+        return self.__started
+
+    def ended(self) -> bool:
+        """
+        Check whether the run has an end time.
+
+        Returns
+        -------
+        bool
+            True if the end signature has been found in the file
+        """
+        return self.__ended
+
+    def pid_exist(self) -> bool:
+        """
+        Check whether a process id exist.
+
+        Returns
+        -------
+        bool
+            True if the pid has been found
+        """
+        return self.__pid_exist
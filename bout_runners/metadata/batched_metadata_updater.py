@@ -0,0 +1,167 @@
+"""Module containing the BatchedMetadataUpdater class."""
+
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Tuple, Union
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.database_writer import DatabaseWriter
+from bout_runners.metadata.metadata_updater import MetadataUpdater
+
+
+class BatchedMetadataUpdater(MetadataUpdater):
+    r"""
+    Class which buffers updates of the run table and writes them at once.
+
+    The updates are merged per run, and written by flush with one executemany
+    per set of updated columns in a single transaction.
+    Values equal to those already stored are not written, so that a flush where
+    nothing changed does not write to the database at all.
+
+    Attributes
+    ----------
+    __db_connector : DatabaseConnector
+        The database connector
+    __changes : dict of int, dict
+        The buffered values keyed by the run id and the column
+    number_of_pending : int
+        The number of runs with buffered changes
+
+    Methods
+    -------
+    update_field(column, value)
+        Buffer the update of a field of the current run
+    __drop_unchanged()
+        Remove the buffered values which equal the stored values
+    flush()
+        Write the buffered updates in one transaction
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from datetime import datetime
+    >>> from bout_runners.database.database_connector import DatabaseConnector
+    >>> db_root_path = Path().joinpath('path', 'to', 'db_root')
+    >>> db_connector = DatabaseConnector('name_of_db', db_root_path)
+    >>> metadata_updater = BatchedMetadataUpdater(db_connector, run_id=1)
+    >>> metadata_updater.update_start_time(datetime.now())
+    >>> metadata_updater.update_latest_status('running')
+    >>> metadata_updater.run_id = 2
+    >>> metadata_updater.update_latest_status('error')
+    >>> metadata_updater.flush()
+    2
+    """
+
+    def __init__(self, db_connector: DatabaseConnector, run_id: int) -> None:
+        """
+        Set the database and id to use.
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            The database connector
+        run_id : int
+            The id of the run to update
+        """
+        super().__init__(db_connector, run_id)
+        self.__db_connector = db_connector
+        self.__changes: Dict[int, Dict[str, Any]] = dict()
+
+    @property
+    def number_of_pending(self) -> int:
+        """
+        Return the number of runs with buffered changes.
+
+        Returns
+        -------
+        int
+            The number of runs with buffered changes
+        """
+        return len(self.__changes)
+
+    def update_field(self, column: str, value: Union[datetime, str, float]) -> None:
+        """
+        Buffer the update of a field of the current run.
+
+        Parameters
+        ----------
+        column : str
+            The column to update
+        value : object
+            The updating value
+        """
+        self.__changes.setdefault(self.run_id, dict())[column] = value
+
+    @staticmethod
+    def __as_stored(value: Any) -> Any:
+        """
+        Return a value as it would be read back from the database.
+
+        Parameters
+        ----------
+        value : object
+            The value to store
+
+        Returns
+        -------
+        object
+            The value as read from the database
+        """
+        # NOTE: The datetime objects are stored as strings
+        if isinstance(value, datetime):
+            return str(value)
+        return value
+
+    def __drop_unchanged(self) -> None:
+        """Remove the buffered values which equal the stored values."""
+        columns = sorted({column for row in self.__changes.values() for column in row})
+        run_ids = list(self.__changes.keys())
+        chunk_size = DatabaseReader.max_variables
+        for start in range(0, len(run_ids), chunk_size):
+            chunk = run_ids[start : start + chunk_size]
+            # NOTE: Protection against SQL injection through the use of ? for the
+            #       values, the columns are not supplied by the user
+            query = (
+                f"SELECT id, {', '.join(columns)} FROM run "  # nosec
+                f"WHERE id IN ({', '.join('?' * len(chunk))})"
+            )
+            for stored in self.__db_connector.connection.execute(query, chunk):
+                row = self.__changes[stored[0]]
+                for column, stored_value in zip(columns, stored[1:]):
+                    if column in row and self.__as_stored(row[column]) == stored_value:
+                        row.pop(column)
+        self.__changes = {
+            run_id: row for run_id, row in self.__changes.items() if len(row) != 0
+        }
+
+    def flush(self) -> int:
+        """
+        Write the buffered updates in one transaction.
+
+        Returns
+        -------
+        int
+            The number of updated runs
+        """
+        if len(self.__changes) == 0:
+            return 0
+        self.__drop_unchanged()
+        grouped: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = dict()
+        for run_id, row in self.__changes.items():
+            columns = tuple(sorted(row.keys()))
+            grouped.setdefault(columns, list()).append(
+                tuple(row[column] for column in columns) + (run_id,)
+            )
+        if len(grouped) != 0:
+            with self.__db_connector.transaction():
+                for columns, values in grouped.items():
+                    update_str = DatabaseWriter.create_update_string(
+                        field_names=columns, table_name="run", search_condition="id = ?"
+                    )
+                    self.__db_connector.execute_many(update_str, values)
+        number_of_updated = len(self.__changes)
+        self.__changes = dict()
+        logging.debug("Flushed updates of %d runs", number_of_updated)
+        return number_of_updated
@@ -8,6 +8,7 @@ from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from pandas import DataFrame
 
 from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
 from bout_runners.database.database_reader import DatabaseReader
 
 
@@ -480,6 +481,9 @@ class MetadataReader:
         """
         Return all the table names in the schema.
 
+        The tables derived from the logs are not part of the metadata of the runs,
+        and are left out
+
         Returns
         -------
         tuple
@@ -492,12 +496,18 @@ class MetadataReader:
             "    name NOT LIKE 'sqlite_%'"
         )
         # pylint: disable=no-member
-        return tuple(self.__db_reader.query(query).loc[:, "name"])
+        return tuple(
+            table_name
+            for table_name in self.__db_reader.query(query).loc[:, "name"]
+            if table_name not in DatabaseCreator.derived_tables
+        )
 
     def __get_table_column_dict(self) -> Dict[str, Tuple[str, ...]]:
         """
         Return all the column names of the specified tables.
 
+        The fingerprint columns are only used for look-ups, and are left out
+
         Returns
         -------
         table_column_dict : dict of tuple
@@ -514,7 +524,11 @@ class MetadataReader:
         for table_name in self.table_names:
             # pylint: disable=no-member
             table_column_dict[table_name] = tuple(
-                self.__db_reader.query(query.format(table_name)).loc[:, "name"]
+                column
+                for column in self.__db_reader.query(query.format(table_name)).loc[
+                    :, "name"
+                ]
+                if column != "fingerprint"
             )
 
         return table_column_dict
@@ -3,11 +3,16 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, Mapping, Optional, Union
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
 from bout_runners.database.database_reader import DatabaseReader
-from bout_runners.database.database_utils import get_file_modification, get_system_info
+from bout_runners.database.database_utils import (
+    get_file_modification,
+    get_fingerprint,
+    get_system_info,
+)
 from bout_runners.database.database_writer import DatabaseWriter
 from bout_runners.make.make import Make
 from bout_runners.parameters.bout_paths import BoutPaths
@@ -25,17 +30,29 @@ class MetadataRecorder:
         Getter variable for db_writer
     __db_reader : DatabaseReader
         Getter variable for db_reader
+    __latest_run_id : None or int
+        Getter variable for latest_run_id
     db_writer : DatabaseWriter
         Object which writes to the database
     db_reader : DatabaseReader
         Object which reads from the database
+    latest_run_id : None or int
+        The id of the run entry created by the latest capture of data
 
     Methods
     -------
     capture_new_data_from_run(runner, processor_split)
         Capture new data from a run
+    __get_or_create_entry(table_name, entries_dict)
+        Return the id of an entry, create the entry if it does not exist
+    __get_or_create_entries(table_name, rows)
+        Return the ids of several entries, create the entries which do not exist
+    create_entry(table_name, entries_dict, fingerprint)
+        Create a database entry and return the entry id
     _create_parameter_tables_entry(parameters_dict)
         Insert the parameters into a the parameter tables
+    create_parameter_tables_entries(parameters_dicts)
+        Insert the parameters of several runs into the parameter tables at once
 
     Examples
     --------
@@ -84,6 +101,7 @@ class MetadataRecorder:
         db_connector: DatabaseConnector,
         bout_paths: BoutPaths,
         final_parameters: FinalParameters,
+        make: Optional[Make] = None,
     ) -> None:
         """
         Set the database to use.
@@ -96,12 +114,16 @@ class MetadataRecorder:
             Object containing the paths
         final_parameters : FinalParameters
             Object containing the final parameters
+        make : Make or None
+            Object for making the project
+            If None, a Make object of the project path will be made
         """
         self.__db_writer = DatabaseWriter(db_connector)
         self.__db_reader = DatabaseReader(db_connector)
+        self.__latest_run_id: Optional[int] = None
         self.__bout_paths = bout_paths
         self.__final_parameters = final_parameters
-        self.__make = Make(self.__bout_paths.project_path)
+        self.__make = make if make is not None else Make(self.__bout_paths.project_path)
 
     @property
     def db_reader(self) -> DatabaseReader:
@@ -119,6 +141,20 @@ class MetadataRecorder:
         """
         return self.__db_reader
 
+    @property
+    def latest_run_id(self) -> Optional[int]:
+        """
+        Return the id of the run entry created by the latest capture of data.
+
+        Returns
+        -------
+        self.__latest_run_id : None or int
+            The id of the run entry
+            None if the latest call to capture_new_data_from_run did not create an
+            entry
+        """
+        return self.__latest_run_id
+
     @property
     def db_writer(self):
         """
@@ -165,65 +201,154 @@ class MetadataRecorder:
             If no previous run with the same configuration has been executed,
             this will return None, else the run_id is returned
         """
-        # Initiate the run_dict (will be filled with the ids)
-        run_dict: Dict[str, Union[str, int, float, None]] = {
-            "name": self.__bout_paths.bout_inp_dst_dir.name
-        }
-
-        # Update the parameters
-        parameters_dict = self.__final_parameters.get_final_parameters()
-        if restart:
-            parameters_dict["global"]["restart"] = 1
-
-        run_dict["parameters_id"] = self._create_parameter_tables_entry(parameters_dict)
+        # NOTE: All the entries are committed at once
+        with self.__db_writer.db_connector.transaction():
+            # Initiate the run_dict (will be filled with the ids)
+            run_dict: Dict[str, Union[str, int, float, None]] = {
+                "name": self.__bout_paths.bout_inp_dst_dir.name
+            }
+
+            # Update the parameters
+            parameters_dict = self.__final_parameters.get_final_parameters()
+            if restart:
+                parameters_dict["global"]["restart"] = 1
+
+            run_dict["parameters_id"] = self._create_parameter_tables_entry(
+                parameters_dict
+            )
 
-        # Update the file_modification
-        file_modification_dict = get_file_modification(
-            self.__bout_paths.project_path,
-            self.__make.makefile_path,
-            self.__make.exec_name,
-        )
-        run_dict["file_modification_id"] = self.__db_reader.get_entry_id(
-            "file_modification", file_modification_dict
-        )
-        if run_dict["file_modification_id"] is None:
-            run_dict["file_modification_id"] = self.create_entry(
+            # Update the file_modification
+            file_modification_dict = get_file_modification(
+                self.__bout_paths.project_path,
+                self.__make.makefile_path,
+                self.__make.exec_name,
+            )
+            run_dict["file_modification_id"] = self.__get_or_create_entry(
                 "file_modification", file_modification_dict
             )
 
-        # Update the split
-        split_dict = {
-            "number_of_processors": processor_split.number_of_processors,
-            "number_of_nodes": processor_split.number_of_nodes,
-            "processors_per_node": processor_split.processors_per_node,
-        }
-        run_dict["split_id"] = self.__db_reader.get_entry_id("split", split_dict)
-        if run_dict["split_id"] is None:
-            run_dict["split_id"] = self.create_entry("split", split_dict)
-
-        # Update the system info
-        system_info_dict = get_system_info()
-        run_dict["system_info_id"] = self.__db_reader.get_entry_id(
-            "system_info", system_info_dict
-        )
-        if run_dict["system_info_id"] is None:
-            run_dict["system_info_id"] = self.create_entry(
+            # Update the split
+            split_dict = {
+                "number_of_processors": processor_split.number_of_processors,
+                "number_of_nodes": processor_split.number_of_nodes,
+                "processors_per_node": processor_split.processors_per_node,
+            }
+            run_dict["split_id"] = self.__get_or_create_entry("split", split_dict)
+
+            # Update the system info
+            system_info_dict = get_system_info()
+            run_dict["system_info_id"] = self.__get_or_create_entry(
                 "system_info", system_info_dict
             )
 
-        # Update the run
-        # NOTE: If restart is True, a new run_id will be given as the run_dict["name"]
-        #       will be unique
-        run_id = self.__db_reader.get_entry_id("run", run_dict)
-        if force or run_id is None:
-            run_dict["latest_status"] = "submitted"
-            run_dict["submitted_time"] = datetime.now().isoformat()
-            _ = self.create_entry("run", run_dict)
+            # Update the run
+            # NOTE: If restart is True, a new run_id will be given as the
+            #       run_dict["name"] will be unique
+            run_fingerprint = get_fingerprint(
+                {
+                    column: run_dict[column]
+                    for column in DatabaseCreator.run_identity_columns
+                }
+            )
+            run_id = self.__db_reader.get_entry_id_from_fingerprint(
+                "run", run_fingerprint
+            )
+            self.__latest_run_id = None
+            if force or run_id is None:
+                run_dict["latest_status"] = "submitted"
+                run_dict["submitted_time"] = datetime.now().isoformat()
+                self.__latest_run_id = self.create_entry(
+                    "run", run_dict, run_fingerprint
+                )
 
         return run_id
 
-    def create_entry(
+    def __get_or_create_entry(
         self, table_name: str, entries_dict: Mapping[str, Union[int, str, float, None]]
+    ) -> int:
+        """
+        Return the id of an entry, create the entry if it does not exist.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table
+        entries_dict : dict
+            Dictionary containing the entries as key value pairs
+
+        Returns
+        -------
+        entry_id : int
+            The id of the entry
+        """
+        fingerprint = get_fingerprint(entries_dict)
+        entry_id = self.__db_reader.get_entry_id_from_fingerprint(
+            table_name, fingerprint
+        )
+        if entry_id is None:
+            entry_id = self.create_entry(table_name, entries_dict, fingerprint)
+        return entry_id
+
+    def __get_or_create_entries(
+        self,
+        table_name: str,
+        rows: Sequence[Mapping[str, Union[int, str, float, None]]],
+    ) -> Tuple[int, ...]:
+        """
+        Return the ids of several entries, create the entries which do not exist.
+
+        The entries are looked up by their fingerprints with one query per chunk
+        and the missing entries are inserted with one executemany per set of keys
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table
+        rows : sequence of dict
+            Dictionaries containing the entries as key value pairs
+
+        Returns
+        -------
+        tuple of int
+            The ids of the entries in the order of the rows
+        """
+        fingerprints = [get_fingerprint(row) for row in rows]
+        # NOTE: Identical rows are only looked up and created once
+        unique_rows = dict(zip(fingerprints, rows))
+        unique_fingerprints = tuple(unique_rows.keys())
+        found_ids = self.__db_reader.get_entry_ids(
+            table_name,
+            [{"fingerprint": fingerprint} for fingerprint in unique_fingerprints],
+        )
+        entry_ids = {
+            fingerprint: entry_id
+            for fingerprint, entry_id in zip(unique_fingerprints, found_ids)
+            if entry_id is not None
+        }
+
+        # NOTE: The entries inserted at once must have the same keys
+        missing: Dict[Tuple[str, ...], List[str]] = dict()
+        for fingerprint in unique_fingerprints:
+            if fingerprint not in entry_ids:
+                keys = tuple(unique_rows[fingerprint].keys())
+                missing.setdefault(keys, list()).append(fingerprint)
+        for missing_fingerprints in missing.values():
+            created_ids = self.__db_writer.create_entries(
+                table_name,
+                [
+                    {**unique_rows[fingerprint], "fingerprint": fingerprint}
+                    for fingerprint in missing_fingerprints
+                ],
+            )
+            entry_ids.update(zip(missing_fingerprints, created_ids))
+
+        return tuple(entry_ids[fingerprint] for fingerprint in fingerprints)
+
+    def create_entry(
+        self,
+        table_name: str,
+        entries_dict: Mapping[str, Union[int, str, float, None]],
+        fingerprint: Optional[str] = None,
     ) -> int:
         """
         Create a database entry and return the entry id.
@@ -234,6 +359,9 @@ class MetadataRecorder:
             Name of the table
         entries_dict : dict
             Dictionary containing the entries as key value pairs
+        fingerprint : None or str
+            The fingerprint of the entry
+            If None, the fingerprint is computed from entries_dict
 
         Returns
         -------
@@ -245,8 +373,15 @@ class MetadataRecorder:
         RuntimeError
             If the newly created id could not be fetched
         """
-        self.__db_writer.create_entry(table_name, entries_dict)
-        entry_id = self.__db_reader.get_entry_id(table_name, entries_dict)
+        fingerprint = (
+            fingerprint if fingerprint is not None else get_fingerprint(entries_dict)
+        )
+        self.__db_writer.create_entry(
+            table_name, {**entries_dict, "fingerprint": fingerprint}
+        )
+        entry_id = self.__db_reader.get_entry_id_from_fingerprint(
+            table_name, fingerprint
+        )
         if entry_id is None:
             msg = "Could not fetch the newly created id"
             logging.critical(msg)
@@ -282,17 +417,65 @@ class MetadataRecorder:
             # Replace bad characters for SQL
             section_name = section.replace(":", "_")
             section_parameters = parameters_dict[section]
-            section_id = self.__db_reader.get_entry_id(section_name, section_parameters)
-            if section_id is None:
-                section_id = self.create_entry(section_name, section_parameters)
+            section_id = self.__get_or_create_entry(section_name, section_parameters)
 
             parameters_foreign_keys[f"{section_name}_id"] = section_id
 
         # Update the parameters table
-        parameters_id = self.__db_reader.get_entry_id(
+        parameters_id = self.__get_or_create_entry(
             "parameters", parameters_foreign_keys
         )
-        if parameters_id is None:
-            parameters_id = self.create_entry("parameters", parameters_foreign_keys)
 
         return parameters_id
+
+    def create_parameter_tables_entries(
+        self, parameters_dicts: Sequence[Dict[str, Dict[str, Union[int, str, float]]]]
+    ) -> Tuple[int, ...]:
+        """
+        Insert the parameters of several runs into the parameter tables at once.
+
+        The result is the same as calling _create_parameter_tables_entry for each
+        of the parameter dicts, but every table is only queried and written a
+        few times in one transaction
+
+        Parameters
+        ----------
+        parameters_dicts : sequence of dict
+            The dictionaries on the form
+
+            >>> {'section': {'parameter': 'value'}}
+
+        Returns
+        -------
+        tuple of int
+            The id keys from the `parameters` table in the order of the dicts
+        """
+        parameters_foreign_keys: List[Dict[str, Union[int, str, float, None]]] = [
+            dict() for _ in parameters_dicts
+        ]
+        sections: Dict[str, None] = dict()
+        for parameters_dict in parameters_dicts:
+            sections.update(dict.fromkeys(parameters_dict.keys()))
+
+        with self.__db_writer.db_connector.transaction():
+            for section in sections:
+                # Replace bad characters for SQL
+                section_name = section.replace(":", "_")
+                indices = [
+                    index
+                    for index, parameters_dict in enumerate(parameters_dicts)
+                    if section in parameters_dict
+                ]
+                section_ids = self.__get_or_create_entries(
+                    section_name,
+                    [parameters_dicts[index][section] for index in indices],
+                )
+                for index, section_id in zip(indices, section_ids):
+                    parameters_foreign_keys[index][f"{section_name}_id"] = section_id
+
+            # Update the parameters table
+            parameters_ids = self.__get_or_create_entries(
+                "parameters", parameters_foreign_keys
+            )
+
+        return parameters_ids
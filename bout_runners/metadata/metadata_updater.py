@@ -27,6 +27,12 @@ class MetadataUpdater:
         Update the end time
     update_latest_status(status)
         Update the latest status
+    update_queue_wait_time(queue_wait_time)
+        Update the time the run waited for free processors
+    update_array_task_id(array_task_id)
+        Update the job id of the job array task the run was submitted as
+    update_field(column, value)
+        Update a field with a certain row in the run table
 
     Examples
     --------
@@ -89,7 +95,29 @@ class MetadataUpdater:
         """
         self.update_field("latest_status", status)
 
-    def update_field(self, column: str, value: Union[datetime, str]) -> None:
+    def update_queue_wait_time(self, queue_wait_time: float) -> None:
+        """
+        Update the time the run waited for free processors.
+
+        Parameters
+        ----------
+        queue_wait_time : float
+            Seconds the run waited in the local execution pool before it was started
+        """
+        self.update_field("queue_wait_time", queue_wait_time)
+
+    def update_array_task_id(self, array_task_id: str) -> None:
+        """
+        Update the job id of the job array task the run was submitted as.
+
+        Parameters
+        ----------
+        array_task_id : str
+            The job id of the task in the job array
+        """
+        self.update_field("array_task_id", array_task_id)
+
+    def update_field(self, column: str, value: Union[datetime, str, float]) -> None:
         """
         Update a field with a certain row in the run table.
 
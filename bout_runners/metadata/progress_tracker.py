@@ -0,0 +1,310 @@
+"""Module containing the ProgressTracker class."""
+
+
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from pandas import DataFrame, isna
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.database_writer import DatabaseWriter
+from bout_runners.log.tailing_log_reader import TailingLogReader
+
+
+class ProgressTracker:
+    r"""
+    Class which samples the progress of the running runs into the database.
+
+    Every call to sample reads what has been appended to the logs of the running
+    runs, and stores a row in the progress table for each run with the simulation
+    time reached, the throughput since the previous sample and the expected end
+    time.
+    The expected end time is projected from nout and timestep of the global
+    section of the parameters, if these are recorded.
+    A run which has stalled has a simulated time per second of zero.
+
+    Attributes
+    ----------
+    __db_reader : DatabaseReader
+        Object to read the database with
+    __db_writer : DatabaseWriter
+        Object to write to the database with
+    __log_readers : dict of int, TailingLogReader
+        The log readers of the running runs keyed by the run id
+    __previous : dict of int, tuple
+        The sample time, simulation time and right hand side evaluations of the
+        previous sample of each running run
+    __has_end_sim_time : None or bool
+        Whether nout and timestep are recorded in the database
+    project_path : Path
+        Path to the project
+
+    Methods
+    -------
+    __get_running_runs()
+        Return the running runs and the simulation time they end at
+    __sample_run(run_id, name, end_sim_time, sample_time)
+        Return the progress sample of a run
+    sample()
+        Sample the progress of the running runs
+    get_progress(name)
+        Return the progress samples
+    get_latest_progress()
+        Return the latest progress sample of each run
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from bout_runners.database.database_connector import DatabaseConnector
+    >>> db_connector = DatabaseConnector('name_of_db',
+    ...     Path().joinpath('path', 'to', 'db'))
+    >>> project_path = Path('path').joinpath('to', 'project')
+    >>> progress_tracker = ProgressTracker(db_connector, project_path)
+    >>> progress_tracker.sample()
+    1
+
+    Some time later
+
+    >>> progress_tracker.sample()
+    1
+    >>> progress_tracker.get_latest_progress().loc[
+    ...     :, ['name', 'sim_time', 'sim_time_per_second', 'expected_end_time']]
+        name  sim_time  sim_time_per_second           expected_end_time
+    0  run_1       6.0                 0.25  2020-05-01T17:07:26.000123
+    """
+
+    def __init__(
+        self,
+        db_connector: DatabaseConnector,
+        project_path: Optional[Union[Path, str]] = None,
+    ) -> None:
+        """
+        Set the database and project, and upgrade the schema if needed.
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            Connection to the database
+        project_path : Path
+            Path to the project (the root directory with which usually contains the
+            makefile and the executable)
+        """
+        self.__db_reader = DatabaseReader(db_connector)
+        self.__db_writer = DatabaseWriter(db_connector)
+        self.project_path = Path(project_path) if project_path is not None else Path()
+        self.__log_readers: Dict[int, TailingLogReader] = dict()
+        self.__previous: Dict[int, Tuple[datetime, float, int]] = dict()
+        self.__has_end_sim_time: Optional[bool] = None
+        # NOTE: Schemas created by earlier versions lack the active_runs view
+        db_creator = DatabaseCreator(db_connector)
+        if db_creator.needs_upgrade():
+            db_creator.upgrade_schema()
+        db_creator.create_progress_table()
+
+    def __get_running_runs(self) -> DataFrame:
+        """
+        Return the running runs and the simulation time they end at.
+
+        Returns
+        -------
+        DataFrame
+            The run_id, name and the simulation time the run ends at, where the
+            latter is nout times timestep (None if these are not recorded)
+        """
+        if self.__has_end_sim_time is None:
+            columns = self.__db_reader.query(
+                "SELECT name FROM pragma_table_info('global')"
+            ).loc[:, "name"]
+            parameters_columns = self.__db_reader.query(
+                "SELECT name FROM pragma_table_info('parameters')"
+            ).loc[:, "name"]
+            self.__has_end_sim_time = (
+                "nout" in set(columns)
+                and "timestep" in set(columns)
+                and "global_id" in set(parameters_columns)
+            )
+        if self.__has_end_sim_time:
+            query = (
+                "SELECT active_runs.run_id, active_runs.name,\n"
+                '       "global".nout * "global".timestep AS end_sim_time\n'
+                "FROM active_runs\n"
+                "    INNER JOIN run ON run.id = active_runs.run_id\n"
+                "    INNER JOIN parameters ON parameters.id = run.parameters_id\n"
+                '    INNER JOIN "global" ON "global".id = parameters.global_id\n'
+                "WHERE active_runs.latest_status = 'running'"
+            )
+        else:
+            query = (
+                "SELECT run_id, name, NULL AS end_sim_time FROM active_runs\n"
+                "WHERE latest_status = 'running'"
+            )
+        return self.__db_reader.query(query)
+
+    def __sample_run(
+        self,
+        run_id: int,
+        name: str,
+        end_sim_time: Optional[float],
+        sample_time: datetime,
+    ) -> Optional[Dict[str, Union[int, float, str, None]]]:
+        """
+        Return the progress sample of a run.
+
+        Parameters
+        ----------
+        run_id : int
+            The id of the run
+        name : str
+            The name of the run
+        end_sim_time : None or float
+            The simulation time the run ends at, counted from the first step
+        sample_time : datetime
+            The time of the sample
+
+        Returns
+        -------
+        None or dict
+            The row of the progress table, where the times are given in the ISO
+            format
+            None if no simulation steps have been written
+        """
+        if run_id not in self.__log_readers:
+            self.__log_readers[run_id] = TailingLogReader(
+                self.project_path.joinpath(name, "BOUT.log.0")
+            )
+        else:
+            self.__log_readers[run_id].update()
+        log_reader = self.__log_readers[run_id]
+        sim_time = log_reader.last_sim_time
+        first_sim_time = log_reader.first_sim_time
+        if sim_time is None or first_sim_time is None:
+            return None
+
+        # The throughput is measured since the previous sample, or since the start
+        if run_id in self.__previous:
+            previous_time, previous_sim_time, previous_rhs_evals = self.__previous[
+                run_id
+            ]
+        elif log_reader.start_time is not None:
+            previous_time, previous_sim_time, previous_rhs_evals = (
+                log_reader.start_time,
+                first_sim_time,
+                0,
+            )
+        else:
+            previous_time, previous_sim_time, previous_rhs_evals = (
+                sample_time,
+                sim_time,
+                log_reader.total_rhs_evals,
+            )
+        self.__previous[run_id] = (sample_time, sim_time, log_reader.total_rhs_evals)
+
+        sim_time_per_second = None
+        rhs_evals_per_second = None
+        expected_end_time = None
+        elapsed = (sample_time - previous_time).total_seconds()
+        if elapsed > 0:
+            sim_time_per_second = (sim_time - previous_sim_time) / elapsed
+            rhs_evals_per_second = (
+                log_reader.total_rhs_evals - previous_rhs_evals
+            ) / elapsed
+            if end_sim_time is not None and sim_time_per_second > 0:
+                remaining = first_sim_time + end_sim_time - sim_time
+                try:
+                    expected_end_time = sample_time + timedelta(
+                        seconds=max(remaining, 0) / sim_time_per_second
+                    )
+                except OverflowError:
+                    # The run is too slow to finish within the range of datetime
+                    expected_end_time = None
+        return {
+            "sample_time": sample_time.isoformat(),
+            "sim_time": sim_time,
+            "number_of_steps": log_reader.number_of_steps,
+            "rhs_evals": log_reader.total_rhs_evals,
+            "wall_time": log_reader.total_wall_time,
+            "sim_time_per_second": sim_time_per_second,
+            "rhs_evals_per_second": rhs_evals_per_second,
+            "expected_end_time": None
+            if expected_end_time is None
+            else expected_end_time.isoformat(),
+            "run_id": run_id,
+        }
+
+    def sample(self) -> int:
+        """
+        Sample the progress of the running runs.
+
+        Returns
+        -------
+        int
+            The number of samples stored
+        """
+        running = self.__get_running_runs()
+        sample_time = datetime.now()
+        rows: List[Dict[str, Union[int, float, str, None]]] = list()
+        for run_id, name, end_sim_time in running.itertuples(index=False):
+            row = self.__sample_run(
+                int(run_id),
+                name,
+                None if isna(end_sim_time) else float(end_sim_time),
+                sample_time,
+            )
+            if row is not None:
+                rows.append(row)
+
+        # Forget the runs which are no longer running
+        running_ids = set(int(run_id) for run_id in running.loc[:, "run_id"])
+        for run_id in tuple(self.__log_readers.keys()):
+            if run_id not in running_ids:
+                self.__log_readers.pop(run_id)
+                self.__previous.pop(run_id, None)
+
+        self.__db_writer.create_entries("progress", rows)
+        logging.debug("Sampled the progress of %d runs", len(rows))
+        return len(rows)
+
+    def get_progress(self, name: Optional[str] = None) -> DataFrame:
+        """
+        Return the progress samples.
+
+        Parameters
+        ----------
+        name : None or str
+            Name of the run to return the samples of
+            If None, the samples of all the runs are returned
+
+        Returns
+        -------
+        DataFrame
+            The progress samples and the name of the runs ordered by time
+        """
+        query = (
+            "SELECT run.name, progress.* FROM progress\n"
+            "    INNER JOIN run ON run.id = progress.run_id\n"
+        )
+        if name is None:
+            return self.__db_reader.query(f"{query}ORDER BY progress.id")
+        return self.__db_reader.query(
+            f"{query}WHERE run.name = ?\nORDER BY progress.id", params=(name,)
+        )
+
+    def get_latest_progress(self) -> DataFrame:
+        """
+        Return the latest progress sample of each run.
+
+        Returns
+        -------
+        DataFrame
+            The latest progress sample and the name of each run
+        """
+        return self.__db_reader.query(
+            "SELECT run.name, progress.* FROM progress\n"
+            "    INNER JOIN run ON run.id = progress.run_id\n"
+            "WHERE progress.id IN (SELECT MAX(id) FROM progress GROUP BY run_id)\n"
+            "ORDER BY progress.run_id"
+        )
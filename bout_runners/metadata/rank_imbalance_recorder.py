@@ -0,0 +1,159 @@
+"""Module containing the RankImbalanceRecorder class."""
+
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.database_writer import DatabaseWriter
+from bout_runners.log.rank_log_aggregator import RankLogAggregator
+
+
+class RankImbalanceRecorder:
+    r"""
+    Class which records the load imbalance between the MPI ranks of runs.
+
+    The rank logs of a run are aggregated by a RankLogAggregator, and the summary
+    is stored in the rank_imbalance table
+
+    Attributes
+    ----------
+    __db_reader : DatabaseReader
+        Object to read the database with
+    __db_writer : DatabaseWriter
+        Object to write to the database with
+    project_path : Path
+        Path to the project
+    max_workers : None or int
+        Number of processes aggregating the rank logs of a run
+
+    Methods
+    -------
+    get_column_name(timing_column)
+        Return the name of a timing column in the rank_imbalance table
+    record(run_id, name)
+        Record the load imbalance of a run
+    record_stopped()
+        Record the load imbalance of the stopped runs which are not yet recorded
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from bout_runners.database.database_connector import DatabaseConnector
+    >>> db_connector = DatabaseConnector('name_of_db',
+    ...     Path().joinpath('path', 'to', 'db'))
+    >>> project_path = Path('path').joinpath('to', 'project')
+    >>> recorder = RankImbalanceRecorder(db_connector, project_path)
+    >>> recorder.record_stopped()
+    3
+    """
+
+    def __init__(
+        self,
+        db_connector: DatabaseConnector,
+        project_path: Optional[Union[Path, str]] = None,
+        max_workers: Optional[int] = 1,
+    ) -> None:
+        """
+        Set the database and project, and create the rank_imbalance table if needed.
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            Connection to the database
+        project_path : Path
+            Path to the project (the root directory with which usually contains the
+            makefile and the executable)
+        max_workers : None or int
+            Number of processes aggregating the rank logs of a run
+            If 1, the logs are aggregated in the calling process
+            If None, the number of processors on the machine will be used
+        """
+        self.__db_reader = DatabaseReader(db_connector)
+        self.__db_writer = DatabaseWriter(db_connector)
+        self.project_path = Path(project_path) if project_path is not None else Path()
+        self.max_workers = max_workers
+        DatabaseCreator(db_connector).create_rank_imbalance_table(
+            self.get_column_name(column) for column in RankLogAggregator.timing_columns
+        )
+
+    @staticmethod
+    def get_column_name(timing_column: str) -> str:
+        """
+        Return the name of a timing column in the rank_imbalance table.
+
+        Parameters
+        ----------
+        timing_column : str
+            The name of the column in the step table
+
+        Returns
+        -------
+        str
+            The name in the rank_imbalance table
+
+        Examples
+        --------
+        >>> RankImbalanceRecorder.get_column_name('I/O')
+        'io'
+        """
+        return timing_column.replace("/", "").lower()
+
+    def record(self, run_id: int, name: str) -> Dict[str, Union[int, float, None]]:
+        """
+        Record the load imbalance of a run.
+
+        Parameters
+        ----------
+        run_id : int
+            The id of the run
+        name : str
+            The name of the run
+
+        Returns
+        -------
+        summary : dict
+            The summary as stored in the rank_imbalance table
+        """
+        aggregator = RankLogAggregator(
+            self.project_path.joinpath(name), max_workers=self.max_workers
+        )
+        summary: Dict[str, Union[int, float, None]] = dict()
+        for key, value in aggregator.get_summary().items():
+            for timing_column in RankLogAggregator.timing_columns:
+                if key.startswith(f"{timing_column}_"):
+                    key = key.replace(
+                        timing_column, self.get_column_name(timing_column), 1
+                    )
+                    break
+            summary[key] = value
+        self.__db_writer.create_entry(
+            "rank_imbalance",
+            {"recorded_time": datetime.now().isoformat(), **summary, "run_id": run_id},
+        )
+        logging.debug(
+            "Recorded the imbalance of %d ranks of %s", summary["number_of_ranks"], name
+        )
+        return summary
+
+    def record_stopped(self) -> int:
+        """
+        Record the load imbalance of the stopped runs which are not yet recorded.
+
+        Returns
+        -------
+        int
+            The number of runs recorded
+        """
+        stopped = self.__db_reader.query(
+            "SELECT id, name FROM run\n"
+            "WHERE latest_status IN ('complete', 'error') AND\n"
+            "    id NOT IN (SELECT run_id FROM rank_imbalance)"
+        )
+        for run_id, name in stopped.itertuples(index=False):
+            self.record(int(run_id), name)
+        return len(stopped.index)
@@ -3,17 +3,24 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import psutil
 from pandas import DataFrame
 
 from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
 from bout_runners.database.database_reader import DatabaseReader
 from bout_runners.log.log_reader import LogReader
+from bout_runners.log.tailing_log_reader import TailingLogReader
+from bout_runners.metadata.batched_metadata_updater import BatchedMetadataUpdater
 from bout_runners.metadata.metadata_updater import MetadataUpdater
 
+RunState = Tuple[Optional[datetime], Optional[datetime], str]
+
 
 class StatusChecker:
     r"""
@@ -25,20 +32,38 @@ class StatusChecker:
         Connection to the database under consideration
     __db_reader : DatabaseReader
         Object to read the database with
+    __schema_checked : bool
+        Whether the schema has been checked
+    __log_readers : dict of Path, TailingLogReader
+        The log readers of the active runs, which are reused between the checks
     project_path : Path
         Path to the project
 
     Methods
     -------
-    check_and_update_status()
+    __check_schema()
+        Check that the schema exists and is up to date
+    __get_log_reader(log_path)
+        Return the up to date log reader of a log file
+    __forget_stopped(log_path, latest_status)
+        Drop the log reader of a run which has stopped
+    check_and_update_status(max_workers, names)
         Check and update the status for the schema
-    check_and_update_status_until_complete()
+    check_and_update_status_until_complete(seconds_between_update, max_workers)
         Check and update the status until all runs are stopped
-    __check_submitted(metadata_updater, submitted_to_check)
+    __map(function, names, executor)
+        Call a function for the name of each run, concurrently if possible
+    __inspect_submitted(name)
+        Inspect the log of a run which has status `submitted`
+    __inspect_running(name)
+        Inspect the log of a run which has status `running`
+    __update(metadata_updater, runs_to_check, states)
+        Buffer the inspected states of the runs in the metadata updater
+    __check_submitted(metadata_updater, submitted_to_check, executor)
         Check the status of all runs which has status `submitted`
-    __check_running(metadata_updater, running_to_check)
+    __check_running(metadata_updater, running_to_check, executor)
         Check the status of all runs which has status `running`
-     __check_if_stopped(log_reader, metadata_updater)
+     __check_if_stopped(log_reader)
         Check if a run has stopped
     check_if_running_or_errored(log_reader)
         Check if a run is still running or has errored
@@ -85,16 +110,23 @@ class StatusChecker:
         self.__db_connector = db_connector
         self.__db_reader = DatabaseReader(self.__db_connector)
         self.__project_path = Path(project_path) if project_path is not None else Path()
+        self.__schema_checked = False
+        self.__log_readers: Dict[Path, TailingLogReader] = dict()
 
-    def check_and_update_status(self) -> None:
+    def __check_schema(self) -> None:
         """
-        Check and update the status for the schema.
+        Check that the schema exists, and upgrade it if needed.
+
+        The schema is only checked once per instance, as the status is polled
+        repeatedly
 
         Raises
         ------
         RuntimeError
             If the schema does not exist
         """
+        if self.__schema_checked:
+            return
         # Check that run table exist
         if not self.__db_reader.check_tables_created():
             logging.error(
@@ -104,23 +136,109 @@ class StatusChecker:
             message = "Can not check the status of schemas that does not exist"
             logging.critical(message)
             raise RuntimeError(message)
+        # NOTE: Schemas created by earlier versions lack the active_runs view
+        db_creator = DatabaseCreator(self.__db_connector)
+        if db_creator.needs_upgrade():
+            db_creator.upgrade_schema()
+        self.__schema_checked = True
+
+    def __get_log_reader(self, log_path: Path) -> TailingLogReader:
+        """
+        Return the up to date log reader of a log file.
+
+        The log readers are kept between the checks, so that only the lines
+        appended to the log files since the previous check are read
+
+        Parameters
+        ----------
+        log_path : Path
+            Path to the log file
+
+        Returns
+        -------
+        TailingLogReader
+            The log reader
+        """
+        if log_path in self.__log_readers:
+            self.__log_readers[log_path].update()
+        else:
+            self.__log_readers[log_path] = TailingLogReader(log_path)
+        return self.__log_readers[log_path]
+
+    def __forget_stopped(self, log_path: Path, latest_status: str) -> None:
+        """
+        Drop the log reader of a run which has stopped.
 
-        # Create place holder metadata_updater
-        metadata_updater = MetadataUpdater(self.__db_connector, run_id=-1)
+        Parameters
+        ----------
+        log_path : Path
+            Path to the log file
+        latest_status : str
+            The latest status of the run
+        """
+        if latest_status in ("complete", "error"):
+            self.__log_readers.pop(log_path, None)
+
+    def check_and_update_status(
+        self, max_workers: int = 1, names: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Check and update the status for the schema.
+
+        Only the runs in the active_runs view are checked
+
+        Parameters
+        ----------
+        max_workers : int
+            Number of threads checking the log files of the runs concurrently
+            The database is updated from the calling thread in one transaction,
+            where only the changed values are written
+        names : None or iterable of str
+            The names of the runs to check
+            If None, all the active runs are checked
+
+        Raises
+        ------
+        RuntimeError
+            If the schema does not exist
+        """
+        self.__check_schema()
+
+        # Create place holder metadata_updater, which is flushed after the checks
+        metadata_updater = BatchedMetadataUpdater(self.__db_connector, run_id=-1)
 
         # Check runs with status 'submitted'
         query = (
-            "SELECT name, id AS run_id FROM run WHERE\n"
+            "SELECT name, run_id FROM active_runs WHERE\n"
             "latest_status = 'submitted' OR\n"
             "latest_status = 'created'"
         )
         submitted_to_check = self.__db_reader.query(query)
-        self.__check_submitted(metadata_updater, submitted_to_check)
 
         # Check runs with status 'running'
-        query = 'SELECT name, id FROM run WHERE latest_status = "running"'
+        query = (
+            "SELECT name, run_id AS id FROM active_runs WHERE\n"
+            "latest_status = 'running'"
+        )
         running_to_check = self.__db_reader.query(query)
-        self.__check_running(metadata_updater, running_to_check)
+
+        if names is not None:
+            names = set(names)
+            submitted_to_check = submitted_to_check.loc[
+                submitted_to_check.loc[:, "name"].isin(names), :
+            ]
+            running_to_check = running_to_check.loc[
+                running_to_check.loc[:, "name"].isin(names), :
+            ]
+
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                self.__check_submitted(metadata_updater, submitted_to_check, executor)
+                self.__check_running(metadata_updater, running_to_check, executor)
+        else:
+            self.__check_submitted(metadata_updater, submitted_to_check)
+            self.__check_running(metadata_updater, running_to_check)
+        metadata_updater.flush()
 
     @staticmethod
     def get_query_string_for_non_errored_runs() -> str:
@@ -132,14 +250,11 @@ class StatusChecker:
         str
             Query string for non errored results
         """
-        return (
-            "SELECT name, id AS run_id FROM run WHERE\n"
-            "latest_status = 'submitted' OR\n"
-            "latest_status = 'created' OR\n"
-            "latest_status = 'running'"
-        )
+        return "SELECT name, run_id FROM active_runs"
 
-    def check_and_update_until_complete(self, seconds_between_update: int = 5) -> None:
+    def check_and_update_until_complete(
+        self, seconds_between_update: int = 5, max_workers: int = 1
+    ) -> None:
         """
         Check and update the status until all runs are stopped.
 
@@ -147,68 +262,182 @@ class StatusChecker:
         ----------
         seconds_between_update : int
             Number of seconds before a new status check is performed
+        max_workers : int
+            Number of threads checking the log files of the runs concurrently
         """
+        self.__check_schema()
         query = self.get_query_string_for_non_errored_runs()
         while len(self.__db_reader.query(query).index) != 0:
-            self.check_and_update_status()
+            self.check_and_update_status(max_workers)
             time.sleep(seconds_between_update)
 
-    def __check_submitted(
-        self, metadata_updater: MetadataUpdater, submitted_to_check: DataFrame
-    ) -> None:
+    @staticmethod
+    def __map(
+        function: Callable[[str], RunState],
+        names: Iterable[str],
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> List[RunState]:
         """
-        Check the status of all runs which has status `submitted`.
+        Call a function for the name of each run, concurrently if possible.
 
         Parameters
         ----------
-        metadata_updater : MetadataUpdater
-            Object which updates the database
-        submitted_to_check : DataFrame
-            DataFrame containing the `id` and `name` of the runs with status `submitted`
+        function : function
+            The function checking a run
+        names : iterable of str
+            The names of the runs
+        executor : None or ThreadPoolExecutor
+            The executor to call the function with
+            If None the function is called serially
+
+        Returns
+        -------
+        list of tuple
+            The results of the function in the order of the names
+        """
+        if executor is None:
+            return [function(name) for name in names]
+        return list(executor.map(function, names))
+
+    def __inspect_submitted(self, name: str) -> RunState:
+        """
+        Inspect the log of a run which has status `submitted`.
+
+        Only the log file is read, so that several runs can be inspected
+        concurrently
+
+        Parameters
+        ----------
+        name : str
+            Name of the run
+
+        Returns
+        -------
+        start_time : None or datetime
+            The start time if the run has started
+        end_time : None or datetime
+            The end time if the run has completed
+        latest_status : str
+            The latest status
 
         Raises
         ------
         RuntimeError
             In case log_reader.started() is True and log_reader.start_time is None
         """
-        for name, run_id in submitted_to_check.itertuples(index=False):
-            metadata_updater.run_id = run_id
-
-            log_path = self.__project_path.joinpath(name, "BOUT.log.0")
-
-            if log_path.is_file():
-                log_reader = LogReader(log_path)
-                if log_reader.started():
-                    start_time = log_reader.start_time
-                    # Assert to prevent "Incompatible types in assignment" with Optional
-                    if start_time is None:
-                        msg = (
-                            "log_reader.start_time is None although "
-                            "log_reader.started is True"
-                        )
-                        logging.critical(msg)
-                        raise RuntimeError(msg)
-                    metadata_updater.update_start_time(start_time)
-                    latest_status = self.__check_if_stopped(
-                        log_reader, metadata_updater
+        log_path = self.__project_path.joinpath(name, "BOUT.log.0")
+        start_time = None
+        end_time = None
+
+        if log_path.is_file():
+            log_reader = self.__get_log_reader(log_path)
+            if log_reader.started():
+                start_time = log_reader.start_time
+                # Assert to prevent "Incompatible types in assignment" with Optional
+                if start_time is None:
+                    msg = (
+                        "log_reader.start_time is None although "
+                        "log_reader.started is True"
                     )
+                    logging.critical(msg)
+                    raise RuntimeError(msg)
+                end_time, latest_status = self.__check_if_stopped(log_reader)
 
-                else:
-                    # No started time is found in the log
-                    latest_status = self.check_if_running_or_errored(log_reader)
             else:
-                # No log file exists
-                # NOTE: This means that the execution is either in a
-                #       queue or has failed the submission.
-                #       For now, we still consider this as submitted
-                #       This can maybe be decided by checking either the
-                #       pid or the status from the submitter
-                latest_status = "submitted"
+                # No started time is found in the log
+                latest_status = self.check_if_running_or_errored(log_reader)
+        else:
+            # No log file exists
+            # NOTE: This means that the execution is either in a
+            #       queue or has failed the submission.
+            #       For now, we still consider this as submitted
+            #       This can maybe be decided by checking either the
+            #       pid or the status from the submitter
+            latest_status = "submitted"
+        return start_time, end_time, latest_status
+
+    def __inspect_running(self, name: str) -> RunState:
+        """
+        Inspect the log of a run which has status `running`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the run
 
+        Returns
+        -------
+        start_time : None
+            The start time has already been recorded
+        end_time : None
+            The end time is not recorded for running runs
+        latest_status : str
+            The latest status
+        """
+        log_path = self.__project_path.joinpath(name, "BOUT.log.0")
+        log_reader = self.__get_log_reader(log_path)
+        return None, None, self.check_if_running_or_errored(log_reader)
+
+    def __update(
+        self,
+        metadata_updater: MetadataUpdater,
+        runs_to_check: DataFrame,
+        states: List[RunState],
+    ) -> None:
+        """
+        Buffer the inspected states of the runs in the metadata updater.
+
+        Parameters
+        ----------
+        metadata_updater : MetadataUpdater
+            Object which updates the database
+        runs_to_check : DataFrame
+            DataFrame containing the `name` and `id` of the runs
+        states : list of tuple
+            The start time, end time and latest status of each run
+        """
+        for (name, run_id), (start_time, end_time, latest_status) in zip(
+            runs_to_check.itertuples(index=False), states
+        ):
+            metadata_updater.run_id = run_id
+            if start_time is not None:
+                metadata_updater.update_start_time(start_time)
+            if end_time is not None:
+                metadata_updater.update_stop_time(end_time)
             metadata_updater.update_latest_status(latest_status)
+            self.__forget_stopped(
+                self.__project_path.joinpath(name, "BOUT.log.0"), latest_status
+            )
+
+    def __check_submitted(
+        self,
+        metadata_updater: MetadataUpdater,
+        submitted_to_check: DataFrame,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        """
+        Check the status of all runs which has status `submitted`.
+
+        Parameters
+        ----------
+        metadata_updater : MetadataUpdater
+            Object which updates the database
+        submitted_to_check : DataFrame
+            DataFrame containing the `id` and `name` of the runs with status `submitted`
+        executor : None or ThreadPoolExecutor
+            The executor inspecting the logs concurrently
+            If None the logs are inspected serially
+        """
+        states = self.__map(
+            self.__inspect_submitted, submitted_to_check.loc[:, "name"], executor
+        )
+        self.__update(metadata_updater, submitted_to_check, states)
 
     def __check_running(
-        self, metadata_updater: MetadataUpdater, running_to_check: DataFrame
+        self,
+        metadata_updater: MetadataUpdater,
+        running_to_check: DataFrame,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> None:
         """
         Check the status of all runs which has status `running`.
@@ -219,29 +448,31 @@ class StatusChecker:
             Object which updates the database
         running_to_check : DataFrame
             DataFrame containing the `id` and `name` of the runs with status `running`
+        executor : None or ThreadPoolExecutor
+            The executor inspecting the logs concurrently
+            If None the logs are inspected serially
         """
-        for name, run_id in running_to_check.itertuples(index=False):
-            metadata_updater.run_id = run_id
-            log_path = self.__project_path.joinpath(name, "BOUT.log.0")
-            log_reader = LogReader(log_path)
-            latest_status = self.check_if_running_or_errored(log_reader)
-            metadata_updater.update_latest_status(latest_status)
+        states = self.__map(
+            self.__inspect_running, running_to_check.loc[:, "name"], executor
+        )
+        self.__update(metadata_updater, running_to_check, states)
 
     def __check_if_stopped(
-        self, log_reader: LogReader, metadata_updater: MetadataUpdater
-    ) -> str:
+        self,
+        log_reader: Union[LogReader, TailingLogReader],
+    ) -> Tuple[Optional[datetime], str]:
         """
         Check if a run has stopped.
 
         Parameters
         ----------
-        log_reader : LogReader
+        log_reader : LogReader or TailingLogReader
             The object which reads log files
-        metadata_updater : MetadataUpdater
-            Object which updates the database
 
         Returns
         -------
+        end_time : None or datetime
+            The end time if the run has completed
         latest_status : str
             The latest status
 
@@ -257,20 +488,19 @@ class StatusChecker:
                 msg = "log_reader.end_time is None although log_reader.ended() is True"
                 logging.critical(msg)
                 raise RuntimeError(msg)
-            metadata_updater.update_stop_time(end_time)
-            latest_status = "complete"
-        else:
-            latest_status = self.check_if_running_or_errored(log_reader)
-        return latest_status
+            return end_time, "complete"
+        return None, self.check_if_running_or_errored(log_reader)
 
     @staticmethod
-    def check_if_running_or_errored(log_reader: LogReader) -> str:
+    def check_if_running_or_errored(
+        log_reader: Union[LogReader, TailingLogReader]
+    ) -> str:
         """
         Check if a run is still running or has errored.
 
         Parameters
         ----------
-        log_reader : LogReader
+        log_reader : LogReader or TailingLogReader
             The object which reads log files
 
         Returns
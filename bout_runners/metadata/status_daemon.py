@@ -0,0 +1,555 @@
+"""Module containing the StatusDaemon class."""
+
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from pandas import DataFrame
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.progress_tracker import ProgressTracker
+from bout_runners.metadata.rank_imbalance_recorder import RankImbalanceRecorder
+from bout_runners.metadata.status_checker import StatusChecker
+from bout_runners.metadata.status_watcher import StatusWatcher
+from bout_runners.utils.inotify import Inotify
+
+
+class StatusDaemon:
+    r"""
+    Class which checks and updates the status of runs in a background thread.
+
+    There is one daemon per database and project in a process, obtained through
+    get_daemon.
+    Every user of a daemon should call release when it no longer needs the
+    daemon, and the daemon is only stopped (after a final check) and removed
+    from the process when the last user has released it.
+    The daemon checks the status every seconds_between_update seconds, and as
+    soon as a check is requested, so that the callers never wait for the file
+    and database I/O of the checks unless they ask to.
+    The thread opens its own connection to the database, as sqlite connections
+    can only be used by the thread which created them.
+    If track_progress is True, the progress of the running runs is sampled by a
+    ProgressTracker after every check.
+    If record_imbalance is True, the load imbalance between the MPI ranks of the
+    runs which have stopped is recorded by a RankImbalanceRecorder after every
+    check.
+    If watch_logs is True and inotify is available, the log files of the active
+    runs are watched by a StatusWatcher between the periodic checks, and only
+    the runs whose logs changed are checked as soon as they change, so that the
+    periodic checks are only a fallback for runs which stop without writing to
+    their logs.
+
+    Attributes
+    ----------
+    __daemons : dict
+        The daemons of the process on the form
+
+        >>> {(db_path, project_path): status_daemon}
+
+    __number_of_users : dict
+        The number of users of the daemons on the form
+
+        >>> {status_daemon: number_of_users}
+
+    __lock : threading.Lock
+        Lock protecting the daemons and their number of users
+    __thread : None or threading.Thread
+        The thread checking the status
+    __wake : threading.Event
+        Event which is set when a check is requested
+    __stop : threading.Event
+        Event which is set when the daemon should stop
+    __checked : threading.Condition
+        Condition notified after every check
+    __active_runs : DataFrame
+        Getter variable for active_runs
+    __number_of_started : int
+        The number of checks started
+    __number_of_checks : int
+        Getter variable for number_of_checks
+    __last_error : None or Exception
+        Getter variable for last_error
+    __last_full_check : float
+        The monotonic time of the start of the latest check of all the active runs
+    db_path : Path
+        Path to the database
+    project_path : Path
+        Path to the project
+    seconds_between_update : float
+        Number of seconds between the periodic checks
+    max_workers : int
+        Number of threads checking the log files of the runs concurrently
+    track_progress : bool
+        Whether the progress of the running runs is sampled after every check
+    watch_logs : bool
+        Whether the log files are watched with inotify between the periodic
+        checks
+    use_wal : bool
+        Whether the connection of the thread is opened with the write-ahead log
+    record_imbalance : bool
+        Whether the load imbalance of the stopped runs is recorded after every
+        check
+    watch_slice_seconds : float
+        Number of seconds the log files are watched before the daemon looks for
+        requested checks
+    active_runs : DataFrame
+        The name, run_id and latest_status of the active runs at the latest check
+    number_of_checks : int
+        The number of checks made
+    number_of_users : int
+        The number of users which have obtained the daemon through get_daemon
+        and not released it
+    last_error : None or Exception
+        The error raised by the latest check, if any
+    running : bool
+        Whether the thread is running
+
+    Methods
+    -------
+    get_daemon(db_connector, project_path, seconds_between_update, max_workers,
+    track_progress, record_imbalance)
+        Return the started daemon of a database and project, create it if needed
+    stop_all()
+        Stop all the daemons of the process
+    release()
+        Release the daemon, stop it if no other user needs it
+    __wait(status_watcher)
+        Wait until a check is due, and return the names of the runs to check
+    __record(db_connector, progress_tracker, imbalance_recorder)
+        Sample the progress and record the imbalance of the runs if asked to
+    __run()
+        Check the status until the daemon is stopped
+    start()
+        Start the thread
+    request_check()
+        Request a check without waiting for it
+    check_now(timeout)
+        Request a check and wait until it has been made
+    stop(timeout)
+        Stop the thread after a final check, and remove the daemon from the
+        process
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from bout_runners.database.database_connector import DatabaseConnector
+    >>> db_connector = DatabaseConnector('name_of_db',
+    ...     Path().joinpath('path', 'to', 'db'))
+    >>> project_path = Path('path').joinpath('to', 'project')
+    >>> status_daemon = StatusDaemon.get_daemon(db_connector, project_path)
+    >>> status_daemon.request_check()
+
+    Other tools in the process can read the latest status without any I/O
+
+    >>> status_daemon.active_runs
+       name  run_id latest_status
+    0  run_1       1       running
+
+    The daemon is stopped when all the users have released it
+
+    >>> status_daemon.release()
+    """
+
+    __daemons: Dict[Tuple[Path, Path], "StatusDaemon"] = dict()
+    __number_of_users: Dict["StatusDaemon", int] = dict()
+    __lock = threading.Lock()
+    watch_slice_seconds = 0.1
+
+    def __init__(
+        self,
+        db_path: Path,
+        project_path: Path,
+        seconds_between_update: float = 5,
+        max_workers: int = 1,
+        track_progress: bool = False,
+        watch_logs: bool = True,
+        use_wal: bool = False,
+        record_imbalance: bool = False,
+    ) -> None:
+        """
+        Set the database and project to check.
+
+        Parameters
+        ----------
+        db_path : Path
+            Path to the database
+        project_path : Path
+            Path to the project
+        seconds_between_update : float
+            Number of seconds between the periodic checks
+        max_workers : int
+            Number of threads checking the log files of the runs concurrently
+        track_progress : bool
+            Whether the progress of the running runs is sampled after every check
+        watch_logs : bool
+            Whether the log files are watched with inotify between the periodic
+            checks
+            Ignored if inotify is not available
+        use_wal : bool
+            Whether the connection of the thread is opened with the write-ahead log
+        record_imbalance : bool
+            Whether the load imbalance of the stopped runs is recorded after every
+            check
+        """
+        self.db_path = Path(db_path).absolute()
+        self.project_path = Path(project_path).absolute()
+        self.seconds_between_update = seconds_between_update
+        self.max_workers = max_workers
+        self.track_progress = track_progress
+        self.watch_logs = watch_logs
+        self.use_wal = use_wal
+        self.record_imbalance = record_imbalance
+        self.__thread: Optional[threading.Thread] = None
+        self.__wake = threading.Event()
+        self.__stop = threading.Event()
+        self.__checked = threading.Condition()
+        self.__active_runs = DataFrame(columns=["name", "run_id", "latest_status"])
+        self.__number_of_started = 0
+        self.__number_of_checks = 0
+        self.__last_error: Optional[Exception] = None
+        self.__last_full_check = time.monotonic()
+
+    @classmethod
+    def get_daemon(
+        cls,
+        db_connector: DatabaseConnector,
+        project_path: Path,
+        seconds_between_update: float = 5,
+        max_workers: int = 1,
+        track_progress: bool = False,
+        record_imbalance: bool = False,
+    ) -> "StatusDaemon":
+        """
+        Return the started daemon of a database and project, create it if needed.
+
+        The caller is counted as a user of the daemon until it calls release
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            Connection to the database
+            If the daemon is created, its thread uses the write-ahead log if the
+            connector does
+        project_path : Path
+            Path to the project
+        seconds_between_update : float
+            Number of seconds between the periodic checks
+            Only used if the daemon is created
+        max_workers : int
+            Number of threads checking the log files of the runs concurrently
+            Only used if the daemon is created
+        track_progress : bool
+            Whether the progress of the running runs is sampled after every check
+            If True, the progress will be tracked also by an existing daemon
+        record_imbalance : bool
+            Whether the load imbalance of the stopped runs is recorded after every
+            check
+            If True, the imbalance will be recorded also by an existing daemon
+
+        Returns
+        -------
+        StatusDaemon
+            The running daemon
+        """
+        key = (db_connector.db_path.absolute(), Path(project_path).absolute())
+        with cls.__lock:
+            if key not in cls.__daemons:
+                cls.__daemons[key] = cls(
+                    key[0],
+                    key[1],
+                    seconds_between_update,
+                    max_workers,
+                    use_wal=db_connector.use_wal,
+                )
+            daemon = cls.__daemons[key]
+            daemon.track_progress = daemon.track_progress or track_progress
+            daemon.record_imbalance = daemon.record_imbalance or record_imbalance
+            cls.__number_of_users[daemon] = cls.__number_of_users.get(daemon, 0) + 1
+        if not daemon.running:
+            daemon.start()
+        return daemon
+
+    @classmethod
+    def stop_all(cls) -> None:
+        """Stop all the daemons of the process."""
+        with cls.__lock:
+            daemons = tuple(cls.__daemons.values())
+        for daemon in daemons:
+            daemon.stop()
+
+    def release(self) -> None:
+        """Release the daemon, stop it if no other user needs it."""
+        with StatusDaemon.__lock:
+            number_of_users = StatusDaemon.__number_of_users.get(self, 0) - 1
+            if number_of_users > 0:
+                StatusDaemon.__number_of_users[self] = number_of_users
+            else:
+                StatusDaemon.__number_of_users.pop(self, None)
+            last_user = number_of_users <= 0
+        if last_user:
+            self.stop()
+
+    @property
+    def active_runs(self) -> DataFrame:
+        """
+        Return the active runs at the latest check.
+
+        Returns
+        -------
+        DataFrame
+            The name, run_id and latest_status of the active runs
+        """
+        return self.__active_runs.copy()
+
+    @property
+    def number_of_checks(self) -> int:
+        """
+        Return the number of checks made.
+
+        Returns
+        -------
+        int
+            The number of checks
+        """
+        return self.__number_of_checks
+
+    @property
+    def number_of_users(self) -> int:
+        """
+        Return the number of users of the daemon.
+
+        Returns
+        -------
+        int
+            The number of users which have not released the daemon
+        """
+        return StatusDaemon.__number_of_users.get(self, 0)
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """
+        Return the error raised by the latest check.
+
+        Returns
+        -------
+        None or Exception
+            The error, None if the latest check succeeded
+        """
+        return self.__last_error
+
+    @property
+    def running(self) -> bool:
+        """
+        Return whether the thread is running.
+
+        Returns
+        -------
+        bool
+            True if the thread is alive
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def __wait(self, status_watcher: Optional[StatusWatcher]) -> Optional[Set[str]]:
+        """
+        Wait until a check is due, and return the names of the runs to check.
+
+        A check is due when it is requested, when seconds_between_update have
+        passed since the latest check of all the active runs, or when the logs of
+        some runs changed
+        All the active runs are checked when the period has passed, also when the
+        logs keep changing, so that runs which stop without writing to their logs
+        are found
+
+        Parameters
+        ----------
+        status_watcher : None or StatusWatcher
+            The watcher of the log files
+            If None, the daemon waits for a request or for the period to pass
+
+        Returns
+        -------
+        None or set of str
+            The names of the runs whose logs changed
+            None if all the active runs should be checked
+        """
+        if status_watcher is None:
+            self.__wake.wait(self.seconds_between_update)
+            return None
+        deadline = self.__last_full_check + self.seconds_between_update
+        while not self.__wake.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # NOTE: The logs are watched in slices, so that requested checks are
+            #       not delayed until the period has passed
+            changed = status_watcher.read_changed_runs(
+                min(remaining, self.watch_slice_seconds)
+            )
+            if len(changed) != 0 and not self.__wake.is_set():
+                return changed
+        return None
+
+    def __record(
+        self,
+        db_connector: DatabaseConnector,
+        progress_tracker: Optional[ProgressTracker],
+        imbalance_recorder: Optional[RankImbalanceRecorder],
+    ) -> Tuple[Optional[ProgressTracker], Optional[RankImbalanceRecorder]]:
+        """
+        Sample the progress and record the imbalance of the runs if asked to.
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            The connection of the thread to the database
+        progress_tracker : None or ProgressTracker
+            The progress tracker of the thread, if created
+        imbalance_recorder : None or RankImbalanceRecorder
+            The imbalance recorder of the thread, if created
+
+        Returns
+        -------
+        progress_tracker : None or ProgressTracker
+            The progress tracker of the thread, created on first use
+        imbalance_recorder : None or RankImbalanceRecorder
+            The imbalance recorder of the thread, created on first use
+        """
+        if self.track_progress:
+            if progress_tracker is None:
+                progress_tracker = ProgressTracker(db_connector, self.project_path)
+            progress_tracker.sample()
+        if self.record_imbalance:
+            if imbalance_recorder is None:
+                imbalance_recorder = RankImbalanceRecorder(
+                    db_connector, self.project_path
+                )
+            imbalance_recorder.record_stopped()
+        return progress_tracker, imbalance_recorder
+
+    def __run(self) -> None:
+        """Check the status until the daemon is stopped."""
+        # NOTE: The connector and checker are created and deleted in this thread
+        #       as the connection can only be used by the thread which created it
+        db_connector = DatabaseConnector(
+            self.db_path.stem, self.db_path.parent, use_wal=self.use_wal
+        )
+        db_reader = DatabaseReader(db_connector)
+        status_checker = StatusChecker(db_connector, self.project_path)
+        progress_tracker: Optional[ProgressTracker] = None
+        imbalance_recorder: Optional[RankImbalanceRecorder] = None
+        status_watcher: Optional[StatusWatcher] = None
+        stopping = False
+        while not stopping:
+            names = self.__wait(status_watcher)
+            self.__wake.clear()
+            # NOTE: A final check is made after the daemon has been stopped
+            stopping = self.__stop.is_set()
+            if stopping or names is None:
+                self.__last_full_check = time.monotonic()
+            with self.__checked:
+                self.__number_of_started += 1
+            try:
+                status_checker.check_and_update_status(
+                    self.max_workers, None if stopping else names
+                )
+                # NOTE: The watcher is created after the first check, which
+                #       ensures that the schema exists
+                if status_watcher is None and self.watch_logs and Inotify.available():
+                    status_watcher = StatusWatcher(
+                        db_connector, self.project_path, status_checker
+                    )
+                if status_watcher is not None:
+                    status_watcher.watch_active_runs()
+                progress_tracker, imbalance_recorder = self.__record(
+                    db_connector, progress_tracker, imbalance_recorder
+                )
+                self.__active_runs = db_reader.query(
+                    "SELECT name, run_id, latest_status FROM active_runs"
+                )
+                self.__last_error = None
+            # NOTE: The daemon keeps running, the error is raised by check_now
+            except Exception as error:  # pylint: disable=broad-except
+                logging.error("The status check of %s failed: %s", self.db_path, error)
+                # NOTE: The traceback would keep the connector of this thread alive
+                self.__last_error = error.with_traceback(None)
+            with self.__checked:
+                self.__number_of_checks += 1
+                self.__checked.notify_all()
+        if status_watcher is not None:
+            status_watcher.close()
+
+    def start(self) -> None:
+        """Start the thread."""
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__run,
+            name=f"StatusDaemon({self.db_path.name})",
+            daemon=True,
+        )
+        self.__thread.start()
+        logging.debug("Started the status daemon of %s", self.db_path)
+
+    def request_check(self) -> None:
+        """Request a check without waiting for it."""
+        self.__wake.set()
+
+    def check_now(self, timeout: Optional[float] = None) -> None:
+        """
+        Request a check and wait until it has been made.
+
+        Parameters
+        ----------
+        timeout : None or float
+            Maximum number of seconds to wait
+            If None, wait until the check has been made
+
+        Raises
+        ------
+        RuntimeError
+            If the daemon is not running
+        Exception
+            Any error raised by the check
+        """
+        if not self.running:
+            msg = f"The status daemon of {self.db_path} is not running"
+            logging.critical(msg)
+            raise RuntimeError(msg)
+        with self.__checked:
+            # NOTE: A check which has already started may have missed the latest
+            #       changes, so we wait for the first check started after the
+            #       request
+            target = self.__number_of_started + 1
+            self.__wake.set()
+            self.__checked.wait_for(
+                lambda: self.__number_of_checks >= target or not self.running,
+                timeout,
+            )
+        if self.__last_error is not None:
+            raise self.__last_error
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the thread after a final check and remove the daemon from the process.
+
+        Parameters
+        ----------
+        timeout : None or float
+            Maximum number of seconds to wait for the thread
+        """
+        # NOTE: The daemon is removed first, so that get_daemon creates a new
+        #       daemon rather than returning one which is stopping
+        with StatusDaemon.__lock:
+            key = (self.db_path, self.project_path)
+            if StatusDaemon.__daemons.get(key, None) is self:
+                StatusDaemon.__daemons.pop(key)
+            StatusDaemon.__number_of_users.pop(self, None)
+        if self.__thread is not None:
+            self.__stop.set()
+            self.__wake.set()
+            self.__thread.join(timeout)
+            self.__thread = None
+            logging.debug("Stopped the status daemon of %s", self.db_path)
@@ -0,0 +1,264 @@
+"""Module containing the StatusWatcher class."""
+
+
+import logging
+import time
+from pathlib import Path
+from typing import List, Optional, Set, Tuple, Union
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.status_checker import StatusChecker
+from bout_runners.utils.inotify import Inotify
+
+
+class StatusWatcher:
+    r"""
+    Class to update the status of runs as soon as their log files change.
+
+    The project directory and the directories of the active runs are watched
+    with inotify, and the status of a run is checked as soon as its log file is
+    created or appended to.
+    As a run appends to its log in bursts, the events are collected until the
+    logs have been quiet for debounce_seconds (at most max_debounce_seconds),
+    and only the runs whose directories changed are checked.
+    As a crashing run does not necessarily write to its log, the status of all
+    the runs is also checked when seconds_between_update have passed since the
+    previous check of all the runs, even if other runs keep writing to their logs.
+    On machines without inotify the status is polled by the StatusChecker.
+    The StatusDaemon uses a StatusWatcher between its periodic checks when
+    inotify is available.
+
+    Attributes
+    ----------
+    __db_reader : DatabaseReader
+        Object to read the database with
+    __inotify : None or Inotify
+        The inotify watcher, None if inotify is not available
+    status_checker : StatusChecker
+        The object which checks and updates the status
+    project_path : Path
+        Path to the project
+    log_prefix : str
+        The prefix of the file names which triggers a status check
+    debounce_seconds : float
+        Number of seconds the logs must be quiet before the changed runs are
+        checked
+    max_debounce_seconds : float
+        Maximum number of seconds to collect events before the changed runs are
+        checked
+    watching : bool
+        Whether the log files are watched with inotify
+
+    Methods
+    -------
+    watch_active_runs()
+        Watch the directories of the active runs and return their names
+    __get_changed_runs(events)
+        Return the names of the runs whose directories changed
+    read_changed_runs(timeout)
+        Return the names of the runs which changed within the timeout
+    check_and_update_until_complete(seconds_between_update)
+        Check and update the status until all runs are stopped
+    close()
+        Stop watching
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> from bout_runners.database.database_connector import \
+    ...     DatabaseConnector
+    >>> db_connector = DatabaseConnector('name_of_db',
+    ...     Path().joinpath('path', 'to', 'db'))
+    >>> project_path = Path('path').joinpath('to', 'project')
+    >>> status_watcher = StatusWatcher(db_connector, project_path)
+    >>> status_watcher.check_and_update_until_complete()
+    """
+
+    log_prefix = "BOUT.log"
+    debounce_seconds = 0.1
+    max_debounce_seconds = 1.0
+
+    def __init__(
+        self,
+        db_connector: DatabaseConnector,
+        project_path: Optional[Union[Path, str]] = None,
+        status_checker: Optional[StatusChecker] = None,
+    ) -> None:
+        """
+        Set the status checker and start watching if inotify is available.
+
+        Parameters
+        ----------
+        db_connector : DatabaseConnector
+            Connection to the database
+        project_path : Path
+            Path to the project (the root directory with which usually contains the
+            makefile and the executable)
+        status_checker : None or StatusChecker
+            The object which checks and updates the status
+            If None, a StatusChecker will be created
+        """
+        self.project_path = (
+            Path(project_path).absolute() if project_path is not None else Path.cwd()
+        )
+        self.status_checker = (
+            status_checker
+            if status_checker is not None
+            else StatusChecker(db_connector, self.project_path)
+        )
+        self.__db_reader = DatabaseReader(db_connector)
+        self.__inotify: Optional[Inotify] = None
+        if Inotify.available():
+            self.__inotify = Inotify()
+        else:
+            logging.info("inotify is not available, the status will be polled")
+
+    @property
+    def watching(self) -> bool:
+        """
+        Return whether the log files are watched with inotify.
+
+        Returns
+        -------
+        bool
+            True if inotify is used
+        """
+        return self.__inotify is not None
+
+    def watch_active_runs(self) -> Set[str]:
+        """
+        Watch the directories of the active runs and return their names.
+
+        The project directory is watched as well, so that the creation of a run
+        directory is noticed
+
+        Returns
+        -------
+        active_names : set of str
+            The names of the active runs
+
+        Raises
+        ------
+        RuntimeError
+            If inotify is not available
+        """
+        if self.__inotify is None:
+            msg = "The log files can not be watched without inotify"
+            logging.critical(msg)
+            raise RuntimeError(msg)
+        active_names = set(
+            self.__db_reader.query(
+                StatusChecker.get_query_string_for_non_errored_runs()
+            ).loc[:, "name"]
+        )
+        self.__inotify.add_watch(self.project_path)
+        for name in active_names:
+            run_path = self.project_path.joinpath(name)
+            if run_path.is_dir():
+                self.__inotify.add_watch(run_path)
+        for path in self.__inotify.watched_paths:
+            if path != self.project_path and path.name not in active_names:
+                self.__inotify.remove_watch(path)
+        return active_names
+
+    def __get_changed_runs(self, events: List[Tuple[Path, str, int]]) -> Set[str]:
+        """
+        Return the names of the runs whose directories changed.
+
+        Parameters
+        ----------
+        events : list of tuple
+            The events as returned from Inotify.read_events
+
+        Returns
+        -------
+        changed : set of str
+            The names of the runs whose log file changed, and of the run
+            directories created in the project directory
+        """
+        changed: Set[str] = set()
+        for path, name, _ in events:
+            if path == self.project_path:
+                if self.project_path.joinpath(name).is_dir():
+                    changed.add(name)
+            elif name.startswith(self.log_prefix):
+                changed.add(path.name)
+        return changed
+
+    def read_changed_runs(self, timeout: float) -> Set[str]:
+        """
+        Return the names of the runs which changed within the timeout.
+
+        The call returns as soon as the logs have been quiet for debounce_seconds
+        after a change, or after max_debounce_seconds of changes
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait for a change
+
+        Returns
+        -------
+        changed : set of str
+            The names of the runs which changed
+            The set is empty if nothing changed within the timeout
+
+        Raises
+        ------
+        RuntimeError
+            If inotify is not available
+        """
+        if self.__inotify is None:
+            msg = "The log files can not be watched without inotify"
+            logging.critical(msg)
+            raise RuntimeError(msg)
+        events = self.__inotify.read_events(timeout=timeout)
+        changed = self.__get_changed_runs(events)
+        deadline = time.monotonic() + self.max_debounce_seconds
+        while len(events) != 0 and time.monotonic() < deadline:
+            events = self.__inotify.read_events(
+                timeout=min(self.debounce_seconds, deadline - time.monotonic())
+            )
+            changed.update(self.__get_changed_runs(events))
+        return changed
+
+    def check_and_update_until_complete(self, seconds_between_update: int = 5) -> None:
+        """
+        Check and update the status until all runs are stopped.
+
+        Parameters
+        ----------
+        seconds_between_update : int
+            Maximum number of seconds between the status checks
+            If inotify is not available, this is the polling interval
+        """
+        if self.__inotify is None:
+            self.status_checker.check_and_update_until_complete(seconds_between_update)
+            return
+
+        logging.info("Start: Watching the status of the runs in %s", self.project_path)
+        # NOTE: The first check also upgrades schemas lacking the active_runs view
+        self.status_checker.check_and_update_status()
+        last_full_check = time.monotonic()
+        while len(self.watch_active_runs()) != 0:
+            changed = self.read_changed_runs(
+                max(seconds_between_update - (time.monotonic() - last_full_check), 0)
+            )
+            # NOTE: All the runs are checked when the period has passed, also when
+            #       other runs keep writing to their logs, so that runs which
+            #       stopped without writing to their log are found
+            if (
+                len(changed) == 0
+                or time.monotonic() - last_full_check >= seconds_between_update
+            ):
+                self.status_checker.check_and_update_status()
+                last_full_check = time.monotonic()
+            else:
+                self.status_checker.check_and_update_status(names=changed)
+        logging.info("Done: Watching the status of the runs in %s", self.project_path)
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self.__inotify is not None:
+            self.__inotify.close()
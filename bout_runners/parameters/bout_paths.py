@@ -5,7 +5,7 @@ import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from bout_runners.utils.file_operations import get_caller_dir
 
@@ -22,17 +22,29 @@ class BoutPaths:
         Getter and setter variable for bout_inp_src_dir
     __bout_inp_dst_dir : None or Path
         Getter and setter variable for bout_inp_dst_dir
+    __lazy : bool
+        Getter variable for lazy
+    __materialized : bool
+        Getter and setter variable for materialized
     project_path : Path
         The root path of the project
     bout_inp_src_dir : Path
         The path to the BOUT.inp source directory
     bout_inp_dst_dir : Path
         The path to the BOUT.inp destination directory
+    lazy : bool
+        Whether the destination directory is only made on materialization
+    materialized : bool
+        Whether the destination directory and BOUT.inp reflect the paths
 
     Methods
     -------
     _copy_files()
         Copy BOUT.inp from bout_inp_src_dir to bout_inp_dst_dir
+    materialize()
+        Make the destination directory and copy BOUT.inp if not already done
+    materialize_many(bout_paths_iterable)
+        Materialize several BoutPaths objects in one pass
 
     Examples
     --------
@@ -48,6 +60,15 @@ class BoutPaths:
 
     >>> bout_paths.bout_inp_dst_dir = 'foo'
     Path(/root/BOUT-dev/examples/conduction/foo)
+
+    In the lazy mode the paths are only computed, and the filesystem is first
+    touched on materialization
+
+    >>> bout_paths = BoutPaths(bout_inp_dst_dir='bar', lazy=True)
+    >>> bout_paths.materialized
+    False
+    >>> BoutPaths.materialize_many((bout_paths,))
+    1
     """
 
     def __init__(
@@ -55,6 +76,7 @@ class BoutPaths:
         project_path: Optional[Union[Path, str]] = None,
         bout_inp_src_dir: Optional[Union[Path, str]] = None,
         bout_inp_dst_dir: Optional[Union[Path, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Set the paths.
@@ -71,6 +93,11 @@ class BoutPaths:
             The path to the BOUT.inp bout_inp_dst_dir directory (relative to
             self.project_path)
             If None, the current time will be used
+        lazy : bool
+            If True, the destination directory is not made and BOUT.inp is not
+            copied before materialize or materialize_many is called, so that
+            changing the paths does not touch the filesystem
+            If False, this is done whenever the paths are set
         """
         logging.info("Start: Making a BoutPahts object")
         # Declare variables to be used in the getters and setters
@@ -79,6 +106,8 @@ class BoutPaths:
         self.__project_path: Path = Path()
         self.__bout_inp_src_dir: Path = Path()
         self.__bout_inp_dst_dir: Path = Path()
+        self.__lazy = lazy
+        self.__materialized = False
 
         # NOTE: type: ignore due to https://github.com/python/mypy/issues/3004
         # Set the project path
@@ -155,7 +184,10 @@ class BoutPaths:
 
         # Copy file to bout_inp_dst_dir if set
         if self.bout_inp_dst_dir != Path():
-            self._copy_files()
+            self.__materialized = False
+            if not self.__lazy:
+                self._copy_files()
+                self.__materialized = True
 
     @property
     def bout_inp_dst_dir(self) -> Path:
@@ -185,10 +217,47 @@ class BoutPaths:
         )
 
         self.__bout_inp_dst_dir = self.project_path.joinpath(bout_inp_dst_dir)
-        self.__bout_inp_dst_dir.mkdir(exist_ok=True, parents=True)
         logging.debug("self.bout_inp_dst_dir set to %s", self.__bout_inp_dst_dir)
 
-        self._copy_files()
+        self.__materialized = False
+        if not self.__lazy:
+            self.materialize()
+
+    @property
+    def lazy(self) -> bool:
+        """
+        Return whether the destination directory is only made on materialization.
+
+        Returns
+        -------
+        self.__lazy : bool
+            Whether the paths are lazy
+
+        Notes
+        -----
+        The lazy is read only
+        """
+        return self.__lazy
+
+    @property
+    def materialized(self) -> bool:
+        """
+        Return whether the destination directory and BOUT.inp reflect the paths.
+
+        Returns
+        -------
+        self.__materialized : bool
+            Whether the paths are materialized
+
+        Notes
+        -----
+        The setter only records the state, the filesystem is not touched
+        """
+        return self.__materialized
+
+    @materialized.setter
+    def materialized(self, materialized: bool) -> None:
+        self.__materialized = materialized
 
     def _copy_files(self) -> None:
         """Copy BOUT.inp from bout_inp_src_dir to bout_inp_dst_dir."""
@@ -197,3 +266,65 @@ class BoutPaths:
             dst = self.bout_inp_dst_dir.joinpath(src.name)
             shutil.copy(src, dst)
             logging.debug("Copied %s to %s", src, dst)
+
+    def materialize(self) -> None:
+        """Make the destination directory and copy BOUT.inp if not already done."""
+        if self.__materialized:
+            return
+        self.__bout_inp_dst_dir.mkdir(exist_ok=True, parents=True)
+        self._copy_files()
+        self.__materialized = True
+
+    @classmethod
+    def materialize_many(cls, bout_paths_iterable: Iterable["BoutPaths"]) -> int:
+        """
+        Materialize several BoutPaths objects in one pass.
+
+        The result is the same as calling materialize on each of the objects,
+        but the parents of the destination directories are made once, and each
+        BOUT.inp source file is read once
+
+        Parameters
+        ----------
+        bout_paths_iterable : iterable of BoutPaths
+            The objects to materialize
+
+        Returns
+        -------
+        int
+            The number of objects which were materialized by the call
+        """
+        # NOTE: Several objects may share the same destination directory (for
+        #       example the copies made by BoutRunExecutor)
+        pending: Dict[Path, List["BoutPaths"]] = dict()
+        for bout_paths in bout_paths_iterable:
+            if not bout_paths.materialized:
+                pending.setdefault(bout_paths.bout_inp_dst_dir, list()).append(
+                    bout_paths
+                )
+        if len(pending) == 0:
+            return 0
+
+        logging.info("Start: Materializing %d destination directories", len(pending))
+        for parent in {bout_inp_dst_dir.parent for bout_inp_dst_dir in pending}:
+            parent.mkdir(exist_ok=True, parents=True)
+
+        bout_inp_contents: Dict[Path, bytes] = dict()
+        number_of_materialized = 0
+        for bout_inp_dst_dir, bout_paths_list in pending.items():
+            bout_inp_dst_dir.mkdir(exist_ok=True)
+            copied = set()
+            for bout_paths in bout_paths_list:
+                src_dir = bout_paths.bout_inp_src_dir
+                if src_dir != bout_inp_dst_dir and src_dir not in copied:
+                    src = src_dir.joinpath("BOUT.inp")
+                    if src not in bout_inp_contents:
+                        bout_inp_contents[src] = src.read_bytes()
+                    bout_inp_dst_dir.joinpath(src.name).write_bytes(
+                        bout_inp_contents[src]
+                    )
+                    copied.add(src_dir)
+                bout_paths.materialized = True
+                number_of_materialized += 1
+        logging.info("Done: Materializing %d destination directories", len(pending))
+        return number_of_materialized
@@ -10,6 +10,7 @@ from bout_runners.parameters.bout_paths import BoutPaths
 from bout_runners.parameters.final_parameters import FinalParameters
 from bout_runners.runner.bout_run_executor import BoutRunExecutor
 from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.utils.paths import get_use_wal
 
 
 class BoutRunSetup:
@@ -63,6 +64,7 @@ class BoutRunSetup:
         executor: Optional[BoutRunExecutor] = None,
         db_connector: Optional[DatabaseConnector] = None,
         final_parameters: Optional[FinalParameters] = None,
+        check_schema: bool = True,
     ) -> None:
         """
         Set the member data.
@@ -76,10 +78,16 @@ class BoutRunSetup:
             If None, default parameters will be used
         db_connector : DatabaseConnector or None
             The connection to the database
-            If None: Default database connector will be used
+            If None: Default database connector will be used, which uses the
+            write-ahead log if use_wal is set in the database section of
+            bout_runners.ini
         final_parameters : FinalParameters or None
             The object containing the parameters which are going to be used in the run
             If None, default parameters will be used
+        check_schema : bool
+            Whether to create or upgrade the schema of the database
+            Can be set to False when the schema has already been checked by another
+            BoutRunSetup connected to the same database
         """
         # Set member data
         # NOTE: We are not setting the default as a keyword argument
@@ -95,19 +103,28 @@ class BoutRunSetup:
             else DatabaseConnector(
                 name=self.__executor.exec_name,
                 db_root_path=self.__executor.bout_paths.project_path,
+                use_wal=get_use_wal(),
             )
         )
         self.__db_creator = DatabaseCreator(self.db_connector)
         self.__metadata_recorder = MetadataRecorder(
-            self.__db_connector, self.executor.bout_paths, self.final_parameters
+            self.__db_connector,
+            self.executor.bout_paths,
+            self.final_parameters,
+            self.executor.make,
         )
 
-        if not self.__metadata_recorder.db_reader.check_tables_created():
+        if not check_schema:
+            logging.debug("Skipping the schema check")
+        elif not self.__metadata_recorder.db_reader.check_tables_created():
             logging.info(
                 "Creating schema as no tables were found in " "%s",
                 self.__metadata_recorder.db_reader.db_connector.db_path,
             )
             self.__create_schema()
+        elif self.__db_creator.needs_upgrade():
+            # NOTE: The schema is migrated once, as its version is recorded
+            self.__db_creator.upgrade_schema()
         logging.info("Done: Making a BoutRunSetup object")
 
     @property
@@ -5,13 +5,16 @@ import ast
 import configparser
 import logging
 import re
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from bout_runners.parameters.bout_paths import BoutPaths
 from bout_runners.parameters.run_parameters import RunParameters
+from bout_runners.parameters.settings_cache import SettingsCache
 from bout_runners.runner.bout_run_executor import BoutRunExecutor
 from bout_runners.submitter.local_submitter import LocalSubmitter
+from bout_runners.utils.file_operations import get_caller_dir
 
 
 class DefaultParameters:
@@ -23,6 +26,13 @@ class DefaultParameters:
 
     Attributes
     ----------
+    __parsed : dict
+        The parsed settings files shared by all instances on the form
+
+        >>> {'path/to/BOUT.settings': ((st_mtime_ns, st_size), parsed_dict)}
+
+    __parsed_lock : threading.Lock
+        Lock guarding __parsed
     self.__bout_paths : BoutPaths
         Object for the BOUT++ paths
     self.__settings_path : None or Path
@@ -30,10 +40,14 @@ class DefaultParameters:
 
     Methods
     -------
+    get_settings_cache()
+        Return the settings cache of the project
     run_parameters_run()
         Execute a run to obtain the default parameters.
     get_default_parameters()
         Return the default parameters from the settings file.
+    parse_settings_file(settings_path)
+        Return the parameters parsed from a settings file
 
     Examples
     --------
@@ -68,16 +82,26 @@ class DefaultParameters:
     {'global': {'append': False, 'async_send': False, ...}}
     """
 
+    __parsed: Dict[
+        str,
+        Tuple[Tuple[int, int], Dict[str, Dict[str, Union[str, int, float, bool]]]],
+    ] = dict()
+    __parsed_lock = threading.Lock()
+
     def __init__(
         self,
         bout_paths: Optional[BoutPaths] = None,
         settings_path: Optional[Path] = None,
+        use_settings_cache: bool = True,
     ) -> None:
         """
         Set the member data.
 
         If the settings_path is None, the constructor will call run_parameters_run to
-        create a settings_path
+        create a settings_path.
+        Unless use_settings_cache is False, the settings run is only executed if
+        the settings of the current BOUT.inp and executable are not found in the
+        settings cache of the project
 
         Warnings
         --------
@@ -96,19 +120,44 @@ class DefaultParameters:
         settings_path : None or Path
             Path to the up-to-date `settings_path`
             Will invoke `run_parameters_run` if set to None
+        use_settings_cache : bool
+            Whether to look up and store the settings in the settings cache of the
+            project when `settings_path` is not valid
         """
         logging.info("Start: Making a DefaultParameters object")
         self.__bout_paths = bout_paths
         self.__settings_path = Path() if settings_path is None else Path(settings_path)
 
         if not self.__settings_path.is_file():
-            logging.info(
-                "Running parameter run as the parameters of the project are unknown"
-            )
-            self.run_parameters_run(self.__bout_paths)
+            if use_settings_cache:
+                self.__settings_path = self.get_settings_cache().get_settings_path(
+                    lambda: self.run_parameters_run(self.__bout_paths)
+                )
+            else:
+                logging.info(
+                    "Running parameter run as the parameters of the project are "
+                    "unknown"
+                )
+                self.run_parameters_run(self.__bout_paths)
         logging.info("Done: Making a DefaultParameters object")
 
-    def run_parameters_run(self, bout_paths: Optional[BoutPaths]) -> None:
+    def get_settings_cache(self) -> SettingsCache:
+        """
+        Return the settings cache of the project.
+
+        Returns
+        -------
+        SettingsCache
+            The cache of the project given by the BoutPaths object, or of the
+            caller directory if no BoutPaths object was given
+        """
+        if self.__bout_paths is None:
+            return SettingsCache(get_caller_dir())
+        return SettingsCache(
+            self.__bout_paths.project_path, self.__bout_paths.bout_inp_src_dir
+        )
+
+    def run_parameters_run(self, bout_paths: Optional[BoutPaths]) -> Path:
         """
         Execute a run to obtain the default parameters.
 
@@ -119,6 +168,11 @@ class DefaultParameters:
         ----------
         bout_paths : BoutPaths
             Object containing the paths of the project
+
+        Returns
+        -------
+        Path
+            Path to the created BOUT.settings
         """
         if bout_paths is None:
             bout_paths = BoutPaths(bout_inp_dst_dir="settings_run")
@@ -138,6 +192,7 @@ class DefaultParameters:
         executor.submitter.wait_until_completed()
 
         self.__settings_path = bout_paths.bout_inp_dst_dir.joinpath("BOUT.settings")
+        return self.__settings_path
 
     @staticmethod
     def get_test_executor(bout_paths: BoutPaths) -> BoutRunExecutor:
@@ -185,10 +240,48 @@ class DefaultParameters:
            renamed `all_boundaries` as `all` is a protected SQL keyword
         4. The section `run` will be dropped due to bout_runners own `run` table
         5. The string values will be stored using lowercase
+
+        The settings file is only parsed if it has changed since it was last
+        parsed by this process.
+        Every call returns a new copy of the dictionaries, so that the caller can
+        modify them without corrupting the parsed settings of the other callers
+        """
+        stat = self.__settings_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        path_str = str(self.__settings_path.absolute())
+        with self.__parsed_lock:
+            parsed = self.__parsed.get(path_str)
+        if parsed is None or parsed[0] != stamp:
+            logging.debug("Parsing %s", self.__settings_path)
+            parsed = (stamp, self.parse_settings_file(self.__settings_path))
+            with self.__parsed_lock:
+                self.__parsed[path_str] = parsed
+
+        # NOTE: The values are immutable, so copying the dictionaries suffices
+        return {section: dict(parameters) for section, parameters in parsed[1].items()}
+
+    @staticmethod
+    def parse_settings_file(
+        settings_path: Path,
+    ) -> Dict[str, Dict[str, Union[str, int, float, bool]]]:
+        """
+        Return the parameters parsed from a settings file.
+
+        See get_default_parameters for the details
+
+        Parameters
+        ----------
+        settings_path : Path
+            Path to the BOUT.settings file
+
+        Returns
+        -------
+        default_parameters_dict : dict
+            Dictionary containing the parameters given in BOUT.settings
         """
         # The settings file lacks a header for the global parameter
         # Therefore, we add add the header [global]
-        with self.__settings_path.open("r") as settings_file:
+        with settings_path.open("r") as settings_file:
             settings_memory = f"[global]\n{settings_file.read()}"
 
         config = configparser.ConfigParser()
@@ -220,7 +313,7 @@ class DefaultParameters:
                 default_parameters_dict[section][key] = val
 
         # NOTE: Bug in .settings: -d path is captured with # not in use
-        bout_inp_dir = self.__settings_path.parent
+        bout_inp_dir = settings_path.parent
         default_parameters_dict["global"].pop("d", None)
         default_parameters_dict["global"].pop(str(bout_inp_dir).lower(), None)
 
@@ -0,0 +1,303 @@
+"""Contains the class caching the BOUT.settings of projects."""
+
+
+import hashlib
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from bout_runners.database.database_utils import get_git_sha
+from bout_runners.utils.names import get_exec_name, get_makefile_path
+from bout_runners.utils.paths import get_bout_directory
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # NOTE: fcntl is not available on Windows, where only the threads of one
+    #       process are prevented from running the settings run simultaneously
+    fcntl = None  # type: ignore
+
+
+class SettingsCache:
+    """
+    Class which caches the BOUT.settings file of a project on disk.
+
+    The settings are keyed by a hash of the BOUT.inp file, the modification
+    time and size of the executable and the git sha of BOUT++.
+    A hit returns the cached BOUT.settings without executing anything.
+    On a miss the settings run is executed once, even if several threads or
+    processes ask for the settings at the same time, as the settings runs of a
+    cache directory are serialized by a lock.
+
+    Attributes
+    ----------
+    __locks : dict of str, threading.Lock
+        The locks of the cache directories shared by all instances
+    __locks_lock : threading.Lock
+        Lock guarding __locks
+    __bout_git_shas : dict of Path, str
+        The git sha of the BOUT++ directories read by this process
+    __project_path : Path
+        Getter variable for project_path
+    __bout_inp_src_dir : Path
+        Getter variable for bout_inp_src_dir
+    __cache_dir : Path
+        Getter variable for cache_dir
+    project_path : Path
+        Root path of the project, i.e. where the Makefile is situated
+    bout_inp_src_dir : Path
+        The directory of the BOUT.inp file
+    cache_dir : Path
+        The directory of the cached settings
+
+    Methods
+    -------
+    __get_bout_git_sha()
+        Return the git sha of BOUT++, read at most once per process
+    __lock()
+        Lock the cache directory for the other threads and processes
+    get_key()
+        Return the key of the current input file and executable
+    get_cached_path(key)
+        Return the path of the cached BOUT.settings
+    store(settings_path, key)
+        Store a BOUT.settings file in the cache
+    get_settings_path(run_settings)
+        Return the path to the cached BOUT.settings, run the settings run on a miss
+
+    Examples
+    --------
+    >>> settings_cache = SettingsCache(Path('path', 'to', 'project'))
+    >>> settings_cache.get_settings_path(run_settings)
+    PosixPath('path/to/project/settings_cache/2f3c...e1/BOUT.settings')
+    """
+
+    __locks: Dict[str, threading.Lock] = dict()
+    __locks_lock = threading.Lock()
+    __bout_git_shas: Dict[Path, str] = dict()
+
+    def __init__(
+        self,
+        project_path: Path,
+        bout_inp_src_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Set the paths.
+
+        Parameters
+        ----------
+        project_path : Path
+            Root path of the project, i.e. where the Makefile is situated
+        bout_inp_src_dir : None or Path
+            The directory of the BOUT.inp file
+            If None, the data directory of the project will be used
+        cache_dir : None or Path
+            The directory of the cached settings
+            If None, the settings_cache directory of the project will be used
+        """
+        self.__project_path = Path(project_path).absolute()
+        self.__bout_inp_src_dir = (
+            self.__project_path.joinpath("data")
+            if bout_inp_src_dir is None
+            else Path(bout_inp_src_dir).absolute()
+        )
+        self.__cache_dir = (
+            self.__project_path.joinpath("settings_cache")
+            if cache_dir is None
+            else Path(cache_dir).absolute()
+        )
+
+    @property
+    def project_path(self) -> Path:
+        """
+        Return the root path of the project.
+
+        Returns
+        -------
+        Path
+            The root path of the project
+        """
+        return self.__project_path
+
+    @property
+    def bout_inp_src_dir(self) -> Path:
+        """
+        Return the directory of the BOUT.inp file.
+
+        Returns
+        -------
+        Path
+            The directory of the BOUT.inp file
+        """
+        return self.__bout_inp_src_dir
+
+    @property
+    def cache_dir(self) -> Path:
+        """
+        Return the directory of the cached settings.
+
+        Returns
+        -------
+        Path
+            The directory of the cached settings
+        """
+        return self.__cache_dir
+
+    def __get_bout_git_sha(self) -> str:
+        """
+        Return the git sha of BOUT++, read at most once per process.
+
+        Returns
+        -------
+        str
+            The git sha of the BOUT++ directory
+        """
+        bout_path = get_bout_directory()
+        if bout_path not in self.__bout_git_shas:
+            self.__bout_git_shas[bout_path] = get_git_sha(bout_path)
+        return self.__bout_git_shas[bout_path]
+
+    def get_key(self) -> str:
+        """
+        Return the key of the current input file and executable.
+
+        Returns
+        -------
+        str
+            The hexadecimal sha256 hash of the BOUT.inp file, the modification time
+            and size of the executable and the git sha of BOUT++
+        """
+        key_hash = hashlib.sha256()
+        key_hash.update(self.__bout_inp_src_dir.joinpath("BOUT.inp").read_bytes())
+
+        exec_name = get_exec_name(get_makefile_path(self.__project_path, None))
+        exec_path = self.__project_path.joinpath(exec_name)
+        if exec_path.is_file():
+            stat = exec_path.stat()
+            key_hash.update(f"{exec_name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        else:
+            key_hash.update(f"{exec_name}:None".encode())
+
+        key_hash.update(self.__get_bout_git_sha().encode())
+        return key_hash.hexdigest()
+
+    def get_cached_path(self, key: str) -> Path:
+        """
+        Return the path of the cached BOUT.settings.
+
+        Parameters
+        ----------
+        key : str
+            The key of the settings
+
+        Returns
+        -------
+        Path
+            The path of the cached BOUT.settings (which may not exist)
+        """
+        return self.__cache_dir.joinpath(key, "BOUT.settings")
+
+    def store(self, settings_path: Path, key: str) -> Path:
+        """
+        Store a BOUT.settings file in the cache.
+
+        The file is written to a temporary file which is renamed, so that a
+        reader never sees a partially written file
+
+        Parameters
+        ----------
+        settings_path : Path
+            Path to the BOUT.settings file created by the settings run
+        key : str
+            The key of the settings
+
+        Returns
+        -------
+        cached_path : Path
+            The path of the cached BOUT.settings
+        """
+        # NOTE: The directory of the settings run is captured as a parameter in
+        #       BOUT.settings, see DefaultParameters.get_default_parameters.
+        #       It is dropped as it would not be recognized from the cache
+        run_dir = str(settings_path.parent).lower()
+        with settings_path.open("r") as settings_file:
+            lines = [
+                line
+                for line in settings_file
+                if line.split("=")[0].strip().lower() != run_dir
+            ]
+
+        cached_path = self.get_cached_path(key)
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached_path.with_name(
+            f"{cached_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text("".join(lines))
+        os.replace(tmp_path, cached_path)
+        logging.debug("Stored %s in the settings cache as %s", settings_path, key)
+        return cached_path
+
+    @contextmanager
+    def __lock(self) -> Iterator[None]:
+        """
+        Lock the cache directory for the other threads and processes.
+
+        Yields
+        ------
+        None
+            The cache directory is locked until the context is left
+        """
+        with self.__locks_lock:
+            thread_lock = self.__locks.setdefault(
+                str(self.__cache_dir), threading.Lock()
+            )
+        with thread_lock:
+            self.__cache_dir.mkdir(parents=True, exist_ok=True)
+            with self.__cache_dir.joinpath(".lock").open("w") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def get_settings_path(self, run_settings: Callable[[], Path]) -> Path:
+        """
+        Return the path to the cached BOUT.settings, run the settings run on a miss.
+
+        Parameters
+        ----------
+        run_settings : callable
+            Function which executes the settings run, and returns the path to the
+            created BOUT.settings
+
+        Returns
+        -------
+        Path
+            The path of the cached BOUT.settings
+        """
+        cached_path = self.get_cached_path(self.get_key())
+        if cached_path.is_file():
+            logging.info("Using the cached settings %s", cached_path)
+            return cached_path
+
+        with self.__lock():
+            # NOTE: Another thread or process may have stored the settings while
+            #       we were waiting for the lock
+            cached_path = self.get_cached_path(self.get_key())
+            if cached_path.is_file():
+                logging.info("Using the cached settings %s", cached_path)
+                return cached_path
+
+            logging.info("Start: Running the settings run as the cache was missed")
+            settings_path = run_settings()
+            # NOTE: The key is computed anew as the settings run may have made the
+            #       executable
+            cached_path = self.store(settings_path, self.get_key())
+            logging.info("Done: Running the settings run as the cache was missed")
+        return cached_path
@@ -3,7 +3,7 @@
 
 import logging
 import re
-from copy import deepcopy
+from copy import copy
 from pathlib import Path
 from typing import Optional
 
@@ -31,6 +31,8 @@ class BoutRunExecutor:
         Object containing the paths
     exec_name : str
         Name of the executable
+    make : Make
+        Object for making the project
     restart_from : None or Path
         Path to copy restart files from prior to the execution
     run_parameters : RunParameters
@@ -91,6 +93,7 @@ class BoutRunExecutor:
         submitter: Optional[AbstractSubmitter] = None,
         run_parameters: Optional[RunParameters] = None,
         restart_from: Optional[Path] = None,
+        make: Optional[Make] = None,
     ) -> None:
         """
         Set the input parameters.
@@ -107,19 +110,24 @@ class BoutRunExecutor:
             If None, default parameters will be used
         restart_from : Path or None
             The path to copy the restart files from
+        make : Make or None
+            Object for making the project
+            Can be shared by the executors of a project to avoid reading the
+            makefile once per executor
+            If None, a Make object of the project path will be made
         """
         # NOTE: We are not setting the default as a keyword argument
         #       as this would mess up the paths
-        # NOTE: We are deepcopying bout_paths as it may be altered by for
+        # NOTE: We are copying bout_paths as it may be altered by for
         #       example the self.restart_from setter
+        #       A shallow copy suffices as the paths are immutable, and are
+        #       replaced rather than altered by the setters
         logging.info("Start: Making an BoutRunExecutor object")
-        self.__bout_paths = (
-            deepcopy(bout_paths) if bout_paths is not None else BoutPaths()
-        )
+        self.__bout_paths = copy(bout_paths) if bout_paths is not None else BoutPaths()
         self.__run_parameters = (
             run_parameters if run_parameters is not None else RunParameters()
         )
-        self.__make = Make(self.__bout_paths.project_path)
+        self.__make = make if make is not None else Make(self.__bout_paths.project_path)
 
         self.submitter = submitter if submitter is not None else get_submitter()
         if isinstance(self.submitter, AbstractClusterSubmitter):
@@ -220,6 +228,22 @@ class BoutRunExecutor:
         """
         return self.__make.exec_name
 
+    @property
+    def make(self) -> Make:
+        """
+        Return the Make object of the project.
+
+        Returns
+        -------
+        self.__make : Make
+            Object for making the project
+
+        Notes
+        -----
+        The make is read only
+        """
+        return self.__make
+
     @property
     def run_parameters(self) -> RunParameters:
         """
@@ -266,6 +290,8 @@ class BoutRunExecutor:
         restart : bool
             If True the 'restart' will be appended to the command string
         """
+        # Make the destination directory if the paths are lazy
+        self.__bout_paths.materialize()
         # Make the project if not already made
         self.__make.run_make()
         # Submit the command
@@ -1,20 +1,22 @@
 """Contains the BOUT runner class."""
 
 
+import asyncio
 import logging
 from pathlib import Path
-from time import sleep
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
-from bout_runners.database.database_connector import DatabaseConnector
-from bout_runners.metadata.status_checker import StatusChecker
+from bout_runners.parameters.bout_paths import BoutPaths
 from bout_runners.parameters.bout_run_setup import BoutRunSetup
+from bout_runners.runner.node_dispatcher import NodeDispatcher
 from bout_runners.runner.run_graph import RunGraph
 from bout_runners.runner.run_group import RunGroup
+from bout_runners.runner.run_planner import RunPlanner
+from bout_runners.runner.run_status_tracker import RunStatusTracker
 from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
 from bout_runners.submitter.abstract_submitter import AbstractSubmitter
-from bout_runners.submitter.local_submitter import LocalSubmitter
 from bout_runners.submitter.submitter_factory import get_submitter
+from bout_runners.submitter.worker_pool_submitter import WorkerPoolSubmitter
 from bout_runners.utils.file_operations import copy_restart_files
 
 
@@ -26,16 +28,21 @@ class BoutRunner:
     ----------
     __run_graph : RunGraph
         Getter variable for executor the run graph
+    __status_tracker : RunStatusTracker
+        The tracker of the status of the bout runs
+    __node_dispatcher : NodeDispatcher
+        The dispatcher submitting the nodes of the run graph
     run_graph : Graph
         The run graph to be executed
     wait_time : int
         Time to wait before checking if a job has completed
+    track_progress : bool
+        Whether the progress of the running BOUT++ runs is sampled into the
+        progress table of the database
 
     Methods
     -------
-    __add_waiting_for(node_name)
-        Add the job_ids to wait for in the submission script
-    __prepare_run(force, restart_all)
+    __prepare_run(force, restart_all, skip_done)
         Prepare the run sequence
     __updates_when_restart_all_is_true()
         Update paths and nodes when restart_all is True
@@ -43,16 +50,8 @@ class BoutRunner:
         Inject a node which copy restart files
     __make_restart_files_node(to_node_name, copy_restart_from, copy_restart_to)
         Make nodes which copies restart files
-    __next_order_has_local(submitter_dict)
-        Check if the current order of nodes has any local submitters
-    __monitor_runs(submitter_dict, raise_errors)
-        Monitor the runs belonging to the same order
-    __run_status_checker(node_name)
-        Run the StatusChecker
-    __this_order_has_local(submitter_dict)
-        Check if the current order of nodes has any local submitters
-    __update_submitter_dict_after_run_bout_run(node_name, submitted, submitter_dict)
-        Update the submitter dict after calling run_bout_run
+    __submit_node(node_name, force)
+        Submit the node and mark it as submitted
     find_matching_order_number(node_names, node_orders)
         Return the order matching the node names
     run_bout_run(bout_run_setup, restart_from_bout_inp_dst, force)
@@ -67,8 +66,11 @@ class BoutRunner:
         Check if any of the nodes have a submitter of type AbstractClusterSubmitter
     wait_until_completed(self)
         Wait until all submitted nodes are completed
-    run(restart_all, force, raise_errors)
+    run(restart_all, force, raise_errors, dispatch_when_ready, use_job_arrays,
+        skip_done)
         Execute the run
+    run_async(restart_all, force, raise_errors, skip_done)
+        Execute the run, awaiting the completion of the nodes
 
     Examples
     --------
@@ -129,7 +131,10 @@ class BoutRunner:
     """
 
     def __init__(
-        self, run_graph: Optional[RunGraph] = None, wait_time: int = 5
+        self,
+        run_graph: Optional[RunGraph] = None,
+        wait_time: int = 5,
+        track_progress: bool = False,
     ) -> None:
         """
         Set the member data.
@@ -142,8 +147,10 @@ class BoutRunner:
             default BoutRunSetup
         wait_time : int
             Time to wait before checking if a job has completed
+        track_progress : bool
+            Whether the progress of the running BOUT++ runs is sampled into the
+            progress table of the database every time the status is checked
         """
-        self.wait_time = wait_time
         if run_graph is None:
             self.__run_graph = RunGraph()
             _ = RunGroup(self.__run_graph, BoutRunSetup())
@@ -160,34 +167,21 @@ class BoutRunner:
                 == 0
             ):
                 logging.warning("The provided run_graph does not contain any bout_runs")
-
-    def __add_waiting_for(self, node_name: str) -> None:
-        """
-        Add the job_ids to wait for in the submission script.
-
-        Parameters
-        ----------
-        node_name : str
-            Name of current node
-        """
-        predecessors = self.__run_graph.predecessors(node_name)
-        waiting_for = (
-            self.__run_graph[p_name]["submitter"].job_id
-            for p_name in predecessors
-            if isinstance(
-                self.__run_graph[p_name]["submitter"],
-                AbstractClusterSubmitter,
-            )
-            and not self.__run_graph[p_name]["submitter"].completed()
+        self.__status_tracker = RunStatusTracker(
+            self.__run_graph, wait_time, track_progress
+        )
+        self.__node_dispatcher = NodeDispatcher(
+            self.__run_graph, self.__status_tracker, self.__submit_node
         )
-        self.__run_graph[node_name]["submitter"].add_waiting_for(waiting_for)
 
-    def __prepare_run(self, force: bool, restart_all: bool) -> None:
+    def __prepare_run(self, force: bool, restart_all: bool, skip_done: bool) -> None:
         """
         Prepare the run sequence.
 
         If any bout_run nodes contain restart_from this function will create a
-        node which copies the restart files
+        node which copies the restart files.
+        The destination directories of the bout_run nodes which are still ready
+        are materialized in one pass
 
         Parameters
         ----------
@@ -195,6 +189,10 @@ class BoutRunner:
             All the BOUT++ runs in the run graph will be restarted
         force : bool
             Execute the run even if has been performed with the same parameters
+        skip_done : bool
+            Mark the bout_run nodes which have been done before, and the nodes
+            only depending on them, as skipped before any node is submitted
+            Ignored if force is True
 
         Raises
         ------
@@ -234,6 +232,18 @@ class BoutRunner:
                     node,
                 )
                 self.__inject_copy_restart_files_node(node)
+
+        if skip_done and not force:
+            RunPlanner(self.__run_graph).skip_done_nodes()
+
+        # NOTE: The destination directories of lazy BoutPaths are made in one
+        #       pass, so that the skipped nodes never touch the filesystem
+        BoutPaths.materialize_many(
+            self.__run_graph[node]["bout_run_setup"].bout_paths
+            for node in self.__run_graph.nodes
+            if node.startswith("bout_run")
+            and self.__run_graph[node]["status"] == "ready"
+        )
         logging.info("Done: Preparing all runs")
 
     def __updates_when_restart_all_is_true(self) -> None:
@@ -371,220 +381,99 @@ class BoutRunner:
         )
         return current_node_name
 
-    def __next_order_has_local(
-        self,
-        submitter_dict: Dict[
-            str,
-            Dict[
-                str, Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]]
-            ],
-        ],
-    ) -> bool:
+    def __submit_node(self, node_name: str, force: bool) -> bool:
         """
-        Check if the current order of nodes has any local submitters.
+        Submit the node and mark it as submitted.
 
         Parameters
         ----------
-        submitter_dict : dict
-            Dict containing the the node names as keys and a new dict as values
-            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+        node_name : str
+            Name of the node to submit
+        force : bool
+            Execute the run even if has been performed with the same parameters
 
         Returns
         -------
-        bool
-            True if the current order has local submitters
-        """
-        for node_name in submitter_dict.keys():
-            for successor_name in self.__run_graph.successors(node_name):
-                if isinstance(
-                    self.__run_graph[successor_name]["submitter"], LocalSubmitter
-                ):
-                    logging.info(
-                        "%s in the next node order is of local submitter type, "
-                        "will monitor this node order",
-                        successor_name,
-                    )
-                    return True
-        return False
-
-    def __monitor_runs(
-        self,
-        submitter_dict: Dict[
-            str,
-            Dict[
-                str, Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]]
-            ],
-        ],
-        raise_errors: bool,
-    ) -> None:
-        """
-        Monitor the runs belonging to the same order.
-
-        Parameters
-        ----------
-        submitter_dict : dict
-            Dict containing the the node names as keys and a new dict as values
-            The new dict contains the keywords 'submitter' with value AbstractSubmitter
-            If the submitter contains a bout run, the new dict will also contain the
-            keyword 'db_connector' with the value DatabaseConnector and the keyword
-            'project_path' with the value Path which will be used in the StatusChecker
-        raise_errors : bool
-            If True the program will raise any error caught when during the running
-            of the nodes
-            If False the program will continue execution, but all nodes depending on
-            the errored node will be marked as errored and not submitted
-
-        Raises
-        ------
-        RuntimeError
-            If the types in the dict are unexpected
-        """
-        logging.info("Start: Monitoring jobs at current order")
-        node_names = list(node_name for node_name in submitter_dict.keys())
-        while len(node_names) != 0:
-            for node_name in node_names:
-                submitter = submitter_dict[node_name]["submitter"]
-                if not isinstance(submitter, AbstractSubmitter):
-                    msg = (
-                        f"The submitter of the '{node_name}' node was expected to be "
-                        f"of type 'AbstractSubmitter', but got '{type(submitter)}' "
-                        f"instead"
-                    )
-                    logging.critical(msg)
-                    raise RuntimeError(msg)
-
-                if submitter.completed():
-                    if submitter.errored():
-                        self.__run_graph.change_status_node_and_dependencies(node_name)
-                        if raise_errors:
-                            submitter.raise_error()
-
-                    node_names.remove(node_name)
-                else:
-                    logging.debug(
-                        "job_id=%s found, %s seems to be running",
-                        submitter.job_id,
-                        node_name,
-                    )
-
-                if node_name.startswith("bout_run"):
-                    self.__run_status_checker(node_name)
-
-            sleep(self.wait_time)
-        logging.info("Done: Monitoring jobs at current order")
-
-    def __run_status_checker(self, node_name: str) -> None:
-        """
-        Run the StatusChecker.
-
-        Parameters
-        ----------
-        node_name : str
-            Name of node to run the status checker for
-
-        Raises
-        ------
-        RuntimeError
-            If the types of self.__run_graph[node_name]["db_connector"] or
-            self.__run_graph[node_name]["project_path"] are unexpected
-        """
-        db_connector = self.__run_graph[node_name]["db_connector"]
-        if not isinstance(db_connector, DatabaseConnector):
-            raise RuntimeError(
-                f"The db_connector of the '{node_name}' node was expected "
-                f"to be of type 'DatabaseConnector', but got "
-                f"'{type(db_connector)}' instead"
+        submitted : bool
+            Whether or not anything was submitted
+            This is False for bout_run nodes which have been run before with the
+            same configuration (and force is False)
+        """
+        logging.info("Start: Processing %s", node_name)
+        if node_name.startswith("bout_run"):
+            submitted = self.run_bout_run(
+                self.__run_graph[node_name]["bout_run_setup"],
+                force,
             )
-        project_path = self.__run_graph[node_name]["project_path"]
-        if not isinstance(project_path, Path):
-            raise RuntimeError(
-                f"The project_path of the '{node_name}' node was expected "
-                f"to be of type 'Path', but got '{type(project_path)}' "
-                f"instead"
+            if submitted:
+                # Add the information needed by the StatusChecker
+                self.__run_graph[node_name]["db_connector"] = self.__run_graph[
+                    node_name
+                ]["bout_run_setup"].db_connector
+                self.__run_graph[node_name]["project_path"] = self.__run_graph[
+                    node_name
+                ]["bout_run_setup"].bout_paths.project_path
+                self.__run_graph[node_name]["run_id"] = self.__run_graph[node_name][
+                    "bout_run_setup"
+                ].metadata_recorder.latest_run_id
+        else:
+            self.run_function(
+                self.__run_graph[node_name]["path"],
+                self.__run_graph[node_name]["submitter"],
+                self.__run_graph[node_name]["function"],
+                self.__run_graph[node_name]["args"],
+                self.__run_graph[node_name]["kwargs"],
             )
-        StatusChecker(db_connector, project_path).check_and_update_status()
+            submitted = True
 
-    @staticmethod
-    def __this_order_has_local(
-        submitter_dict: Dict[
-            str,
-            Dict[
-                str, Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]]
-            ],
-        ]
-    ) -> bool:
-        """
-        Check if the current order of nodes has any local submitters.
+        self.__run_graph[node_name]["status"] = "submitted"
+        logging.info("Done: Processing %s", node_name)
+        return submitted
 
-        Parameters
-        ----------
-        submitter_dict : dict
-            Dict containing the the node names as keys and a new dict as values
-            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+    @property
+    def run_graph(self) -> RunGraph:
+        """
+        Get the properties of self.run_graph.
 
         Returns
         -------
-        bool
-            True if the current order has local submitters
+        self.__run_graph : RunGraph
+            The RunGraph object
         """
-        for node_name in submitter_dict.keys():
-            if isinstance(submitter_dict[node_name]["submitter"], LocalSubmitter):
-                logging.debug(
-                    "%s is of local submitter type, will monitor this node order",
-                    node_name,
-                )
-                return True
-        return False
+        return self.__run_graph
 
-    def __update_submitter_dict_after_run_bout_run(
-        self,
-        node_name: str,
-        submitted: bool,
-        submitter_dict: Dict[
-            str,
-            Dict[
-                str,
-                Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]],
-            ],
-        ],
-    ) -> None:
+    @property
+    def wait_time(self) -> int:
         """
-        Update the submitter dict after calling run_bout_run.
-
-        If the run has been submitted we add information about the database in the dict.
-        Else we pop the node name from the dict in order not to monitor it.
+        Set the properties of self.wait_time.
 
-        Parameters
-        ----------
-        node_name : str
-            Name of current node
-        submitted : bool
-            Whether or not the run was submitted
-        submitter_dict : dict
-            Dict containing the the node names as keys and a new dict as values
-            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+        Returns
+        -------
+        int
+            Time to wait before checking if a job has completed
         """
-        if submitted:
-            self.__run_graph[node_name]["db_connector"] = self.__run_graph[node_name][
-                "bout_run_setup"
-            ].db_connector
-            self.__run_graph[node_name]["project_path"] = self.__run_graph[node_name][
-                "bout_run_setup"
-            ].bout_paths.project_path
-        else:
-            submitter_dict.pop(node_name)
+        return self.__status_tracker.wait_time
+
+    @wait_time.setter
+    def wait_time(self, wait_time: int) -> None:
+        self.__status_tracker.wait_time = wait_time
 
     @property
-    def run_graph(self) -> RunGraph:
+    def track_progress(self) -> bool:
         """
-        Get the properties of self.run_graph.
+        Set the properties of self.track_progress.
 
         Returns
         -------
-        self.__run_graph : RunGraph
-            The RunGraph object
+        bool
+            Whether the progress of the running BOUT++ runs is sampled into the
+            progress table of the database
         """
-        return self.__run_graph
+        return self.__status_tracker.track_progress
+
+    @track_progress.setter
+    def track_progress(self, track_progress: bool) -> None:
+        self.__status_tracker.track_progress = track_progress
 
     @staticmethod
     def find_matching_order_number(
@@ -606,17 +495,7 @@ class BoutRunner:
             The first order where a match was found
             If no match was found 0 is returned
         """
-        order_number = -1
-        found = False
-        for order_nodes in node_orders:
-            for node_name in node_names:
-                if node_name in order_nodes:
-                    found = True
-                    break
-                order_number += 1
-        if found:
-            return order_number
-        return None
+        return NodeDispatcher.find_matching_order_number(node_names, node_orders)
 
     @staticmethod
     def run_bout_run(
@@ -707,7 +586,15 @@ class BoutRunner:
             args,
             kwargs,
         )
+        # NOTE: The directory may belong to a bout run with lazy paths which was
+        #       skipped, and which therefore is not materialized
+        path.parent.mkdir(exist_ok=True, parents=True)
         submitter.write_python_script(path, function, args, kwargs)
+        if isinstance(submitter, WorkerPoolSubmitter):
+            # The workers have already started and imported the heavy modules, so
+            # the function is called directly instead of through the script
+            submitter.submit_function(function, args, kwargs)
+            return submitter
         command = f"python3 {path}"
         submitter.submit_command(command)
         return submitter
@@ -726,16 +613,7 @@ class BoutRunner:
         nodes_to_release : iterable
             Name of nodes to release
         """
-        if len(nodes_to_release) != 0:
-            logging.info("Start: Releasing held cluster nodes")
-            logging.debug("Release order: %s", nodes_to_release)
-            for order in nodes_to_release:
-                for node in order:
-                    if isinstance(
-                        self.__run_graph[node]["submitter"], AbstractClusterSubmitter
-                    ):
-                        self.__run_graph[node]["submitter"].release()
-            logging.info("Done: Releasing held cluster nodes")
+        self.__node_dispatcher.release_nodes(nodes_to_release)
 
     def cluster_node_exist(self, node_names: Iterable[str]) -> bool:
         """
@@ -751,30 +629,43 @@ class BoutRunner:
         bool
             Whether the iterable contains any cluster nodes
         """
-        for node in node_names:
-            if isinstance(
-                self.__run_graph[node]["submitter"], AbstractClusterSubmitter
-            ):
-                return True
-        return False
+        return self.__node_dispatcher.cluster_node_exist(node_names)
 
     def wait_until_completed(self) -> None:
         """Wait until all submitted nodes are completed."""
         logging.info("Start: Waiting for all submitted jobs to complete")
-        for node_name in self.__run_graph.nodes:
-            if self.__run_graph[node_name]["status"] == "submitted":
-                self.__run_graph[node_name]["submitter"].wait_until_completed()
-                self.__run_graph[node_name]["status"] = "completed"
-                if node_name.startswith("bout_run"):
-                    self.__run_status_checker(node_name)
+        try:
+            for node_name in self.__run_graph.nodes:
+                if self.__run_graph[node_name]["status"] == "submitted":
+                    self.__run_graph[node_name]["submitter"].wait_until_completed()
+                    self.__run_graph[node_name]["status"] = "completed"
+                    if node_name.startswith("bout_run"):
+                        self.__status_tracker.record_queue_wait_time(node_name)
+                        self.__status_tracker.check(node_name)
+        finally:
+            self.__status_tracker.stop()
         logging.info("Done: Waiting for all submitted jobs to complete")
 
     def run(
-        self, restart_all: bool = False, force: bool = False, raise_errors: bool = True
+        self,
+        restart_all: bool = False,
+        force: bool = False,
+        raise_errors: bool = True,
+        dispatch_when_ready: bool = False,
+        use_job_arrays: bool = False,
+        skip_done: bool = False,
     ) -> None:
         """
         Execute all the nodes in the run_graph.
 
+        By default the nodes are executed order by order, where the next order is
+        not processed before all the nodes in the current order have finished (if
+        the graph contains local nodes)
+        With dispatch_when_ready set to True a node is instead submitted as soon as
+        all its predecessors have completed, so that a slow node only delays the
+        nodes depending on it.
+        The call will then return when all the nodes have completed
+
         Parameters
         ----------
         restart_all : bool
@@ -786,92 +677,94 @@ class BoutRunner:
             of the nodes
             If False the program will continue execution, but all nodes depending on
             the errored node will be marked as errored and not submitted
+        dispatch_when_ready : bool
+            If True, submit the nodes as soon as their predecessors have completed
+            instead of processing the graph order by order
+        use_job_arrays : bool
+            If True, the cluster bout_run nodes of the same order which share
+            submitter type, processor split, submission_dict and dependencies are
+            submitted as one job array
+            Only used when the graph is processed order by order
+        skip_done : bool
+            If True, the bout_run nodes which have been done before, and the nodes
+            only depending on them, are skipped without capturing their data
+            The done runs are found with one bulk query per table of the database
+            Ignored if force is True
         """
         logging.info("Start: Calling .run() in BoutRunners")
-        self.__prepare_run(force, restart_all)
+        self.__prepare_run(force, restart_all, skip_done)
         logging.debug("Dot-graph of the run\n%s", self.__run_graph.get_dot_string())
 
-        for nodes_at_current_order in self.__run_graph:
-            logging.info("Start: Processing nodes at current order")
-            submitter_dict: Dict[
-                str,
-                Dict[
-                    str,
-                    Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]],
-                ],
-            ] = dict()
-            for node_name in nodes_at_current_order:
-                if self.__run_graph[node_name]["status"] != "ready":
-                    logging.info(
-                        "Skipping node '%s' as it has status=%s",
-                        node_name,
-                        self.__run_graph[node_name]["status"],
-                    )
-                    continue
-                logging.info("Start: Processing %s", node_name)
-                if isinstance(
-                    self.__run_graph[node_name]["submitter"],
-                    AbstractClusterSubmitter,
-                ):
-                    self.__add_waiting_for(node_name)
-
-                submitter_dict[node_name] = dict()
-                submitter_dict[node_name]["submitter"] = self.__run_graph[node_name][
-                    "submitter"
-                ]
-                if node_name.startswith("bout_run"):
-                    submitted = self.run_bout_run(
-                        self.__run_graph[node_name]["bout_run_setup"],
-                        force,
-                    )
-                    self.__update_submitter_dict_after_run_bout_run(
-                        node_name, submitted, submitter_dict
-                    )
-                else:
-                    self.run_function(
-                        self.__run_graph[node_name]["path"],
-                        self.__run_graph[node_name]["submitter"],
-                        self.__run_graph[node_name]["function"],
-                        self.__run_graph[node_name]["args"],
-                        self.__run_graph[node_name]["kwargs"],
-                    )
-
-                self.__run_graph[node_name]["status"] = "submitted"
-                logging.info("Done: Processing %s", node_name)
-
-            # We only monitor the runs if any local_submitters are present in
-            # the current or the next order
-            # Else the clusters will handle the monitoring
-            monitor_run = False
-            if self.__this_order_has_local(
-                submitter_dict
-            ) or self.__next_order_has_local(submitter_dict):
-                monitor_run = True
-
-            if monitor_run:
-                if self.cluster_node_exist(self.__run_graph.nodes):
-                    logging.warning(
-                        "Mixed local and cluster nodes found in graph. "
-                        "Releasing the cluster nodes up until the order of the "
-                        "LocalSubmitter. This can cause a node waiting for one of "
-                        "these nodes to be submitted after those nodes have finished "
-                        "so that the cluster will reject those jobs."
-                    )
-                    reverse_sorted_node_orders = self.__run_graph.get_node_orders(
-                        reverse=True
-                    )
-                    order_number = self.find_matching_order_number(
-                        tuple(submitter_dict.keys()), reverse_sorted_node_orders
-                    )
-                    orders_to_release = reverse_sorted_node_orders[order_number:]
-                    self.release_nodes(orders_to_release)
-                    # We also need to release the current order in case
-                    # the graph is not connected
-                    self.release_nodes((tuple(submitter_dict.keys()),))
-                self.__monitor_runs(submitter_dict, raise_errors)
-            logging.info("Done: Processing nodes at current order")
-
-        if self.cluster_node_exist(self.__run_graph.nodes):
-            reverse_sorted_node_orders = self.__run_graph.get_node_orders(reverse=True)
-            self.release_nodes(reverse_sorted_node_orders)
+        # NOTE: The status daemons are released also when a node raises, as they
+        #       are shared with the other tools of the process
+        try:
+            self.__node_dispatcher.dispatch(
+                force, raise_errors, dispatch_when_ready, use_job_arrays
+            )
+        finally:
+            self.__status_tracker.stop()
         logging.info("Done: Calling .run() in BoutRunners")
+
+    async def run_async(
+        self,
+        restart_all: bool = False,
+        force: bool = False,
+        raise_errors: bool = True,
+        skip_done: bool = False,
+    ) -> None:
+        """
+        Execute all the nodes in the run_graph, awaiting the completion of the nodes.
+
+        As with run(dispatch_when_ready=True) a node is submitted as soon as all its
+        predecessors have completed.
+        Instead of polling the nodes in a sleep loop, the completion of every
+        submitted node is awaited through the wait_async method of its submitter.
+        Nodes with an AsyncLocalSubmitter are awaited directly on the exit of their
+        processes, whereas the cluster submitters are polled concurrently in the
+        default executor of the event loop, so that any number of in-flight nodes
+        can be tracked from one event loop
+        The submission of the nodes and the requests of status checks (which may
+        build the project or call the cluster scheduler) are also made in the
+        default executor, so that they do not block the event loop
+
+        Parameters
+        ----------
+        restart_all : bool
+            All the BOUT++ runs in the run graph will be restarted
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        skip_done : bool
+            If True, the bout_run nodes which have been done before, and the nodes
+            only depending on them, are skipped without capturing their data
+            The done runs are found with one bulk query per table of the database
+            Ignored if force is True
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> runner = BoutRunner(run_graph)
+        >>> asyncio.run(runner.run_async())
+
+        asyncio.run requires python 3.7, with python 3.6 the loop must be run
+        explicitly
+
+        >>> asyncio.get_event_loop().run_until_complete(runner.run_async())
+        """
+        logging.info("Start: Calling .run_async() in BoutRunners")
+        self.__prepare_run(force, restart_all, skip_done)
+        logging.debug("Dot-graph of the run\n%s", self.__run_graph.get_dot_string())
+
+        try:
+            await self.__node_dispatcher.dispatch_async(force, raise_errors)
+        finally:
+            # NOTE: The final status checks are blocking, and
+            #       asyncio.get_running_loop requires python 3.7
+            await asyncio.get_event_loop().run_in_executor(
+                None, self.__status_tracker.stop
+            )
+        logging.info("Done: Calling .run_async() in BoutRunners")
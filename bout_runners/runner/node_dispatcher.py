@@ -0,0 +1,886 @@
+"""Contains the class dispatching the nodes of a run graph."""
+
+
+import asyncio
+import logging
+from collections import deque
+from pathlib import Path
+from time import sleep
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.metadata.metadata_updater import MetadataUpdater
+from bout_runners.runner.run_graph import RunGraph
+from bout_runners.runner.run_status_tracker import RunStatusTracker
+from bout_runners.submitter.abstract_cluster_job_array import AbstractClusterJobArray
+from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+
+SubmitterDict = Dict[
+    str,
+    Dict[str, Union[Optional[AbstractSubmitter], Union[DatabaseConnector, Path]]],
+]
+
+
+class NodeDispatcher:
+    """
+    Class which submits the nodes of a run graph and monitors them.
+
+    The nodes are either dispatched order by order, where the next order is not
+    processed before all the nodes in the current order have finished (if the graph
+    contains local nodes), or as soon as all their predecessors have completed, so
+    that a slow node only delays the nodes depending on it
+
+    Attributes
+    ----------
+    __run_graph : RunGraph
+        The run graph to dispatch
+    __status_tracker : RunStatusTracker
+        The tracker of the status of the bout runs
+    __submit_node : callable
+        Callable which submits a node given its name and whether to force the run,
+        and returns whether anything was submitted
+    __pending_predecessors : dict of str, int
+        The node names as keys and the number of pending predecessors as values
+    __ready_queue : deque of str
+        The names of the nodes which can be submitted
+    __completed_queue : deque of str
+        The names of the submitted nodes which have completed
+    __in_flight : dict of str, tuple
+        The submitters and completion callbacks of the submitted nodes which have
+        not been handled
+
+    Methods
+    -------
+    __add_waiting_for(node_name)
+        Add the job_ids to wait for in the submission script
+    __submit_order(nodes_at_current_order, force, use_job_arrays)
+        Submit the ready nodes of the current order
+    __join_job_array(node_name, job_arrays)
+        Let the submitter of a cluster bout_run node join a compatible job array
+    __submit_job_arrays(job_arrays, node_names)
+        Submit the job arrays and record the job ids of the tasks
+    __is_local(submitter)
+        Check if the submitter runs its jobs on the local machine
+    __this_order_has_local(submitter_dict)
+        Check if the current order of nodes has any local submitters
+    __next_order_has_local(submitter_dict)
+        Check if the next order of nodes has any local submitters
+    __release_up_to_order(node_names)
+        Release the cluster nodes up until the order of the nodes
+    __monitor_runs(submitter_dict, raise_errors)
+        Monitor the runs belonging to the same order
+    __reset_queues()
+        Reset the queues from the statuses of the run graph
+    __pop_ready_nodes()
+        Pop the ready nodes which still have the status 'ready'
+    __submit_ready_nodes(force, raise_errors)
+        Submit the ready nodes and register their completion callbacks
+    __poll_in_flight()
+        Poll the submitted nodes and request the status checks of the bout runs
+    __handle_completed_nodes(raise_errors)
+        Handle the nodes in the completed queue
+    __check_in_flight_async(loop, node_names)
+        Request the status checks of the bout runs in the default executor
+    __handle_finished_node(node_name, submitter, raise_errors)
+        Update the status of a finished node and queue the successors now ready
+    __make_completion_callback(node_name)
+        Return a callback which puts the node name in the completed queue
+    __release_successors(node_name)
+        Queue the successors which no longer waits for any predecessors
+    find_matching_order_number(node_names, node_orders)
+        Return the order matching the node names
+    release_nodes(nodes_to_release)
+        Release nodes to a submission queue if applicable
+    cluster_node_exist(node_names)
+        Check if any of the nodes have a submitter of type AbstractClusterSubmitter
+    dispatch(force, raise_errors, dispatch_when_ready, use_job_arrays)
+        Submit the nodes either order by order or as soon as they are ready
+    dispatch_by_order(force, raise_errors, use_job_arrays)
+        Submit the nodes order by order
+    dispatch_when_ready(force, raise_errors)
+        Submit the nodes as soon as all their predecessors have completed
+    dispatch_async(force, raise_errors)
+        Submit the nodes as soon as all their predecessors have completed, awaiting
+        the completion of the nodes
+
+    Examples
+    --------
+    >>> status_tracker = RunStatusTracker(run_graph)
+    >>> node_dispatcher = NodeDispatcher(run_graph, status_tracker, submit_node)
+    >>> node_dispatcher.dispatch(
+    ...     force=False, raise_errors=True, dispatch_when_ready=True,
+    ...     use_job_arrays=False)
+    >>> status_tracker.stop()
+    """
+
+    def __init__(
+        self,
+        run_graph: RunGraph,
+        status_tracker: RunStatusTracker,
+        submit_node: Callable[[str, bool], bool],
+    ) -> None:
+        """
+        Set the member data.
+
+        Parameters
+        ----------
+        run_graph : RunGraph
+            The run graph to dispatch
+        status_tracker : RunStatusTracker
+            The tracker of the status of the bout runs
+            The wait time of the tracker is used between the polls of the nodes
+        submit_node : callable
+            Callable which submits a node given its name and whether to force the
+            run, and returns whether anything was submitted
+        """
+        self.__run_graph = run_graph
+        self.__status_tracker = status_tracker
+        self.__submit_node = submit_node
+        self.__pending_predecessors: Dict[str, int] = dict()
+        self.__ready_queue: Deque[str] = deque()
+        self.__completed_queue: Deque[str] = deque()
+        self.__in_flight: Dict[
+            str, Tuple[AbstractSubmitter, Callable[[AbstractSubmitter], None]]
+        ] = dict()
+
+    def __add_waiting_for(self, node_name: str) -> None:
+        """
+        Add the job_ids to wait for in the submission script.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of current node
+        """
+        predecessors = self.__run_graph.predecessors(node_name)
+        waiting_for = (
+            self.__run_graph[p_name]["submitter"].job_id
+            for p_name in predecessors
+            if isinstance(
+                self.__run_graph[p_name]["submitter"],
+                AbstractClusterSubmitter,
+            )
+            and not self.__run_graph[p_name]["submitter"].completed()
+        )
+        self.__run_graph[node_name]["submitter"].add_waiting_for(waiting_for)
+
+    def __submit_order(
+        self, nodes_at_current_order: Tuple[str, ...], force: bool, use_job_arrays: bool
+    ) -> SubmitterDict:
+        """
+        Submit the ready nodes of the current order.
+
+        Parameters
+        ----------
+        nodes_at_current_order : tuple of str
+            The names of the nodes in the current order
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        use_job_arrays : bool
+            Whether the cluster bout_run nodes are submitted as job arrays
+
+        Returns
+        -------
+        submitter_dict : dict
+            Dict containing the the names of the submitted nodes as keys and a new
+            dict as values
+            The new dict contains the keywords 'submitter' with value
+            AbstractSubmitter
+        """
+        submitter_dict: SubmitterDict = dict()
+        job_arrays: Dict[Tuple[Any, ...], AbstractClusterJobArray] = dict()
+        for node_name in nodes_at_current_order:
+            if self.__run_graph[node_name]["status"] != "ready":
+                logging.info(
+                    "Skipping node '%s' as it has status=%s",
+                    node_name,
+                    self.__run_graph[node_name]["status"],
+                )
+                continue
+            if isinstance(
+                self.__run_graph[node_name]["submitter"],
+                AbstractClusterSubmitter,
+            ):
+                self.__add_waiting_for(node_name)
+                if use_job_arrays and node_name.startswith("bout_run"):
+                    self.__join_job_array(node_name, job_arrays)
+
+            submitter_dict[node_name] = dict()
+            submitter_dict[node_name]["submitter"] = self.__run_graph[node_name][
+                "submitter"
+            ]
+            if not self.__submit_node(node_name, force):
+                # Nothing was submitted, so there is nothing to monitor
+                submitter_dict.pop(node_name)
+        if len(job_arrays) != 0:
+            self.__submit_job_arrays(job_arrays, submitter_dict.keys())
+        return submitter_dict
+
+    def __join_job_array(
+        self,
+        node_name: str,
+        job_arrays: Dict[Tuple[Any, ...], AbstractClusterJobArray],
+    ) -> None:
+        """
+        Let the submitter of a cluster bout_run node join a compatible job array.
+
+        A new job array is created if none of the job arrays are compatible
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node
+        job_arrays : dict
+            The job arrays of the current order, keyed by the job array key of the
+            submitters
+            The dict is updated in place
+        """
+        submitter = self.__run_graph[node_name]["submitter"]
+        key = submitter.get_job_array_key()
+        if key not in job_arrays:
+            job_array = submitter.create_job_array()
+            if job_array is None:
+                return
+            job_arrays[key] = job_array
+        job_arrays[key].add(submitter)
+
+    def __submit_job_arrays(
+        self,
+        job_arrays: Dict[Tuple[Any, ...], AbstractClusterJobArray],
+        node_names: Iterable[str],
+    ) -> None:
+        """
+        Submit the job arrays and record the job ids of the tasks.
+
+        Parameters
+        ----------
+        job_arrays : dict
+            The job arrays of the current order
+        node_names : iterable of str
+            The names of the nodes in the current order
+        """
+        for job_array in job_arrays.values():
+            job_array.submit()
+        for node_name in node_names:
+            submitter = self.__run_graph[node_name]["submitter"]
+            run_id = self.__run_graph[node_name].get("run_id", None)
+            if (
+                isinstance(submitter, AbstractClusterSubmitter)
+                and submitter.job_array is not None
+                and submitter.job_id is not None
+                and run_id is not None
+            ):
+                MetadataUpdater(
+                    self.__run_graph[node_name]["db_connector"], run_id
+                ).update_array_task_id(submitter.job_id)
+
+    @staticmethod
+    def __is_local(submitter: Any) -> bool:
+        """
+        Check if the submitter runs its jobs on the local machine.
+
+        All submitters which are not cluster submitters (like the LocalSubmitter,
+        the AsyncLocalSubmitter and the WorkerPoolSubmitter) are local
+
+        Parameters
+        ----------
+        submitter : object
+            The submitter to check
+
+        Returns
+        -------
+        bool
+            True if the submitter is local
+        """
+        return isinstance(submitter, AbstractSubmitter) and not isinstance(
+            submitter, AbstractClusterSubmitter
+        )
+
+    def __this_order_has_local(self, submitter_dict: SubmitterDict) -> bool:
+        """
+        Check if the current order of nodes has any local submitters.
+
+        Parameters
+        ----------
+        submitter_dict : dict
+            Dict containing the the node names as keys and a new dict as values
+            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+
+        Returns
+        -------
+        bool
+            True if the current order has local submitters
+        """
+        for node_name in submitter_dict.keys():
+            if self.__is_local(submitter_dict[node_name]["submitter"]):
+                logging.debug(
+                    "%s is of local submitter type, will monitor this node order",
+                    node_name,
+                )
+                return True
+        return False
+
+    def __next_order_has_local(self, submitter_dict: SubmitterDict) -> bool:
+        """
+        Check if the next order of nodes has any local submitters.
+
+        Parameters
+        ----------
+        submitter_dict : dict
+            Dict containing the the node names as keys and a new dict as values
+            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+
+        Returns
+        -------
+        bool
+            True if the next order has local submitters
+        """
+        for node_name in submitter_dict.keys():
+            for successor_name in self.__run_graph.successors(node_name):
+                if self.__is_local(self.__run_graph[successor_name]["submitter"]):
+                    logging.info(
+                        "%s in the next node order is of local submitter type, "
+                        "will monitor this node order",
+                        successor_name,
+                    )
+                    return True
+        return False
+
+    def __release_up_to_order(self, node_names: Tuple[str, ...]) -> None:
+        """
+        Release the cluster nodes up until the order of the nodes.
+
+        Parameters
+        ----------
+        node_names : tuple of str
+            The names of the nodes in the current order
+        """
+        logging.warning(
+            "Mixed local and cluster nodes found in graph. "
+            "Releasing the cluster nodes up until the order of the "
+            "local submitter. This can cause a node waiting for one of "
+            "these nodes to be submitted after those nodes have finished "
+            "so that the cluster will reject those jobs."
+        )
+        reverse_sorted_node_orders = self.__run_graph.get_node_orders(reverse=True)
+        order_number = self.find_matching_order_number(
+            node_names, reverse_sorted_node_orders
+        )
+        orders_to_release = reverse_sorted_node_orders[order_number:]
+        self.release_nodes(orders_to_release)
+        # We also need to release the current order in case
+        # the graph is not connected
+        self.release_nodes((node_names,))
+
+    def __monitor_runs(self, submitter_dict: SubmitterDict, raise_errors: bool) -> None:
+        """
+        Monitor the runs belonging to the same order.
+
+        Parameters
+        ----------
+        submitter_dict : dict
+            Dict containing the the node names as keys and a new dict as values
+            The new dict contains the keywords 'submitter' with value AbstractSubmitter
+            If the submitter contains a bout run, the new dict will also contain the
+            keyword 'db_connector' with the value DatabaseConnector and the keyword
+            'project_path' with the value Path which will be used in the StatusChecker
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+
+        Raises
+        ------
+        RuntimeError
+            If the types in the dict are unexpected
+        """
+        logging.info("Start: Monitoring jobs at current order")
+        node_names = list(node_name for node_name in submitter_dict.keys())
+        while len(node_names) != 0:
+            for node_name in node_names:
+                submitter = submitter_dict[node_name]["submitter"]
+                if not isinstance(submitter, AbstractSubmitter):
+                    msg = (
+                        f"The submitter of the '{node_name}' node was expected to be "
+                        f"of type 'AbstractSubmitter', but got '{type(submitter)}' "
+                        f"instead"
+                    )
+                    logging.critical(msg)
+                    raise RuntimeError(msg)
+
+                if submitter.completed():
+                    if node_name.startswith("bout_run"):
+                        self.__status_tracker.record_queue_wait_time(node_name)
+                    if submitter.errored():
+                        self.__run_graph.change_status_node_and_dependencies(node_name)
+                        if raise_errors:
+                            submitter.raise_error()
+
+                    node_names.remove(node_name)
+                else:
+                    logging.debug(
+                        "job_id=%s found, %s seems to be running",
+                        submitter.job_id,
+                        node_name,
+                    )
+
+                if node_name.startswith("bout_run"):
+                    self.__status_tracker.check(node_name)
+
+            sleep(self.__status_tracker.wait_time)
+        logging.info("Done: Monitoring jobs at current order")
+
+    def __reset_queues(self) -> None:
+        """
+        Reset the queues from the statuses of the run graph.
+
+        Only predecessors with status 'ready' are counted as pending, as nodes with
+        other statuses will not be dispatched in this run
+        """
+        self.__pending_predecessors = {
+            node_name: len(
+                [
+                    predecessor
+                    for predecessor in self.__run_graph.predecessors(node_name)
+                    if self.__run_graph[predecessor]["status"] == "ready"
+                ]
+            )
+            for node_name in self.__run_graph.nodes
+        }
+        self.__ready_queue = deque(
+            node_name
+            for node_name, number_of_pending in self.__pending_predecessors.items()
+            if number_of_pending == 0
+            and self.__run_graph[node_name]["status"] == "ready"
+        )
+        self.__completed_queue = deque()
+        self.__in_flight = dict()
+
+    def __pop_ready_nodes(self) -> Iterator[str]:
+        """
+        Pop the ready nodes which still have the status 'ready'.
+
+        Nodes added to the ready queue while iterating are also popped
+
+        Yields
+        ------
+        node_name : str
+            Name of the node to submit
+        """
+        while len(self.__ready_queue) != 0:
+            node_name = self.__ready_queue.popleft()
+            if self.__run_graph[node_name]["status"] != "ready":
+                logging.info(
+                    "Skipping node '%s' as it has status=%s",
+                    node_name,
+                    self.__run_graph[node_name]["status"],
+                )
+                continue
+            yield node_name
+
+    def __submit_ready_nodes(self, force: bool, raise_errors: bool) -> None:
+        """
+        Submit the ready nodes and register their completion callbacks.
+
+        Parameters
+        ----------
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        """
+        for node_name in self.__pop_ready_nodes():
+            submitter = self.__run_graph[node_name]["submitter"]
+            callback = self.__make_completion_callback(node_name)
+            submitter.add_completion_callback(callback)
+            if self.__submit_node(node_name, force):
+                self.__in_flight[node_name] = (submitter, callback)
+                if isinstance(submitter, AbstractClusterSubmitter):
+                    submitter.release()
+            else:
+                submitter.remove_completion_callback(callback)
+                self.__handle_finished_node(node_name, None, raise_errors)
+
+    def __poll_in_flight(self) -> None:
+        """Poll the submitted nodes and request the status checks of the bout runs."""
+        # Polling the submitters triggers the completion callbacks
+        for node_name, (submitter, _) in tuple(self.__in_flight.items()):
+            if not submitter.completed():
+                logging.debug(
+                    "job_id=%s found, %s seems to be running",
+                    submitter.job_id,
+                    node_name,
+                )
+            if node_name.startswith("bout_run"):
+                self.__status_tracker.check(node_name)
+
+    def __handle_completed_nodes(self, raise_errors: bool) -> None:
+        """
+        Handle the nodes in the completed queue.
+
+        Parameters
+        ----------
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        """
+        while len(self.__completed_queue) != 0:
+            node_name = self.__completed_queue.popleft()
+            submitter, callback = self.__in_flight.pop(node_name)
+            submitter.remove_completion_callback(callback)
+            self.__handle_finished_node(node_name, submitter, raise_errors)
+
+    async def __check_in_flight_async(
+        self, loop: asyncio.AbstractEventLoop, node_names: Iterable[str]
+    ) -> None:
+        """
+        Request the status checks of the bout runs in the default executor.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The running event loop
+        node_names : iterable of str
+            The names of the nodes in flight
+        """
+        for node_name in node_names:
+            if node_name.startswith("bout_run"):
+                await loop.run_in_executor(None, self.__status_tracker.check, node_name)
+
+    def __handle_finished_node(
+        self, node_name: str, submitter: Optional[AbstractSubmitter], raise_errors: bool
+    ) -> None:
+        """
+        Update the status of a finished node and queue the successors now ready.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the finished node
+        submitter : None or AbstractSubmitter
+            The submitter of the node
+            None if nothing was submitted, i.e. the dependencies are fulfilled
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False all nodes depending on the errored node will be marked as
+            errored
+        """
+        if submitter is not None:
+            if node_name.startswith("bout_run"):
+                self.__status_tracker.record_queue_wait_time(node_name)
+            if submitter.errored():
+                self.__run_graph.change_status_node_and_dependencies(node_name)
+                if raise_errors:
+                    submitter.raise_error()
+                return
+        self.__run_graph[node_name]["status"] = "completed"
+        logging.info("%s completed", node_name)
+        self.__release_successors(node_name)
+
+    def __make_completion_callback(
+        self, node_name: str
+    ) -> Callable[[AbstractSubmitter], None]:
+        """
+        Return a callback which puts the node name in the completed queue.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node the callback belongs to
+
+        Returns
+        -------
+        callback : callable
+            The completion callback
+        """
+        completed_queue = self.__completed_queue
+
+        def callback(_: AbstractSubmitter) -> None:
+            """Put the node name in the completed queue."""
+            completed_queue.append(node_name)
+
+        return callback
+
+    def __release_successors(self, node_name: str) -> None:
+        """
+        Queue the successors which no longer waits for any predecessors.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node which has completed
+        """
+        for successor in self.__run_graph.successors(node_name):
+            self.__pending_predecessors[successor] -= 1
+            if (
+                self.__pending_predecessors[successor] == 0
+                and self.__run_graph[successor]["status"] == "ready"
+            ):
+                logging.debug(
+                    "All predecessors of %s has completed, adding it to the ready "
+                    "queue",
+                    successor,
+                )
+                self.__ready_queue.append(successor)
+
+    @staticmethod
+    def find_matching_order_number(
+        node_names: Tuple[str, ...], node_orders: Tuple[Tuple[str, ...], ...]
+    ) -> Optional[int]:
+        """
+        Return the order matching the node names.
+
+        Parameters
+        ----------
+        node_names : tuple of str
+            Node names
+        node_orders : tuple of tuple of str
+            Ordered tuple of orders
+
+        Returns
+        -------
+        order_number : int or None
+            The first order where a match was found
+            If no match was found 0 is returned
+        """
+        order_number = -1
+        found = False
+        for order_nodes in node_orders:
+            for node_name in node_names:
+                if node_name in order_nodes:
+                    found = True
+                    break
+                order_number += 1
+        if found:
+            return order_number
+        return None
+
+    def release_nodes(self, nodes_to_release: Tuple[Tuple[str, ...], ...]) -> None:
+        """
+        Release nodes to a submission queue if applicable.
+
+        Parameters
+        ----------
+        nodes_to_release : iterable
+            Name of nodes to release
+        """
+        if len(nodes_to_release) != 0:
+            logging.info("Start: Releasing held cluster nodes")
+            logging.debug("Release order: %s", nodes_to_release)
+            for order in nodes_to_release:
+                for node in order:
+                    if isinstance(
+                        self.__run_graph[node]["submitter"], AbstractClusterSubmitter
+                    ):
+                        self.__run_graph[node]["submitter"].release()
+            logging.info("Done: Releasing held cluster nodes")
+
+    def cluster_node_exist(self, node_names: Iterable[str]) -> bool:
+        """
+        Check if any of the nodes have a submitter of type AbstractClusterSubmitter.
+
+        Parameters
+        ----------
+        node_names : iterable of str
+            Iterable containing node names
+
+        Returns
+        -------
+        bool
+            Whether the iterable contains any cluster nodes
+        """
+        for node in node_names:
+            if isinstance(
+                self.__run_graph[node]["submitter"], AbstractClusterSubmitter
+            ):
+                return True
+        return False
+
+    def dispatch(
+        self,
+        force: bool,
+        raise_errors: bool,
+        dispatch_when_ready: bool,
+        use_job_arrays: bool,
+    ) -> None:
+        """
+        Submit the nodes either order by order or as soon as they are ready.
+
+        Parameters
+        ----------
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        dispatch_when_ready : bool
+            If True, submit the nodes as soon as their predecessors have completed
+            instead of processing the graph order by order
+        use_job_arrays : bool
+            If True, the cluster bout_run nodes of the same order which share
+            submitter type, processor split, submission_dict and dependencies are
+            submitted as one job array
+            Only used when the graph is processed order by order
+        """
+        if not dispatch_when_ready:
+            self.dispatch_by_order(force, raise_errors, use_job_arrays)
+            return
+        if use_job_arrays:
+            logging.warning(
+                "use_job_arrays is ignored as the nodes are dispatched one by "
+                "one when dispatch_when_ready is True"
+            )
+        self.dispatch_when_ready(force, raise_errors)
+
+    def dispatch_by_order(
+        self, force: bool, raise_errors: bool, use_job_arrays: bool
+    ) -> None:
+        """
+        Submit the nodes order by order.
+
+        The runs are only monitored if any local submitters are present in the
+        current or the next order, else the clusters will handle the monitoring
+
+        Parameters
+        ----------
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        use_job_arrays : bool
+            If True, the cluster bout_run nodes of the same order which share
+            submitter type, processor split, submission_dict and dependencies are
+            submitted as one job array
+        """
+        for nodes_at_current_order in self.__run_graph:
+            logging.info("Start: Processing nodes at current order")
+            submitter_dict = self.__submit_order(
+                nodes_at_current_order, force, use_job_arrays
+            )
+            if self.__this_order_has_local(
+                submitter_dict
+            ) or self.__next_order_has_local(submitter_dict):
+                if self.cluster_node_exist(self.__run_graph.nodes):
+                    self.__release_up_to_order(tuple(submitter_dict.keys()))
+                self.__monitor_runs(submitter_dict, raise_errors)
+            logging.info("Done: Processing nodes at current order")
+
+        if self.cluster_node_exist(self.__run_graph.nodes):
+            reverse_sorted_node_orders = self.__run_graph.get_node_orders(reverse=True)
+            self.release_nodes(reverse_sorted_node_orders)
+
+    def dispatch_when_ready(self, force: bool, raise_errors: bool) -> None:
+        """
+        Submit the nodes as soon as all their predecessors have completed.
+
+        Nodes whose predecessors have completed are put in a ready queue, and the
+        completion of a submitted node is signalled through a completion callback
+        on its submitter.
+        As the dependencies have already completed when a node is submitted, cluster
+        nodes are released immediately after submission.
+
+        Parameters
+        ----------
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        """
+        logging.info("Start: Dispatching nodes as their dependencies complete")
+        self.__reset_queues()
+        while len(self.__ready_queue) != 0 or len(self.__in_flight) != 0:
+            self.__submit_ready_nodes(force, raise_errors)
+            self.__poll_in_flight()
+            self.__handle_completed_nodes(raise_errors)
+            if len(self.__ready_queue) == 0 and len(self.__in_flight) != 0:
+                sleep(self.__status_tracker.wait_time)
+        logging.info("Done: Dispatching nodes as their dependencies complete")
+
+    async def dispatch_async(self, force: bool, raise_errors: bool) -> None:
+        """
+        Submit the nodes as soon as all their predecessors have completed.
+
+        Instead of polling the nodes in a sleep loop, the completion of every
+        submitted node is awaited through the wait_async method of its submitter.
+        The submission of the nodes and the requests of status checks (which may
+        build the project or call the cluster scheduler) are made in the default
+        executor, so that they do not block the event loop
+
+        Parameters
+        ----------
+        force : bool
+            Execute the run even if has been performed with the same parameters
+        raise_errors : bool
+            If True the program will raise any error caught when during the running
+            of the nodes
+            If False the program will continue execution, but all nodes depending on
+            the errored node will be marked as errored and not submitted
+        """
+        logging.info("Start: Dispatching nodes asynchronously")
+        self.__reset_queues()
+        in_flight: Dict["asyncio.Future[None]", str] = dict()
+        # NOTE: asyncio.get_running_loop requires python 3.7
+        loop = asyncio.get_event_loop()
+
+        while len(self.__ready_queue) != 0 or len(in_flight) != 0:
+            for node_name in self.__pop_ready_nodes():
+                submitter = self.__run_graph[node_name]["submitter"]
+                # NOTE: The nodes are submitted one at a time, so that the run
+                #       graph is only modified by one thread at a time
+                if await loop.run_in_executor(
+                    None, self.__submit_node, node_name, force
+                ):
+                    if isinstance(submitter, AbstractClusterSubmitter):
+                        submitter.release()
+                    in_flight[
+                        asyncio.ensure_future(
+                            submitter.wait_async(self.__status_tracker.wait_time)
+                        )
+                    ] = node_name
+                else:
+                    self.__handle_finished_node(node_name, None, raise_errors)
+
+            if len(in_flight) == 0:
+                continue
+
+            done, _ = await asyncio.wait(
+                tuple(in_flight.keys()),
+                timeout=self.__status_tracker.wait_time,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            await self.__check_in_flight_async(loop, tuple(in_flight.values()))
+
+            for future in done:
+                node_name = in_flight.pop(future)
+                # Raise any exception from the awaiting of the submitter
+                future.result()
+                self.__handle_finished_node(
+                    node_name, self.__run_graph[node_name]["submitter"], raise_errors
+                )
+        logging.info("Done: Dispatching nodes asynchronously")
@@ -0,0 +1,584 @@
+"""Contains the ParameterSweep class."""
+
+
+import itertools
+import logging
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_utils import get_fingerprint
+from bout_runners.make.make import Make
+from bout_runners.parameters.bout_paths import BoutPaths
+from bout_runners.parameters.bout_run_setup import BoutRunSetup
+from bout_runners.parameters.default_parameters import DefaultParameters
+from bout_runners.parameters.final_parameters import FinalParameters
+from bout_runners.parameters.run_parameters import RunParameters
+from bout_runners.runner.bout_run_executor import BoutRunExecutor
+from bout_runners.runner.run_graph import RunGraph
+from bout_runners.runner.run_group import RunGroup
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.submitter_factory import get_submitter, infer_submitter
+from bout_runners.utils.file_operations import get_caller_dir
+from bout_runners.utils.paths import get_use_wal
+
+Point = Dict[str, Dict[str, Union[int, float, bool, str]]]
+
+
+class ParameterSweep:
+    """
+    Class for building the run groups of a parameter sweep in one pass.
+
+    All the runs of the sweep share one DefaultParameters, Make, DatabaseConnector
+    and submitter inference, the schema of the database is checked once, and
+    the parameters of all the runs are registered with bulk database operations.
+
+    The points of the sweep are given on the same form as the dict of
+    RunParameters, and the runs are named by the name of the sweep and a hash of
+    the point, so that the same point gets the same name if the sweep is built
+    again.
+
+    Attributes
+    ----------
+    __run_graph : RunGraph
+        Getter variable for run_graph
+    __name : str
+        Getter variable for name
+    __project_path : Path
+        Getter variable for project_path
+    __bout_inp_src_dir : Path
+        The directory of the BOUT.inp file
+    __make : Make
+        The Make object shared by the runs
+    __default_parameters : DefaultParameters
+        The default parameters shared by the runs
+    __db_connector : DatabaseConnector
+        Getter variable for db_connector
+    __submitter_factory : callable
+        Function returning a new submitter for each run
+    __schema_checked : bool
+        Whether the schema of the database has been checked
+    __lazy_paths : bool
+        Whether the BoutPaths of the runs are lazy
+    __run_groups : dict of str, RunGroup
+        The run groups added by the sweep with the names of the points as keys
+    run_graph : RunGraph
+        The RunGraph which the RunGroups are attached to
+    name : str
+        Name of the sweep, used as the prefix of the names of the runs
+    project_path : Path
+        Root path of the project
+    db_connector : DatabaseConnector
+        The database connector shared by the runs
+
+    Methods
+    -------
+    get_grid_points(grid)
+        Return the points of the cartesian product of the parameter values
+    get_zipped_points(zipped)
+        Return the points of parameter values zipped together
+    get_data_frame_points(points)
+        Return the points given by the rows of a DataFrame
+    get_point_name(point)
+        Return the name of the run of a point
+    add_grid(grid, waiting_for)
+        Add the runs of the cartesian product of the parameter values
+    add_zipped(zipped, waiting_for)
+        Add the runs of parameter values zipped together
+    add_data_frame(points, waiting_for)
+        Add the runs given by the rows of a DataFrame
+    add_points(points, waiting_for)
+        Add a run for each point
+
+    Examples
+    --------
+    >>> run_graph = RunGraph()
+    >>> sweep = ParameterSweep(run_graph, project_path=Path('path', 'to', 'project'))
+    >>> run_groups = sweep.add_grid({'global': {'timestep': [0.1, 0.2]},
+    ...                              'mesh': {'nx': [4, 8, 16]}})
+    >>> len(run_groups)
+    6
+    >>> BoutRunner(run_graph).run()
+    """
+
+    def __init__(
+        self,
+        run_graph: Optional[RunGraph] = None,
+        name: str = "sweep",
+        project_path: Optional[Path] = None,
+        bout_inp_src_dir: Optional[Path] = None,
+        default_parameters: Optional[DefaultParameters] = None,
+        db_connector: Optional[DatabaseConnector] = None,
+        submitter_factory: Optional[Callable[[], AbstractSubmitter]] = None,
+        lazy_paths: bool = False,
+    ) -> None:
+        """
+        Set the objects shared by the runs.
+
+        Parameters
+        ----------
+        run_graph : None or RunGraph
+            The RunGraph which the RunGroups will be attached to
+            If None, a new RunGraph will be made
+        name : str
+            Name of the sweep, used as the prefix of the names of the runs
+        project_path : None or Path
+            Root path of the project
+            If None, the path of the root caller will be used
+        bout_inp_src_dir : None or Path
+            The directory of the BOUT.inp file (relative to the project path)
+            If None, data will be used
+        default_parameters : None or DefaultParameters
+            The default parameters shared by the runs
+            If None, the default parameters of the project will be used
+        db_connector : None or DatabaseConnector
+            The database connector shared by the runs
+            If None, the database of the project executable will be used, with
+            the write-ahead log if use_wal is set in the database section of
+            bout_runners.ini
+        submitter_factory : None or callable
+            Function returning a new submitter for each run
+            If None, the submitter will be inferred once and a new submitter of
+            the inferred type will be made for each run
+        lazy_paths : bool
+            If True, the directories of the runs are not made when the runs are
+            added, but by the BoutRunner just before the runs are submitted, so
+            that runs which are skipped never touch the filesystem
+        """
+        logging.info("Start: Making a ParameterSweep object")
+        self.__run_graph = run_graph if run_graph is not None else RunGraph()
+        self.__name = name
+        self.__project_path = (
+            Path(project_path).absolute()
+            if project_path is not None
+            else get_caller_dir()
+        )
+        self.__bout_inp_src_dir = self.__project_path.joinpath(
+            bout_inp_src_dir if bout_inp_src_dir is not None else "data"
+        )
+        self.__make = Make(self.__project_path)
+        self.__default_parameters = (
+            default_parameters
+            if default_parameters is not None
+            else DefaultParameters(
+                BoutPaths(
+                    project_path=self.__project_path,
+                    bout_inp_src_dir=self.__bout_inp_src_dir,
+                    bout_inp_dst_dir="settings_run",
+                )
+            )
+        )
+        self.__db_connector = (
+            db_connector
+            if db_connector is not None
+            else DatabaseConnector(
+                name=self.__make.exec_name,
+                db_root_path=self.__project_path,
+                use_wal=get_use_wal(),
+            )
+        )
+        factory: Callable[[], AbstractSubmitter]
+        if submitter_factory is not None:
+            factory = submitter_factory
+        else:
+            submitter_name, argument_dict = infer_submitter()
+
+            def factory() -> AbstractSubmitter:
+                """
+                Return a new submitter of the inferred type.
+
+                Returns
+                -------
+                AbstractSubmitter
+                    The submitter
+                """
+                # NOTE: get_submitter adds the missing arguments to the dict
+                return get_submitter(submitter_name, dict(argument_dict))
+
+        self.__submitter_factory = factory
+        self.__schema_checked = False
+        self.__lazy_paths = lazy_paths
+        self.__run_groups: Dict[str, RunGroup] = dict()
+        logging.info("Done: Making a ParameterSweep object")
+
+    @property
+    def run_graph(self) -> RunGraph:
+        """
+        Return the run graph.
+
+        Returns
+        -------
+        RunGraph
+            The run graph
+        """
+        return self.__run_graph
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the sweep.
+
+        Returns
+        -------
+        str
+            The name of the sweep
+        """
+        return self.__name
+
+    @property
+    def project_path(self) -> Path:
+        """
+        Return the root path of the project.
+
+        Returns
+        -------
+        Path
+            The root path of the project
+        """
+        return self.__project_path
+
+    @property
+    def db_connector(self) -> DatabaseConnector:
+        """
+        Return the database connector shared by the runs.
+
+        Returns
+        -------
+        DatabaseConnector
+            The database connector
+        """
+        return self.__db_connector
+
+    @staticmethod
+    def get_grid_points(grid: Mapping[str, Mapping[str, Sequence[Any]]]) -> List[Point]:
+        """
+        Return the points of the cartesian product of the parameter values.
+
+        Parameters
+        ----------
+        grid : dict
+            The values of the parameters on the form
+
+            >>> {'section': {'parameter': [value_1, value_2]}}
+
+        Returns
+        -------
+        points : list of dict
+            The points on the form
+
+            >>> [{'section': {'parameter': value_1}},
+            ...  {'section': {'parameter': value_2}}]
+        """
+        keys = [
+            (section, parameter)
+            for section, parameters in grid.items()
+            for parameter in parameters.keys()
+        ]
+        values = [grid[section][parameter] for section, parameter in keys]
+        points: List[Point] = list()
+        for combination in itertools.product(*values):
+            point: Point = dict()
+            for (section, parameter), value in zip(keys, combination):
+                point.setdefault(section, dict())[parameter] = value
+            points.append(point)
+        return points
+
+    @staticmethod
+    def get_zipped_points(
+        zipped: Mapping[str, Mapping[str, Sequence[Any]]],
+    ) -> List[Point]:
+        """
+        Return the points of parameter values zipped together.
+
+        Parameters
+        ----------
+        zipped : dict
+            The values of the parameters on the form
+
+            >>> {'section': {'parameter': [value_1, value_2]}}
+
+            All the sequences must have the same length
+
+        Returns
+        -------
+        points : list of dict
+            The points on the form
+
+            >>> [{'section': {'parameter': value_1}},
+            ...  {'section': {'parameter': value_2}}]
+
+        Raises
+        ------
+        ValueError
+            If the sequences have different lengths
+        """
+        keys = [
+            (section, parameter)
+            for section, parameters in zipped.items()
+            for parameter in parameters.keys()
+        ]
+        values = [zipped[section][parameter] for section, parameter in keys]
+        lengths = {len(value) for value in values}
+        if len(lengths) > 1:
+            msg = f"The zipped parameters have different lengths {sorted(lengths)}"
+            logging.critical(msg)
+            raise ValueError(msg)
+        points: List[Point] = list()
+        for combination in zip(*values):
+            point: Point = dict()
+            for (section, parameter), value in zip(keys, combination):
+                point.setdefault(section, dict())[parameter] = value
+            points.append(point)
+        return points
+
+    @staticmethod
+    def get_data_frame_points(points: pd.DataFrame) -> List[Point]:
+        """
+        Return the points given by the rows of a DataFrame.
+
+        Parameters
+        ----------
+        points : DataFrame
+            The points where the columns are named `section.parameter` as in the
+            DataFrames of the MetadataReader
+            Missing values (NaN) are not set, so the default value is used
+
+        Returns
+        -------
+        list of dict
+            The points on the form
+
+            >>> [{'section': {'parameter': value_1}},
+            ...  {'section': {'parameter': value_2}}]
+
+        Raises
+        ------
+        ValueError
+            If a column is not named `section.parameter`
+        """
+        keys: List[Tuple[str, str]] = list()
+        for column in points.columns:
+            section, separator, parameter = str(column).partition(".")
+            if separator == "" or section == "" or parameter == "":
+                msg = (
+                    f"The column '{column}' is not on the form 'section.parameter' "
+                    f"(use 'global.{column}' for parameters without a section)"
+                )
+                logging.critical(msg)
+                raise ValueError(msg)
+            keys.append((section, parameter))
+        data_frame_points: List[Point] = list()
+        for row in points.itertuples(index=False, name=None):
+            point: Point = dict()
+            for (section, parameter), value in zip(keys, row):
+                if pd.isna(value):
+                    continue
+                if isinstance(value, np.generic):
+                    value = value.item()
+                point.setdefault(section, dict())[parameter] = value
+            data_frame_points.append(point)
+        return data_frame_points
+
+    def get_point_name(self, point: Point) -> str:
+        """
+        Return the name of the run of a point.
+
+        Parameters
+        ----------
+        point : dict
+            The point on the form
+
+            >>> {'section': {'parameter': value}}
+
+        Returns
+        -------
+        str
+            The name of the sweep followed by the first 12 characters of the
+            fingerprint of the point
+        """
+        flat_point = {
+            f"{section}.{parameter}": value
+            for section, parameters in point.items()
+            for parameter, value in parameters.items()
+        }
+        return f"{self.__name}_{get_fingerprint(flat_point)[:12]}"
+
+    def add_grid(
+        self,
+        grid: Mapping[str, Mapping[str, Sequence[Any]]],
+        waiting_for: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[RunGroup]:
+        """
+        Add the runs of the cartesian product of the parameter values.
+
+        Parameters
+        ----------
+        grid : dict
+            The values of the parameters, see get_grid_points
+        waiting_for : None or str or iterable
+            Name of nodes all the runs will wait for
+
+        Returns
+        -------
+        list of RunGroup
+            The run groups of the runs
+        """
+        return self.add_points(self.get_grid_points(grid), waiting_for)
+
+    def add_zipped(
+        self,
+        zipped: Mapping[str, Mapping[str, Sequence[Any]]],
+        waiting_for: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[RunGroup]:
+        """
+        Add the runs of parameter values zipped together.
+
+        Parameters
+        ----------
+        zipped : dict
+            The values of the parameters, see get_zipped_points
+        waiting_for : None or str or iterable
+            Name of nodes all the runs will wait for
+
+        Returns
+        -------
+        list of RunGroup
+            The run groups of the runs
+        """
+        return self.add_points(self.get_zipped_points(zipped), waiting_for)
+
+    def add_data_frame(
+        self,
+        points: pd.DataFrame,
+        waiting_for: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[RunGroup]:
+        """
+        Add the runs given by the rows of a DataFrame.
+
+        Parameters
+        ----------
+        points : DataFrame
+            The points, see get_data_frame_points
+        waiting_for : None or str or iterable
+            Name of nodes all the runs will wait for
+
+        Returns
+        -------
+        list of RunGroup
+            The run groups of the runs
+        """
+        return self.add_points(self.get_data_frame_points(points), waiting_for)
+
+    def add_points(
+        self,
+        points: Sequence[Point],
+        waiting_for: Optional[Union[str, Iterable[str]]] = None,
+    ) -> List[RunGroup]:
+        """
+        Add a run for each point.
+
+        Points which are given more than once, also in earlier calls, only give
+        one run, and the run group of that run is returned for each of the
+        repetitions.
+        The parameters of all the runs are registered in the database, so that
+        recording the metadata of the runs does not write to the parameter
+        tables.
+
+        Parameters
+        ----------
+        points : sequence of dict
+            The points on the form
+
+            >>> [{'section': {'parameter': value_1}},
+            ...  {'section': {'parameter': value_2}}]
+
+        waiting_for : None or str or iterable
+            Name of nodes all the runs will wait for
+
+        Returns
+        -------
+        list of RunGroup
+            The run groups of the runs with one run group per point in the order
+            of the points
+
+        Raises
+        ------
+        ValueError
+            If the run graph contains a run of a point which was not added by this
+            sweep (like a run added by another sweep with the same name), as the
+            runs would share the same directory
+        """
+        logging.info("Start: Adding %d points to the sweep %s", len(points), self.name)
+        point_names = [self.get_point_name(point) for point in points]
+        unique_points: Dict[str, Point] = dict()
+        for point_name, point in zip(point_names, points):
+            if point_name in unique_points or point_name in self.__run_groups:
+                logging.warning("The point %s is repeated, adding its run once", point)
+                continue
+            if f"bout_run_{point_name}" in self.__run_graph.nodes:
+                msg = (
+                    f"The run graph already contains the run {point_name} of the "
+                    f"point {point}, which was not added by this sweep. Use another "
+                    f"name for the sweep to add the point again"
+                )
+                logging.critical(msg)
+                raise ValueError(msg)
+            unique_points[point_name] = point
+
+        bout_run_setups: List[BoutRunSetup] = list()
+        final_parameters_dicts = list()
+        for point_name, point in unique_points.items():
+            bout_paths = BoutPaths(
+                project_path=self.__project_path,
+                bout_inp_src_dir=self.__bout_inp_src_dir,
+                bout_inp_dst_dir=point_name,
+                lazy=self.__lazy_paths,
+            )
+            run_parameters = RunParameters(point)
+            final_parameters = FinalParameters(
+                self.__default_parameters, run_parameters
+            )
+            final_parameters_dicts.append(final_parameters.get_final_parameters())
+            executor = BoutRunExecutor(
+                bout_paths=bout_paths,
+                submitter=self.__submitter_factory(),
+                run_parameters=run_parameters,
+                make=self.__make,
+            )
+            bout_run_setup = BoutRunSetup(
+                executor,
+                self.__db_connector,
+                final_parameters,
+                check_schema=not self.__schema_checked,
+            )
+            self.__schema_checked = True
+            bout_run_setups.append(bout_run_setup)
+            self.__run_groups[point_name] = RunGroup(
+                self.__run_graph,
+                bout_run_setup,
+                name=point_name,
+                waiting_for=waiting_for,
+            )
+
+        if len(bout_run_setups) > 0:
+            # NOTE: The runs share the database, so any of the metadata recorders
+            #       can register the parameters of all the runs
+            bout_run_setups[0].metadata_recorder.create_parameter_tables_entries(
+                final_parameters_dicts
+            )
+        logging.info("Done: Adding %d points to the sweep %s", len(points), self.name)
+        return [self.__run_groups[point_name] for point_name in point_names]
@@ -278,7 +278,7 @@ class RunGraph:
             status="ready",
         )
 
-        self.__node_set = set(self.__graph.nodes)
+        self.__node_set.add(name)
 
     def add_function_node(
         self,
@@ -338,7 +338,7 @@ class RunGraph:
             submitter=submitter,
             status="ready",
         )
-        self.__node_set = set(self.__graph.nodes)
+        self.__node_set.add(name)
 
     def add_edge(self, start_node: str, end_node: str) -> None:
         """
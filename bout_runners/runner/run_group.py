@@ -4,7 +4,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from bout_runners.database.database_connector import DatabaseConnector
 from bout_runners.parameters.bout_paths import BoutPaths
@@ -28,8 +28,8 @@ class RunGroup:
     ----------
     __counter : int
         Counter used if no name is given in the constructor
-    __names : list of str
-        List of the run group names, makes sure there will be no name collision
+    __names : set of str
+        Set of the run group names, makes sure there will be no name collision
     __dst_dir : Path
         The path to the dump directory
     __name : str
@@ -92,7 +92,7 @@ class RunGroup:
     """
 
     __counter = 0
-    __names: List[str] = list()
+    __names: Set[str] = set()
 
     def __init__(
         self,
@@ -132,7 +132,7 @@ class RunGroup:
             RunGroup.__counter += 1
         if self.__name in RunGroup.__names:
             self.__increment_name()
-        RunGroup.__names.append(self.__name)
+        RunGroup.__names.add(self.__name)
 
         # Assign a node to bout_run_setup
         self.__bout_run_node_name = f"bout_run_{self.__name}"
@@ -0,0 +1,523 @@
+"""Contains the class planning which nodes of a run graph to skip."""
+
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from bout_runners.database.database_creator import DatabaseCreator
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.database_utils import (
+    get_file_modification,
+    get_fingerprint,
+    get_system_info,
+)
+from bout_runners.runner.run_graph import RunGraph
+
+RunDicts = Dict[str, Dict[str, Union[str, int, float, None]]]
+
+
+class RunPlanner:
+    """
+    Class which finds the bout runs of a run graph which have been done before.
+
+    A bout run has been done before if the database of the run contains a run
+    with the same final parameters, file modification, split and system info,
+    i.e. if BoutRunner.run_bout_run would not execute it.
+    Instead of capturing the data of the runs one by one, the fingerprints of
+    all the runs are resolved with one bulk query per table, and nothing is
+    written to the database.
+
+    Attributes
+    ----------
+    __run_graph : RunGraph
+        Getter variable for run_graph
+    run_graph : RunGraph
+        The run graph to plan
+
+    Methods
+    -------
+    __get_candidates()
+        Return the bout_run nodes which could have been done before
+    __get_entry_ids(db_reader, table_name, fingerprints)
+        Return the ids of the entries with the given fingerprints
+    __get_section_ids(db_reader, table_names, node_names)
+        Return the ids of the sections of the parameters of the nodes
+    __resolve_parameters(db_reader, table_names, node_names, run_dicts)
+        Resolve the parameters of the nodes
+    __resolve_file_modifications(db_reader, node_names, run_dicts)
+        Resolve the file modifications of the nodes
+    __resolve_splits(db_reader, node_names, run_dicts)
+        Resolve the processor splits of the nodes
+    __resolve_system_info(db_reader, node_names, run_dicts)
+        Resolve the system info of the nodes
+    __resolve_runs(db_reader, node_names, run_dicts)
+        Resolve the runs of the nodes
+    __get_done_runs(node_names)
+        Return the run ids of the nodes sharing a database which are done
+    get_done_nodes()
+        Return the bout_run nodes which have been done before
+    skip_done_nodes()
+        Mark the done bout_run nodes and the nodes only depending on them as skipped
+
+    Examples
+    --------
+    >>> run_planner = RunPlanner(run_graph)
+    >>> run_planner.skip_done_nodes()
+    ('bout_run_sweep_0f3a2b1c9d8e', 'post_processor_sweep_0f3a2b1c9d8e_0')
+    """
+
+    def __init__(self, run_graph: RunGraph) -> None:
+        """
+        Set the run graph.
+
+        Parameters
+        ----------
+        run_graph : RunGraph
+            The run graph to plan
+        """
+        self.__run_graph = run_graph
+
+    @property
+    def run_graph(self) -> RunGraph:
+        """
+        Return the run graph.
+
+        Returns
+        -------
+        self.__run_graph : RunGraph
+            The run graph to plan
+        """
+        return self.__run_graph
+
+    def __get_candidates(self) -> Tuple[str, ...]:
+        """
+        Return the bout_run nodes which could have been done before.
+
+        Runs from restart files are never done before, as they get a new name
+
+        Returns
+        -------
+        tuple of str
+            The names of the bout_run nodes with status 'ready' which do not
+            restart from another run
+        """
+        return tuple(
+            node_name
+            for node_name in self.__run_graph.nodes
+            if node_name.startswith("bout_run")
+            and self.__run_graph[node_name]["status"] == "ready"
+            and self.__run_graph[node_name]["bout_run_setup"].executor.restart_from
+            is None
+        )
+
+    @staticmethod
+    def __get_entry_ids(
+        db_reader: DatabaseReader, table_name: str, fingerprints: Iterable[str]
+    ) -> Dict[str, Optional[int]]:
+        """
+        Return the ids of the entries with the given fingerprints.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        table_name : str
+            Name of the table
+        fingerprints : iterable of str
+            The fingerprints to look up
+
+        Returns
+        -------
+        dict of str, None or int
+            The fingerprints as keys and the ids as values
+            None is given for the fingerprints which are not found
+        """
+        unique_fingerprints = tuple(dict.fromkeys(fingerprints))
+        entry_ids = db_reader.get_entry_ids(
+            table_name,
+            [{"fingerprint": fingerprint} for fingerprint in unique_fingerprints],
+        )
+        return dict(zip(unique_fingerprints, entry_ids))
+
+    def __get_section_ids(
+        self, db_reader: DatabaseReader, table_names: Set[str], node_names: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """
+        Return the ids of the sections of the parameters of the nodes.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        table_names : set of str
+            The names of the tables in the database
+        node_names : list of str
+            The bout_run nodes to resolve
+
+        Returns
+        -------
+        dict of str, dict
+            The names of the nodes as keys, and the ids of their sections keyed by
+            the name of the section tables as values
+            None is given for the sections which are not found
+        """
+        # NOTE: Most sections are shared by the runs of a sweep, so the
+        #       fingerprints are memoized on the items of the sections
+        #       The types are part of the key as 1 == 1.0 == True
+        memoized_fingerprints: Dict[Tuple[Tuple[str, type, Any], ...], str] = dict()
+        section_fingerprints: Dict[str, Dict[str, str]] = dict()
+        for node_name in node_names:
+            parameters_dict = self.__run_graph[node_name][
+                "bout_run_setup"
+            ].final_parameters.get_final_parameters()
+            section_fingerprints[node_name] = dict()
+            for section, section_parameters in parameters_dict.items():
+                items = tuple(
+                    (parameter, type(value), value)
+                    for parameter, value in section_parameters.items()
+                )
+                if items not in memoized_fingerprints:
+                    memoized_fingerprints[items] = get_fingerprint(section_parameters)
+                section_fingerprints[node_name][
+                    section.replace(":", "_")
+                ] = memoized_fingerprints[items]
+
+        ids_per_section: Dict[str, Dict[str, Optional[int]]] = dict()
+        for section_name in {
+            fingerprint_section
+            for fingerprints in section_fingerprints.values()
+            for fingerprint_section in fingerprints
+        }:
+            if section_name not in table_names:
+                ids_per_section[section_name] = dict()
+                continue
+            ids_per_section[section_name] = self.__get_entry_ids(
+                db_reader,
+                section_name,
+                (
+                    fingerprints[section_name]
+                    for fingerprints in section_fingerprints.values()
+                    if section_name in fingerprints
+                ),
+            )
+        return {
+            node_name: {
+                section_name: ids_per_section[section_name].get(fingerprint)
+                for section_name, fingerprint in fingerprints.items()
+            }
+            for node_name, fingerprints in section_fingerprints.items()
+        }
+
+    def __resolve_parameters(
+        self,
+        db_reader: DatabaseReader,
+        table_names: Set[str],
+        node_names: List[str],
+        run_dicts: RunDicts,
+    ) -> List[str]:
+        """
+        Resolve the parameters of the nodes.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        table_names : set of str
+            The names of the tables in the database
+        node_names : list of str
+            The bout_run nodes to resolve
+        run_dicts : dict
+            The run entries of the nodes, which are given the parameters_id
+
+        Returns
+        -------
+        list of str
+            The nodes whose parameters are found
+        """
+        parameters_fingerprints: Dict[str, str] = dict()
+        for node_name, section_ids in self.__get_section_ids(
+            db_reader, table_names, node_names
+        ).items():
+            if None not in section_ids.values():
+                parameters_fingerprints[node_name] = get_fingerprint(
+                    {
+                        f"{section_name}_id": section_id
+                        for section_name, section_id in section_ids.items()
+                    }
+                )
+        parameters_ids = self.__get_entry_ids(
+            db_reader, "parameters", parameters_fingerprints.values()
+        )
+        remaining = list()
+        for node_name, fingerprint in parameters_fingerprints.items():
+            if parameters_ids[fingerprint] is not None:
+                run_dicts[node_name]["parameters_id"] = parameters_ids[fingerprint]
+                remaining.append(node_name)
+        return remaining
+
+    def __resolve_file_modifications(
+        self, db_reader: DatabaseReader, node_names: List[str], run_dicts: RunDicts
+    ) -> List[str]:
+        """
+        Resolve the file modifications of the nodes.
+
+        The file modification is found once per project, as it involves calls to
+        git
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        node_names : list of str
+            The bout_run nodes to resolve
+        run_dicts : dict
+            The run entries of the nodes, which are given the file_modification_id
+
+        Returns
+        -------
+        list of str
+            The nodes whose file modifications are found
+        """
+        fingerprints: Dict[Tuple[Path, Path, str], str] = dict()
+        node_keys: Dict[str, Tuple[Path, Path, str]] = dict()
+        for node_name in node_names:
+            bout_run_setup = self.__run_graph[node_name]["bout_run_setup"]
+            make = bout_run_setup.executor.make
+            key = (
+                bout_run_setup.bout_paths.project_path,
+                make.makefile_path,
+                make.exec_name,
+            )
+            if key not in fingerprints:
+                try:
+                    fingerprints[key] = get_fingerprint(get_file_modification(*key))
+                except FileNotFoundError:
+                    # NOTE: No run can have been done with an executable which
+                    #       does not exist
+                    logging.debug("The executable of %s is not made", key[0])
+                    continue
+            node_keys[node_name] = key
+        file_modification_ids = self.__get_entry_ids(
+            db_reader, "file_modification", fingerprints.values()
+        )
+        remaining = list()
+        for node_name, key in node_keys.items():
+            if file_modification_ids[fingerprints[key]] is not None:
+                run_dicts[node_name]["file_modification_id"] = file_modification_ids[
+                    fingerprints[key]
+                ]
+                remaining.append(node_name)
+        return remaining
+
+    def __resolve_splits(
+        self, db_reader: DatabaseReader, node_names: List[str], run_dicts: RunDicts
+    ) -> List[str]:
+        """
+        Resolve the processor splits of the nodes.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        node_names : list of str
+            The bout_run nodes to resolve
+        run_dicts : dict
+            The run entries of the nodes, which are given the split_id
+
+        Returns
+        -------
+        list of str
+            The nodes whose splits are found
+        """
+        fingerprints: Dict[str, str] = dict()
+        for node_name in node_names:
+            processor_split = self.__run_graph[node_name][
+                "bout_run_setup"
+            ].executor.submitter.processor_split
+            fingerprints[node_name] = get_fingerprint(
+                {
+                    "number_of_processors": processor_split.number_of_processors,
+                    "number_of_nodes": processor_split.number_of_nodes,
+                    "processors_per_node": processor_split.processors_per_node,
+                }
+            )
+        split_ids = self.__get_entry_ids(db_reader, "split", fingerprints.values())
+        remaining = list()
+        for node_name, fingerprint in fingerprints.items():
+            if split_ids[fingerprint] is not None:
+                run_dicts[node_name]["split_id"] = split_ids[fingerprint]
+                remaining.append(node_name)
+        return remaining
+
+    def __resolve_system_info(
+        self, db_reader: DatabaseReader, node_names: List[str], run_dicts: RunDicts
+    ) -> List[str]:
+        """
+        Resolve the system info of the nodes.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        node_names : list of str
+            The bout_run nodes to resolve
+        run_dicts : dict
+            The run entries of the nodes, which are given the system_info_id
+
+        Returns
+        -------
+        list of str
+            The nodes given as input if the system info is found, otherwise none
+        """
+        fingerprint = get_fingerprint(get_system_info())
+        system_info_id = self.__get_entry_ids(db_reader, "system_info", (fingerprint,))[
+            fingerprint
+        ]
+        if system_info_id is None:
+            return list()
+        for node_name in node_names:
+            run_dicts[node_name]["system_info_id"] = system_info_id
+        return node_names
+
+    def __resolve_runs(
+        self, db_reader: DatabaseReader, node_names: List[str], run_dicts: RunDicts
+    ) -> Dict[str, int]:
+        """
+        Resolve the runs of the nodes.
+
+        Parameters
+        ----------
+        db_reader : DatabaseReader
+            The reader of the database
+        node_names : list of str
+            The bout_run nodes to resolve
+        run_dicts : dict
+            The run entries of the nodes
+
+        Returns
+        -------
+        done_runs : dict of str, int
+            The names of the done nodes as keys and the ids of the runs as values
+        """
+        fingerprints = {
+            node_name: get_fingerprint(
+                {
+                    column: run_dicts[node_name][column]
+                    for column in DatabaseCreator.run_identity_columns
+                }
+            )
+            for node_name in node_names
+        }
+        run_ids = self.__get_entry_ids(db_reader, "run", fingerprints.values())
+        done_runs: Dict[str, int] = dict()
+        for node_name, fingerprint in fingerprints.items():
+            run_id = run_ids[fingerprint]
+            if run_id is not None:
+                done_runs[node_name] = run_id
+        return done_runs
+
+    def __get_done_runs(self, node_names: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        Return the run ids of the nodes sharing a database which are done.
+
+        The foreign keys of the runs are resolved one table at the time, and
+        only the nodes whose entries are found are resolved in the next table
+
+        Parameters
+        ----------
+        node_names : tuple of str
+            The bout_run nodes using the same database
+
+        Returns
+        -------
+        dict of str, int
+            The names of the done nodes as keys and the ids of the runs as values
+        """
+        db_reader = DatabaseReader(
+            self.__run_graph[node_names[0]]["bout_run_setup"].db_connector
+        )
+        query_str = 'SELECT name FROM sqlite_master WHERE type="table"'
+        table_names = set(db_reader.query(query_str).loc[:, "name"])
+        if "run" not in table_names:
+            return dict()
+
+        # NOTE: The keys of the dicts mirror those of
+        #       MetadataRecorder.capture_new_data_from_run
+        run_dicts: RunDicts = {
+            node_name: {
+                "name": self.__run_graph[node_name][
+                    "bout_run_setup"
+                ].bout_paths.bout_inp_dst_dir.name
+            }
+            for node_name in node_names
+        }
+        remaining = self.__resolve_parameters(
+            db_reader, table_names, list(node_names), run_dicts
+        )
+        remaining = self.__resolve_file_modifications(db_reader, remaining, run_dicts)
+        remaining = self.__resolve_splits(db_reader, remaining, run_dicts)
+        remaining = self.__resolve_system_info(db_reader, remaining, run_dicts)
+        return self.__resolve_runs(db_reader, remaining, run_dicts)
+
+    def get_done_nodes(self) -> Dict[str, int]:
+        """
+        Return the bout_run nodes which have been done before.
+
+        Returns
+        -------
+        done_nodes : dict of str, int
+            The names of the done nodes as keys and the ids of the matching runs
+            as values
+        """
+        logging.info("Start: Finding the bout runs which have been done before")
+        node_names_per_db: Dict[Path, List[str]] = dict()
+        for node_name in self.__get_candidates():
+            db_path = self.__run_graph[node_name]["bout_run_setup"].db_connector.db_path
+            node_names_per_db.setdefault(db_path, list()).append(node_name)
+
+        done_nodes: Dict[str, int] = dict()
+        for node_names in node_names_per_db.values():
+            done_nodes.update(self.__get_done_runs(tuple(node_names)))
+        logging.info(
+            "Done: Finding the bout runs which have been done before, found %d",
+            len(done_nodes),
+        )
+        return done_nodes
+
+    def skip_done_nodes(self) -> Tuple[str, ...]:
+        """
+        Mark the done bout_run nodes and the nodes only depending on them as skipped.
+
+        A node which is not a bout_run node is skipped if all its predecessors
+        are skipped, so that the post-processors of a done run are skipped,
+        whereas a node which also waits for a run to be executed is not
+
+        Returns
+        -------
+        tuple of str
+            The names of the skipped nodes in the order of the graph
+        """
+        done_nodes = self.get_done_nodes()
+        skipped: Set[str] = set(done_nodes)
+        skipped_nodes: List[str] = list()
+        for nodes_at_current_order in self.__run_graph.get_node_orders():
+            for node_name in nodes_at_current_order:
+                if node_name not in skipped:
+                    predecessors = self.__run_graph.predecessors(node_name)
+                    if (
+                        node_name.startswith("bout_run")
+                        or self.__run_graph[node_name]["status"] != "ready"
+                        or len(predecessors) == 0
+                        or not skipped.issuperset(predecessors)
+                    ):
+                        continue
+                    skipped.add(node_name)
+                self.__run_graph[node_name]["status"] = "skipped"
+                skipped_nodes.append(node_name)
+        logging.info(
+            "Marked %d nodes as skipped, of which %d are done bout runs",
+            len(skipped_nodes),
+            len(done_nodes),
+        )
+        return tuple(skipped_nodes)
@@ -0,0 +1,161 @@
+"""Contains the class tracking the status of the bout runs in a run graph."""
+
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.metadata.metadata_updater import MetadataUpdater
+from bout_runners.metadata.status_daemon import StatusDaemon
+from bout_runners.runner.run_graph import RunGraph
+from bout_runners.submitter.local_submitter import LocalSubmitter
+
+
+class RunStatusTracker:
+    r"""
+    Class which tracks the status of the bout_run nodes of a run graph.
+
+    The statuses are checked by StatusDaemons, which are shared by the nodes with
+    the same database and project path
+
+    Attributes
+    ----------
+    __run_graph : RunGraph
+        The run graph of the nodes
+    __status_daemons : dict
+        The status daemons of the bout runs on the form
+
+        >>> {(db_path, project_path): status_daemon}
+
+    wait_time : int
+        Time between the status checks of the daemons
+    track_progress : bool
+        Whether the progress of the running BOUT++ runs is sampled into the
+        progress table of the database
+
+    Methods
+    -------
+    check(node_name)
+        Request a status check from the StatusDaemon of the node
+    stop()
+        Release the status daemons after a final check
+    record_queue_wait_time(node_name)
+        Record the time a BOUT++ run waited for free local processors
+
+    Examples
+    --------
+    >>> status_tracker = RunStatusTracker(run_graph, wait_time=5)
+    >>> status_tracker.check('bout_run_0')
+    >>> status_tracker.stop()
+    """
+
+    def __init__(
+        self, run_graph: RunGraph, wait_time: int = 5, track_progress: bool = False
+    ) -> None:
+        """
+        Set the member data.
+
+        Parameters
+        ----------
+        run_graph : RunGraph
+            The run graph of the nodes
+        wait_time : int
+            Time between the status checks of the daemons
+        track_progress : bool
+            Whether the progress of the running BOUT++ runs is sampled into the
+            progress table of the database every time the status is checked
+        """
+        self.__run_graph = run_graph
+        self.wait_time = wait_time
+        self.track_progress = track_progress
+        self.__status_daemons: Dict[Tuple[Path, Path], StatusDaemon] = dict()
+
+    def check(self, node_name: str) -> None:
+        """
+        Request a status check from the StatusDaemon of the node.
+
+        The check is made in the background, so that the monitoring does not wait
+        for the status I/O
+
+        Parameters
+        ----------
+        node_name : str
+            Name of node to run the status checker for
+
+        Raises
+        ------
+        RuntimeError
+            If the types of self.__run_graph[node_name]["db_connector"] or
+            self.__run_graph[node_name]["project_path"] are unexpected
+        """
+        db_connector = self.__run_graph[node_name]["db_connector"]
+        if not isinstance(db_connector, DatabaseConnector):
+            raise RuntimeError(
+                f"The db_connector of the '{node_name}' node was expected "
+                f"to be of type 'DatabaseConnector', but got "
+                f"'{type(db_connector)}' instead"
+            )
+        project_path = self.__run_graph[node_name]["project_path"]
+        if not isinstance(project_path, Path):
+            raise RuntimeError(
+                f"The project_path of the '{node_name}' node was expected "
+                f"to be of type 'Path', but got '{type(project_path)}' "
+                f"instead"
+            )
+        # NOTE: The daemons are reused so that the logs are not read anew on every
+        #       check
+        key = (db_connector.db_path, project_path)
+        if key not in self.__status_daemons or not self.__status_daemons[key].running:
+            if key in self.__status_daemons:
+                self.__status_daemons[key].release()
+            self.__status_daemons[key] = StatusDaemon.get_daemon(
+                db_connector,
+                project_path,
+                self.wait_time,
+                track_progress=self.track_progress,
+            )
+        self.__status_daemons[key].request_check()
+
+    def stop(self) -> None:
+        """
+        Release the status daemons after a final check.
+
+        The daemons are shared with other tools in the process, so they are
+        only stopped if no other tool is using them
+
+        Raises
+        ------
+        Exception
+            Any error raised by the final checks
+        """
+        status_daemons = tuple(self.__status_daemons.values())
+        self.__status_daemons = dict()
+        for status_daemon in status_daemons:
+            status_daemon.release()
+        for status_daemon in status_daemons:
+            # NOTE: A daemon which is still used by other tools is not stopped,
+            #       so the final check is requested explicitly
+            if status_daemon.running:
+                status_daemon.check_now()
+            elif status_daemon.last_error is not None:
+                raise status_daemon.last_error
+
+    def record_queue_wait_time(self, node_name: str) -> None:
+        """
+        Record the time a BOUT++ run waited for free local processors.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the bout_run node
+        """
+        submitter = self.__run_graph[node_name]["submitter"]
+        run_id = self.__run_graph[node_name].get("run_id", None)
+        if (
+            isinstance(submitter, LocalSubmitter)
+            and submitter.queue_wait_time is not None
+            and run_id is not None
+        ):
+            MetadataUpdater(
+                self.__run_graph[node_name]["db_connector"], run_id
+            ).update_queue_wait_time(submitter.queue_wait_time)
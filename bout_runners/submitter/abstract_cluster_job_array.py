@@ -0,0 +1,358 @@
+"""Contains the abstract cluster job array class."""
+
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
+from bout_runners.submitter.local_submitter import LocalSubmitter
+
+
+class AbstractClusterJobArray(ABC):
+    """
+    The abstract base class of the job arrays.
+
+    A job array bundles the commands of compatible cluster submitters into one
+    submission, where each task of the array picks its command from a command table
+    file by its array index.
+    The submitters joining the job array defer their submissions to the job array
+    until it is submitted.
+    When the job array is submitted, each submitter is given the job_id of its task,
+    so that dependencies, status tracking and std_out and std_err work per task.
+
+    Attributes
+    ----------
+    __job_name : str
+        Getter variable for job_name
+    __store_dir : Path
+        Getter variable for store_dir
+    __members : list of AbstractClusterSubmitter
+        The submitters which have joined the job array
+    __tasks : list of tuple
+        The submitters and commands of the tasks on the form
+
+        >>> [(submitter, command), ...]
+
+    __waiting_for : tuple of str
+        The job ids the job array will wait for
+    __array_id : None or str
+        Getter variable for array_id
+    __released : bool
+        Getter variable for released
+    array_id : None or str
+        The job id of the job array
+        None if the job array has not been submitted
+    job_name : str
+        Name of the job array
+    number_of_tasks : int
+        The number of commands added to the job array
+    released : bool
+        Whether or not the job array has been released to the queue
+    store_dir : Path
+        Directory to store the script and the command table
+    submitted : bool
+        Whether or not the job array has been submitted
+
+    Methods
+    -------
+    _create_submission_string(template, dispatch_command, waiting_for)
+        Return the script of the job array
+    get_dispatch_command(table_path)
+        Return the command which executes the command of the current array index
+    get_task_id(index)
+        Return the job id of a task
+    get_task_log_and_error_base(index)
+        Return the base for the path for the .log and .err files of a task
+    add(submitter)
+        Let a submitter join the job array
+    add_command(submitter, command, waiting_for)
+        Add the command of a member to the job array
+    submit()
+        Submit the job array
+    release()
+        Release the job array if held
+
+    Examples
+    --------
+    >>> job_array = submitter_1.create_job_array()
+    >>> job_array.add(submitter_1)
+    >>> job_array.add(submitter_2)
+    >>> submitter_1.submit_command("echo 'Hello'")
+    >>> submitter_2.submit_command("echo 'World'")
+    >>> job_array.submit()
+    >>> job_array.release()
+    """
+
+    def __init__(self, job_name: str, store_dir: Path) -> None:
+        """
+        Set the member data.
+
+        Parameters
+        ----------
+        job_name : str
+            Name of the job array
+        store_dir : Path
+            Directory to store the script and the command table
+        """
+        self.__job_name = job_name
+        self.__store_dir = store_dir
+        self.__members: List[AbstractClusterSubmitter] = list()
+        self.__tasks: List[Tuple[AbstractClusterSubmitter, str]] = list()
+        self.__waiting_for: Tuple[str, ...] = tuple()
+        self.__array_id: Optional[str] = None
+        self.__released = False
+
+    @property
+    def job_name(self) -> str:
+        """
+        Return the name of the job array.
+
+        Returns
+        -------
+        str
+            The job name
+        """
+        return self.__job_name
+
+    @property
+    def store_dir(self) -> Path:
+        """
+        Return the directory to store the script and the command table.
+
+        Returns
+        -------
+        Path
+            Path to the store directory
+        """
+        return self.__store_dir
+
+    @property
+    def array_id(self) -> Optional[str]:
+        """
+        Return the job id of the job array.
+
+        Returns
+        -------
+        None or str
+            The job id of the job array
+            None if the job array has not been submitted
+        """
+        return self.__array_id
+
+    @property
+    def number_of_tasks(self) -> int:
+        """
+        Return the number of commands added to the job array.
+
+        Returns
+        -------
+        int
+            The number of tasks
+        """
+        return len(self.__tasks)
+
+    @property
+    def submitted(self) -> bool:
+        """
+        Return whether the job array has been submitted.
+
+        Returns
+        -------
+        bool
+            True if the job array has been submitted
+        """
+        return self.__array_id is not None
+
+    @property
+    def released(self) -> bool:
+        """
+        Return whether the job array has been released to the cluster.
+
+        Returns
+        -------
+        bool
+            True if the job array is not held in the cluster
+        """
+        return self.__released
+
+    @abstractmethod
+    def _create_submission_string(
+        self,
+        template: AbstractClusterSubmitter,
+        dispatch_command: str,
+        waiting_for: Tuple[str, ...],
+    ) -> str:
+        """
+        Return the script of the job array.
+
+        Parameters
+        ----------
+        template : AbstractClusterSubmitter
+            The submitter whose options are used for all the tasks
+        dispatch_command : str
+            The command which executes the command of the current array index
+        waiting_for : tuple of str
+            Tuple of ids that the job array will wait for
+
+        Returns
+        -------
+        str
+            The script to be submitted
+        """
+
+    @staticmethod
+    @abstractmethod
+    def get_dispatch_command(table_path: Path) -> str:
+        """
+        Return the command which executes the command of the current array index.
+
+        Parameters
+        ----------
+        table_path : Path
+            Path to the command table, where line number i + 1 contains the command
+            of array index i
+
+        Returns
+        -------
+        str
+            The command
+        """
+
+    @abstractmethod
+    def get_task_id(self, index: int) -> str:
+        """
+        Return the job id of a task.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the task
+
+        Returns
+        -------
+        str
+            The job id of the task
+        """
+
+    @abstractmethod
+    def get_task_log_and_error_base(self, index: int) -> Path:
+        """
+        Return the base for the path for the .log and .err files of a task.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the task
+
+        Returns
+        -------
+        Path
+            The base of the .log and .err files
+        """
+
+    def add(self, submitter: AbstractClusterSubmitter) -> None:
+        """
+        Let a submitter join the job array.
+
+        Parameters
+        ----------
+        submitter : AbstractClusterSubmitter
+            The submitter which will defer its submissions to the job array
+        """
+        submitter.join_job_array(self)
+        self.__members.append(submitter)
+
+    def add_command(
+        self,
+        submitter: AbstractClusterSubmitter,
+        command: str,
+        waiting_for: Tuple[str, ...],
+    ) -> None:
+        """
+        Add the command of a member to the job array.
+
+        Parameters
+        ----------
+        submitter : AbstractClusterSubmitter
+            The submitter the command belongs to
+        command : str
+            The command to submit
+        waiting_for : tuple of str
+            Tuple of ids that the submitter will wait for
+            The job array waits for the union of the ids of all its commands
+        """
+        self.__tasks.append((submitter, command))
+        self.__waiting_for = tuple(dict.fromkeys(self.__waiting_for + waiting_for))
+        logging.debug(
+            "Deferred the submission of %s to the job array %s",
+            submitter.job_name,
+            self.job_name,
+        )
+
+    def submit(self) -> Optional[str]:
+        """
+        Submit the job array.
+
+        A single command is submitted as an ordinary job
+
+        Returns
+        -------
+        array_id : None or str
+            The job id of the job array
+            None if less than two commands were added
+        """
+        for member in self.__members:
+            member.leave_job_array()
+        if len(self.__tasks) == 0:
+            return None
+        if len(self.__tasks) == 1:
+            submitter, command = self.__tasks[0]
+            submitter.add_waiting_for(self.__waiting_for)
+            submitter.submit_command(command)
+            return None
+
+        template = self.__tasks[0][0]
+        table_path = self.store_dir.joinpath(f"{self.job_name}.commands")
+        with table_path.open("w") as file:
+            file.write("\n".join(command for _, command in self.__tasks) + "\n")
+        submission_time = datetime.now()
+        self.__array_id = template.submit_script(
+            self.store_dir.joinpath(f"{self.job_name}.sh"),
+            self._create_submission_string(
+                template, self.get_dispatch_command(table_path), self.__waiting_for
+            ),
+        )
+        for index, (submitter, _) in enumerate(self.__tasks):
+            # The members keep the reference to the job array so that they are
+            # released together
+            submitter.join_job_array(self)
+            submitter.set_array_task(
+                self.get_task_id(index),
+                self.get_task_log_and_error_base(index),
+                submission_time,
+            )
+        logging.info(
+            "job_id %s (%s) given to the job array of %d tasks with commands in %s",
+            self.__array_id,
+            self.job_name,
+            len(self.__tasks),
+            table_path,
+        )
+        return self.__array_id
+
+    def release(self) -> None:
+        """Release the job array if held."""
+        if self.__array_id is not None and not self.__released:
+            template = self.__tasks[0][0]
+            logging.debug("Releasing job array %s (%s)", self.__array_id, self.job_name)
+            # pylint: disable=protected-access
+            release_str = template._cluster_specific["release_str"]
+            submitter = LocalSubmitter()
+            submitter.submit_command(f"{release_str} {self.__array_id}")
+            submitter.wait_until_completed()
+            self.__released = True
+            for task_submitter, _ in self.__tasks:
+                task_submitter.release()
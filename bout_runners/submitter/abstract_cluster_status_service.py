@@ -0,0 +1,355 @@
+"""Contains the abstract cluster status service class."""
+
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from bout_runners.submitter.local_submitter import LocalSubmitter
+from bout_runners.utils.paths import get_submitters_configuration
+
+
+class AbstractClusterStatusService(ABC):
+    """
+    The abstract base class of the services polling the status of cluster jobs.
+
+    Instead of letting every submitter query the scheduler for its own job, the
+    submitters register their job ids to the service shared by all submitters of
+    the same kind in the process.
+    When the status of a job is requested and the cached statuses are older than
+    cache_ttl, the status of every tracked job is obtained from one query to the
+    scheduler.
+    Jobs are no longer polled once they have finished.
+
+    Attributes
+    ----------
+    __services : dict
+        The services shared by all the submitters in this process on the form
+
+        >>> {service_class: service}
+
+    __cache_ttl : float
+        Getter and setter variable for cache_ttl
+    __tracked : dict of str, None or datetime
+        The job ids of the jobs to poll as keys, and the submission times as values
+        The submission time is None if it is unknown
+    __statuses : dict of str, tuple
+        The job ids as keys, and the latest state and return code as values
+    __last_poll : None or float
+        Monotonic time of the last query to the scheduler
+    __lock : threading.Lock
+        Lock ensuring that only one thread queries the scheduler at the time
+    cache_ttl : float
+        Seconds the statuses obtained from the scheduler are reused
+    number_of_tracked : int
+        The number of jobs which are polled
+    start_time_margin : timedelta
+        Margin subtracted from the earliest submission time when querying
+    unknown_start_time : timedelta
+        How far back to query if the submission time of a job is unknown
+    finished_states : tuple of str
+        States of the jobs which have finished without a return code
+
+    Methods
+    -------
+    _query(job_ids, start_time)
+        Return the states and return codes of the jobs from the scheduler
+    _run_command(command)
+        Run a command locally and return the standard output
+    get_service()
+        Return the service shared by all the submitters in this process
+    get_cache_ttl_from_configuration()
+        Return the cache_ttl given in the submitters configuration
+    track(job_id, submission_time)
+        Add a job to the jobs to poll
+    untrack(job_id)
+        Remove a job from the jobs to poll and from the cache
+    get_start_time()
+        Return the earliest time to query from
+    refresh(force)
+        Update the statuses of all the tracked jobs if the cache has expired
+    is_finished(state, return_code)
+        Return whether the job has finished
+    get_status(job_id)
+        Return the state and return code of a job
+    """
+
+    __services: Dict[type, "AbstractClusterStatusService"] = dict()
+
+    start_time_margin = timedelta(hours=1)
+    unknown_start_time = timedelta(days=365)
+    finished_states: Tuple[str, ...] = tuple()
+
+    def __init__(self, cache_ttl: Optional[float] = None) -> None:
+        """
+        Set the member data.
+
+        Parameters
+        ----------
+        cache_ttl : None or float
+            Seconds the statuses obtained from the scheduler are reused
+            If None, the value from the submitters configuration will be used
+        """
+        self.__cache_ttl = 0.0
+        self.cache_ttl = (
+            cache_ttl
+            if cache_ttl is not None
+            else self.get_cache_ttl_from_configuration()
+        )
+        self.__tracked: Dict[str, Optional[datetime]] = dict()
+        self.__statuses: Dict[str, Tuple[Optional[str], Optional[int]]] = dict()
+        self.__last_poll: Optional[float] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def cache_ttl(self) -> float:
+        """
+        Set the properties of self.cache_ttl.
+
+        Returns
+        -------
+        float
+            Seconds the statuses obtained from the scheduler are reused
+
+        Raises
+        ------
+        ValueError
+            If the cache_ttl is negative
+        """
+        return self.__cache_ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, cache_ttl: float) -> None:
+        if cache_ttl < 0:
+            msg = f"The cache_ttl must be non-negative, got {cache_ttl}"
+            logging.critical(msg)
+            raise ValueError(msg)
+        self.__cache_ttl = float(cache_ttl)
+        logging.debug("cache_ttl set to %s", cache_ttl)
+
+    @property
+    def number_of_tracked(self) -> int:
+        """
+        Return the number of jobs which are polled.
+
+        Returns
+        -------
+        int
+            The number of tracked jobs
+        """
+        return len(self.__tracked)
+
+    @abstractmethod
+    def _query(
+        self, job_ids: Tuple[str, ...], start_time: datetime
+    ) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """
+        Return the states and return codes of the jobs from the scheduler.
+
+        Parameters
+        ----------
+        job_ids : tuple of str
+            The job ids to query
+        start_time : datetime
+            The earliest submission time of the jobs
+
+        Returns
+        -------
+        statuses : dict of str, tuple
+            The job ids as keys, and the state and return code as values
+            The return code must be None if the job has not finished
+            Jobs unknown to the scheduler may be left out
+        """
+
+    @staticmethod
+    def _run_command(command: str, run_path: Optional[Path] = None) -> str:
+        """
+        Run a command locally and return the standard output.
+
+        Parameters
+        ----------
+        command : str
+            The command to run
+        run_path : None or Path
+            Directory to run the command from
+            If None, the current working directory will be used
+
+        Returns
+        -------
+        str
+            The standard output of the command
+        """
+        local_submitter = LocalSubmitter(
+            run_path=run_path if run_path is not None else Path.cwd()
+        )
+        local_submitter.submit_command(command)
+        local_submitter.wait_until_completed(raise_error=False)
+        return local_submitter.std_out if local_submitter.std_out is not None else ""
+
+    @classmethod
+    def get_service(cls) -> "AbstractClusterStatusService":
+        """
+        Return the service shared by all the submitters in this process.
+
+        Returns
+        -------
+        AbstractClusterStatusService
+            The shared service of the calling class
+        """
+        if cls not in AbstractClusterStatusService.__services:
+            AbstractClusterStatusService.__services[cls] = cls()
+            logging.debug("Created the shared %s", cls.__name__)
+        return AbstractClusterStatusService.__services[cls]
+
+    @staticmethod
+    def get_cache_ttl_from_configuration() -> float:
+        """
+        Return the cache_ttl given in the submitters configuration.
+
+        Returns
+        -------
+        float
+            The status_cache_ttl of the cluster section
+            5 seconds if it is not present
+        """
+        config = get_submitters_configuration()
+        if config.has_section("cluster"):
+            return config["cluster"].getfloat("status_cache_ttl", fallback=5.0)
+        return 5.0
+
+    def track(self, job_id: str, submission_time: Optional[datetime] = None) -> None:
+        """
+        Add a job to the jobs to poll.
+
+        Parameters
+        ----------
+        job_id : str
+            The job id
+        submission_time : None or datetime
+            The time the job was submitted
+            If None, the jobs are queried from unknown_start_time ago
+        """
+        with self.__lock:
+            self.__tracked[job_id] = submission_time
+            self.__statuses.pop(job_id, None)
+        logging.debug("Tracking job_id %s in %s", job_id, self.__class__.__name__)
+
+    def untrack(self, job_id: str) -> None:
+        """
+        Remove a job from the jobs to poll and from the cache.
+
+        Parameters
+        ----------
+        job_id : str
+            The job id
+        """
+        with self.__lock:
+            self.__tracked.pop(job_id, None)
+            self.__statuses.pop(job_id, None)
+
+    def get_start_time(self) -> datetime:
+        """
+        Return the earliest time to query from.
+
+        Returns
+        -------
+        datetime
+            The earliest submission time of the tracked jobs minus
+            start_time_margin
+        """
+        now = datetime.now()
+        earliest = min(
+            (
+                submission_time
+                if submission_time is not None
+                else now - self.unknown_start_time
+                for submission_time in self.__tracked.values()
+            ),
+            default=now,
+        )
+        return earliest - self.start_time_margin
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Update the statuses of all the tracked jobs if the cache has expired.
+
+        Parameters
+        ----------
+        force : bool
+            Query the scheduler even if the cache has not expired
+        """
+        with self.__lock:
+            if len(self.__tracked) == 0:
+                return
+            if (
+                not force
+                and self.__last_poll is not None
+                and monotonic() - self.__last_poll < self.cache_ttl
+            ):
+                return
+            job_ids = tuple(self.__tracked.keys())
+            statuses = self._query(job_ids, self.get_start_time())
+            self.__last_poll = monotonic()
+            for job_id in job_ids:
+                if job_id not in statuses:
+                    continue
+                self.__statuses[job_id] = statuses[job_id]
+                if self.is_finished(*statuses[job_id]):
+                    # The job has finished, so there is no need to poll it again
+                    self.__tracked.pop(job_id)
+            logging.debug(
+                "Polled %d job(s) in one query, %d are still tracked",
+                len(job_ids),
+                len(self.__tracked),
+            )
+
+    def is_finished(self, state: Optional[str], return_code: Optional[int]) -> bool:
+        """
+        Return whether the job has finished.
+
+        Parameters
+        ----------
+        state : None or str
+            The state of the job
+        return_code : None or int
+            The return code of the job
+
+        Returns
+        -------
+        bool
+            True if the return code of the job is known, or if the job has one of
+            the finished_states
+        """
+        return return_code is not None or state in self.finished_states
+
+    def get_status(self, job_id: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Return the state and return code of a job.
+
+        Jobs which are not already tracked will be tracked
+
+        Parameters
+        ----------
+        job_id : str
+            The job id
+
+        Returns
+        -------
+        state : None or str
+            The state of the job
+            None if the scheduler does not know the job
+        return_code : None or int
+            The return code of the job
+            None if the job has not finished
+        """
+        with self.__lock:
+            known = job_id in self.__tracked or job_id in self.__statuses
+        if not known:
+            self.track(job_id)
+        self.refresh()
+        with self.__lock:
+            return self.__statuses.get(job_id, (None, None))
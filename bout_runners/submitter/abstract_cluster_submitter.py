@@ -4,13 +4,19 @@ import re
 from abc import abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from bout_runners.submitter.abstract_submitter import AbstractSubmitter
 from bout_runners.submitter.local_submitter import LocalSubmitter
 from bout_runners.submitter.processor_split import ProcessorSplit
 from bout_runners.utils.file_operations import get_caller_dir
 
+if TYPE_CHECKING:
+    # NOTE: Only imported for type checking to avoid circular imports
+    from bout_runners.submitter.abstract_cluster_job_array import (
+        AbstractClusterJobArray,
+    )
+
 
 class AbstractClusterSubmitter(AbstractSubmitter):
     """
@@ -21,6 +27,8 @@ class AbstractClusterSubmitter(AbstractSubmitter):
     _cluster_specific : dict
         Dict containing the commands for cancelling a job, releasing a job and
         submit a job for the inherited object
+    _job_array : None or AbstractClusterJobArray
+        Getter variable for job_array
     _job_name : str
         Getter and setter variable for job_name
     _log_and_error_base : Path
@@ -33,6 +41,8 @@ class AbstractClusterSubmitter(AbstractSubmitter):
         Getter variable for waiting_for
     _waiting_for : tuple of str
         Getter variable for released
+    job_array : None or AbstractClusterJobArray
+        The job array the submissions are deferred to
     job_name : str
         Name of the job
     released : bool
@@ -46,18 +56,32 @@ class AbstractClusterSubmitter(AbstractSubmitter):
     -------
     _populate_std_out_and_std_err()
         Populate std_out and std_err
+    _on_submitted(submission_time)
+        Act on a new job_id
     get_return_code(sacct_str)
         Return the exit code if any
     create_submission_string(command, waiting_for)
         Create the submission string
     get_days_hours_minutes_seconds_from_str(time_str)
         Return days, hours, minutes, seconds from the string
+    create_job_array()
+        Return a job array which can bundle this and compatible submissions
+    get_job_array_key()
+        Return the key identifying submissions which can share a job array
+    join_job_array(job_array)
+        Defer the submissions to a job array
+    leave_job_array()
+        Stop deferring the submissions to a job array
+    set_array_task(job_id, log_and_error_base, submission_time)
+        Set the job_id and log paths of a task in a submitted job array
     add_waiting_for(waiting_for_id)
         Add a waiting for id to the waiting for list
     kill()
         Kill a job if it exists
     release()
         Release job if held
+    submit_script(script_path, submission_string)
+        Write, submit and return the job_id of a held submission script
     submit_command(command)
         Submit a command
     raise_error()
@@ -117,6 +141,7 @@ class AbstractClusterSubmitter(AbstractSubmitter):
         self._log_and_error_base: Path = Path()
         self._waiting_for: List[str] = list()
         self._released = False
+        self._job_array: Optional["AbstractClusterJobArray"] = None
 
         # The following will be set by the implementations
         self._cluster_specific = {"cancel_str": "", "release_str": "", "submit_str": ""}
@@ -160,6 +185,19 @@ class AbstractClusterSubmitter(AbstractSubmitter):
                 self.job_name,
             )
 
+    def _on_submitted(self, submission_time: datetime) -> None:
+        """
+        Act on a new job_id.
+
+        Called when the job_id has been set, either by submitting the job or by
+        submitting the job array the job belongs to
+
+        Parameters
+        ----------
+        submission_time : datetime
+            The time the job was submitted
+        """
+
     @staticmethod
     @abstractmethod
     def extract_job_id(std_out: Optional[str]) -> str:
@@ -246,6 +284,19 @@ class AbstractClusterSubmitter(AbstractSubmitter):
             raise ValueError(msg)
         return days, hours, minutes, seconds
 
+    @property
+    def job_array(self) -> Optional["AbstractClusterJobArray"]:
+        """
+        Return the job array the submissions are deferred to.
+
+        Returns
+        -------
+        None or AbstractClusterJobArray
+            The job array
+            None if the submissions are not deferred
+        """
+        return self._job_array
+
     @property
     def job_name(self) -> str:
         """
@@ -336,6 +387,81 @@ class AbstractClusterSubmitter(AbstractSubmitter):
                         waiting_id,
                     )
 
+    def create_job_array(self) -> Optional["AbstractClusterJobArray"]:
+        """
+        Return a job array which can bundle this and compatible submissions.
+
+        Returns
+        -------
+        None or AbstractClusterJobArray
+            The job array
+            None if the cluster does not support job arrays
+        """
+        return None
+
+    def get_job_array_key(self) -> Tuple[Any, ...]:
+        """
+        Return the key identifying submissions which can share a job array.
+
+        Only submissions with the same submitter type, processor split,
+        submission_dict and dependencies can share a job array
+
+        Returns
+        -------
+        tuple
+            The key
+        """
+        return (
+            type(self),
+            self.processor_split.number_of_processors,
+            self.processor_split.number_of_nodes,
+            self.processor_split.processors_per_node,
+            tuple(sorted(self._submission_dict.items())),
+            tuple(sorted(self._waiting_for)),
+        )
+
+    def join_job_array(self, job_array: "AbstractClusterJobArray") -> None:
+        """
+        Defer the submissions to a job array.
+
+        Until the job array is submitted, calling submit_command will add the
+        command to the job array rather than submitting it
+
+        Parameters
+        ----------
+        job_array : AbstractClusterJobArray
+            The job array to join
+        """
+        self._job_array = job_array
+
+    def leave_job_array(self) -> None:
+        """Stop deferring the submissions to a job array."""
+        self._job_array = None
+
+    def set_array_task(
+        self, job_id: str, log_and_error_base: Path, submission_time: datetime
+    ) -> None:
+        """
+        Set the job_id and log paths of a task in a submitted job array.
+
+        Parameters
+        ----------
+        job_id : str
+            The job_id of the task
+        log_and_error_base : Path
+            Base for the path for the .log and .err files of the task
+        submission_time : datetime
+            The time the job array was submitted
+        """
+        self._status["job_id"] = job_id
+        self._log_and_error_base = log_and_error_base
+        self._on_submitted(submission_time)
+        logging.info(
+            "job_id %s (%s) given to the task of the job array",
+            self.job_id,
+            self.job_name,
+        )
+
     def kill(self) -> None:
         """Kill a job if it exists."""
         if self.job_id is not None and not self.completed():
@@ -350,6 +476,12 @@ class AbstractClusterSubmitter(AbstractSubmitter):
     def release(self) -> None:
         """Release job if held."""
         if self.job_id is not None and not self._released:
+            if self._job_array is not None and self._job_array.submitted:
+                # The tasks of a job array are released together
+                if not self._job_array.released:
+                    self._job_array.release()
+                self._released = True
+                return
             logging.debug("Releasing job_id %s (%s)", self.job_id, self.job_name)
             submitter = LocalSubmitter()
             submitter.submit_command(
@@ -358,6 +490,37 @@ class AbstractClusterSubmitter(AbstractSubmitter):
             submitter.wait_until_completed()
             self._released = True
 
+    def submit_script(self, script_path: Path, submission_string: str) -> str:
+        """
+        Write, submit and return the job_id of a held submission script.
+
+        Parameters
+        ----------
+        script_path : Path
+            Path to write the script to
+        submission_string : str
+            The script to submit
+
+        Returns
+        -------
+        job_id : str
+            The job id given by the cluster
+        """
+        with script_path.open("w") as file:
+            file.write(submission_string)
+
+        # Make the script executable
+        local_submitter = LocalSubmitter(run_path=self.store_dir)
+        local_submitter.submit_command(f"chmod +x {script_path}")
+        local_submitter.wait_until_completed()
+
+        # Submit the command through a local submitter
+        local_submitter.submit_command(
+            f"{self._cluster_specific['submit_str']} {script_path}"
+        )
+        local_submitter.wait_until_completed()
+        return self.extract_job_id(local_submitter.std_out)
+
     def submit_command(self, command: str) -> None:
         """
         Submit a command.
@@ -367,6 +530,8 @@ class AbstractClusterSubmitter(AbstractSubmitter):
         All submitted jobs are held
         Release with self.release
         See [1]_ for details
+        If the submitter has joined a job array which has not yet been submitted,
+        the command is added to the job array instead
 
         Parameters
         ----------
@@ -381,21 +546,17 @@ class AbstractClusterSubmitter(AbstractSubmitter):
         # spurious member data, before doing so, we must capture the waiting for tuple
         waiting_for = self.waiting_for
         self.reset()
+        if self._job_array is not None:
+            if not self._job_array.submitted:
+                self._job_array.add_command(self, command, waiting_for)
+                return
+            self.leave_job_array()
         script_path = self.store_dir.joinpath(f"{self._job_name}.sh")
-        with script_path.open("w") as file:
-            file.write(self.create_submission_string(command, waiting_for=waiting_for))
-
-        # Make the script executable
-        local_submitter = LocalSubmitter(run_path=self.store_dir)
-        local_submitter.submit_command(f"chmod +x {script_path}")
-        local_submitter.wait_until_completed()
-
-        # Submit the command through a local submitter
-        local_submitter.submit_command(
-            f"{self._cluster_specific['submit_str']} {script_path}"
+        submission_time = datetime.now()
+        self._status["job_id"] = self.submit_script(
+            script_path, self.create_submission_string(command, waiting_for=waiting_for)
         )
-        local_submitter.wait_until_completed()
-        self._status["job_id"] = self.extract_job_id(local_submitter.std_out)
+        self._on_submitted(submission_time)
         logging.info(
             "job_id %s (%s) given to command '%s' in %s",
             self.job_id,
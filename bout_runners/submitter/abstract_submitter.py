@@ -1,12 +1,13 @@
 """Contains the abstract submitter class."""
 
 
+import asyncio
 import json
 import logging
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from bout_runners.submitter.processor_split import ProcessorSplit
 from bout_runners.utils.serializers import is_jsonable
@@ -18,6 +19,10 @@ class AbstractSubmitter(ABC):
 
     Attributes
     ----------
+    _completion_callbacks : list of callable
+        Callables to be called with the submitter when the submission completes
+    _completion_notified : bool
+        Whether the completion callbacks have been called for the current submission
     _logged_complete_status : bool
         Whether the complete status has been logged
     _status : dict of str
@@ -39,14 +44,24 @@ class AbstractSubmitter(ABC):
         Reset the status dict
     _catch_error
         Log the error
+    _notify_completion()
+        Call the completion callbacks if they have not already been called
     _wait_for_std_out_and_std_err
        Wait until the process completes if a process has been started
     submit_command(command)
         Submit a command
     completed()
         Return the completed status
+    completed_async()
+        Return the completed status without blocking the event loop
+    wait_async(poll_interval)
+        Await the completion of the submission
     raise_error()
         Raise and error from the subprocess in a clean way
+    add_completion_callback(callback)
+        Add a callable which is called when the submission completes
+    remove_completion_callback(callback)
+        Remove a previously added completion callback
     write_python_script(path, function, args, kwargs)
         Write python function to file
     reset()
@@ -68,6 +83,8 @@ class AbstractSubmitter(ABC):
             If None, default values will be used
         """
         self._logged_complete_status = False
+        self._completion_notified = False
+        self._completion_callbacks: List[Callable[["AbstractSubmitter"], None]] = list()
         self._status: Dict[str, Union[Optional[int], Optional[str]]] = dict()
         self.processor_split = (
             processor_split if processor_split is not None else ProcessorSplit()
@@ -87,6 +104,7 @@ class AbstractSubmitter(ABC):
         self._status["std_out"] = None
         self._status["std_err"] = None
         self._logged_complete_status = False
+        self._completion_notified = False
 
     def _catch_error(self) -> None:
         """Log the error."""
@@ -104,6 +122,25 @@ class AbstractSubmitter(ABC):
                 logging.error(self.std_err)
                 self._logged_complete_status = True
 
+    def _notify_completion(self) -> None:
+        """
+        Call the completion callbacks if they have not already been called.
+
+        The implementations call this as soon as they have detected that the
+        submission has completed, so that the callbacks are called exactly once per
+        submission
+        """
+        if not self._completion_notified:
+            self._completion_notified = True
+            logging.debug(
+                "job_id %s completed, calling %d completion callback(s)",
+                self.job_id,
+                len(self._completion_callbacks),
+            )
+            # Iterate over a copy as the callbacks may remove themselves
+            for callback in tuple(self._completion_callbacks):
+                callback(self)
+
     @abstractmethod
     def _wait_for_std_out_and_std_err(self) -> None:
         """
@@ -131,6 +168,35 @@ class AbstractSubmitter(ABC):
     def raise_error(self) -> None:
         """Raise and error from the subprocess in a clean way."""
 
+    async def completed_async(self) -> bool:
+        """
+        Return the completed status without blocking the event loop.
+
+        As completed() may block (for example when querying the scheduler of a
+        cluster), it is called in the default executor of the running event loop.
+        Implementations which can await the completion directly should override
+        this method
+
+        Returns
+        -------
+        bool
+            True if the submission has completed
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.completed)
+
+    async def wait_async(self, poll_interval: float = 5) -> None:
+        """
+        Await the completion of the submission.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds to wait between checking whether the submission has completed
+        """
+        while not await self.completed_async():
+            await asyncio.sleep(poll_interval)
+
     @property
     def job_id(self) -> Optional[str]:
         """
@@ -192,6 +258,36 @@ class AbstractSubmitter(ABC):
             else None
         )
 
+    def add_completion_callback(
+        self, callback: Callable[["AbstractSubmitter"], None]
+    ) -> None:
+        """
+        Add a callable which is called when the submission completes.
+
+        The callbacks are called from the thread detecting the completion, i.e.
+        the thread calling completed(), errored() or wait_until_completed()
+
+        Parameters
+        ----------
+        callback : callable
+            Callable which takes the submitter as its only argument
+        """
+        self._completion_callbacks.append(callback)
+
+    def remove_completion_callback(
+        self, callback: Callable[["AbstractSubmitter"], None]
+    ) -> None:
+        """
+        Remove a previously added completion callback.
+
+        Parameters
+        ----------
+        callback : callable
+            The callback to remove
+        """
+        if callback in self._completion_callbacks:
+            self._completion_callbacks.remove(callback)
+
     @staticmethod
     def write_python_script(
         path: Path,
@@ -0,0 +1,298 @@
+"""Contains the asynchronous local submitter class."""
+
+
+import asyncio
+import logging
+
+# NOTE: Subprocess below is only used to raise errors in the same way as the
+#       LocalSubmitter
+import subprocess  # nosec
+import sys
+import threading
+from asyncio.subprocess import Process
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Optional, Tuple
+
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.processor_split import ProcessorSplit
+from bout_runners.utils.file_operations import get_caller_dir
+
+
+class AsyncLocalSubmitter(AbstractSubmitter):
+    """
+    Submits a command to an event loop which awaits the exit of the process.
+
+    All the AsyncLocalSubmitters in a process share one event loop running in a
+    background thread.
+    The exit of the child processes are awaited through
+    asyncio.create_subprocess_exec, so that any number of in-flight processes can be
+    tracked without polling.
+    The submitter can be used synchronously as any other submitter, or awaited
+    through wait_async from another event loop (see BoutRunner.run_async)
+
+    Attributes
+    ----------
+    __loop : None or asyncio.AbstractEventLoop
+        The event loop shared by all instances
+    __loop_lock : threading.Lock
+        Lock guarding the creation of the event loop
+    __command : None or str
+        The latest submitted command
+    __future : None or Future
+        Future which resolves to the return code, std_out and std_err of the process
+    run_path : Path or str
+        Directory to run the command from
+
+    Methods
+    -------
+    get_event_loop()
+        Return the event loop shared by all instances, start it if needed
+    __start_process(command)
+        Start the process in the event loop
+    __communicate(process)
+        Await the process and return the return code, std_out and std_err
+    __populate_status()
+        Populate the return_code, std_out and std_err from the finished future
+    _wait_for_std_out_and_std_err()
+        Wait until the process completes, populate return_code, std_out and std_err
+    submit_command(command)
+        Submit a subprocess
+    completed()
+        Return the completed status
+    completed_async()
+        Return the completed status
+    wait_async(poll_interval)
+        Await the completion of the process
+    raise_error()
+        Raise and error from the subprocess in a clean way
+
+    Notes
+    -----
+    Awaiting child processes from an event loop which does not run in the main
+    thread requires Python 3.8 or newer
+
+    Examples
+    --------
+    >>> submitter = AsyncLocalSubmitter()
+    >>> submitter.submit_command('ls')
+    >>> submitter.wait_until_completed()
+    >>> print(submitter.std_out)
+    __init__.py
+    test_async_local_submitter.py
+    """
+
+    __loop: Optional[asyncio.AbstractEventLoop] = None
+    __loop_lock = threading.Lock()
+
+    def __init__(
+        self,
+        run_path: Optional[Path] = None,
+        processor_split: Optional[ProcessorSplit] = None,
+    ) -> None:
+        """
+        Set the path from where the calls are made from.
+
+        Parameters
+        ----------
+        run_path : Path or str or None
+            Directory to run the command from
+            If None, the calling directory will be used
+        processor_split : ProcessorSplit or None
+            Object containing the processor split
+            If None, default values will be used
+
+        Raises
+        ------
+        NotImplementedError
+            If the python version is older than 3.8
+        """
+        if sys.version_info < (3, 8):
+            msg = "The AsyncLocalSubmitter requires python 3.8 or newer"
+            logging.critical(msg)
+            raise NotImplementedError(msg)
+        AbstractSubmitter.__init__(self, processor_split)
+        # NOTE: We are not setting the default as a keyword argument
+        #       as this would mess up the paths
+        self.run_path = (
+            Path(run_path).absolute() if run_path is not None else get_caller_dir()
+        )
+        self.__command: Optional[str] = None
+        self.__future: Optional[Future] = None
+
+    @classmethod
+    def get_event_loop(cls) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop shared by all instances, start it if needed.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+            The event loop running in the background thread
+        """
+        with cls.__loop_lock:
+            if cls.__loop is None:
+                cls.__loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=cls.__loop.run_forever,
+                    name="AsyncLocalSubmitter",
+                    daemon=True,
+                )
+                thread.start()
+                logging.debug("Started the event loop of the AsyncLocalSubmitters")
+        return cls.__loop
+
+    async def __start_process(self, command: str) -> Process:
+        """
+        Start the process in the event loop.
+
+        Parameters
+        ----------
+        command : str
+            The command to run
+
+        Returns
+        -------
+        asyncio.subprocess.Process
+            The started process
+        """
+        return await asyncio.create_subprocess_exec(
+            *command.split(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.run_path),
+        )
+
+    @staticmethod
+    async def __communicate(
+        process: Process,
+    ) -> Tuple[int, str, str]:
+        """
+        Await the process and return the return code, std_out and std_err.
+
+        Parameters
+        ----------
+        process : asyncio.subprocess.Process
+            The process to await
+
+        Returns
+        -------
+        return_code : int
+            The return code of the process
+        std_out : str
+            The standard output
+        std_err : str
+            The standard error
+        """
+        std_out, std_err = await process.communicate()
+        # NOTE: The return code is set after communicate has returned
+        return_code = process.returncode if process.returncode is not None else -1
+        return (
+            return_code,
+            std_out.decode("utf8").strip(),
+            std_err.decode("utf8").strip(),
+        )
+
+    def __populate_status(self) -> None:
+        """Populate the return_code, std_out and std_err from the finished future."""
+        if self.__future is not None and self.return_code is None:
+            return_code, std_out, std_err = self.__future.result()
+            self._status["std_out"] = std_out
+            self._status["std_err"] = std_err
+            self._status["return_code"] = return_code
+            self._notify_completion()
+
+    def _wait_for_std_out_and_std_err(self) -> None:
+        """
+        Wait until the process completes if a process has been started.
+
+        Populate return_code, std_out and std_err
+        """
+        if self.__future is not None:
+            self.__future.result()
+            self.__populate_status()
+        else:
+            logging.warning(
+                "No process started, return_code, std_out, std_err not populated"
+            )
+
+    def submit_command(self, command: str) -> None:
+        """
+        Submit a subprocess.
+
+        Parameters
+        ----------
+        command : str
+            The command to run
+        """
+        # This starts the job anew, so we restart the instance to clear it from any
+        # spurious member data
+        self.reset()
+        self.__future = None
+        loop = self.get_event_loop()
+        # NOTE: Errors from starting the process (like FileNotFoundError) are raised
+        #       here
+        process = asyncio.run_coroutine_threadsafe(
+            self.__start_process(command), loop
+        ).result()
+        self.__command = command
+        self._status["job_id"] = str(process.pid)
+        self.__future = asyncio.run_coroutine_threadsafe(
+            self.__communicate(process), loop
+        )
+        logging.debug(
+            "job_id %s given to command '%s' in %s", self.job_id, command, self.run_path
+        )
+
+    def completed(self) -> bool:
+        """
+        Return the completed status.
+
+        Returns
+        -------
+        bool
+            True if the process has completed
+        """
+        if self.__future is not None:
+            if self.return_code is not None:
+                return True
+            if self.__future.done():
+                self.__populate_status()
+                return True
+        return False
+
+    async def completed_async(self) -> bool:
+        """
+        Return the completed status.
+
+        As completed() never blocks, it is called directly
+
+        Returns
+        -------
+        bool
+            True if the process has completed
+        """
+        return self.completed()
+
+    async def wait_async(self, poll_interval: float = 5) -> None:
+        """
+        Await the completion of the process.
+
+        The exit of the process is awaited directly, so no polling is done
+
+        Parameters
+        ----------
+        poll_interval : float
+            Not used, present for compatibility with the other submitters
+        """
+        if self.__future is not None:
+            await asyncio.wrap_future(self.__future)
+            self.__populate_status()
+
+    def raise_error(self) -> None:
+        """Raise and error from the subprocess in a clean way."""
+        if self.completed() and isinstance(self.return_code, int):
+            result = subprocess.CompletedProcess(
+                str(self.__command), self.return_code, self.std_out, self.std_err
+            )
+            result.check_returncode()
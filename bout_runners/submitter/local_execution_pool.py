@@ -0,0 +1,358 @@
+"""Contains the local execution pool class."""
+
+
+import logging
+import os
+
+# NOTE: Only used for type hints of the launched processes
+import subprocess  # nosec
+import threading
+from time import monotonic, sleep
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class LocalExecutionPool:
+    """
+    Pool which admits local processes only while there are free processors.
+
+    The pool is given a processor budget.
+    Submissions which do not fit in the remaining budget are queued, and are
+    admitted as soon as enough processors are freed.
+    When processors are freed the queued submissions are packed greedily with the
+    first-fit-decreasing heuristic, i.e. the submissions requiring the most
+    processors are considered first, and each of them are admitted if it fits in
+    the remaining budget.
+
+    A submission requiring more processors than the total budget is admitted when
+    nothing else is running, so that it will not be queued forever.
+
+    As a submission is launched by whichever caller polls the pool, an error raised
+    when launching it is handed to the on_error callable of the submission rather
+    than raised to the caller, and the other submissions are still admitted.
+
+    The pool can be used from several threads, as the queue and the running
+    processes are only read and changed while holding the lock of the pool.
+
+    Attributes
+    ----------
+    __shared_pool : None or LocalExecutionPool
+        The pool shared by all the submitters in this process
+    __shared_pool_lock : threading.Lock
+        Lock protecting the creation of the shared pool
+    __processor_budget : int
+        Getter and setter variable for processor_budget
+    __queued : dict
+        The queued submissions on the form
+
+        >>> {ticket: (number_of_processors, launch, on_error, enqueued_time)}
+
+    __running : dict
+        The running submissions on the form
+
+        >>> {ticket: (number_of_processors, process)}
+
+    __next_ticket : int
+        The ticket to give to the next submission
+    __lock : threading.RLock
+        Lock protecting the queued and running submissions
+    processor_budget : int
+        Total number of processors the pool can use
+    free_processors : int
+        The number of processors not occupied by running processes
+    number_of_queued : int
+        The number of submissions waiting to be admitted
+
+    Methods
+    -------
+    __admit()
+        Admit queued submissions which fit into the free processors
+    get_shared_pool(processor_budget)
+        Return the pool shared by all the submitters in this process
+    submit(number_of_processors, launch, on_error)
+        Submit a launch callable to the pool
+    poll()
+        Free the processors of finished processes and admit queued submissions
+    is_queued(ticket)
+        Return whether the submission is waiting to be admitted
+    cancel(ticket)
+        Remove a submission from the queue
+    wait_until_admitted(ticket, wait_time)
+        Wait until the submission has been admitted
+
+    Examples
+    --------
+    >>> pool = LocalExecutionPool(processor_budget=4)
+    >>> submitter = LocalSubmitter(execution_pool=pool)
+    >>> submitter.submit_command('ls')
+    >>> submitter.wait_until_completed()
+    """
+
+    __shared_pool: Optional["LocalExecutionPool"] = None
+    __shared_pool_lock = threading.Lock()
+
+    def __init__(self, processor_budget: Optional[int] = None) -> None:
+        """
+        Set the processor budget.
+
+        Parameters
+        ----------
+        processor_budget : None or int
+            Total number of processors the pool can use
+            If None, the number of processors on the machine will be used
+        """
+        self.__processor_budget = 1
+        self.processor_budget = (
+            processor_budget if processor_budget is not None else os.cpu_count() or 1
+        )
+        self.__queued: Dict[
+            int,
+            Tuple[
+                int,
+                Callable[[float], subprocess.Popen],
+                Optional[Callable[[float, Exception], None]],
+                float,
+            ],
+        ] = dict()
+        self.__running: Dict[int, Tuple[int, subprocess.Popen]] = dict()
+        self.__next_ticket = 0
+        # NOTE: Reentrant as submit polls the pool
+        self.__lock = threading.RLock()
+
+    @property
+    def processor_budget(self) -> int:
+        """
+        Set the properties of self.processor_budget.
+
+        Returns
+        -------
+        int
+            Total number of processors the pool can use
+
+        Raises
+        ------
+        ValueError
+            If the budget is less than one
+        """
+        return self.__processor_budget
+
+    @processor_budget.setter
+    def processor_budget(self, processor_budget: int) -> None:
+        if processor_budget < 1:
+            msg = f"The processor_budget must be at least 1, got {processor_budget}"
+            logging.critical(msg)
+            raise ValueError(msg)
+        self.__processor_budget = processor_budget
+        logging.debug("processor_budget set to %s", processor_budget)
+
+    @property
+    def free_processors(self) -> int:
+        """
+        Return the number of processors not occupied by running processes.
+
+        Returns
+        -------
+        int
+            The number of free processors
+        """
+        with self.__lock:
+            return self.processor_budget - sum(
+                number_of_processors
+                for number_of_processors, _ in self.__running.values()
+            )
+
+    @property
+    def number_of_queued(self) -> int:
+        """
+        Return the number of submissions waiting to be admitted.
+
+        Returns
+        -------
+        int
+            The number of queued submissions
+        """
+        with self.__lock:
+            return len(self.__queued)
+
+    @classmethod
+    def get_shared_pool(
+        cls, processor_budget: Optional[int] = None
+    ) -> "LocalExecutionPool":
+        """
+        Return the pool shared by all the submitters in this process.
+
+        Parameters
+        ----------
+        processor_budget : None or int
+            Total number of processors the pool can use
+            If None, the number of processors on the machine will be used
+
+        Returns
+        -------
+        LocalExecutionPool
+            The shared pool
+        """
+        with cls.__shared_pool_lock:
+            if cls.__shared_pool is None:
+                cls.__shared_pool = cls(processor_budget)
+                logging.debug(
+                    "Created the shared LocalExecutionPool with processor_budget=%s",
+                    cls.__shared_pool.processor_budget,
+                )
+            elif processor_budget is not None:
+                cls.__shared_pool.processor_budget = processor_budget
+            return cls.__shared_pool
+
+    def __admit(self) -> None:
+        """
+        Admit queued submissions which fit into the free processors.
+
+        The caller must hold the lock of the pool
+        """
+        # First-fit-decreasing: Largest first, ties are broken by submission order
+        candidates: List[Tuple[int, int]] = sorted(
+            (
+                (-number_of_processors, ticket)
+                for ticket, (number_of_processors, *_) in self.__queued.items()
+            )
+        )
+        for negative_number_of_processors, ticket in candidates:
+            number_of_processors = -negative_number_of_processors
+            if number_of_processors > self.free_processors:
+                if len(self.__running) != 0:
+                    continue
+                logging.warning(
+                    "The submission requires %s processors, whereas the "
+                    "processor_budget is %s. Admitting it as nothing else is running",
+                    number_of_processors,
+                    self.processor_budget,
+                )
+            _, launch, on_error, enqueued_time = self.__queued[ticket]
+            queue_wait_time = monotonic() - enqueued_time
+            # NOTE: The ticket stays in the queue until launch has returned, so that
+            #       the submission is not seen as admitted before its process (and
+            #       thereby its job_id) exists
+            try:
+                process = launch(queue_wait_time)
+            # NOTE: The caller may be polling on behalf of another submission, so
+            #       the error is handed to the owner of the ticket
+            except Exception as error:  # pylint: disable=broad-except
+                logging.error("Could not launch ticket %s: %s", ticket, error)
+                if on_error is not None:
+                    on_error(queue_wait_time, error)
+                continue
+            finally:
+                self.__queued.pop(ticket)
+            self.__running[ticket] = (number_of_processors, process)
+            logging.debug(
+                "Admitted ticket %s using %s processors after waiting %.2f s in the "
+                "queue (%s processors free)",
+                ticket,
+                number_of_processors,
+                queue_wait_time,
+                self.free_processors,
+            )
+
+    def submit(
+        self,
+        number_of_processors: int,
+        launch: Callable[[float], subprocess.Popen],
+        on_error: Optional[Callable[[float, Exception], None]] = None,
+    ) -> int:
+        """
+        Submit a launch callable to the pool.
+
+        The callable is called as soon as the requested processors are free
+
+        Parameters
+        ----------
+        number_of_processors : int
+            The number of processors the process will use
+        launch : callable
+            Callable which takes the time spent in the queue (in seconds) as input,
+            and returns the started process
+        on_error : None or callable
+            Callable which takes the time spent in the queue (in seconds) and the
+            error raised by launch as input
+            If None, the error is only logged
+
+        Returns
+        -------
+        ticket : int
+            The ticket identifying the submission in the pool
+        """
+        with self.__lock:
+            ticket = self.__next_ticket
+            self.__next_ticket += 1
+            self.__queued[ticket] = (
+                number_of_processors,
+                launch,
+                on_error,
+                monotonic(),
+            )
+            self.poll()
+            if self.is_queued(ticket):
+                logging.info(
+                    "Queued submission requiring %s processors as only %s of %s "
+                    "processors are free",
+                    number_of_processors,
+                    self.free_processors,
+                    self.processor_budget,
+                )
+            return ticket
+
+    def poll(self) -> None:
+        """Free the processors of finished processes and admit queued submissions."""
+        with self.__lock:
+            for ticket, (_, process) in tuple(self.__running.items()):
+                if process.poll() is not None:
+                    self.__running.pop(ticket)
+            if len(self.__queued) != 0:
+                self.__admit()
+
+    def is_queued(self, ticket: int) -> bool:
+        """
+        Return whether the submission is waiting to be admitted.
+
+        Parameters
+        ----------
+        ticket : int
+            The ticket of the submission
+
+        Returns
+        -------
+        bool
+            True if the submission is waiting in the queue
+        """
+        with self.__lock:
+            return ticket in self.__queued
+
+    def cancel(self, ticket: int) -> None:
+        """
+        Remove a submission from the queue.
+
+        Submissions which already have been admitted are unaffected
+
+        Parameters
+        ----------
+        ticket : int
+            The ticket of the submission
+        """
+        with self.__lock:
+            if self.__queued.pop(ticket, None) is not None:
+                logging.debug("Removed ticket %s from the queue", ticket)
+
+    def wait_until_admitted(self, ticket: int, wait_time: float = 0.1) -> None:
+        """
+        Wait until the submission has been admitted.
+
+        Parameters
+        ----------
+        ticket : int
+            The ticket of the submission
+        wait_time : float
+            Time to wait between each poll
+        """
+        self.poll()
+        while self.is_queued(ticket):
+            sleep(wait_time)
+            self.poll()
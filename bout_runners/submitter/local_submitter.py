@@ -6,10 +6,12 @@ import logging
 # NOTE: Subprocess below is safe against shell injections
 # https://github.com/PyCQA/bandit/issues/280
 import subprocess  # nosec
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.local_execution_pool import LocalExecutionPool
 from bout_runners.submitter.processor_split import ProcessorSplit
 from bout_runners.utils.file_operations import get_caller_dir
 
@@ -22,11 +24,29 @@ class LocalSubmitter(AbstractSubmitter):
     ----------
     __process : None or Popen
         The Popen process if it has been created
+    __execution_pool : None or LocalExecutionPool
+        Getter variable for execution_pool
+    __ticket : None or int
+        The ticket of the submission in the execution pool
+    __command : None or str
+        The latest submitted command
+    __queue_wait_time : None or float
+        Getter variable for queue_wait_time
     run_path : Path or str
         Directory to run the command from
+    execution_pool : None or LocalExecutionPool
+        The pool limiting the number of processors in use
+    queue_wait_time : None or float
+        Seconds the latest submission waited in the execution pool
+    queued : bool
+        Whether the submission is waiting for free processors
 
     Methods
     -------
+    __launch(command, queue_wait_time)
+        Start the process
+    __record_launch_error(queue_wait_time, error)
+        Record that the execution pool could not start the process
     _wait_for_std_out_and_std_err()
         Wait until the process completes, populate return_code, std_out and std_err
     submit_command(command)
@@ -35,6 +55,10 @@ class LocalSubmitter(AbstractSubmitter):
         Return the completed status
     raise_error(self)
         Raise and error from the subprocess in a clean way
+    reset()
+        Reset the submitter
+    wait_until_completed(raise_error)
+        Wait until the process has completed
 
     Examples
     --------
@@ -52,6 +76,7 @@ class LocalSubmitter(AbstractSubmitter):
         self,
         run_path: Optional[Path] = None,
         processor_split: Optional[ProcessorSplit] = None,
+        execution_pool: Optional[LocalExecutionPool] = None,
     ) -> None:
         """
         Set the path from where the calls are made from.
@@ -64,6 +89,11 @@ class LocalSubmitter(AbstractSubmitter):
         processor_split : ProcessorSplit or None
             Object containing the processor split
             If None, default values will be used
+        execution_pool : None or LocalExecutionPool
+            Pool which limits the total number of processors in use
+            If given, the command is not started before
+            processor_split.number_of_processors processors are free in the pool
+            If None, the command is started immediately
         """
         AbstractSubmitter.__init__(self, processor_split)
         # NOTE: We are not setting the default as a keyword argument
@@ -72,6 +102,105 @@ class LocalSubmitter(AbstractSubmitter):
             Path(run_path).absolute() if run_path is not None else get_caller_dir()
         )
         self.__process: Optional[subprocess.Popen] = None
+        self.__execution_pool = execution_pool
+        self.__ticket: Optional[int] = None
+        self.__command: Optional[str] = None
+        self.__queue_wait_time: Optional[float] = None
+
+    @property
+    def execution_pool(self) -> Optional[LocalExecutionPool]:
+        """
+        Return the execution pool.
+
+        Returns
+        -------
+        self.__execution_pool : None or LocalExecutionPool
+            The pool limiting the number of processors in use
+        """
+        return self.__execution_pool
+
+    @property
+    def queue_wait_time(self) -> Optional[float]:
+        """
+        Return the number of seconds the latest submission waited in the pool.
+
+        Returns
+        -------
+        self.__queue_wait_time : None or float
+            The queue wait time
+            None if the process has not been started
+        """
+        return self.__queue_wait_time
+
+    @property
+    def queued(self) -> bool:
+        """
+        Return whether the submission is waiting for free processors.
+
+        Returns
+        -------
+        bool
+            True if the submission is waiting in the queue of the execution pool
+        """
+        pool = self.__execution_pool
+        return (
+            pool is not None
+            and self.__ticket is not None
+            and pool.is_queued(self.__ticket)
+        )
+
+    def __launch(self, command: str, queue_wait_time: float) -> subprocess.Popen:
+        """
+        Start the process.
+
+        Parameters
+        ----------
+        command : str
+            The command to run
+        queue_wait_time : float
+            Seconds the submission waited before being started
+
+        Returns
+        -------
+        subprocess.Popen
+            The started process
+        """
+        self.__process = subprocess.Popen(
+            command.split(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.run_path,
+            # https://docs.python.org/3/library/subprocess.html#security-considerations
+            # https://github.com/PyCQA/bandit/issues/280
+            shell=False,  # nosec
+        )
+        self.__queue_wait_time = queue_wait_time
+        self._status["job_id"] = str(self.__process.pid)
+        logging.debug(
+            "job_id %s given to command '%s' in %s", self.job_id, command, self.run_path
+        )
+        return self.__process
+
+    def __record_launch_error(self, queue_wait_time: float, error: Exception) -> None:
+        """
+        Record that the execution pool could not start the process.
+
+        The submission is marked as completed with a non-zero return code, so that
+        the error is reported for this submitter rather than for the submitter which
+        happened to poll the pool
+
+        Parameters
+        ----------
+        queue_wait_time : float
+            Seconds the submission waited before the launch was attempted
+        error : Exception
+            The error raised when starting the process
+        """
+        self.__queue_wait_time = queue_wait_time
+        self._status["return_code"] = 1
+        self._status["std_out"] = ""
+        self._status["std_err"] = str(error)
+        self._notify_completion()
 
     def _wait_for_std_out_and_std_err(self) -> None:
         """
@@ -84,6 +213,10 @@ class LocalSubmitter(AbstractSubmitter):
             self._status["return_code"] = self.__process.poll()
             self._status["std_out"] = std_out.decode("utf8").strip()
             self._status["std_err"] = std_err.decode("utf8").strip()
+            if self.__execution_pool is not None:
+                # Let queued submissions use the freed processors
+                self.__execution_pool.poll()
+            self._notify_completion()
         else:
             logging.warning(
                 "No process started, return_code, std_out, std_err not populated"
@@ -101,19 +234,15 @@ class LocalSubmitter(AbstractSubmitter):
         # This starts the job anew, so we restart the instance to clear it from any
         # spurious member data
         self.reset()
-        self.__process = subprocess.Popen(
-            command.split(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self.run_path,
-            # https://docs.python.org/3/library/subprocess.html#security-considerations
-            # https://github.com/PyCQA/bandit/issues/280
-            shell=False,  # nosec
-        )
-        self._status["job_id"] = str(self.__process.pid)
-        logging.debug(
-            "job_id %s given to command '%s' in %s", self.job_id, command, self.run_path
-        )
+        self.__command = command
+        if self.__execution_pool is None:
+            self.__launch(command, 0.0)
+        else:
+            self.__ticket = self.__execution_pool.submit(
+                self.processor_split.number_of_processors,
+                partial(self.__launch, command),
+                self.__record_launch_error,
+            )
 
     def completed(self) -> bool:
         """
@@ -126,9 +255,16 @@ class LocalSubmitter(AbstractSubmitter):
         bool
             True if the process has completed
         """
+        pool = self.__execution_pool
+        if pool is not None and self.queued:
+            pool.poll()
+            if self.queued:
+                return False
+        if self.return_code is not None:
+            # NOTE: The return code is also set if the pool could not start the
+            #       process
+            return True
         if self.__process is not None:
-            if self.return_code is not None:
-                return True
             return_code = self.__process.poll()
             if return_code is not None:
                 self._status["return_code"] = return_code
@@ -138,12 +274,47 @@ class LocalSubmitter(AbstractSubmitter):
 
     def raise_error(self) -> None:
         """Raise and error from the subprocess in a clean way."""
-        if self.completed():
-            if isinstance(self.__process, subprocess.Popen) and isinstance(
-                self.return_code, int
-            ):
-                result = subprocess.CompletedProcess(
-                    self.__process.args, self.return_code, self.std_out, self.std_err
-                )
-
-                result.check_returncode()
+        if self.completed() and isinstance(self.return_code, int):
+            result = subprocess.CompletedProcess(
+                self.__process.args
+                if isinstance(self.__process, subprocess.Popen)
+                else str(self.__command),
+                self.return_code,
+                self.std_out,
+                self.std_err,
+            )
+
+            result.check_returncode()
+
+    def reset(self) -> None:
+        """Reset the submitter."""
+        pool = self.__execution_pool
+        if pool is not None and self.__ticket is not None and self.queued:
+            pool.cancel(self.__ticket)
+        self.__ticket = None
+        self.__command = None
+        self.__process = None
+        self.__queue_wait_time = None
+        super().reset()
+
+    def wait_until_completed(self, raise_error: bool = True) -> None:
+        """
+        Wait until the process has completed.
+
+        If the submission is queued in the execution pool, this will first wait
+        until it has been admitted
+
+        Parameters
+        ----------
+        raise_error : bool
+            Whether or not to raise errors
+        """
+        pool = self.__execution_pool
+        if pool is not None and self.__ticket is not None and self.queued:
+            logging.info("Start: Waiting for free processors in the execution pool")
+            pool.wait_until_admitted(self.__ticket)
+            logging.info("Done: Waiting for free processors in the execution pool")
+        super().wait_until_completed(raise_error)
+        if self.__process is None:
+            # NOTE: The pool could not start the process
+            self.errored(raise_error)
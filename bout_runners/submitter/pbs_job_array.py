@@ -0,0 +1,130 @@
+"""Contains the PBS job array class."""
+
+
+from pathlib import Path
+from typing import Tuple
+
+from bout_runners.submitter.abstract_cluster_job_array import AbstractClusterJobArray
+from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
+
+
+class PBSJobArray(AbstractClusterJobArray):
+    """
+    The PBS job array class.
+
+    The sub-jobs are submitted with ``#PBS -J 0-N``.
+    If the job array has the job id ``1234[].server``, the sub-job with array index
+    i has the job id ``1234[i].server``.
+    The array index is read from ``PBS_ARRAY_INDEX``.
+    The directives and variables are those of PBS Pro (and OpenPBS), Torque uses
+    other ones, so PBSSubmitter.create_job_array does not create job arrays on
+    Torque.
+
+    Methods
+    -------
+    _create_submission_string(template, dispatch_command, waiting_for)
+        Return the script of the job array
+    get_dispatch_command(table_path)
+        Return the command which executes the command of the current array index
+    get_task_id(index)
+        Return the job id of a sub-job
+    get_task_log_and_error_base(index)
+        Return the base for the path for the .log and .err files of a sub-job
+
+    Examples
+    --------
+    >>> job_array = PBSJobArray("sweep", store_path)
+    >>> job_array.add(submitter_1)
+    >>> job_array.add(submitter_2)
+    >>> submitter_1.submit_command("echo 'Hello'")
+    >>> submitter_2.submit_command("echo 'World'")
+    >>> job_array.submit()
+    '1234[].pbs'
+    >>> submitter_2.job_id
+    '1234[1].pbs'
+    """
+
+    def _create_submission_string(
+        self,
+        template: AbstractClusterSubmitter,
+        dispatch_command: str,
+        waiting_for: Tuple[str, ...],
+    ) -> str:
+        """
+        Return the script of the job array.
+
+        Parameters
+        ----------
+        template : AbstractClusterSubmitter
+            The submitter whose options are used for all the sub-jobs
+        dispatch_command : str
+            The command which executes the command of the current array index
+        waiting_for : tuple of str
+            Tuple of ids that the job array will wait for
+
+        Returns
+        -------
+        str
+            The script to be submitted
+        """
+        # NOTE: The template is a PBSSubmitter, but it is not imported here to
+        #       avoid circular imports
+        return template.create_submission_string(  # type: ignore
+            dispatch_command,
+            waiting_for,
+            job_name=self.job_name,
+            number_of_array_tasks=self.number_of_tasks,
+        )
+
+    @staticmethod
+    def get_dispatch_command(table_path: Path) -> str:
+        """
+        Return the command which executes the command of the current array index.
+
+        Parameters
+        ----------
+        table_path : Path
+            Path to the command table, where line number i + 1 contains the command
+            of array index i
+
+        Returns
+        -------
+        str
+            The command
+        """
+        return (
+            f'COMMAND=$(sed -n "$((PBS_ARRAY_INDEX + 1))p" {table_path})\n'
+            'eval "${COMMAND}"'
+        )
+
+    def get_task_id(self, index: int) -> str:
+        """
+        Return the job id of a sub-job.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the sub-job
+
+        Returns
+        -------
+        str
+            The job id of the sub-job
+        """
+        return str(self.array_id).replace("[]", f"[{index}]", 1)
+
+    def get_task_log_and_error_base(self, index: int) -> Path:
+        """
+        Return the base for the path for the .log and .err files of a sub-job.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the sub-job
+
+        Returns
+        -------
+        Path
+            The base of the .log and .err files
+        """
+        return self.store_dir.joinpath(f"{self.job_name}_{index}")
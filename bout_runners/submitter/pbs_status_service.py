@@ -0,0 +1,177 @@
+"""Contains the PBS status service class."""
+
+
+import json
+import logging
+import math
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from bout_runners.submitter.abstract_cluster_status_service import (
+    AbstractClusterStatusService,
+)
+
+
+class PBSStatusService(AbstractClusterStatusService):
+    """
+    Service polling the status of all tracked PBS jobs with one ``qstat`` call.
+
+    The jobs are queried with ``qstat -x -f -t -F json``, where sub-jobs of job
+    arrays are queried through their job array.
+    Only the jobs missing from the result (for example if they have been removed
+    from the job history of the server) are traced with ``tracejob``.
+
+    Attributes
+    ----------
+    dequeued_state : str
+        State given to jobs which have been dequeued without an exit status
+    finished_states : tuple of str
+        States of the jobs which have finished without a return code
+
+    Methods
+    -------
+    _query(job_ids, start_time)
+        Return the states and return codes of the jobs from ``qstat``
+    _trace(job_id, start_time)
+        Return the state and return code of a job from ``tracejob``
+    parse_qstat(qstat_str)
+        Return the states and return codes from the json output of ``qstat``
+    parse_trace(trace)
+        Return the state and return code from the output of ``tracejob``
+
+    Examples
+    --------
+    >>> service = PBSStatusService.get_service()
+    >>> service.track("1234.pbs", datetime.now())
+    >>> service.get_status("1234.pbs")
+    ('R', None)
+    """
+
+    dequeued_state = "DEQUEUED"
+    finished_states = (dequeued_state,)
+
+    def _query(
+        self, job_ids: Tuple[str, ...], start_time: datetime
+    ) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """
+        Return the states and return codes of the jobs from ``qstat``.
+
+        Parameters
+        ----------
+        job_ids : tuple of str
+            The job ids to query
+        start_time : datetime
+            The earliest submission time of the jobs
+
+        Returns
+        -------
+        statuses : dict of str, tuple
+            The job ids as keys, and the state and return code as values
+        """
+        # Sub-jobs are queried through their job array, and -t expands the job
+        # arrays into their sub-jobs
+        query_ids = dict.fromkeys(
+            re.sub(r"\[\d+\]", "[]", job_id) for job_id in job_ids
+        )
+        statuses = self.parse_qstat(
+            self._run_command(f"qstat -x -f -t -F json {' '.join(query_ids)}")
+        )
+        missing = tuple(job_id for job_id in job_ids if job_id not in statuses)
+        if len(missing) != 0:
+            logging.debug(
+                "%d job(s) not found by qstat, falling back to tracejob", len(missing)
+            )
+        for job_id in missing:
+            state, return_code = self._trace(job_id, start_time)
+            if state is not None:
+                statuses[job_id] = (state, return_code)
+        return statuses
+
+    def _trace(
+        self, job_id: str, start_time: datetime
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Return the state and return code of a job from ``tracejob``.
+
+        Parameters
+        ----------
+        job_id : str
+            The job id
+        start_time : datetime
+            The earliest submission time of the jobs
+
+        Returns
+        -------
+        state : None or str
+            The state of the job
+        return_code : None or int
+            The return code of the job
+        """
+        days = max(math.ceil((datetime.now() - start_time).total_seconds() / 86400), 1)
+        return self.parse_trace(self._run_command(f"tracejob -n {days} {job_id}"))
+
+    @staticmethod
+    def parse_qstat(qstat_str: str) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """
+        Return the states and return codes from the json output of ``qstat``.
+
+        Parameters
+        ----------
+        qstat_str : str
+            Output from ``qstat -x -f -t -F json``
+
+        Returns
+        -------
+        statuses : dict of str, tuple
+            The job ids as keys, and the state and return code as values
+            The return code is None if the job has not finished
+        """
+        if qstat_str.strip() == "":
+            return dict()
+        try:
+            jobs: Dict[str, Dict[str, Any]] = json.loads(qstat_str).get("Jobs", dict())
+        except json.JSONDecodeError:
+            logging.warning("Could not decode the output of qstat:\n%s", qstat_str)
+            return dict()
+
+        statuses: Dict[str, Tuple[Optional[str], Optional[int]]] = dict()
+        for job_id, attributes in jobs.items():
+            state = attributes.get("job_state")
+            exit_status = attributes.get("Exit_status")
+            if exit_status is not None:
+                statuses[job_id] = (state, int(exit_status))
+            elif state in ("F", "X"):
+                # The job (or the sub-job if "X") finished without running
+                statuses[job_id] = (PBSStatusService.dequeued_state, None)
+            else:
+                statuses[job_id] = (state, None)
+        return statuses
+
+    @staticmethod
+    def parse_trace(trace: str) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Return the state and return code from the output of ``tracejob``.
+
+        Parameters
+        ----------
+        trace : str
+            Trace obtained from the ``tracejob`` command
+
+        Returns
+        -------
+        state : None or str
+            "F" if the job has an exit status, dequeued_state if the job has been
+            dequeued without one, None if the trace does not show either
+        return_code : None or int
+            The return code of the job
+        """
+        # Using search as match will only search the beginning of
+        # the string
+        # https://stackoverflow.com/a/32134461/2786884
+        match = re.search(r"Exit_status=(-?\d+)", trace, flags=re.MULTILINE)
+        if match is not None:
+            return "F", int(match.group(1))
+        if re.search(r"dequeuing", trace, flags=re.MULTILINE) is not None:
+            return PBSStatusService.dequeued_state, None
+        return None, None
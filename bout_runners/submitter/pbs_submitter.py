@@ -3,12 +3,15 @@
 
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
 from time import sleep
 from typing import Dict, Optional, Tuple
 
 from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
 from bout_runners.submitter.local_submitter import LocalSubmitter
+from bout_runners.submitter.pbs_job_array import PBSJobArray
+from bout_runners.submitter.pbs_status_service import PBSStatusService
 from bout_runners.submitter.processor_split import ProcessorSplit
 
 
@@ -16,15 +19,26 @@ class PBSSubmitter(AbstractClusterSubmitter):
     """
     The PBS submitter class.
 
+    The status of the jobs are obtained from the PBSStatusService shared by all
+    the PBSSubmitters, so that all the in-flight jobs are polled with one call
+    to ``qstat``
+
     Attributes
     ----------
     __dequeued : bool
         Whether or not the job has been dequeued from the queue
+    __status_service : PBSStatusService
+        The service polling the status of the job
+    __pbs_pro : None or bool
+        Whether the PBS system is PBS Pro
+        None until it has been checked
 
     Methods
     -------
     _wait_for_std_out_and_std_err()
         Wait until the process completes if a process has been started
+    _on_submitted(submission_time)
+        Track the job in the status service
     get_return_code(sacct_str)
         Return the exit code if any
     get_return_code(trace)
@@ -35,12 +49,19 @@ class PBSSubmitter(AbstractClusterSubmitter):
         Structure the time string to a PBS time string
     completed()
         Return the completed status
-    create_submission_string(command, waiting_for)
+    get_array_dependency_id(job_id)
+        Return the job id to depend on for a job or a sub-job of a job array
+    create_submission_string(command, waiting_for, job_name, number_of_array_tasks)
         Return the PBS script as a string
+    is_pbs_pro()
+        Return whether the PBS system is PBS Pro
+    create_job_array()
+        Return a PBS job array which can bundle compatible submissions
     get_trace()
         Return the trace from ``tracejob``
     reset()
-        Reset dequeued, released, waiting_for and status dict
+        Reset dequeued, released, waiting_for and status dict, and stop tracking
+        the job
 
     Examples
     --------
@@ -51,12 +72,15 @@ class PBSSubmitter(AbstractClusterSubmitter):
     Hello
     """
 
+    __pbs_pro: Optional[bool] = None
+
     def __init__(
         self,
         job_name: Optional[str] = None,
         store_directory: Optional[Path] = None,
         submission_dict: Optional[Dict[str, Optional[str]]] = None,
         processor_split: Optional[ProcessorSplit] = None,
+        status_service: Optional[PBSStatusService] = None,
     ):
         """
         Set the member data.
@@ -82,8 +106,16 @@ class PBSSubmitter(AbstractClusterSubmitter):
         processor_split : ProcessorSplit or None
             Object containing the processor split
             If None, default values will be used
+        status_service : None or PBSStatusService
+            The service polling the status of the job
+            If None, the service shared by all the PBSSubmitters will be used
         """
         super().__init__(job_name, store_directory, submission_dict, processor_split)
+        self.__status_service = (
+            status_service
+            if status_service is not None
+            else PBSStatusService.get_service()
+        )
         if self._submission_dict["walltime"] is not None:
             self._submission_dict["walltime"] = self.structure_time_to_pbs_format(
                 self._submission_dict["walltime"]
@@ -128,14 +160,23 @@ class PBSSubmitter(AbstractClusterSubmitter):
         if self._status["job_id"] is not None:
             self.release()
             while self._status["return_code"] is None and not self.__dequeued:
-                trace = self.get_trace()
-                self._status["return_code"] = self.get_return_code(trace)
-                self.__dequeued = self.has_dequeue(trace)
-                sleep(5)
-                logging.debug("Trace is reading:\n%s", trace)
+                state, return_code = self.__status_service.get_status(
+                    str(self._status["job_id"])
+                )
+                self._status["return_code"] = return_code
+                self.__dequeued = self.__status_service.is_finished(state, return_code)
+                logging.debug(
+                    "job_id %s (%s) has state %s",
+                    self.job_id,
+                    self.job_name,
+                    state,
+                )
+                if not self.__dequeued:
+                    sleep(max(self.__status_service.cache_ttl, 1))
 
             if self._status["return_code"] is not None:
                 self._populate_std_out_and_std_err()
+                self._notify_completion()
             else:
                 # If the return code is empty it must be because the while loop
                 # exited because the job was dequeued
@@ -144,6 +185,7 @@ class PBSSubmitter(AbstractClusterSubmitter):
                     "No process started, so "
                     "return_code, std_out, std_err are not populated"
                 )
+                self._notify_completion()
         else:
             # No job_id
             logging.warning(
@@ -241,18 +283,46 @@ class PBSSubmitter(AbstractClusterSubmitter):
         if self._status["job_id"] is not None and self._released:
             if self._status["return_code"] is not None:
                 return True
-            trace = self.get_trace()
-            return_code = self.get_return_code(trace)
+            state, return_code = self.__status_service.get_status(
+                str(self._status["job_id"])
+            )
             if return_code is not None:
                 self._status["return_code"] = return_code
                 self._wait_for_std_out_and_std_err()
                 return True
-            self.__dequeued = self.has_dequeue(trace)
+            self.__dequeued = self.__status_service.is_finished(state, return_code)
+            if self.__dequeued:
+                self._notify_completion()
             return self.__dequeued
         return False
 
+    @staticmethod
+    def get_array_dependency_id(job_id: str) -> str:
+        """
+        Return the job id to depend on for a job or a sub-job of a job array.
+
+        PBS does not support dependencies on single sub-jobs, so dependencies on a
+        sub-job are expressed against the whole job array
+
+        Parameters
+        ----------
+        job_id : str
+            The job id, where sub-jobs are on the form ``1234[5].server``
+
+        Returns
+        -------
+        str
+            The job id, where sub-jobs are replaced by their job array on the form
+            ``1234[].server``
+        """
+        return re.sub(r"\[\d+\]", "[]", job_id)
+
     def create_submission_string(
-        self, command: str, waiting_for: Tuple[str, ...]
+        self,
+        command: str,
+        waiting_for: Tuple[str, ...],
+        job_name: Optional[str] = None,
+        number_of_array_tasks: Optional[int] = None,
     ) -> str:
         """
         Return the PBS script as a string.
@@ -263,6 +333,12 @@ class PBSSubmitter(AbstractClusterSubmitter):
             The command to submit
         waiting_for : tuple of str
             Tuple of ids that this job will wait for
+        job_name : None or str
+            Name of the job
+            If None, the job_name of the submitter will be used
+        number_of_array_tasks : None or int
+            The number of sub-jobs if the script is for a job array
+            The .log and .err files will then be suffixed with the array index
 
         Returns
         -------
@@ -275,9 +351,24 @@ class PBSSubmitter(AbstractClusterSubmitter):
         account = self._submission_dict["account"]
         queue = self._submission_dict["queue"]
         mail = self._submission_dict["mail"]
-        # Notice that we do not add the stem here
-        self._log_and_error_base = self.store_dir.joinpath(self._job_name)
-
+        if job_name is None:
+            job_name = self._job_name
+        if number_of_array_tasks is None:
+            array_str = ""
+            # Notice that we do not add the stem here
+            self._log_and_error_base = self.store_dir.joinpath(job_name)
+            log_and_error_base = str(self._log_and_error_base)
+        else:
+            array_str = f"#PBS -J 0-{number_of_array_tasks - 1}{newline}"
+            # ^array_index^ is replaced by the array index of the sub-job
+            log_and_error_base = f"{self.store_dir.joinpath(job_name)}_^array_index^"
+
+        # Remove duplicates while preserving the order
+        waiting_for = tuple(
+            dict.fromkeys(
+                self.get_array_dependency_id(job_id) for job_id in waiting_for
+            )
+        )
         waiting_for_str = (
             f"#PBS -W depend=afterok:{':'.join(waiting_for)}{newline}"
             if len(waiting_for) != 0
@@ -285,15 +376,16 @@ class PBSSubmitter(AbstractClusterSubmitter):
         )
         job_string = (
             "#!/bin/bash\n"
-            f"#PBS -N {self._job_name}\n"
+            f"#PBS -N {job_name}\n"
+            f"{array_str}"
             f"#PBS -l nodes={self.processor_split.number_of_nodes}"
             f":ppn={self.processor_split.processors_per_node}\n"
             # hh:mm:ss
             f"{f'#PBS -l walltime={walltime}{newline}' if walltime is not None else ''}"
             f"{f'#PBS -A {account}{newline}' if account is not None else ''}"
             f"{f'#PBS -q {queue}{newline}' if queue is not None else ''}"
-            f"#PBS -o {self._log_and_error_base}.log\n"
-            f"#PBS -e {self._log_and_error_base}.err\n"
+            f"#PBS -o {log_and_error_base}.log\n"
+            f"#PBS -e {log_and_error_base}.err\n"
             # a=abort b=begin e=end
             f"{f'#PBS -m abe{newline}' if mail is not None else ''}"
             f"{f'#PBS -M {mail}{newline}' if mail is not None else ''}"
@@ -305,10 +397,76 @@ class PBSSubmitter(AbstractClusterSubmitter):
         )
         return job_string
 
+    def _on_submitted(self, submission_time: datetime) -> None:
+        """
+        Track the job in the status service.
+
+        Parameters
+        ----------
+        submission_time : datetime
+            The time the job was submitted
+        """
+        if self._status["job_id"] is not None:
+            self.__status_service.track(str(self._status["job_id"]), submission_time)
+
+    @classmethod
+    def is_pbs_pro(cls) -> bool:
+        """
+        Return whether the PBS system is PBS Pro.
+
+        PBS Pro (and OpenPBS) reports its version as ``pbs_version = x.y.z``,
+        whereas Torque reports it as ``Version: x.y.z``.
+        The check is only made once per process
+
+        Returns
+        -------
+        bool
+            True if the PBS system is PBS Pro
+        """
+        if cls.__pbs_pro is None:
+            # Submit the command through a local submitter
+            local_submitter = LocalSubmitter()
+            try:
+                local_submitter.submit_command("qstat --version")
+                local_submitter.wait_until_completed(raise_error=False)
+                version_str = (
+                    f"{local_submitter.std_out} {local_submitter.std_err}".lower()
+                )
+                cls.__pbs_pro = "pbs_version" in version_str
+            except FileNotFoundError:
+                # subprocess.Popen throws FileNotFoundError if a command is not in
+                # scope
+                cls.__pbs_pro = False
+            logging.debug("PBS is%s PBS Pro", " not" if not cls.__pbs_pro else "")
+        return cls.__pbs_pro
+
+    def create_job_array(self) -> Optional[PBSJobArray]:
+        """
+        Return a PBS job array which can bundle compatible submissions.
+
+        Returns
+        -------
+        None or PBSJobArray
+            The job array
+            None if the PBS system is not PBS Pro, as the job arrays use the
+            directives and variables of PBS Pro
+        """
+        if not self.is_pbs_pro():
+            logging.info(
+                "Job arrays are only supported for PBS Pro, submitting %s as a "
+                "single job",
+                self._job_name,
+            )
+            return None
+        return PBSJobArray(f"{self._job_name}_array", self.store_dir)
+
     def get_trace(self) -> str:
         """
         Return the trace from ``tracejob``.
 
+        The status of the job is polled through the status service, this method
+        is only used for inspecting a single job
+
         Returns
         -------
         trace : str
@@ -327,7 +485,9 @@ class PBSSubmitter(AbstractClusterSubmitter):
         return ""
 
     def reset(self) -> None:
-        """Reset dequeued, released, waiting_for and status dict."""
+        """Reset dequeued, released, waiting_for and status dict, stop tracking job."""
+        if self._status["job_id"] is not None:
+            self.__status_service.untrack(str(self._status["job_id"]))
         self._released = False
         self.__dequeued = False
         self._waiting_for = list()
@@ -0,0 +1,125 @@
+"""Contains the SLURM job array class."""
+
+
+from pathlib import Path
+from typing import Tuple
+
+from bout_runners.submitter.abstract_cluster_job_array import AbstractClusterJobArray
+from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
+
+
+class SLURMJobArray(AbstractClusterJobArray):
+    """
+    The SLURM job array class.
+
+    The tasks are submitted with ``#SBATCH --array=0-N``, and the task with array
+    index i has the job id ``<array_id>_<i>``.
+
+    Methods
+    -------
+    _create_submission_string(template, dispatch_command, waiting_for)
+        Return the script of the job array
+    get_dispatch_command(table_path)
+        Return the command which executes the command of the current array index
+    get_task_id(index)
+        Return the job id of a task
+    get_task_log_and_error_base(index)
+        Return the base for the path for the .log and .err files of a task
+
+    Examples
+    --------
+    >>> job_array = SLURMJobArray("sweep", store_path)
+    >>> job_array.add(submitter_1)
+    >>> job_array.add(submitter_2)
+    >>> submitter_1.submit_command("echo 'Hello'")
+    >>> submitter_2.submit_command("echo 'World'")
+    >>> job_array.submit()
+    '1234'
+    >>> submitter_2.job_id
+    '1234_1'
+    """
+
+    def _create_submission_string(
+        self,
+        template: AbstractClusterSubmitter,
+        dispatch_command: str,
+        waiting_for: Tuple[str, ...],
+    ) -> str:
+        """
+        Return the script of the job array.
+
+        Parameters
+        ----------
+        template : AbstractClusterSubmitter
+            The submitter whose options are used for all the tasks
+        dispatch_command : str
+            The command which executes the command of the current array index
+        waiting_for : tuple of str
+            Tuple of ids that the job array will wait for
+
+        Returns
+        -------
+        str
+            The script to be submitted
+        """
+        # NOTE: The template is a SLURMSubmitter, but it is not imported here to
+        #       avoid circular imports
+        return template.create_submission_string(  # type: ignore
+            dispatch_command,
+            waiting_for,
+            job_name=self.job_name,
+            number_of_array_tasks=self.number_of_tasks,
+        )
+
+    @staticmethod
+    def get_dispatch_command(table_path: Path) -> str:
+        """
+        Return the command which executes the command of the current array index.
+
+        Parameters
+        ----------
+        table_path : Path
+            Path to the command table, where line number i + 1 contains the command
+            of array index i
+
+        Returns
+        -------
+        str
+            The command
+        """
+        return (
+            f'COMMAND=$(sed -n "$((SLURM_ARRAY_TASK_ID + 1))p" {table_path})\n'
+            'eval "${COMMAND}"'
+        )
+
+    def get_task_id(self, index: int) -> str:
+        """
+        Return the job id of a task.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the task
+
+        Returns
+        -------
+        str
+            The job id of the task
+        """
+        return f"{self.array_id}_{index}"
+
+    def get_task_log_and_error_base(self, index: int) -> Path:
+        """
+        Return the base for the path for the .log and .err files of a task.
+
+        Parameters
+        ----------
+        index : int
+            The array index of the task
+
+        Returns
+        -------
+        Path
+            The base of the .log and .err files
+        """
+        return self.store_dir.joinpath(f"{self.job_name}_{self.array_id}_{index}")
@@ -0,0 +1,110 @@
+"""Contains the SLURM status service class."""
+
+
+import logging
+import re
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from bout_runners.submitter.abstract_cluster_status_service import (
+    AbstractClusterStatusService,
+)
+
+
+class SLURMStatusService(AbstractClusterStatusService):
+    """
+    Service polling the status of all tracked SLURM jobs with one ``sacct`` call.
+
+    Attributes
+    ----------
+    unfinished_states : tuple of str
+        States where the job has not finished
+
+    Methods
+    -------
+    _query(job_ids, start_time)
+        Return the states and return codes of the jobs from ``sacct``
+    parse_sacct(sacct_str)
+        Return the states and return codes from the parsable ``sacct`` output
+
+    Examples
+    --------
+    >>> service = SLURMStatusService.get_service()
+    >>> service.track("1234", datetime.now())
+    >>> service.get_status("1234")
+    ('RUNNING', None)
+    """
+
+    unfinished_states = (
+        "PENDING",
+        "CONFIGURING",
+        "RUNNING",
+        "COMPLETING",
+        "REQUEUED",
+        "RESIZING",
+        "SUSPENDED",
+        "STOPPED",
+    )
+
+    def _query(
+        self, job_ids: Tuple[str, ...], start_time: datetime
+    ) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """
+        Return the states and return codes of the jobs from ``sacct``.
+
+        Parameters
+        ----------
+        job_ids : tuple of str
+            The job ids to query
+        start_time : datetime
+            The earliest submission time of the jobs
+
+        Returns
+        -------
+        statuses : dict of str, tuple
+            The job ids as keys, and the state and return code as values
+        """
+        sacct_str = self._run_command(
+            "sacct --parsable2 --noheader --format JobID,State,ExitCode "
+            f"--starttime {start_time.strftime(r'%Y-%m-%dT%H:%M:%S')} "
+            f"-j {','.join(job_ids)}"
+        )
+        return self.parse_sacct(sacct_str)
+
+    @staticmethod
+    def parse_sacct(sacct_str: str) -> Dict[str, Tuple[Optional[str], Optional[int]]]:
+        """
+        Return the states and return codes from the parsable ``sacct`` output.
+
+        Parameters
+        ----------
+        sacct_str : str
+            Output from ``sacct --parsable2 --noheader --format JobID,State,ExitCode``
+
+        Returns
+        -------
+        statuses : dict of str, tuple
+            The job ids as keys, and the state and return code as values
+            The return code is None if the job has not finished
+            The steps of the jobs (like 1234.batch) are not included
+        """
+        statuses: Dict[str, Tuple[Optional[str], Optional[int]]] = dict()
+        for line in sacct_str.splitlines():
+            fields = line.strip().split("|")
+            if len(fields) < 3 or "." in fields[0]:
+                continue
+            job_id, state_str, exit_code = fields[:3]
+            # The state can be on the form "CANCELLED by 1234"
+            state = state_str.split()[0] if state_str.strip() != "" else None
+            match = re.match(r"(-?\d+):-?\d+", exit_code)
+            if state is None or state in SLURMStatusService.unfinished_states:
+                return_code = None
+            elif match is None:
+                logging.warning(
+                    "Could not parse the exit code %s of job_id %s", exit_code, job_id
+                )
+                return_code = None
+            else:
+                return_code = int(match.group(1))
+            statuses[job_id] = (state, return_code)
+        return statuses
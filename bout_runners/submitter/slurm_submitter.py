@@ -3,7 +3,7 @@
 
 import logging
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from time import sleep
 from typing import Dict, Optional, Tuple
@@ -11,21 +11,31 @@ from typing import Dict, Optional, Tuple
 from bout_runners.submitter.abstract_cluster_submitter import AbstractClusterSubmitter
 from bout_runners.submitter.local_submitter import LocalSubmitter
 from bout_runners.submitter.processor_split import ProcessorSplit
+from bout_runners.submitter.slurm_job_array import SLURMJobArray
+from bout_runners.submitter.slurm_status_service import SLURMStatusService
 
 
 class SLURMSubmitter(AbstractClusterSubmitter):
     """
     The SLURM submitter class.
 
+    The status of the jobs are obtained from the SLURMStatusService shared by all
+    the SLURMSubmitters, so that all the in-flight jobs are polled with one call
+    to ``sacct``
+
     Attributes
     ----------
-    __sacct_starttime : str
-        Time to search from in sacct
+    __status_service : SLURMStatusService
+        The service polling the status of the job
+    __submission_time : None or datetime
+        The time the latest job was submitted
 
     Methods
     -------
     _wait_for_std_out_and_std_err()
         Wait until the process completes if a process has been started
+    _on_submitted(submission_time)
+        Track the job in the status service
     extract_job_id(std_out)
         Return the job_id
     get_return_code(sacct_str)
@@ -36,12 +46,14 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         Structure the time string to a SLURM time string
     completed()
         Return the completed status
-    create_submission_string(command, waiting_for)
-        Return the PBS script as a string
+    create_submission_string(command, waiting_for, job_name, number_of_array_tasks)
+        Return the SLURM script as a string
+    create_job_array()
+        Return a SLURM job array which can bundle compatible submissions
     get_sacct()
         Return the trace from ``sacct``
     reset()
-        Reset released, waiting_for and status dict
+        Reset released, waiting_for and status dict, and stop tracking the job
 
     Examples
     --------
@@ -58,6 +70,7 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         store_directory: Path,
         submission_dict: Optional[Dict[str, Optional[str]]] = None,
         processor_split: Optional[ProcessorSplit] = None,
+        status_service: Optional[SLURMStatusService] = None,
     ):
         """
         Set the member data.
@@ -83,12 +96,18 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         processor_split : ProcessorSplit or None
             Object containing the processor split
             If None, default values will be used
+        status_service : None or SLURMStatusService
+            The service polling the status of the job
+            If None, the service shared by all the SLURMSubmitters will be used
         """
         super().__init__(job_name, store_directory, submission_dict, processor_split)
 
-        self.__sacct_starttime = (datetime.now() - timedelta(days=365)).strftime(
-            r"%Y-%m-%d"
+        self.__status_service = (
+            status_service
+            if status_service is not None
+            else SLURMStatusService.get_service()
         )
+        self.__submission_time: Optional[datetime] = None
 
         if self._submission_dict["walltime"] is not None:
             self._submission_dict["walltime"] = self.structure_time_to_slurm_format(
@@ -108,13 +127,22 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         if self._status["job_id"] is not None:
             self.release()
             while self._status["return_code"] is None:
-                sacct_str = self.get_sacct()
-                self._status["return_code"] = self.get_return_code(sacct_str)
-                sleep(5)
-                logging.debug("sacct is reading:\n%s", sacct_str)
+                state, return_code = self.__status_service.get_status(
+                    str(self._status["job_id"])
+                )
+                self._status["return_code"] = return_code
+                logging.debug(
+                    "job_id %s (%s) has state %s",
+                    self.job_id,
+                    self.job_name,
+                    state,
+                )
+                if return_code is None:
+                    sleep(max(self.__status_service.cache_ttl, 1))
 
             if self._status["return_code"] is not None:
                 self._populate_std_out_and_std_err()
+                self._notify_completion()
         else:
             # No job_id
             logging.warning(
@@ -270,10 +298,9 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         if self._status["job_id"] is not None and self._released:
             if self._status["return_code"] is not None:
                 return True
-            sacct_str = self.get_sacct()
-            if self.get_state(sacct_str) in ("RUNNING", None):
-                return False
-            return_code = self.get_return_code(sacct_str)
+            _, return_code = self.__status_service.get_status(
+                str(self._status["job_id"])
+            )
             if return_code is not None:
                 self._status["return_code"] = return_code
                 self._wait_for_std_out_and_std_err()
@@ -281,10 +308,14 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         return False
 
     def create_submission_string(
-        self, command: str, waiting_for: Tuple[str, ...]
+        self,
+        command: str,
+        waiting_for: Tuple[str, ...],
+        job_name: Optional[str] = None,
+        number_of_array_tasks: Optional[int] = None,
     ) -> str:
         """
-        Return the PBS script as a string.
+        Return the SLURM script as a string.
 
         Parameters
         ----------
@@ -292,6 +323,13 @@ class SLURMSubmitter(AbstractClusterSubmitter):
             The command to submit
         waiting_for : tuple of str
             Tuple of ids that this job will wait for
+        job_name : None or str
+            Name of the job
+            If None, the job_name of the submitter will be used
+        number_of_array_tasks : None or int
+            The number of tasks if the script is for a job array
+            The .log and .err files will then be suffixed with the job id and the
+            array index
 
         Returns
         -------
@@ -312,15 +350,25 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         else:
             waiting_for_str = ""
 
-        # Notice that we do not add the stem here
-        self._log_and_error_base = self.store_dir.joinpath(self._job_name)
-        log_file_str = f"{self._log_and_error_base}.log"
-        err_file_str = f"{self._log_and_error_base}.err"
+        if job_name is None:
+            job_name = self._job_name
+        if number_of_array_tasks is None:
+            array_str = ""
+            # Notice that we do not add the stem here
+            self._log_and_error_base = self.store_dir.joinpath(job_name)
+            log_and_error_base = str(self._log_and_error_base)
+        else:
+            array_str = f"#SBATCH --array=0-{number_of_array_tasks - 1}{newline}"
+            # %A is the job id of the array and %a is the array index
+            log_and_error_base = f"{self.store_dir.joinpath(job_name)}_%A_%a"
+        log_file_str = f"{log_and_error_base}.log"
+        err_file_str = f"{log_and_error_base}.err"
         # NOTE: job_string += added in order not to trigger pylint R0801
         #       (which seems not possible to disable)
         job_string = (
             "#!/bin/bash\n"
-            f"#SBATCH --job-name={self._job_name}\n"
+            f"#SBATCH --job-name={job_name}\n"
+            f"{array_str}"
             f"#SBATCH --nodes={self.processor_split.number_of_nodes}\n"
             f"#SBATCH --tasks-per-node={self.processor_split.processors_per_node}\n"
             f"{f'#SBATCH --time={wall_time}{newline}' if wall_time is not None else ''}"
@@ -343,10 +391,37 @@ class SLURMSubmitter(AbstractClusterSubmitter):
 
         return job_string
 
+    def _on_submitted(self, submission_time: datetime) -> None:
+        """
+        Track the job in the status service.
+
+        Parameters
+        ----------
+        submission_time : datetime
+            The time the job was submitted
+        """
+        self.__submission_time = submission_time
+        if self._status["job_id"] is not None:
+            self.__status_service.track(str(self._status["job_id"]), submission_time)
+
+    def create_job_array(self) -> SLURMJobArray:
+        """
+        Return a SLURM job array which can bundle compatible submissions.
+
+        Returns
+        -------
+        SLURMJobArray
+            The job array
+        """
+        return SLURMJobArray(f"{self._job_name}_array", self.store_dir)
+
     def get_sacct(self) -> str:
         """
         Return the result from ``sacct``.
 
+        The status of the job is polled through the status service, this method
+        is only used for inspecting a single job
+
         Returns
         -------
         sacct_str : str
@@ -354,11 +429,16 @@ class SLURMSubmitter(AbstractClusterSubmitter):
             An empty string is will be returned if no job_id exist
         """
         if self._status["job_id"] is not None:
+            starttime = (
+                self.__submission_time
+                if self.__submission_time is not None
+                else datetime.now() - self.__status_service.unknown_start_time
+            ) - self.__status_service.start_time_margin
             # Submit the command through a local submitter
             local_submitter = LocalSubmitter(run_path=self.store_dir)
             local_submitter.submit_command(
                 f"sacct "
-                f"--starttime {self.__sacct_starttime} "
+                f"--starttime {starttime.strftime(r'%Y-%m-%dT%H:%M:%S')} "
                 f"--j {self._status['job_id']} "
                 f"--brief"
             )
@@ -370,7 +450,9 @@ class SLURMSubmitter(AbstractClusterSubmitter):
         return ""
 
     def reset(self) -> None:
-        """Reset released, waiting_for and status dict."""
+        """Reset released, waiting_for and status dict, and stop tracking the job."""
+        if self._status["job_id"] is not None:
+            self.__status_service.untrack(str(self._status["job_id"]))
         self._released = False
         self._waiting_for = list()
         self._reset_status()
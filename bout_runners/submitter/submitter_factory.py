@@ -3,14 +3,35 @@
 
 import configparser
 import logging
-from typing import Any, Dict, Optional, Tuple
+import sys
+from typing import Any, Dict, Optional, Tuple, Type
 
+from bout_runners.submitter.async_local_submitter import AsyncLocalSubmitter
+from bout_runners.submitter.local_execution_pool import LocalExecutionPool
 from bout_runners.submitter.local_submitter import AbstractSubmitter, LocalSubmitter
 from bout_runners.submitter.pbs_submitter import PBSSubmitter
 from bout_runners.submitter.processor_split import ProcessorSplit
 from bout_runners.submitter.slurm_submitter import SLURMSubmitter
+from bout_runners.submitter.worker_pool_submitter import WorkerPoolSubmitter
 from bout_runners.utils.paths import get_submitters_configuration
 
+# NOTE: Only the arguments listed in the defaults are passed to the submitters,
+#       in addition to the processor_split which is used by all of them
+SUBMITTER_CLASSES: Dict[str, Type[AbstractSubmitter]] = {
+    "local": LocalSubmitter,
+    "async_local": AsyncLocalSubmitter,
+    "worker_pool": WorkerPoolSubmitter,
+    "pbs": PBSSubmitter,
+    "slurm": SLURMSubmitter,
+}
+SUBMITTER_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "local": {"run_path": None, "execution_pool": None},
+    "async_local": {"run_path": None},
+    "worker_pool": {"run_path": None, "max_workers": None, "preload_modules": None},
+    "pbs": {"job_name": None, "store_directory": None, "submission_dict": None},
+    "slurm": {"job_name": None, "store_directory": None, "submission_dict": None},
+}
+
 
 def get_submitter(
     name: Optional[str] = None,
@@ -37,7 +58,19 @@ def get_submitter(
     run_path : Path or str or None
         Positional argument
         Directory to run the command from
+        Used in LocalSubmitters, AsyncLocalSubmitters and WorkerPoolSubmitters
+    execution_pool : LocalExecutionPool or None
+        Keyword argument
+        Pool which limits the total number of processors in use
         Used in LocalSubmitters
+    max_workers : int or None
+        Keyword argument
+        Number of workers in the shared worker pool
+        Used in WorkerPoolSubmitters
+    preload_modules : tuple of str or None
+        Keyword argument
+        The modules the workers import when they start
+        Used in WorkerPoolSubmitters
     job_name : str or None
         Positional argument
         Name of the job
@@ -70,40 +103,32 @@ def get_submitter(
         If the input does not match the desired submitter
     NotImplementedError
         If the name is not a supported submitter class
+        The async_local submitter is only supported from python 3.8
     """
-    implemented = ("local", "pbs", "slurm")
+    # NOTE: Awaiting child processes from an event loop which does not run in the
+    #       main thread requires python 3.8
+    implemented = tuple(
+        submitter_name
+        for submitter_name in SUBMITTER_CLASSES
+        if submitter_name != "async_local" or sys.version_info >= (3, 8)
+    )
 
     if name is None or argument_dict is None:
         name, argument_dict = infer_submitter()
 
-    logging.debug("Choosing a %s submitter", name)
-
-    if "processor_split" not in argument_dict.keys():
-        argument_dict["processor_split"] = ProcessorSplit()
-    if name == "local":
-        if "run_path" not in argument_dict.keys():
-            argument_dict["run_path"] = None
-        return LocalSubmitter(
-            run_path=argument_dict["run_path"],
-            processor_split=argument_dict["processor_split"],
-        )
-    if name in ("pbs", "slurm"):
-        for argument in ("job_name", "store_directory", "submission_dict"):
+    if name in implemented:
+        logging.debug("Choosing a %s submitter", name)
+        if "processor_split" not in argument_dict.keys():
+            argument_dict["processor_split"] = ProcessorSplit()
+        for argument, default in SUBMITTER_DEFAULTS[name].items():
             if argument not in argument_dict.keys():
-                argument_dict[argument] = None
-    if name == "pbs":
-        return PBSSubmitter(
-            job_name=argument_dict["job_name"],
-            store_directory=argument_dict["store_directory"],
-            submission_dict=argument_dict["submission_dict"],
-            processor_split=argument_dict["processor_split"],
-        )
-    if name == "slurm":
-        return SLURMSubmitter(
-            job_name=argument_dict["job_name"],
-            store_directory=argument_dict["store_directory"],
-            submission_dict=argument_dict["submission_dict"],
+                argument_dict[argument] = default
+        return SUBMITTER_CLASSES[name](
             processor_split=argument_dict["processor_split"],
+            **{
+                argument: argument_dict[argument]
+                for argument in SUBMITTER_DEFAULTS[name]
+            },
         )
 
     msg = f"{name} is not a valid submitter class, choose " f"from {implemented}"
@@ -143,10 +168,18 @@ def infer_submitter() -> Tuple[str, Dict[str, Any]]:
         name = "local"
         # NOTE: We will always run one node for local submissions
         processor_split = get_processor_split(submitter_config["local"])
+        # NOTE: All the inferred local submitters share the same execution pool so
+        #       that the local processors are not oversubscribed
+        execution_pool = LocalExecutionPool.get_shared_pool(
+            get_processor_budget(submitter_config["local"])
+        )
         # NOTE: As the keyword argument run_path defaults to the caller dir
         #       we will not override the option here, but let the constructor
         #       give a default value
-        argument_dict = {"processor_split": processor_split}
+        argument_dict = {
+            "processor_split": processor_split,
+            "execution_pool": execution_pool,
+        }
 
     return name, argument_dict
 
@@ -260,3 +293,28 @@ def get_processor_split(submitter_section: configparser.SectionProxy) -> Process
         number_of_nodes=number_of_nodes,
         processors_per_node=processors_per_node,
     )
+
+
+def get_processor_budget(local_section: configparser.SectionProxy) -> Optional[int]:
+    """
+    Return the processor budget of the local execution pool.
+
+    Parameters
+    ----------
+    local_section : configparser.SectionProxy
+        The local section of the submitters configuration
+        The budget is read from processor_budget, where None means that all the
+        processors of the machine can be used
+
+    Returns
+    -------
+    None or int
+        The total number of processors local submissions can use at the same time
+        None if the number of processors of the machine should be used
+    """
+    if (
+        "processor_budget" not in local_section
+        or local_section["processor_budget"].lower() == "none"
+    ):
+        return None
+    return int(local_section["processor_budget"])
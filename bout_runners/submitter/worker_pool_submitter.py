@@ -0,0 +1,436 @@
+"""Contains the worker pool submitter class."""
+
+
+import contextlib
+import importlib
+import io
+import logging
+import os
+
+# NOTE: Subprocess below is safe against shell injections
+# https://github.com/PyCQA/bandit/issues/280
+import subprocess  # nosec
+import sys
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.processor_split import ProcessorSplit
+from bout_runners.utils.file_operations import get_caller_dir
+from bout_runners.utils.process_pools import new_process_pool
+
+
+def _preload_modules(modules: Tuple[str, ...]) -> None:
+    """
+    Import modules in a worker so that the submitted functions need not.
+
+    Parameters
+    ----------
+    modules : tuple of str
+        Name of the modules to import
+        Modules which are not installed are skipped
+    """
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            logging.debug("Could not preload %s in the worker", module)
+
+
+def _preload_and_call(
+    modules: Tuple[str, ...], function: Callable[..., Tuple[int, str, str]], *args: Any
+) -> Tuple[int, str, str]:
+    """
+    Import modules in a worker before calling a function.
+
+    Used instead of the initializer of the executor, which requires python 3.7
+    The modules are only imported once per worker, as they are cached in
+    sys.modules
+
+    Parameters
+    ----------
+    modules : tuple of str
+        Name of the modules to import
+    function : callable
+        The function to call
+    args : tuple
+        The arguments to the function
+
+    Returns
+    -------
+    tuple
+        The return code, std_out and std_err returned by the function
+    """
+    _preload_modules(modules)
+    return function(*args)
+
+
+def _call_function(
+    function: Callable,
+    args: Optional[Tuple[Any, ...]],
+    kwargs: Optional[Dict[str, Any]],
+    run_path: Path,
+) -> Tuple[int, str, str]:
+    """
+    Call a function in a worker and capture its standard output and error.
+
+    Parameters
+    ----------
+    function : function
+        The function to call
+    args : None or tuple
+        The positional arguments
+    kwargs : None or dict
+        The keyword arguments
+    run_path : Path
+        Directory to call the function from
+
+    Returns
+    -------
+    return_code : int
+        0 if the function returned, 1 if it raised an exception
+    std_out : str
+        The standard output
+    std_err : str
+        The standard error, including the traceback if an exception was raised
+    """
+    std_out = io.StringIO()
+    std_err = io.StringIO()
+    return_code = 0
+    cwd = os.getcwd()
+    try:
+        os.chdir(run_path)
+        with contextlib.redirect_stdout(std_out), contextlib.redirect_stderr(std_err):
+            try:
+                function(
+                    *(args if args is not None else tuple()),
+                    **(kwargs if kwargs is not None else dict()),
+                )
+            # NOTE: Any exception from the function is reported as a failure of
+            #       the submission
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+                return_code = 1
+    finally:
+        os.chdir(cwd)
+    return return_code, std_out.getvalue().strip(), std_err.getvalue().strip()
+
+
+def _run_command(command: str, run_path: Path) -> Tuple[int, str, str]:
+    """
+    Run a command from a worker.
+
+    Parameters
+    ----------
+    command : str
+        The command to run
+    run_path : Path
+        Directory to run the command from
+
+    Returns
+    -------
+    return_code : int
+        The return code of the command
+    std_out : str
+        The standard output
+    std_err : str
+        The standard error
+    """
+    result = subprocess.run(
+        command.split(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=run_path,
+        check=False,
+        # https://docs.python.org/3/library/subprocess.html#security-considerations
+        # https://github.com/PyCQA/bandit/issues/280
+        shell=False,  # nosec
+    )
+    return (
+        result.returncode,
+        result.stdout.decode("utf8").strip(),
+        result.stderr.decode("utf8").strip(),
+    )
+
+
+class WorkerPoolSubmitter(AbstractSubmitter):
+    """
+    Submits functions and commands to a pool of long-lived worker processes.
+
+    All the WorkerPoolSubmitters in a process share one ProcessPoolExecutor.
+    The workers import preload_modules when they start (before their first task
+    for python 3.6), so that a function submitted with submit_function neither
+    pays for the start of an interpreter nor for importing heavy modules.
+    As the submitters are used together with threads (like the status daemons),
+    the workers are started with forkserver or spawn rather than by forking the
+    process (for python 3.7 and later).
+    The functions must be importable by the workers (i.e. be defined at the top
+    level of a module), and the arguments must be picklable.
+
+    Attributes
+    ----------
+    __executor : None or ProcessPoolExecutor
+        The executor shared by all the instances
+    __executor_preload_modules : tuple of str
+        The modules preloaded by the workers of the shared executor
+    __counter : int
+        The number of submissions made by all the instances
+    __max_workers : None or int
+        Number of workers in the pool if this instance creates it
+    __preload_modules : None or tuple of str
+        The modules to preload if this instance creates the pool
+    __future : None or Future
+        Future which resolves to the return code, std_out and std_err
+    __description : None or str
+        Description of the latest submission
+    default_preload_modules : tuple of str
+        The modules to preload if nothing else is specified
+    run_path : Path
+        Directory to call the functions and run the commands from
+
+    Methods
+    -------
+    __populate_status()
+        Populate the return_code, std_out and std_err from the finished future
+    _wait_for_std_out_and_std_err()
+        Wait until the submission completes, populate return_code, std_out and
+        std_err
+    get_executor(max_workers, preload_modules)
+        Return the executor shared by all instances, create it if needed
+    shutdown()
+        Shut down the shared executor
+    submit_function(function, args, kwargs)
+        Submit a function to the worker pool
+    submit_command(command)
+        Submit a command to the worker pool
+    completed()
+        Return the completed status
+    raise_error()
+        Raise and error from the submission in a clean way
+
+    Examples
+    --------
+    >>> submitter = WorkerPoolSubmitter()
+    >>> submitter.submit_function(print, ("Hello",))
+    >>> submitter.wait_until_completed()
+    >>> print(submitter.std_out)
+    Hello
+    """
+
+    __executor: Optional[ProcessPoolExecutor] = None
+    __executor_preload_modules: Tuple[str, ...] = tuple()
+    __counter = 0
+
+    default_preload_modules = ("numpy", "pandas", "xarray")
+
+    def __init__(
+        self,
+        run_path: Optional[Path] = None,
+        processor_split: Optional[ProcessorSplit] = None,
+        max_workers: Optional[int] = None,
+        preload_modules: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        """
+        Set the path from where the calls are made from.
+
+        Parameters
+        ----------
+        run_path : Path or str or None
+            Directory to call the functions and run the commands from
+            If None, the calling directory will be used
+        processor_split : ProcessorSplit or None
+            Object containing the processor split
+            If None, default values will be used
+        max_workers : None or int
+            Number of workers in the pool
+            Only used if the shared pool has not been created
+            If None, the number of processors on the machine will be used
+        preload_modules : None or tuple of str
+            The modules the workers import when they start
+            Only used if the shared pool has not been created
+            If None, default_preload_modules will be used
+        """
+        AbstractSubmitter.__init__(self, processor_split)
+        # NOTE: We are not setting the default as a keyword argument
+        #       as this would mess up the paths
+        self.run_path = (
+            Path(run_path).absolute() if run_path is not None else get_caller_dir()
+        )
+        self.__max_workers = max_workers
+        self.__preload_modules = preload_modules
+        self.__future: Optional[Future] = None
+        self.__description: Optional[str] = None
+
+    @classmethod
+    def get_executor(
+        cls,
+        max_workers: Optional[int] = None,
+        preload_modules: Optional[Tuple[str, ...]] = None,
+    ) -> ProcessPoolExecutor:
+        """
+        Return the executor shared by all instances, create it if needed.
+
+        Parameters
+        ----------
+        max_workers : None or int
+            Number of workers in the pool
+            If None, the number of processors on the machine will be used
+        preload_modules : None or tuple of str
+            The modules the workers import when they start
+            If None, default_preload_modules will be used
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            The shared executor
+        """
+        if cls.__executor is None:
+            modules = (
+                preload_modules
+                if preload_modules is not None
+                else cls.default_preload_modules
+            )
+            # NOTE: For python 3.6 the pool does not call the initializer, so
+            #       the modules are preloaded by the tasks
+            cls.__executor = new_process_pool(
+                max_workers, initializer=_preload_modules, initargs=(modules,)
+            )
+            cls.__executor_preload_modules = modules
+            logging.debug("Created the shared worker pool preloading %s", modules)
+        return cls.__executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Shut down the shared executor."""
+        if cls.__executor is not None:
+            cls.__executor.shutdown(wait=True)
+            cls.__executor = None
+            logging.debug("Shut down the shared worker pool")
+
+    def __submit(self, description: str, function: Callable, *args: Any) -> None:
+        """
+        Submit a callable to the shared executor.
+
+        Parameters
+        ----------
+        description : str
+            Description of the submission used in logs and errors
+        function : callable
+            The callable to run in a worker
+        args : tuple
+            The arguments to the callable
+        """
+        # This starts the job anew, so we restart the instance to clear it from any
+        # spurious member data
+        self.reset()
+        self.__future = None
+        executor = self.get_executor(self.__max_workers, self.__preload_modules)
+        WorkerPoolSubmitter.__counter += 1
+        self._status["job_id"] = f"pool_{WorkerPoolSubmitter.__counter}"
+        self.__description = description
+        if sys.version_info >= (3, 7):
+            self.__future = executor.submit(function, *args)
+        else:
+            self.__future = executor.submit(
+                _preload_and_call,
+                WorkerPoolSubmitter.__executor_preload_modules,
+                function,
+                *args,
+            )
+        logging.debug(
+            "job_id %s given to %s in %s", self.job_id, description, self.run_path
+        )
+
+    def __populate_status(self) -> None:
+        """Populate the return_code, std_out and std_err from the finished future."""
+        if self.__future is not None and self.return_code is None:
+            try:
+                return_code, std_out, std_err = self.__future.result()
+            # NOTE: Errors like pickling errors or a crashed worker are reported
+            #       as a failure of the submission
+            except Exception as error:  # pylint: disable=broad-except
+                return_code, std_out, std_err = 1, "", repr(error)
+            self._status["std_out"] = std_out
+            self._status["std_err"] = std_err
+            self._status["return_code"] = return_code
+            self._notify_completion()
+
+    def _wait_for_std_out_and_std_err(self) -> None:
+        """
+        Wait until the submission completes if a submission has been made.
+
+        Populate return_code, std_out and std_err
+        """
+        if self.__future is not None:
+            # Exceptions are handled when populating the status
+            self.__future.exception()
+            self.__populate_status()
+        else:
+            logging.warning(
+                "Nothing submitted, return_code, std_out, std_err not populated"
+            )
+
+    def submit_function(
+        self,
+        function: Callable,
+        args: Optional[Tuple[Any, ...]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Submit a function to the worker pool.
+
+        Parameters
+        ----------
+        function : function
+            The function to call
+        args : None or tuple
+            The positional arguments
+        kwargs : None or dict
+            The keyword arguments
+        """
+        self.__submit(
+            f"function '{function.__name__}'",
+            _call_function,
+            function,
+            args,
+            kwargs,
+            self.run_path,
+        )
+
+    def submit_command(self, command: str) -> None:
+        """
+        Submit a command to the worker pool.
+
+        Parameters
+        ----------
+        command : str
+            The command to run
+        """
+        self.__submit(f"command '{command}'", _run_command, command, self.run_path)
+
+    def completed(self) -> bool:
+        """
+        Return the completed status.
+
+        Returns
+        -------
+        bool
+            True if the submission has completed
+        """
+        if self.__future is not None:
+            if self.return_code is not None:
+                return True
+            if self.__future.done():
+                self.__populate_status()
+                return True
+        return False
+
+    def raise_error(self) -> None:
+        """Raise and error from the submission in a clean way."""
+        if self.completed() and isinstance(self.return_code, int):
+            result = subprocess.CompletedProcess(
+                str(self.__description), self.return_code, self.std_out, self.std_err
+            )
+            result.check_returncode()
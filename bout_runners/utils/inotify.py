@@ -0,0 +1,259 @@
+"""Module containing a minimal ctypes wrapper of the Linux inotify API."""
+
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class Inotify:
+    """
+    Class for watching directories with the Linux inotify API.
+
+    Only the standard library is used, so the class is available on any Linux
+    machine with a C library exposing inotify
+
+    Attributes
+    ----------
+    __libc : None or ctypes.CDLL
+        The C library shared by all instances
+    __fd : int
+        The inotify file descriptor
+    __watches : dict of int, Path
+        The watched directories keyed by their watch descriptors
+    __watched_paths : dict of Path, int
+        The watch descriptors keyed by the watched directories
+    event_struct : struct.Struct
+        The fixed size part of an inotify event
+    masks : dict of str, int
+        The event masks by name
+    default_mask : int
+        The mask of the events which are watched by default
+
+    Methods
+    -------
+    available()
+        Return whether inotify is available on the machine
+    add_watch(path, mask)
+        Watch a directory
+    remove_watch(path)
+        Stop watching a directory
+    read_events(timeout)
+        Return the events which occurred within the timeout
+    close()
+        Close the inotify file descriptor
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> inotify = Inotify()
+    >>> inotify.add_watch(Path('path', 'to', 'dir'))
+    >>> inotify.read_events(timeout=1.0)
+    [(PosixPath('path/to/dir'), 'BOUT.log.0', 2)]
+    """
+
+    __libc: Optional[ctypes.CDLL] = None
+
+    event_struct = struct.Struct("iIII")
+    masks = {
+        "IN_MODIFY": 0x00000002,
+        "IN_CLOSE_WRITE": 0x00000008,
+        "IN_MOVED_TO": 0x00000080,
+        "IN_CREATE": 0x00000100,
+        "IN_IGNORED": 0x00008000,
+    }
+    default_mask = (
+        masks["IN_MODIFY"]
+        | masks["IN_CLOSE_WRITE"]
+        | masks["IN_MOVED_TO"]
+        | masks["IN_CREATE"]
+    )
+
+    def __init__(self) -> None:
+        """
+        Create the inotify file descriptor.
+
+        Raises
+        ------
+        OSError
+            If inotify is not available
+        """
+        libc = self.__get_libc()
+        if libc is None:
+            msg = "inotify is not available on this machine"
+            logging.critical(msg)
+            raise OSError(msg)
+        self.__fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.__fd < 0:
+            errno = ctypes.get_errno()
+            msg = f"inotify_init1 failed: {os.strerror(errno)}"
+            logging.critical(msg)
+            raise OSError(errno, msg)
+        self.__watches: Dict[int, Path] = dict()
+        self.__watched_paths: Dict[Path, int] = dict()
+
+    @classmethod
+    def __get_libc(cls) -> Optional[ctypes.CDLL]:
+        """
+        Return the C library if it exposes inotify.
+
+        Returns
+        -------
+        None or ctypes.CDLL
+            The C library
+        """
+        if cls.__libc is None and sys.platform.startswith("linux"):
+            try:
+                libc = ctypes.CDLL(
+                    ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+                )
+                # Raises AttributeError if inotify is not exposed
+                libc.inotify_init1  # pylint: disable=pointless-statement
+                libc.inotify_add_watch.argtypes = (
+                    ctypes.c_int,
+                    ctypes.c_char_p,
+                    ctypes.c_uint32,
+                )
+                cls.__libc = libc
+            except (OSError, AttributeError):
+                logging.debug("Could not load inotify from the C library")
+        return cls.__libc
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Return whether inotify is available on the machine.
+
+        Returns
+        -------
+        bool
+            True if inotify is available
+        """
+        return cls.__get_libc() is not None
+
+    @property
+    def watched_paths(self) -> Tuple[Path, ...]:
+        """
+        Return the watched directories.
+
+        Returns
+        -------
+        tuple of Path
+            The watched directories
+        """
+        return tuple(self.__watched_paths.keys())
+
+    def add_watch(self, path: Path, mask: Optional[int] = None) -> None:
+        """
+        Watch a directory.
+
+        Parameters
+        ----------
+        path : Path
+            The directory to watch
+        mask : None or int
+            The events to watch
+            If None, default_mask will be used
+
+        Raises
+        ------
+        OSError
+            If the directory could not be watched
+        """
+        path = Path(path)
+        if path in self.__watched_paths:
+            return
+        # NOTE: The libc is loaded as the instance was created
+        watch_descriptor = self.__libc.inotify_add_watch(  # type: ignore
+            self.__fd,
+            os.fsencode(path),
+            mask if mask is not None else self.default_mask,
+        )
+        if watch_descriptor < 0:
+            errno = ctypes.get_errno()
+            msg = f"Could not watch {path}: {os.strerror(errno)}"
+            logging.critical(msg)
+            raise OSError(errno, msg)
+        self.__watches[watch_descriptor] = path
+        self.__watched_paths[path] = watch_descriptor
+        logging.debug("Watching %s", path)
+
+    def remove_watch(self, path: Path) -> None:
+        """
+        Stop watching a directory.
+
+        Parameters
+        ----------
+        path : Path
+            The directory to stop watching
+        """
+        watch_descriptor = self.__watched_paths.pop(Path(path), None)
+        if watch_descriptor is not None:
+            self.__watches.pop(watch_descriptor, None)
+            self.__libc.inotify_rm_watch(self.__fd, watch_descriptor)  # type: ignore
+
+    def read_events(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[Path, str, int]]:
+        """
+        Return the events which occurred within the timeout.
+
+        The call returns as soon as at least one event is available
+
+        Parameters
+        ----------
+        timeout : None or float
+            Maximum number of seconds to wait for an event
+            If None, wait until an event occurs
+
+        Returns
+        -------
+        events : list of tuple
+            The watched directory, the name of the file and the mask of each event
+        """
+        events: List[Tuple[Path, str, int]] = list()
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if len(readable) == 0:
+            return events
+        try:
+            buffer = os.read(self.__fd, 64 * 1024)
+        except BlockingIOError:
+            return events
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, length = self.event_struct.unpack_from(
+                buffer, offset
+            )
+            offset += self.event_struct.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            path = self.__watches.get(watch_descriptor, None)
+            if path is None:
+                continue
+            if mask & self.masks["IN_IGNORED"]:
+                # The directory was removed, so the kernel dropped the watch
+                self.__watches.pop(watch_descriptor, None)
+                self.__watched_paths.pop(path, None)
+                continue
+            events.append((path, name, mask))
+        return events
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+            self.__watches.clear()
+            self.__watched_paths.clear()
+
+    def __del__(self) -> None:
+        """Close the inotify file descriptor."""
+        # NOTE: The descriptor is not set if the creation failed
+        if hasattr(self, "_Inotify__fd"):
+            self.close()
@@ -36,6 +36,28 @@ except ModuleNotFoundError:
 from bout_runners.utils.paths import get_log_file_path, get_logger_config_path
 
 
+def get_stack_depth() -> int:
+    """
+    Return the number of frames in the call stack of the caller.
+
+    This is the same as len(inspect.stack()), but the frames are only counted, so
+    the source files of the frames are not looked up
+
+    Returns
+    -------
+    depth : int
+        The number of frames
+    """
+    depth = 0
+    frame = inspect.currentframe()
+    # NOTE: The frame of this function is not counted
+    frame = frame.f_back if frame is not None else None
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
 class IndentFormatter(logging.Formatter):
     """
     Class which adds the indent formatter to the logging formatter.
@@ -59,7 +81,7 @@ class IndentFormatter(logging.Formatter):
             Format of date
         """
         logging.Formatter.__init__(self, fmt, datefmt)
-        self.subtract = len(inspect.stack())
+        self.subtract = get_stack_depth()
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -77,7 +99,7 @@ class IndentFormatter(logging.Formatter):
         """
         # WARNING: indent will only be available in record if the format
         #          string contains indent
-        spaces = len(inspect.stack()) - self.subtract
+        spaces = get_stack_depth() - self.subtract
         record.indent = "  " * spaces  # type: ignore
         out = logging.Formatter.format(self, record)
         return out
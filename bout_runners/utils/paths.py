@@ -183,3 +183,17 @@ def get_bout_directory() -> Path:
         path_str = f"{Path.home()}/{path_str}"
     bout_path = Path(path_str).absolute()
     return bout_path
+
+
+def get_use_wal() -> bool:
+    """
+    Load whether the databases use the write-ahead log from the configuration file.
+
+    Returns
+    -------
+    bool
+        Whether the databases are opened with the write-ahead log
+        False if the option is missing from the configuration
+    """
+    config = get_bout_runners_configuration()
+    return config.getboolean("database", "use_wal", fallback=False)
@@ -0,0 +1,65 @@
+"""Module containing functions to create pools of processes."""
+
+
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+
+def get_start_method() -> str:
+    """
+    Return the method used to start the processes of the pools.
+
+    Forking a process with running threads (like the status daemons) may deadlock
+    the children, so the processes are started from a fresh interpreter with
+    forkserver if it is available, and spawn otherwise
+
+    Returns
+    -------
+    str
+        The name of the start method
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+def new_process_pool(
+    max_workers: Optional[int] = None,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple[Any, ...] = tuple(),
+) -> ProcessPoolExecutor:
+    """
+    Return a new pool of processes which are not forked from the calling process.
+
+    Parameters
+    ----------
+    max_workers : None or int
+        Number of processes in the pool
+        If None, the number of processors on the machine will be used
+    initializer : None or callable
+        Callable which is called by every process when it starts
+        This is ignored for python 3.6
+    initargs : tuple
+        Arguments to the initializer
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The pool of processes
+
+    Notes
+    -----
+    mp_context, initializer and initargs were added to ProcessPoolExecutor in
+    python 3.7, so for python 3.6 the processes are forked, and the callers must
+    run the initializer through the submitted tasks instead
+    """
+    if sys.version_info >= (3, 7):
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(get_start_method()),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    return ProcessPoolExecutor(max_workers=max_workers)
@@ -162,8 +162,8 @@ def write_to_split(
     yield _write_split
 
 
-@pytest.fixture(scope="function")
-def get_test_db_copy(
+@pytest.fixture(scope="function", name="get_test_db_copy")
+def fixture_get_test_db_copy(
     tmp_path: Path,
     get_test_data_path: Path,
     make_test_database: Callable[[Optional[str]], DatabaseConnector],
@@ -208,3 +208,46 @@ def get_test_db_copy(
         return db_connector
 
     return _get_test_db_copy
+
+
+@pytest.fixture(scope="function")
+def get_migrated_test_db_copy(
+    get_test_db_copy: Callable[[str], DatabaseConnector]
+) -> Callable[[str], DatabaseConnector]:
+    """
+    Return a function which returns a DatabaseConnector connected to a migrated copy.
+
+    test.db is created by an earlier version of bout_runners, so its schema is
+    upgraded as done by bout_runners_migrate_database
+
+    Parameters
+    ----------
+    get_test_db_copy : function
+        Function which returns a a database connector to the copy of the test database
+
+    Returns
+    -------
+    _get_migrated_test_db_copy : function
+        Function which returns a a database connector to the migrated copy of the
+        test database
+    """
+
+    def _get_migrated_test_db_copy(name: str) -> DatabaseConnector:
+        """
+        Return a database connector to the migrated copy of the test database.
+
+        Parameters
+        ----------
+        name : str
+            Name of the temporary database
+
+        Returns
+        -------
+        db_connector : DatabaseConnector
+            DatabaseConnector to the migrated copy of the test database
+        """
+        db_connector = get_test_db_copy(name)
+        DatabaseCreator(db_connector).upgrade_schema()
+        return db_connector
+
+    return _get_migrated_test_db_copy
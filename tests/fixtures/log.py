@@ -1,6 +1,7 @@
 """Contains fixtures for logs."""
 
 
+import re
 import shutil
 from pathlib import Path
 from typing import Callable, Dict, Iterator
@@ -197,3 +198,49 @@ def copy_test_case_log_file(
                             )
 
     return _copy_test_case_log_file
+
+
+@pytest.fixture(scope="function", name="make_rank_logs")
+def fixture_make_rank_logs(get_test_data_path: Path) -> Callable:
+    """
+    Return the function for writing the logs of several MPI ranks.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+
+    Returns
+    -------
+    _make_rank_logs : function
+        Function which writes the rank logs
+    """
+
+    def _make_rank_logs(run_path: Path, number_of_ranks: int) -> None:
+        """
+        Write rank logs where the Calc column increases with the rank.
+
+        The Calc of every step of rank r is the Calc of the success log plus r
+
+        Parameters
+        ----------
+        run_path : Path
+            Directory to write the logs to
+        number_of_ranks : int
+            The number of ranks
+        """
+        run_path.mkdir(parents=True, exist_ok=True)
+        with get_test_data_path.joinpath("BOUT.log.0").open("r") as log_file:
+            lines = log_file.readlines()
+        step_pattern = re.compile(r"^\d\.\d{3}e[+-]\d{2}")
+        for rank in range(number_of_ranks):
+            rank_lines = list()
+            for line in lines:
+                if step_pattern.match(line) is not None:
+                    fields = line.split()
+                    fields[3] = f"{float(fields[3]) + rank:.1f}"
+                    line = f"{'   '.join(fields)}\n"
+                rank_lines.append(line)
+            run_path.joinpath(f"BOUT.log.{rank}").write_text("".join(rank_lines))
+
+    return _make_rank_logs
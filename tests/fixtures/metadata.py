@@ -1,11 +1,13 @@
 """Contains fixtures for file metadata."""
 
 
+import shutil
 from pathlib import Path
 from typing import Callable, Dict, Iterator, Tuple
 
 import pandas as pd
 import pytest
+from _pytest.tmpdir import TempPathFactory
 from pandas import DataFrame
 
 from bout_runners.database.database_connector import DatabaseConnector
@@ -63,21 +65,28 @@ def yield_number_of_rows_for_all_tables() -> Iterator[
 
 
 @pytest.fixture(scope="session")
-def yield_metadata_reader(get_test_data_path: Path) -> Iterator[MetadataReader]:
+def yield_metadata_reader(
+    get_test_data_path: Path, tmp_path_factory: TempPathFactory
+) -> Iterator[MetadataReader]:
     """
-    Yield the connection to the test database.
+    Yield the connection to a copy of the test database.
 
     Parameters
     ----------
     get_test_data_path : Path
         Path to the test data
+    tmp_path_factory : TempPathFactory
+        Factory of temporary paths (pytest fixture)
 
     Yields
     ------
     MetadataReader
         The instance to read the metadata
     """
-    test_db_connector = DatabaseConnector(name="test", db_root_path=get_test_data_path)
+    # NOTE: The tracked database is copied, so that reading it never changes it
+    db_root_path = tmp_path_factory.mktemp("metadata_reader")
+    shutil.copy(get_test_data_path.joinpath("test.db"), db_root_path)
+    test_db_connector = DatabaseConnector(name="test", db_root_path=db_root_path)
     yield MetadataReader(test_db_connector, drop_id=None)
 
 
@@ -1,13 +1,17 @@
 """Contains monkey patches."""
 
 
+import json
 from pathlib import Path
-from typing import Callable, Optional
+from time import sleep
+from typing import Callable, List, Optional, Tuple
 
 import psutil
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+from bout_runners.submitter.pbs_status_service import PBSStatusService
+
 
 @pytest.fixture(scope="function")
 def mock_pid_exists(monkeypatch: MonkeyPatch) -> Callable:
@@ -93,3 +97,86 @@ def get_mock_config_path(
     )
 
     return mock_config_path
+
+
+@pytest.fixture(scope="function")
+def mock_pbs_scheduler(
+    monkeypatch: MonkeyPatch, get_test_data_path: Path
+) -> Callable[[int, Tuple[str, ...], float], List[str]]:
+    """
+    Return a function for setting up a mock of the commands run by PBSStatusService.
+
+    The job attributes of tests/data/test_qstat.json are repeated for the number
+    of requested jobs, and jobs missing from qstat are traced with
+    tests/data/test_trace
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    get_test_data_path : Path
+        Path to the test data
+
+    Returns
+    -------
+    mock_wrapper : function
+        Function which monkeypatches PBSStatusService._run_command, and returns
+        the list where the called commands will be stored
+    """
+    with get_test_data_path.joinpath("test_qstat.json").open("r") as file:
+        qstat_template = json.load(file)
+    trace = get_test_data_path.joinpath("test_trace").read_text()
+    attributes = tuple(qstat_template["Jobs"].values())
+
+    def mock_wrapper(
+        number_of_jobs: int, missing_jobs: Tuple[str, ...], latency: float = 0.0
+    ) -> List[str]:
+        """
+        Monkeypatch PBSStatusService._run_command.
+
+        Parameters
+        ----------
+        number_of_jobs : int
+            Number of jobs known by the mocked scheduler, named 0.pbs, 1.pbs, ...
+        missing_jobs : tuple of str
+            Jobs which are missing from the qstat output
+        latency : float
+            Seconds each command takes
+
+        Returns
+        -------
+        commands : list of str
+            The commands called
+        """
+        commands: List[str] = list()
+        jobs = {
+            f"{index}.pbs": attributes[index % len(attributes)]
+            for index in range(number_of_jobs)
+            if f"{index}.pbs" not in missing_jobs
+        }
+        qstat_str = json.dumps({**qstat_template, "Jobs": jobs})
+
+        def _run_command_mock(command: str, _: Optional[Path] = None) -> str:
+            """
+            Mock PBSStatusService._run_command.
+
+            Parameters
+            ----------
+            command : str
+                The command to run
+
+            Returns
+            -------
+            str
+                The mocked output from qstat or tracejob
+            """
+            commands.append(command)
+            sleep(latency)
+            return qstat_str if command.startswith("qstat") else trace
+
+        monkeypatch.setattr(
+            PBSStatusService, "_run_command", staticmethod(_run_command_mock)
+        )
+        return commands
+
+    return mock_wrapper
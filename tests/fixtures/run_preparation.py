@@ -1,6 +1,7 @@
 """Contains fixtures for preparation of runs."""
 
 
+from pathlib import Path
 from typing import Callable, Optional
 
 import pytest
@@ -11,7 +12,9 @@ from bout_runners.parameters.bout_run_setup import BoutRunSetup
 from bout_runners.parameters.default_parameters import DefaultParameters
 from bout_runners.parameters.final_parameters import FinalParameters
 from bout_runners.runner.bout_run_executor import BoutRunExecutor
+from bout_runners.runner.parameter_sweep import ParameterSweep
 from bout_runners.runner.run_graph import RunGraph
+from bout_runners.submitter.local_submitter import LocalSubmitter
 
 
 @pytest.fixture(scope="function")
@@ -122,3 +125,66 @@ def get_bout_run_setup(
         return bout_run_setup
 
     return _get_bout_run_setup
+
+
+@pytest.fixture(scope="function", name="make_sweep")
+def fixture_make_sweep(
+    get_default_parameters: DefaultParameters,
+    make_test_database: Callable[[str], DatabaseConnector],
+    tmp_path: Path,
+) -> Callable[..., ParameterSweep]:
+    """
+    Return the function making a sweep of a minimal project.
+
+    Parameters
+    ----------
+    get_default_parameters : DefaultParameters
+        The DefaultParameters object
+    make_test_database : function
+        Function making an empty database
+    tmp_path : Path
+        Temporary path (pytest fixture)
+
+    Returns
+    -------
+    _make_sweep : function
+        Function making the sweep
+    """
+    project_path = tmp_path.joinpath("project")
+    project_path.joinpath("data").mkdir(parents=True)
+    project_path.joinpath("Makefile").write_text("TARGET = conduction\n")
+    project_path.joinpath("data", "BOUT.inp").write_text("nout = 1\n")
+    db_connector = make_test_database("parameter_sweep")
+
+    def _make_sweep(
+        name: str, lazy_paths: bool = False, run_graph: Optional[RunGraph] = None
+    ) -> ParameterSweep:
+        """
+        Make a sweep sharing the database with the other sweeps of the test.
+
+        Parameters
+        ----------
+        name : str
+            Name of the sweep
+        lazy_paths : bool
+            Whether the directories of the runs are made lazily
+        run_graph : None or RunGraph
+            The run graph of the sweep
+            If None, a new run graph is made
+
+        Returns
+        -------
+        ParameterSweep
+            The sweep
+        """
+        return ParameterSweep(
+            run_graph if run_graph is not None else RunGraph(),
+            name=name,
+            project_path=project_path,
+            default_parameters=get_default_parameters,
+            db_connector=db_connector,
+            submitter_factory=lambda: LocalSubmitter(project_path),
+            lazy_paths=lazy_paths,
+        )
+
+    return _make_sweep
@@ -2,10 +2,12 @@
 
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from bout_runners.database.database_connector import DatabaseConnector
 
@@ -42,3 +44,148 @@ def test_db_connector(make_test_database: Callable[[str], DatabaseConnector]) ->
     with pytest.raises(AttributeError):
         # Ignoring mypy as db_path is defined as read-only
         db_connector.connection = Path("invalid")  # type: ignore
+
+
+def test_shared_connection(
+    make_test_database: Callable[[str], DatabaseConnector],
+) -> None:
+    """
+    Test that the connection is shared and committed in transactions.
+
+    Parameters
+    ----------
+    make_test_database : function
+        Function which returns the database connection
+    """
+    db_connector = make_test_database("shared_connection_test")
+    other_connector = make_test_database("shared_connection_test")
+    assert db_connector.connection is other_connector.connection
+    # The database file is not converted to the write-ahead log by default
+    assert (
+        db_connector.connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    )
+
+    db_connector.execute_statement("CREATE TABLE my_table (col INT)")
+    insert_str = "INSERT INTO my_table (col) VALUES (?)"
+    count_str = "SELECT COUNT(*) FROM my_table"
+
+    with db_connector.transaction():
+        db_connector.execute_statement(insert_str, 1)
+        with other_connector.transaction():
+            other_connector.execute_statement(insert_str, 2)
+        assert db_connector.in_transaction
+        # Not committed yet, so a separate connection does not see the rows
+        with sqlite3.connect(str(db_connector.db_path)) as connection:
+            assert connection.execute(count_str).fetchone()[0] == 0
+    assert not db_connector.in_transaction
+    with sqlite3.connect(str(db_connector.db_path)) as connection:
+        assert connection.execute(count_str).fetchone()[0] == 2
+
+    with pytest.raises(RuntimeError):
+        with db_connector.transaction():
+            db_connector.execute_statement(insert_str, 3)
+            raise RuntimeError("Roll back")
+    assert db_connector.connection.execute(count_str).fetchone()[0] == 2
+
+    # The connection is closed when the last connector is deleted
+    connection = db_connector.connection
+    del db_connector
+    connection.execute("SELECT 1+1")
+    del other_connector
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1+1")
+
+
+@pytest.mark.parametrize("on_network_filesystem", (False, True))
+def test_use_wal(
+    on_network_filesystem: bool, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test that the write-ahead log is only used on local filesystems when asked for.
+
+    Parameters
+    ----------
+    on_network_filesystem : bool
+        Whether the database is mocked to be on a network filesystem
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    monkeypatch.setattr(
+        DatabaseConnector,
+        "is_on_network_filesystem",
+        staticmethod(lambda _: on_network_filesystem),
+    )
+    db_connector = DatabaseConnector("wal_test", db_root_path=tmp_path, use_wal=True)
+    assert db_connector.use_wal
+    journal_mode = db_connector.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == ("delete" if on_network_filesystem else "wal")
+
+
+def test_is_on_network_filesystem(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the filesystem is found from the longest matching mount point.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    mounts_path = tmp_path.joinpath("mounts")
+    mounts_path.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n"
+        "server:/home /home nfs4 rw 0 0\n"
+        "/dev/sdb1 /home/local ext4 rw 0 0\n"
+    )
+    original_path = Path
+
+    def mock_path(path: str) -> Path:
+        """
+        Return the path to the mocked mounts instead of /proc/mounts.
+
+        Parameters
+        ----------
+        path : str
+            The path to create
+
+        Returns
+        -------
+        Path
+            The created path
+        """
+        if path == "/proc/mounts":
+            return mounts_path
+        return original_path(path)
+
+    monkeypatch.setattr("bout_runners.database.database_connector.Path", mock_path)
+    assert DatabaseConnector.is_on_network_filesystem(original_path("/home/user"))
+    assert not DatabaseConnector.is_on_network_filesystem(
+        original_path("/home/local/user")
+    )
+    assert not DatabaseConnector.is_on_network_filesystem(original_path("/tmp"))
+
+
+def test_connection_per_thread(
+    make_test_database: Callable[[str], DatabaseConnector]
+) -> None:
+    """
+    Test that a connector can be used from another thread than its creator.
+
+    Parameters
+    ----------
+    make_test_database : function
+        Function which returns the database connection
+    """
+    db_connector = make_test_database("connection_per_thread_test")
+    db_connector.execute_statement("CREATE TABLE my_table (col INT)")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_connection = executor.submit(lambda: db_connector.connection).result()
+        executor.submit(
+            db_connector.execute_statement, "INSERT INTO my_table (col) VALUES (1)"
+        ).result()
+    assert thread_connection is not db_connector.connection
+    count_str = "SELECT COUNT(*) FROM my_table"
+    assert db_connector.connection.execute(count_str).fetchone()[0] == 1
@@ -9,6 +9,7 @@ import pytest
 from bout_runners.database.database_connector import DatabaseConnector
 from bout_runners.database.database_creator import DatabaseCreator
 from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.database_utils import get_fingerprint
 
 
 def test_db_creator(
@@ -47,6 +48,8 @@ def test_db_creator(
 
     # The tables should now have been created
     assert db_reader_schema.check_tables_created()
+    # A new schema is up to date
+    assert not db_creator.needs_upgrade()
 
     with pytest.raises(sqlite3.OperationalError):
         db_creator.create_all_schema_tables(final_parameters_as_sql_types)
@@ -96,3 +99,62 @@ def test_get_create_table_statement() -> None:
     )
 
     assert result == expected
+
+
+def test_upgrade_schema(get_test_db_copy: Callable[[str], DatabaseConnector]) -> None:
+    """
+    Test that the schema of an old database can be upgraded.
+
+    Parameters
+    ----------
+    get_test_db_copy : function
+        Function which returns a a database connector to the copy of the test database
+    """
+    db_connector = get_test_db_copy("upgrade_schema")
+    db_reader = DatabaseReader(db_connector)
+    query_str = "PRAGMA table_info(run)"
+    assert "queue_wait_time" not in db_reader.query(query_str).loc[:, "name"].values
+
+    db_creator = DatabaseCreator(db_connector)
+    assert db_creator.needs_upgrade()
+    db_creator.upgrade_schema()
+    assert not db_creator.needs_upgrade()
+    assert db_creator.get_schema_version() == DatabaseCreator.schema_version
+    columns = db_reader.query(query_str).loc[:, "name"].values
+    assert "queue_wait_time" in columns
+    assert "array_task_id" in columns
+
+    # The entries have been given fingerprints
+    assert "fingerprint" in columns
+    assert db_creator.get_fingerprint_columns()["run"] == (
+        DatabaseCreator.run_identity_columns
+    )
+    split_dict = (
+        db_reader.query("SELECT * FROM split")
+        .drop(columns=["id", "fingerprint"])
+        .to_dict(orient="records")[0]
+    )
+    assert db_reader.get_entry_id_from_fingerprint(
+        "split", get_fingerprint(split_dict)
+    ) == db_reader.get_entry_id("split", split_dict)
+
+    # The run table is indexed and the active runs are found in a view
+    indexes = (
+        db_reader.query(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='run'"
+        )
+        .loc[:, "name"]
+        .values
+    )
+    for index in ("run_latest_status", "run_name", "run_split_id", "run_active"):
+        assert index in indexes
+    active_runs = db_reader.query("SELECT * FROM active_runs")
+    all_runs = db_reader.query("SELECT * FROM run")
+    assert len(active_runs.index) == (
+        all_runs.loc[:, "latest_status"].isin(DatabaseCreator.active_statuses).sum()
+    )
+
+    # Upgrading an up to date schema should have no effect
+    db_creator.upgrade_schema()
+    assert len(db_reader.query(query_str).index) == len(columns)
+    assert db_creator.backfill_fingerprints() == 0
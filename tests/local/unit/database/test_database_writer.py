@@ -4,6 +4,7 @@
 from typing import Callable, Tuple
 
 import numpy as np
+import pytest
 
 from bout_runners.database.database_connector import DatabaseConnector
 from bout_runners.database.database_reader import DatabaseReader
@@ -44,12 +45,13 @@ def test_db_writer(
     table = db_reader.query(f"SELECT * FROM {table_name}")  # nosec
 
     # Check that the shape is expected (note that one column is
-    # assigned to the id)
-    assert table.shape == (1, 4)
+    # assigned to the id and one to the fingerprint)
+    assert table.shape == (1, 5)
+    assert table.loc[0, "fingerprint"] is None  # pylint: disable=no-member
 
     # Check all the elements are the same
     # https://www.quora.com/How-do-you-check-if-all-elements-in-a-NumPy-array-are-the-same-in-Python-pandas
-    values = table.dtypes.values
+    values = table.drop(columns="fingerprint").dtypes.values
     assert (values == np.dtype("int64")).all()
 
     for key, value in dummy_split_dict.items():
@@ -69,3 +71,63 @@ def test_db_writer(
     for index, field in enumerate(update_fields):
         # pylint: disable=no-member
         assert table.loc[:, field].values[0] == values[index]
+
+
+def test_create_entries(
+    make_test_schema: Callable[[str], Tuple[DatabaseConnector, str]]
+) -> None:
+    """
+    Test that several entries can be created and looked up at once.
+
+    Parameters
+    ----------
+    make_test_schema : function
+        Function returning the database connection with the schema created
+    """
+    db_connector, _ = make_test_schema("write_many_test")
+    db_reader = DatabaseReader(db_connector)
+    db_writer = DatabaseWriter(db_connector)
+    table_name = "split"
+    db_writer.create_entry(
+        table_name,
+        {"number_of_processors": 1, "number_of_nodes": 1, "processors_per_node": 1},
+    )
+
+    rows = tuple(
+        {
+            "number_of_processors": number,
+            "number_of_nodes": 1,
+            "processors_per_node": number,
+        }
+        for number in range(2, 1002)
+    )
+    entry_ids = db_writer.create_entries(table_name, rows)
+    assert entry_ids == tuple(range(2, 1002))
+    assert db_writer.create_entries(table_name, tuple()) == tuple()
+
+    missing_row = {
+        "number_of_processors": 0,
+        "number_of_nodes": 0,
+        "processors_per_node": 0,
+    }
+    assert db_reader.get_entry_ids(table_name, rows + (missing_row,)) == (
+        entry_ids + (None,)
+    )
+    assert db_reader.get_entry_ids(table_name, rows[-1:])[0] == (
+        db_reader.get_entry_id(table_name, rows[-1])
+    )
+
+    # NULL is matched by NULL, as in get_entry_id
+    null_rows = tuple({**row, "fingerprint": None} for row in rows[:2])
+    assert db_reader.get_entry_ids(table_name, null_rows) == entry_ids[:2]
+    assert db_reader.get_entry_ids(table_name, null_rows[:1])[0] == (
+        db_reader.get_entry_id(table_name, null_rows[0])
+    )
+    assert db_reader.get_entry_ids(
+        table_name, ({**rows[0], "fingerprint": "not_null"},)
+    ) == (None,)
+
+    with pytest.raises(ValueError):
+        db_writer.create_entries(table_name, (rows[0], {"number_of_nodes": 1}))
+    with pytest.raises(ValueError):
+        db_reader.get_entry_ids(table_name, (rows[0], {"number_of_nodes": 1}))
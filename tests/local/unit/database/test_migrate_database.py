@@ -0,0 +1,43 @@
+"""Contains unittests for the database migration."""
+
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.database.migrate_database import main, migrate_database
+
+
+def test_migrate_database(
+    get_test_db_copy: Callable[[str], DatabaseConnector], tmp_path: Path
+) -> None:
+    """
+    Test that the fingerprints of an old database are filled in.
+
+    Parameters
+    ----------
+    get_test_db_copy : function
+        Function which returns a a database connector to the copy of the test database
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    db_connector = get_test_db_copy("migrate")
+    main([str(db_connector.db_path)])
+
+    db_reader = DatabaseReader(db_connector)
+    for table_name in ("run", "split", "parameters"):
+        # NOTE: Protected against SQL injection as table_name is hard-coded above
+        assert (
+            db_reader.query(
+                f"SELECT COUNT(*) AS empty FROM {table_name} "  # nosec
+                "WHERE fingerprint IS NULL"
+            ).loc[0, "empty"]
+            == 0
+        )
+    assert migrate_database(db_connector.db_path) == 0
+
+    with pytest.raises(FileNotFoundError):
+        migrate_database(tmp_path.joinpath("not_a_database.db"))
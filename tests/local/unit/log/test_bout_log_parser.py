@@ -0,0 +1,49 @@
+"""Contains unittests for the bout_log_parser."""
+
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from bout_runners.log.bout_log_parser import BoutLogParser
+
+
+def test_bout_log_parser(yield_logs: Dict[str, Path], tmp_path: Path) -> None:
+    """
+    Test that the log files are parsed in one pass.
+
+    Parameters
+    ----------
+    yield_logs : dict of Path
+        A dictionary containing the log paths used for testing
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    log_paths = yield_logs
+
+    success_log_parser = BoutLogParser(log_paths["success_log"])
+    assert success_log_parser.pid == 1191
+    assert success_log_parser.start_time == datetime(2020, 5, 1, 17, 7, 10)
+    assert success_log_parser.end_time == datetime(2020, 5, 1, 17, 7, 14)
+    assert success_log_parser.number_of_steps == 101
+    simulation_steps = success_log_parser.get_simulation_steps()
+    assert simulation_steps.shape == (101, 8)
+    assert simulation_steps.loc[:, "RHS_evals"].dtype == np.int64
+    assert np.isclose(simulation_steps.loc[:, "Sim_time"].iloc[-1], 10.0)
+
+    # Only the first table is parsed
+    failed_log_parser = BoutLogParser(log_paths["fail_log"])
+    assert failed_log_parser.started()
+    assert not failed_log_parser.ended()
+    assert failed_log_parser.get_simulation_steps().shape == (1, 8)
+
+    unfinished_no_pid_log_parser = BoutLogParser(log_paths["unfinished_no_pid_log"])
+    assert unfinished_no_pid_log_parser.pid is None
+    assert not unfinished_no_pid_log_parser.started()
+    assert unfinished_no_pid_log_parser.get_simulation_steps().empty
+
+    empty_log = tmp_path.joinpath("BOUT.log.0")
+    empty_log.touch()
+    assert BoutLogParser(empty_log).get_simulation_steps().empty
@@ -0,0 +1,137 @@
+"""Contains unittests for the rank_log_aggregator."""
+
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bout_runners.log.bout_log_parser import BoutLogParser
+from bout_runners.log.log_reader import LogReader
+from bout_runners.log.rank_log_aggregator import RankLogAggregator
+
+
+def test_rank_log_aggregator(
+    make_rank_logs: Callable[[Path, int], None],
+    get_test_data_path: Path,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the rank logs are aligned and their imbalance computed.
+
+    Parameters
+    ----------
+    make_rank_logs : function
+        Function which writes the rank logs
+    get_test_data_path : Path
+        Path to the test data
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    number_of_ranks = 12
+    make_rank_logs(tmp_path, number_of_ranks)
+    # A rank which crashed has written fewer steps
+    crashed_log = tmp_path.joinpath("BOUT.log.3")
+    crashed_lines = crashed_log.read_text().splitlines(keepends=True)
+    header_line = next(
+        line_nr
+        for line_nr, line in enumerate(crashed_lines)
+        if line.startswith("Sim Time")
+    )
+    crashed_log.write_text("".join(crashed_lines[: header_line + 12]))
+
+    aggregator = RankLogAggregator(tmp_path, max_workers=1)
+    assert len(aggregator.get_log_paths()) == number_of_ranks
+    statistics = aggregator.get_step_statistics()
+    steps = LogReader(get_test_data_path.joinpath("BOUT.log.0")).get_simulation_steps()
+    assert len(statistics.index) == len(steps.index)
+    assert np.allclose(statistics.loc[:, "Sim_time"], steps.loc[:, "Sim_time"])
+    assert statistics.loc[0, "number_of_ranks"] == number_of_ranks
+    assert statistics.iloc[-1].loc["number_of_ranks"] == number_of_ranks - 1
+
+    # The last rank has the largest Calc in every step
+    assert (statistics.loc[:, "Calc_slowest_rank"] == number_of_ranks - 1).all()
+    assert np.allclose(
+        statistics.loc[:, "Calc_max"], steps.loc[:, "Calc"] + number_of_ranks - 1
+    )
+    positive = statistics.loc[:, "Calc_mean"] > 0
+    assert np.allclose(
+        statistics.loc[positive, "Calc_imbalance"],
+        statistics.loc[positive, "Calc_max"] / statistics.loc[positive, "Calc_mean"],
+    )
+    assert statistics.loc[~positive, "Calc_imbalance"].isna().all()
+
+    summary = aggregator.get_summary()
+    assert summary["number_of_ranks"] == number_of_ranks
+    assert summary["Calc_slowest_rank"] == number_of_ranks - 1
+    max_imbalance = summary["Calc_max_imbalance"]
+    mean_imbalance = summary["Calc_imbalance"]
+    assert max_imbalance is not None and mean_imbalance is not None
+    assert max_imbalance >= mean_imbalance > 1
+
+    # The logs are reduced in chunks by several processes with the same result
+    parallel_statistics = RankLogAggregator(
+        tmp_path, max_workers=2
+    ).get_step_statistics()
+    pd.testing.assert_frame_equal(statistics, parallel_statistics)
+
+
+def test_rank_log_aggregator_missing_column(
+    make_rank_logs: Callable[[Path, int], None],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the mean of a column only includes the ranks which report it.
+
+    Parameters
+    ----------
+    make_rank_logs : function
+        Function which writes the rank logs
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    number_of_ranks = 4
+    make_rank_logs(tmp_path, number_of_ranks)
+    statistics = RankLogAggregator(tmp_path, max_workers=1).get_step_statistics()
+    steps = BoutLogParser(tmp_path.joinpath("BOUT.log.0")).get_simulation_steps()
+
+    # Rank 0 does not report the Calc column
+    get_simulation_steps = BoutLogParser.get_simulation_steps
+
+    def get_steps_without_calc(self: BoutLogParser) -> pd.DataFrame:
+        """
+        Return the simulation steps, without the Calc column of rank 0.
+
+        Parameters
+        ----------
+        self : BoutLogParser
+            The parser of the log
+
+        Returns
+        -------
+        steps : DataFrame
+            The simulation steps
+        """
+        steps = get_simulation_steps(self)
+        if self.log_path.name == "BOUT.log.0":
+            steps = steps.drop(columns="Calc")
+        return steps
+
+    monkeypatch.setattr(BoutLogParser, "get_simulation_steps", get_steps_without_calc)
+    missing_statistics = RankLogAggregator(
+        tmp_path, max_workers=1
+    ).get_step_statistics()
+    calc_sum = statistics.loc[:, "Calc_mean"] * number_of_ranks
+    assert (missing_statistics.loc[:, "number_of_ranks"] == number_of_ranks).all()
+    assert np.allclose(
+        missing_statistics.loc[:, "Calc_mean"],
+        (calc_sum - steps.loc[:, "Calc"]) / (number_of_ranks - 1),
+    )
+    assert np.allclose(
+        missing_statistics.loc[:, "Wall_time_mean"], statistics.loc[:, "Wall_time_mean"]
+    )
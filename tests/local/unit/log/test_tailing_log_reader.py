@@ -0,0 +1,160 @@
+"""Contains unittests for the tailing_log_reader."""
+
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from bout_runners.log.log_reader import LogReader
+from bout_runners.log.tailing_log_reader import TailingLogReader
+
+
+@pytest.mark.parametrize(
+    "log_name",
+    ["success_log", "fail_log", "unfinished_no_pid_log", "unfinished_started_log"],
+)
+def test_same_as_log_reader(yield_logs: Dict[str, Path], log_name: str) -> None:
+    """
+    Test that TailingLogReader parses the same state as LogReader.
+
+    Parameters
+    ----------
+    yield_logs : dict of Path
+        A dictionary containing the log paths used for testing
+    log_name : str
+        Name of the log to test
+    """
+    log_reader = LogReader(yield_logs[log_name])
+    tailing_log_reader = TailingLogReader(yield_logs[log_name])
+    assert tailing_log_reader.started() == log_reader.started()
+    assert tailing_log_reader.ended() == log_reader.ended()
+    assert tailing_log_reader.pid_exist() == log_reader.pid_exist()
+    assert tailing_log_reader.pid == log_reader.pid
+    assert tailing_log_reader.start_time == log_reader.start_time
+    assert tailing_log_reader.end_time == log_reader.end_time
+
+
+def test_update(yield_logs: Dict[str, Path], tmp_path: Path) -> None:
+    """
+    Test that TailingLogReader only parses appended bytes, and rereads new files.
+
+    Parameters
+    ----------
+    yield_logs : dict of Path
+        A dictionary containing the log paths used for testing
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    log_bytes = yield_logs["success_log"].read_bytes()
+    log_path = tmp_path.joinpath("BOUT.log.0")
+    tailing_log_reader = TailingLogReader(log_path)
+    assert not tailing_log_reader.started()
+
+    # Write the log in chunks which splits the lines
+    chunk_size = 1000
+    with log_path.open("wb") as log_file:
+        for start in range(0, len(log_bytes), chunk_size):
+            log_file.write(log_bytes[start : start + chunk_size])
+            log_file.flush()
+            tailing_log_reader.update()
+    log_reader = LogReader(yield_logs["success_log"])
+    assert tailing_log_reader.pid == log_reader.pid
+    assert tailing_log_reader.start_time == log_reader.start_time
+    assert tailing_log_reader.end_time == log_reader.end_time
+    simulation_steps = log_reader.get_simulation_steps()
+    assert tailing_log_reader.number_of_steps == len(simulation_steps.index)
+    assert tailing_log_reader.last_sim_time == simulation_steps.iloc[-1, 0]
+    assert tailing_log_reader.first_sim_time == simulation_steps.iloc[0, 0]
+    assert tailing_log_reader.total_rhs_evals == simulation_steps["RHS_evals"].sum()
+    assert np.isclose(
+        tailing_log_reader.total_wall_time, simulation_steps["Wall_time"].sum()
+    )
+
+    # A truncated file is read anew
+    log_path.write_bytes(log_bytes[:500])
+    tailing_log_reader.update()
+    assert tailing_log_reader.pid == log_reader.pid
+    assert not tailing_log_reader.started()
+    assert tailing_log_reader.number_of_steps == 0
+
+
+def test_read_in_chunks(
+    yield_logs: Dict[str, Path], tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """
+    Test that TailingLogReader reads large logs in bounded chunks.
+
+    Parameters
+    ----------
+    yield_logs : dict of Path
+        A dictionary containing the log paths used for testing
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    log_path = tmp_path.joinpath("BOUT.log.0")
+    log_path.write_bytes(yield_logs["success_log"].read_bytes())
+    expected = TailingLogReader(log_path)
+
+    # NOTE: The chunks are smaller than the lines, so the lines span the chunks
+    chunk_size = 7
+    monkeypatch.setattr(TailingLogReader, "chunk_size", chunk_size)
+    read_sizes: List[int] = list()
+    original_open = Path.open
+
+    def spy_open(path: Path, *args: Any, **kwargs: Any) -> Any:
+        """
+        Return the opened file, and record the sizes of the reads.
+
+        Parameters
+        ----------
+        path : Path
+            The path to open
+        args : tuple
+            Positional arguments to Path.open
+        kwargs : dict
+            Keyword arguments to Path.open
+
+        Returns
+        -------
+        file
+            The opened file
+        """
+        file = original_open(path, *args, **kwargs)
+        read = file.read
+
+        def spy_read(size: int = -1) -> bytes:
+            """
+            Read from the file and record the requested size.
+
+            Parameters
+            ----------
+            size : int
+                The number of bytes to read
+
+            Returns
+            -------
+            bytes
+                The bytes read
+            """
+            read_sizes.append(size)
+            chunk: bytes = read(size)
+            return chunk
+
+        file.read = spy_read
+        return file
+
+    monkeypatch.setattr(Path, "open", spy_open)
+    tailing_log_reader = TailingLogReader(log_path)
+    assert len(read_sizes) > 1
+    assert all(0 < size <= chunk_size for size in read_sizes)
+    assert tailing_log_reader.pid == expected.pid
+    assert tailing_log_reader.start_time == expected.start_time
+    assert tailing_log_reader.end_time == expected.end_time
+    assert tailing_log_reader.number_of_steps == expected.number_of_steps
+    assert tailing_log_reader.last_sim_time == expected.last_sim_time
+    assert tailing_log_reader.total_rhs_evals == expected.total_rhs_evals
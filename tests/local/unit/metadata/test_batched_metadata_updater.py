@@ -0,0 +1,56 @@
+"""Contains unittests for the BatchedMetadataUpdater."""
+
+
+from datetime import datetime
+from typing import Callable
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.batched_metadata_updater import BatchedMetadataUpdater
+
+
+def test_batched_metadata_updater(
+    get_test_db_copy: Callable[[str], DatabaseConnector]
+) -> None:
+    """
+    Test that the updates are buffered, merged and only written when changed.
+
+    Parameters
+    ----------
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    """
+    db_connector = get_test_db_copy("batched_metadata_updater")
+    db_reader = DatabaseReader(db_connector)
+    query = "SELECT id, start_time, latest_status FROM run ORDER BY id"
+    run_ids = db_reader.query(query).loc[:, "id"].to_list()
+    now = datetime.now()
+
+    metadata_updater = BatchedMetadataUpdater(db_connector, run_ids[0])
+    metadata_updater.update_start_time(now)
+    metadata_updater.update_latest_status("running")
+    metadata_updater.run_id = run_ids[1]
+    metadata_updater.update_latest_status("foo")
+    metadata_updater.update_latest_status("error")
+    assert metadata_updater.number_of_pending == 2
+
+    # Nothing is written before the flush
+    result = db_reader.query(query)
+    assert result.loc[0, "start_time"] != str(now)
+
+    assert metadata_updater.flush() == 2
+    assert metadata_updater.number_of_pending == 0
+    result = db_reader.query(query)
+    assert result.loc[0, "start_time"] == str(now)
+    assert result.loc[0, "latest_status"] == "running"
+    assert result.loc[1, "latest_status"] == "error"
+
+    # Unchanged values are not written
+    metadata_updater.run_id = run_ids[0]
+    metadata_updater.update_start_time(now)
+    metadata_updater.update_latest_status("running")
+    metadata_updater.run_id = run_ids[1]
+    metadata_updater.update_latest_status("complete")
+    assert metadata_updater.flush() == 1
+    assert db_reader.query(query).loc[1, "latest_status"] == "complete"
+    assert metadata_updater.flush() == 0
@@ -0,0 +1,77 @@
+"""Contains unittests for the progress tracker."""
+
+
+from pathlib import Path
+from typing import Callable
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.metadata.metadata_reader import MetadataReader
+from bout_runners.metadata.progress_tracker import ProgressTracker
+
+
+def test_progress_tracker(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the progress of the running runs is sampled into the database.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    db_connector = get_test_db_copy("progress_tracker")
+    # Record nout and timestep of the runs
+    db_connector.execute_statement(
+        'CREATE TABLE "global" (id INTEGER PRIMARY KEY, nout INTEGER, timestep REAL)'
+    )
+    db_connector.execute_statement(
+        'INSERT INTO "global" (nout, timestep) VALUES (?, ?)', 200, 0.1
+    )
+    db_connector.execute_statement(
+        "ALTER TABLE parameters ADD COLUMN global_id INTEGER NOT NULL DEFAULT 1"
+    )
+
+    # testdata_5 is the only running run
+    log_bytes = get_test_data_path.joinpath("BOUT.log.0").read_bytes()
+    log_path = tmp_path.joinpath("testdata_5", "BOUT.log.0")
+    log_path.parent.mkdir()
+    steps_start = log_bytes.index(b"Sim Time")
+    steps_end = log_bytes.index(b"Run finished")
+    log_path.write_bytes(log_bytes[: (steps_start + steps_end) // 2])
+
+    progress_tracker = ProgressTracker(db_connector, tmp_path)
+    assert progress_tracker.sample() == 1
+    log_path.write_bytes(log_bytes[:steps_end])
+    assert progress_tracker.sample() == 1
+
+    progress = progress_tracker.get_progress("testdata_5")
+    assert len(progress.index) == 2
+    assert progress.loc[0, "sim_time"] < progress.loc[1, "sim_time"] == 10.0
+    assert progress.loc[1, "number_of_steps"] == 101
+    assert progress.loc[1, "sim_time_per_second"] > 0
+    assert progress.loc[1, "rhs_evals_per_second"] > 0
+    # The run ends at nout * timestep = 20
+    assert progress.loc[1, "expected_end_time"] > progress.loc[1, "sample_time"]
+
+    latest = progress_tracker.get_latest_progress()
+    assert latest.loc[:, "id"].to_list() == [progress.loc[1, "id"]]
+
+    # A stalled run has no throughput and no expected end time
+    progress_tracker.sample()
+    latest = progress_tracker.get_latest_progress()
+    assert latest.loc[0, "sim_time_per_second"] == 0
+    assert latest.loc[0, "expected_end_time"] is None
+
+    # The progress is not part of the metadata of the runs
+    assert "progress" not in MetadataReader(db_connector).table_names
+
+    # Runs which are not running are not sampled
+    db_connector.execute_statement("UPDATE run SET latest_status = 'complete'")
+    assert progress_tracker.sample() == 0
@@ -0,0 +1,52 @@
+"""Contains unittests for the rank imbalance recorder."""
+
+
+from pathlib import Path
+from typing import Callable
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.metadata_reader import MetadataReader
+from bout_runners.metadata.rank_imbalance_recorder import RankImbalanceRecorder
+
+
+def test_rank_imbalance_recorder(
+    make_rank_logs: Callable[[Path, int], None],
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the imbalance of the stopped runs is recorded once.
+
+    Parameters
+    ----------
+    make_rank_logs : function
+        Function which writes the rank logs
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    db_connector = get_test_db_copy("rank_imbalance_recorder")
+    make_rank_logs(tmp_path.joinpath("testdata_1"), 4)
+
+    recorder = RankImbalanceRecorder(db_connector, tmp_path, max_workers=1)
+    db_reader = DatabaseReader(db_connector)
+    stopped = db_reader.query(
+        "SELECT COUNT(*) AS count FROM run "
+        "WHERE latest_status IN ('complete', 'error')"
+    ).loc[0, "count"]
+    assert recorder.record_stopped() == stopped
+    assert recorder.record_stopped() == 0
+
+    result = db_reader.query(
+        "SELECT rank_imbalance.* FROM rank_imbalance "
+        "INNER JOIN run ON run.id = rank_imbalance.run_id "
+        "WHERE run.name = 'testdata_1'"
+    )
+    assert result.loc[0, "number_of_ranks"] == 4
+    assert result.loc[0, "number_of_steps"] == 101
+    assert result.loc[0, "calc_slowest_rank"] == 3
+    assert result.loc[0, "io_imbalance"] >= 1
+
+    assert "rank_imbalance" not in MetadataReader(db_connector).table_names
@@ -1,12 +1,18 @@
 """Contains unittests for the StatusChecker."""
 
+import logging
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from time import perf_counter, sleep
+from typing import Callable, Optional, Tuple
 
+import psutil
 import pytest
 
 from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
 from bout_runners.database.database_reader import DatabaseReader
 from bout_runners.metadata.status_checker import StatusChecker
 
@@ -29,6 +35,25 @@ def test_status_checker_run_time_error(
         status_checker.check_and_update_status()
 
 
+def test_status_checker_outdated_schema(
+    get_test_db_copy: Callable[[str], DatabaseConnector]
+) -> None:
+    """
+    Test that the status checker upgrades an outdated schema.
+
+    Parameters
+    ----------
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    """
+    db_connector = get_test_db_copy("status_checker_outdated_schema")
+    status_checker = StatusChecker(db_connector, Path())
+
+    assert DatabaseCreator(db_connector).needs_upgrade()
+    status_checker.check_and_update_status()
+    assert not DatabaseCreator(db_connector).needs_upgrade()
+
+
 @pytest.mark.parametrize(
     "test_case",
     (
@@ -150,3 +175,136 @@ def test_status_checker_until_complete_infinite(
 
     query = status_checker.get_query_string_for_non_errored_runs()
     assert len(db_reader.query(query).index) == 0
+
+
+def test_check_named_runs(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    copy_test_case_log_file: Callable[[str], None],
+) -> None:
+    """
+    Test that only the named runs are checked.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    copy_test_case_log_file : function
+        Return the function for copying the test case log files
+    """
+    test_case = "infinite_log_file_pid_started_ended_no_mock_pid_complete"
+    db_connector = get_test_db_copy("check_named_runs")
+    copy_test_case_log_file(test_case)
+    db_connector.execute_statement("DELETE FROM run WHERE name = 'testdata_5'")
+    db_reader = DatabaseReader(db_connector)
+    status_checker = StatusChecker(db_connector, get_test_data_path)
+    query = "SELECT latest_status FROM run WHERE name = 'testdata_6'"
+    latest_status = db_reader.query(query).loc[0, "latest_status"]
+    assert latest_status != "complete"
+
+    status_checker.check_and_update_status(names=("testdata_1",))
+    assert db_reader.query(query).loc[0, "latest_status"] == latest_status
+
+    status_checker.check_and_update_status(names=("testdata_6",))
+    assert db_reader.query(query).loc[0, "latest_status"] == "complete"
+
+
+def test_benchmark_parallel_status_check(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Benchmark checking synthetic runs serially against checking them in threads.
+
+    The probe of every pid has the same latency, so the checks are dominated by
+    waiting as on a slow parallel file system
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    number_of_runs = 100
+    db_connector = get_test_db_copy("benchmark_parallel_status_check")
+    db_connector.execute_statement("DELETE FROM run WHERE name != 'testdata_5'")
+    for run_nr in range(number_of_runs):
+        name = f"run_{run_nr}"
+        db_connector.execute_statement(
+            "INSERT INTO run (name, submitted_time, latest_status, "
+            "file_modification_id, split_id, parameters_id, system_info_id) "
+            "SELECT ?, submitted_time, 'running', file_modification_id, split_id, "
+            "parameters_id, system_info_id FROM run WHERE name = 'testdata_5'",
+            name,
+        )
+        tmp_path.joinpath(name).mkdir()
+        shutil.copy(
+            get_test_data_path.joinpath("BOUT.log.0"),
+            tmp_path.joinpath(name, "BOUT.log.0"),
+        )
+    db_connector.execute_statement("DELETE FROM run WHERE name = 'testdata_5'")
+
+    probes = {"active": 0, "max_active": 0}
+    probes_lock = threading.Lock()
+
+    def mock_pid_exists(_: int) -> bool:
+        with probes_lock:
+            probes["active"] += 1
+            probes["max_active"] = max(probes["max_active"], probes["active"])
+        sleep(0.005)
+        with probes_lock:
+            probes["active"] -= 1
+        return True
+
+    monkeypatch.setattr(psutil, "pid_exists", mock_pid_exists)
+
+    def measure(max_workers: int) -> Tuple[float, int]:
+        """
+        Measure a check of all the runs with a fresh StatusChecker.
+
+        A fresh StatusChecker is used so that no measurement benefits from the
+        logs cached by another
+
+        Parameters
+        ----------
+        max_workers : int
+            The number of threads used by the check
+
+        Returns
+        -------
+        check_time : float
+            The wall clock time of the check
+        max_active : int
+            The maximum number of probes which were active at the same time
+        """
+        probes["max_active"] = 0
+        status_checker = StatusChecker(db_connector, tmp_path)
+        tic = perf_counter()
+        status_checker.check_and_update_status(max_workers=max_workers)
+        return perf_counter() - tic, probes["max_active"]
+
+    serial_time, serial_max_active = measure(1)
+    parallel_time, parallel_max_active = measure(8)
+    logging.info(
+        "Checked %d runs in %.3f s serially and in %.3f s with 8 threads",
+        number_of_runs,
+        serial_time,
+        parallel_time,
+    )
+
+    db_reader = DatabaseReader(db_connector)
+    result = db_reader.query("SELECT DISTINCT latest_status FROM run")
+    assert result.loc[:, "latest_status"].to_list() == ["running"]
+    # NOTE: The overlap of the probes is asserted rather than the wall clock
+    #       time, which is unreliable on a loaded machine
+    assert serial_max_active == 1
+    assert parallel_max_active > 1
@@ -0,0 +1,255 @@
+"""Contains unittests for the status daemon."""
+
+
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set
+
+import pytest
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.status_checker import StatusChecker
+from bout_runners.metadata.status_daemon import StatusDaemon
+from bout_runners.utils.inotify import Inotify
+
+
+@pytest.mark.timeout(60)
+def test_status_daemon(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    copy_test_case_log_file: Callable[[str], None],
+) -> None:
+    """
+    Test that the daemon updates the status in the background.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    copy_test_case_log_file : function
+        Return the function for copying the test case log files
+    """
+    test_case = "infinite_log_file_pid_started_ended_no_mock_pid_complete"
+    project_path = get_test_data_path
+    db_connector = get_test_db_copy("status_daemon")
+    copy_test_case_log_file(test_case)
+
+    # Remove row which has status running (as it will always have
+    # this status)
+    db_connector.execute_statement("DELETE FROM run WHERE name = 'testdata_5'")
+
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, project_path, seconds_between_update=3600
+    )
+    assert StatusDaemon.get_daemon(db_connector, project_path) is status_daemon
+    assert status_daemon.running
+
+    status_daemon.check_now(timeout=30)
+    assert status_daemon.number_of_checks >= 1
+    assert len(status_daemon.active_runs.index) == 0
+    db_reader = DatabaseReader(db_connector)
+    query = "SELECT latest_status FROM run WHERE name = 'testdata_6'"
+    assert db_reader.query(query).loc[0, "latest_status"] == "complete"
+
+    StatusDaemon.stop_all()
+    assert not status_daemon.running
+
+
+@pytest.mark.timeout(60)
+def test_status_daemon_record_imbalance(
+    make_rank_logs: Callable[[Path, int], None],
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the daemon records the load imbalance of the stopped runs.
+
+    Parameters
+    ----------
+    make_rank_logs : function
+        Function which writes the rank logs
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    db_connector = get_test_db_copy("status_daemon_record_imbalance")
+    make_rank_logs(tmp_path.joinpath("testdata_1"), 4)
+
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, tmp_path, seconds_between_update=3600
+    )
+    assert not status_daemon.record_imbalance
+    assert (
+        StatusDaemon.get_daemon(db_connector, tmp_path, record_imbalance=True)
+        is status_daemon
+    )
+    assert status_daemon.record_imbalance
+
+    status_daemon.check_now(timeout=30)
+    result = DatabaseReader(db_connector).query(
+        "SELECT rank_imbalance.number_of_ranks FROM rank_imbalance "
+        "INNER JOIN run ON run.id = rank_imbalance.run_id "
+        "WHERE run.name = 'testdata_1'"
+    )
+    assert result.loc[0, "number_of_ranks"] == 4
+    StatusDaemon.stop_all()
+
+
+@pytest.mark.timeout(60)
+def test_status_daemon_error(
+    make_test_database: Callable[[Optional[str]], DatabaseConnector]
+) -> None:
+    """
+    Test that errors of the checks are raised from check_now.
+
+    Parameters
+    ----------
+    make_test_database : DatabaseConnector
+        Connection to the test database
+    """
+    db_connector = make_test_database("status_daemon_no_table")
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, Path(), seconds_between_update=3600
+    )
+    with pytest.raises(RuntimeError):
+        status_daemon.check_now(timeout=30)
+    assert status_daemon.running
+    status_daemon.stop()
+    assert not status_daemon.running
+    with pytest.raises(RuntimeError):
+        status_daemon.check_now()
+
+
+@pytest.mark.timeout(60)
+def test_status_daemon_release(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+) -> None:
+    """
+    Test that the daemon is only stopped when the last user releases it.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    """
+    project_path = get_test_data_path
+    db_connector = get_test_db_copy("status_daemon_release")
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, project_path, seconds_between_update=3600
+    )
+    assert StatusDaemon.get_daemon(db_connector, project_path) is status_daemon
+    assert status_daemon.number_of_users == 2
+
+    status_daemon.release()
+    assert status_daemon.running
+    status_daemon.release()
+    assert not status_daemon.running
+
+    # A stopped daemon is removed from the process
+    new_daemon = StatusDaemon.get_daemon(
+        db_connector, project_path, seconds_between_update=3600
+    )
+    assert new_daemon is not status_daemon
+    assert new_daemon.running
+    new_daemon.stop()
+    assert StatusDaemon.get_daemon(db_connector, project_path) is not new_daemon
+    StatusDaemon.stop_all()
+
+
+def test_status_daemon_use_wal(
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+) -> None:
+    """
+    Test that the daemon uses the write-ahead log if the connector does.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    """
+    db_path = get_test_db_copy("status_daemon_use_wal").db_path
+    db_connector = DatabaseConnector(db_path.stem, db_path.parent, use_wal=True)
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, get_test_data_path, seconds_between_update=3600
+    )
+    assert status_daemon.use_wal
+    status_daemon.release()
+    assert not status_daemon.running
+
+
+@pytest.mark.timeout(60)
+def test_status_daemon_full_check_with_busy_logs(
+    tmp_path: Path,
+    get_migrated_test_db_copy: Callable[[str], DatabaseConnector],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the daemon checks all the runs periodically while a log keeps changing.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    get_migrated_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a migrated copy of
+        test.db
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    if not Inotify.available():
+        pytest.skip("inotify is not available")
+    db_connector = get_migrated_test_db_copy("status_daemon_busy_logs")
+    active_names = set(
+        DatabaseReader(db_connector)
+        .query(StatusChecker.get_query_string_for_non_errored_runs())
+        .loc[:, "name"]
+    )
+    for name in active_names:
+        tmp_path.joinpath(name).mkdir()
+    log_path = tmp_path.joinpath(sorted(active_names)[0], "BOUT.log.0")
+    checked_names: List[Optional[Set[str]]] = list()
+
+    def record_names(
+        _: StatusChecker, __: int = 1, names: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Record the names of the checked runs.
+
+        Parameters
+        ----------
+        names : None or iterable of str
+            The names of the runs to check
+            If None, all the active runs are checked
+        """
+        checked_names.append(set(names) if names is not None else None)
+
+    monkeypatch.setattr(StatusChecker, "check_and_update_status", record_names)
+    status_daemon = StatusDaemon.get_daemon(
+        db_connector, tmp_path, seconds_between_update=2
+    )
+    status_daemon.check_now(timeout=30)
+
+    # NOTE: The log is written to more often than the debounce time, so that
+    #       the watcher always reports changes
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and None not in checked_names[1:]:
+        with log_path.open("a") as log_file:
+            log_file.write("line\n")
+        time.sleep(0.05)
+    # NOTE: The final check made when the daemon stops checks all the runs, so the
+    #       checks are inspected before the daemon is released
+    periodic_names = tuple(checked_names[1:])
+    status_daemon.release()
+
+    assert None in periodic_names
+    assert any(names is not None for names in periodic_names)
@@ -0,0 +1,188 @@
+"""Contains unittests for the status watcher."""
+
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set
+
+import pytest
+
+from bout_runners.database.database_connector import DatabaseConnector
+from bout_runners.database.database_creator import DatabaseCreator
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.metadata.status_checker import StatusChecker
+from bout_runners.metadata.status_watcher import StatusWatcher
+from bout_runners.utils.inotify import Inotify
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize("use_inotify", (True, False))
+def test_status_watcher_until_complete(
+    use_inotify: bool,
+    get_test_data_path: Path,
+    get_test_db_copy: Callable[[str], DatabaseConnector],
+    copy_test_case_log_file: Callable[[str], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the StatusWatcher updates until all runs are stopped.
+
+    Parameters
+    ----------
+    use_inotify : bool
+        Whether or not inotify should be used
+    get_test_data_path : Path
+        Path to the test data
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    copy_test_case_log_file : function
+        Return the function for copying the test case log files
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    if use_inotify and not Inotify.available():
+        pytest.skip("inotify is not available")
+    if not use_inotify:
+        monkeypatch.setattr(Inotify, "available", classmethod(lambda _: False))
+
+    test_case = "infinite_log_file_pid_started_ended_no_mock_pid_complete"
+    project_path = get_test_data_path
+    db_connector = get_test_db_copy(f"watcher_{use_inotify}")
+    copy_test_case_log_file(test_case)
+
+    # Remove row which has status running (as it will always have
+    # this status)
+    db_connector.execute_statement("DELETE FROM run WHERE name = 'testdata_5'")
+
+    status_watcher = StatusWatcher(db_connector, project_path)
+    assert status_watcher.watching is use_inotify
+    status_watcher.check_and_update_until_complete(seconds_between_update=1)
+    status_watcher.close()
+
+    db_reader = DatabaseReader(db_connector)
+    query = status_watcher.status_checker.get_query_string_for_non_errored_runs()
+    assert len(db_reader.query(query).index) == 0
+
+
+def test_read_changed_runs(
+    tmp_path: Path, get_test_db_copy: Callable[[str], DatabaseConnector]
+) -> None:
+    """
+    Test that the changes of the runs are debounced and reported per run.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    get_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a copy of test.db
+    """
+    if not Inotify.available():
+        pytest.skip("inotify is not available")
+    db_connector = get_test_db_copy("read_changed_runs")
+    DatabaseCreator(db_connector).upgrade_schema()
+    db_reader = DatabaseReader(db_connector)
+    active_names = set(
+        db_reader.query(StatusChecker.get_query_string_for_non_errored_runs()).loc[
+            :, "name"
+        ]
+    )
+    assert len(active_names) != 0
+    for name in active_names:
+        tmp_path.joinpath(name).mkdir()
+
+    status_watcher = StatusWatcher(db_connector, tmp_path)
+    assert status_watcher.watch_active_runs() == active_names
+    assert status_watcher.read_changed_runs(timeout=0.1) == set()
+
+    # A burst of writes to the log of one run is reported once
+    name = sorted(active_names)[0]
+    log_path = tmp_path.joinpath(name, "BOUT.log.0")
+    for line in range(3):
+        with log_path.open("a") as log_file:
+            log_file.write(f"{line}\n")
+    tmp_path.joinpath(name, "unrelated.txt").write_text("")
+    assert status_watcher.read_changed_runs(timeout=5) == {name}
+
+    # The creation of a run directory is reported
+    tmp_path.joinpath("new_run").mkdir()
+    assert status_watcher.read_changed_runs(timeout=5) == {"new_run"}
+    status_watcher.close()
+
+
+@pytest.mark.timeout(60)
+def test_full_check_with_busy_logs(
+    tmp_path: Path, get_migrated_test_db_copy: Callable[[str], DatabaseConnector]
+) -> None:
+    """
+    Test that all the runs are checked periodically while a log keeps changing.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    get_migrated_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a migrated copy of
+        test.db
+    """
+    if not Inotify.available():
+        pytest.skip("inotify is not available")
+    db_connector = get_migrated_test_db_copy("full_check_with_busy_logs")
+    db_reader = DatabaseReader(db_connector)
+    active_names = set(
+        db_reader.query(StatusChecker.get_query_string_for_non_errored_runs()).loc[
+            :, "name"
+        ]
+    )
+    for name in active_names:
+        tmp_path.joinpath(name).mkdir()
+    log_path = tmp_path.joinpath(sorted(active_names)[0], "BOUT.log.0")
+    checked_names: List[Optional[Set[str]]] = list()
+    stop_writing = threading.Event()
+
+    class RecordingStatusChecker(StatusChecker):
+        """StatusChecker which completes the runs at the second full check."""
+
+        def check_and_update_status(
+            self, max_workers: int = 1, names: Optional[Iterable[str]] = None
+        ) -> None:
+            """
+            Record the checked names, complete the runs at the second full check.
+
+            Parameters
+            ----------
+            max_workers : int
+                Not used
+            names : None or iterable of str
+                The names of the runs to check
+                If None, all the active runs are checked
+            """
+            checked_names.append(set(names) if names is not None else None)
+            # NOTE: The runs are also completed if the full check never comes, so
+            #       that the test fails rather than hangs
+            if checked_names.count(None) == 2 or len(checked_names) > 20:
+                stop_writing.set()
+                db_connector.execute_statement(
+                    "UPDATE run SET latest_status = 'complete'"
+                )
+
+    def write_log() -> None:
+        """Append to the log of one run until the runs are completed."""
+        while not stop_writing.is_set():
+            with log_path.open("a") as log_file:
+                log_file.write("line\n")
+            time.sleep(0.05)
+
+    writer = threading.Thread(target=write_log, daemon=True)
+    writer.start()
+    status_watcher = StatusWatcher(
+        db_connector, tmp_path, RecordingStatusChecker(db_connector, tmp_path)
+    )
+    status_watcher.check_and_update_until_complete(seconds_between_update=3)
+    status_watcher.close()
+    stop_writing.set()
+    writer.join()
+
+    assert checked_names.count(None) == 2
+    assert any(names is not None for names in checked_names)
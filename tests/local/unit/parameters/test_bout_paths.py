@@ -1,6 +1,7 @@
 """Contains unittests for BOUT paths."""
 
 
+from copy import copy
 from pathlib import Path
 from typing import Callable
 
@@ -44,3 +45,47 @@ def test_bout_path(
     with pytest.raises(FileNotFoundError):
         # NOTE: type: ignore due to https://github.com/python/mypy/issues/3004
         bout_paths.bout_inp_src_dir = "dir_without_BOUT_inp"  # type: ignore
+
+
+def test_lazy_bout_paths(tmp_path: Path) -> None:
+    """
+    Test that lazy BoutPaths only touch the filesystem on materialization.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    project_path = tmp_path.joinpath("project")
+    project_path.joinpath("data").mkdir(parents=True)
+    project_path.joinpath("data", "BOUT.inp").write_text("nout = 1\n")
+
+    bout_paths = BoutPaths(
+        project_path=project_path, bout_inp_dst_dir="first", lazy=True
+    )
+    bout_paths.bout_inp_dst_dir = Path("runs", "second")  # type: ignore
+    assert not bout_paths.materialized
+    assert list(project_path.iterdir()) == [project_path.joinpath("data")]
+
+    # Copies sharing the destination directory are materialized together
+    copied_bout_paths = copy(bout_paths)
+    other_bout_paths = BoutPaths(
+        project_path=project_path, bout_inp_dst_dir=Path("runs", "third"), lazy=True
+    )
+    assert (
+        BoutPaths.materialize_many((bout_paths, copied_bout_paths, other_bout_paths))
+        == 3
+    )
+    assert bout_paths.materialized and copied_bout_paths.materialized
+    assert not project_path.joinpath("first").exists()
+    for name in ("second", "third"):
+        assert project_path.joinpath("runs", name, "BOUT.inp").read_text() == (
+            "nout = 1\n"
+        )
+    assert BoutPaths.materialize_many((bout_paths, other_bout_paths)) == 0
+
+    # Changing the paths of a materialized object calls for a new materialization
+    bout_paths.bout_inp_dst_dir = "fourth"  # type: ignore
+    assert not bout_paths.materialized
+    bout_paths.materialize()
+    assert project_path.joinpath("fourth", "BOUT.inp").is_file()
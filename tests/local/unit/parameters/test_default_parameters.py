@@ -2,6 +2,7 @@
 
 
 from pathlib import Path
+from time import perf_counter
 from typing import Callable
 
 from bout_runners.parameters.bout_paths import BoutPaths
@@ -36,3 +37,79 @@ def test_default_parameters(
     bout_paths_dict = default_parameters_bout_paths.get_default_parameters()
 
     assert isinstance(bout_paths_dict, dict)
+
+
+def test_get_default_parameters_memoized(
+    get_test_data_path: Path, tmp_path: Path
+) -> None:
+    """
+    Test that the parsed settings are reused until the settings file changes.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    settings_path = tmp_path.joinpath("BOUT.settings")
+    settings_path.write_text(get_test_data_path.joinpath("BOUT.settings").read_text())
+    default_parameters = DefaultParameters(settings_path=settings_path)
+    settings_dict = default_parameters.get_default_parameters()
+    assert settings_dict == DefaultParameters.parse_settings_file(settings_path)
+
+    # Modifying the returned dict does not corrupt the parsed settings
+    settings_dict["global"]["nout"] = -1
+    settings_dict.pop("mesh")
+    other_settings_dict = DefaultParameters(
+        settings_path=settings_path
+    ).get_default_parameters()
+    assert other_settings_dict["global"]["nout"] == 100
+    assert "mesh" in other_settings_dict
+
+    # A modified settings file is parsed anew
+    settings_path.write_text(
+        settings_path.read_text().replace("nout = 100", "nout = 1000")
+    )
+    assert default_parameters.get_default_parameters()["global"]["nout"] == 1000
+
+
+def test_benchmark_get_default_parameters(tmp_path: Path) -> None:
+    """
+    Benchmark parsing a large settings file against reusing the parsed settings.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    number_of_sections = 100
+    number_of_parameters = 50
+    number_of_calls = 5
+    lines = ["nout = 100\t\t# type: int, doc: Number of output steps\n"]
+    for section_nr in range(number_of_sections):
+        lines.append(f"\n[section_{section_nr}]\n")
+        for parameter_nr in range(number_of_parameters):
+            lines.append(
+                f"parameter_{parameter_nr} = {parameter_nr * 0.5}"
+                "\t\t# type: BoutReal, doc: Synthetic parameter\n"
+            )
+    settings_path = tmp_path.joinpath("BOUT.settings")
+    settings_path.write_text("".join(lines))
+    default_parameters = DefaultParameters(settings_path=settings_path)
+    # Parse the settings file before the timing
+    default_parameters.get_default_parameters()
+
+    tic = perf_counter()
+    for _ in range(number_of_calls):
+        parsed = DefaultParameters.parse_settings_file(settings_path)
+    parse_time = perf_counter() - tic
+
+    tic = perf_counter()
+    for _ in range(number_of_calls):
+        memoized = default_parameters.get_default_parameters()
+    memoized_time = perf_counter() - tic
+
+    assert memoized == parsed
+    assert len(memoized) == number_of_sections + 1
+    assert memoized_time < parse_time / 10
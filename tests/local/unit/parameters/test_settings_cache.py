@@ -0,0 +1,77 @@
+"""Contains unittests for the settings cache."""
+
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from bout_runners.parameters.settings_cache import SettingsCache
+
+
+def test_settings_cache(tmp_path: Path) -> None:
+    """
+    Test that the settings run is only executed on a miss.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    project_path = tmp_path.joinpath("project")
+    project_path.joinpath("data").mkdir(parents=True)
+    project_path.joinpath("Makefile").write_text("TARGET = fake\n")
+    project_path.joinpath("data", "BOUT.inp").write_text("nout = 1\n")
+    exec_path = project_path.joinpath("fake")
+    exec_path.write_text("")
+    run_dir = project_path.joinpath("settings_run")
+    settings_runs: List[int] = list()
+
+    def run_settings() -> Path:
+        """
+        Write a BOUT.settings like the settings run, and count the runs.
+
+        Returns
+        -------
+        settings_path : Path
+            Path to the BOUT.settings file
+        """
+        settings_runs.append(1)
+        # NOTE: Sleep to let the other threads ask for the settings in the meantime
+        time.sleep(0.2)
+        run_dir.mkdir(exist_ok=True)
+        settings_path = run_dir.joinpath("BOUT.settings")
+        settings_path.write_text(
+            f"nout = 1\t\t# type: int\n{run_dir} = true\t\t# not used\n"
+        )
+        return settings_path
+
+    settings_cache = SettingsCache(project_path)
+    key = settings_cache.get_key()
+    cached_path = settings_cache.get_settings_path(run_settings)
+    assert len(settings_runs) == 1
+    assert cached_path == settings_cache.get_cached_path(key)
+    assert cached_path.read_text() == "nout = 1\t\t# type: int\n"
+
+    # A hit does not execute the settings run
+    assert SettingsCache(project_path).get_settings_path(run_settings) == cached_path
+    assert len(settings_runs) == 1
+
+    # Concurrent misses execute the settings run once
+    project_path.joinpath("data", "BOUT.inp").write_text("nout = 2\n")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        cached_paths = list(
+            executor.map(
+                lambda _: SettingsCache(project_path).get_settings_path(run_settings),
+                range(8),
+            )
+        )
+    assert len(settings_runs) == 2
+    assert len(set(cached_paths)) == 1
+    assert cached_paths[0] != cached_path
+
+    # A rebuilt executable is a miss
+    stat = exec_path.stat()
+    os.utime(exec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert settings_cache.get_key() not in (key, cached_paths[0].parent.name)
@@ -1,19 +1,32 @@
 """Contains unittests for the BoutRunner."""
 
 
+import asyncio
+import subprocess  # nosec
+import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Callable, Dict
 
+import pytest
+
+from bout_runners.database.database_connector import DatabaseConnector
 from bout_runners.database.database_reader import DatabaseReader
 from bout_runners.parameters.bout_run_setup import BoutRunSetup
 from bout_runners.runner.bout_runner import BoutRunner
 from bout_runners.runner.run_graph import RunGraph
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.async_local_submitter import AsyncLocalSubmitter
 from bout_runners.submitter.local_submitter import LocalSubmitter
+from bout_runners.submitter.worker_pool_submitter import WorkerPoolSubmitter
 from bout_runners.utils.file_operations import copy_restart_files
 from tests.utils.dummy_functions import (
+    copy_file,
     return_none,
     return_sum_of_three,
     return_sum_of_two,
+    write_file_after_sleep,
 )
 from tests.utils.paths import FileStateRestorer, change_directory
 from tests.utils.run import (
@@ -180,3 +193,235 @@ def test_function_run(tmp_path: Path) -> None:
     runner.run_function(path, submitter, return_sum_of_three, (1, 2), {"number_3": 3})
     submitter.wait_until_completed()
     assert path.is_file()
+
+    path = tmp_path.joinpath("return_sum_of_two_in_pool.py")
+    pool_submitter = WorkerPoolSubmitter(max_workers=1)
+    runner.run_function(path, pool_submitter, return_sum_of_two, (1, 2))
+    pool_submitter.wait_until_completed()
+    assert path.is_file()
+    assert pool_submitter.return_code == 0
+    WorkerPoolSubmitter.shutdown()
+
+
+def test_dispatch_when_ready(tmp_path: Path) -> None:
+    """
+    Test that nodes are dispatched as soon as their predecessors complete.
+
+    The graph consists of a slow node and an independent chain of two fast nodes.
+    When dispatching the nodes when they are ready, the last node in the chain
+    should not wait for the slow node to complete.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    run_graph = RunGraph()
+    paths = dict()
+    for name, seconds in (("slow", 5), ("fast_0", 0), ("fast_1", 0)):
+        paths[name] = tmp_path.joinpath(f"{name}.txt")
+        run_graph.add_function_node(
+            name,
+            {
+                "function": write_file_after_sleep,
+                "args": (str(paths[name]), seconds),
+                "kwargs": None,
+            },
+            path=tmp_path.joinpath(f"{name}.py"),
+            submitter=LocalSubmitter(run_path=tmp_path),
+        )
+    run_graph.add_edge("fast_0", "fast_1")
+
+    runner = BoutRunner(run_graph, wait_time=1)
+    runner.run(dispatch_when_ready=True)
+
+    for node_name, path in paths.items():
+        assert path.is_file()
+        assert runner.run_graph[node_name]["status"] == "completed"
+    assert paths["fast_1"].stat().st_mtime < paths["slow"].stat().st_mtime
+
+
+@pytest.mark.parametrize(
+    "submitter_type",
+    (
+        pytest.param(
+            AsyncLocalSubmitter,
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 8),
+                reason="The AsyncLocalSubmitter requires python 3.8",
+            ),
+        ),
+        WorkerPoolSubmitter,
+    ),
+)
+def test_run_by_order(
+    tmp_path: Path, submitter_type: Callable[..., AbstractSubmitter]
+) -> None:
+    """
+    Test that the next order is not dispatched before the current has completed.
+
+    The graph consists of a slow node and a node reading the output of the slow
+    node, both submitted with local submitters other than the LocalSubmitter.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    submitter_type : callable
+        The type of the submitters
+    """
+    run_graph = RunGraph()
+    first_path = tmp_path.joinpath("first.txt")
+    second_path = tmp_path.joinpath("second.txt")
+    run_graph.add_function_node(
+        "first",
+        {
+            "function": write_file_after_sleep,
+            "args": (str(first_path), 2),
+            "kwargs": None,
+        },
+        path=tmp_path.joinpath("first.py"),
+        submitter=submitter_type(run_path=tmp_path),
+    )
+    run_graph.add_function_node(
+        "second",
+        {
+            "function": copy_file,
+            "args": (str(first_path), str(second_path)),
+            "kwargs": None,
+        },
+        path=tmp_path.joinpath("second.py"),
+        submitter=submitter_type(run_path=tmp_path),
+    )
+    run_graph.add_edge("first", "second")
+
+    runner = BoutRunner(run_graph, wait_time=0)
+    try:
+        runner.run(raise_errors=True)
+    finally:
+        WorkerPoolSubmitter.shutdown()
+
+    assert second_path.is_file()
+    for node_name in ("first", "second"):
+        assert runner.run_graph[node_name]["submitter"].return_code == 0
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="The AsyncLocalSubmitter requires python 3.8"
+)
+def test_run_async(tmp_path: Path) -> None:
+    """
+    Test that nodes are awaited and dispatched by run_async.
+
+    The graph consists of a slow node and an independent chain of two fast nodes,
+    where the nodes are submitted with a mix of AsyncLocalSubmitters and
+    LocalSubmitters.
+    The last node in the chain should not wait for the slow node to complete.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    run_graph = RunGraph()
+    paths = dict()
+    for name, seconds, submitter in (
+        ("slow", 5, AsyncLocalSubmitter(run_path=tmp_path)),
+        ("fast_0", 0, LocalSubmitter(run_path=tmp_path)),
+        ("fast_1", 0, AsyncLocalSubmitter(run_path=tmp_path)),
+    ):
+        paths[name] = tmp_path.joinpath(f"{name}.txt")
+        run_graph.add_function_node(
+            name,
+            {
+                "function": write_file_after_sleep,
+                "args": (str(paths[name]), seconds),
+                "kwargs": None,
+            },
+            path=tmp_path.joinpath(f"{name}.py"),
+            submitter=submitter,
+        )
+    run_graph.add_edge("fast_0", "fast_1")
+
+    runner = BoutRunner(run_graph, wait_time=1)
+    asyncio.run(runner.run_async())
+
+    for node_name, path in paths.items():
+        assert path.is_file()
+        assert runner.run_graph[node_name]["status"] == "completed"
+    assert paths["fast_1"].stat().st_mtime < paths["slow"].stat().st_mtime
+
+
+@pytest.mark.timeout(60)
+@pytest.mark.parametrize("mode", ("by_order", "when_ready", "async"))
+def test_run_releases_status_daemons(
+    mode: str,
+    tmp_path: Path,
+    get_test_data_path: Path,
+    get_migrated_test_db_copy: Callable[[str], DatabaseConnector],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the status daemons are stopped when a bout_run node raises an error.
+
+    The BOUT++ run is replaced by a script which fails after its status has been
+    checked
+
+    Parameters
+    ----------
+    mode : str
+        How the nodes are dispatched
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    get_test_data_path : Path
+        Path to the test data
+    get_migrated_test_db_copy : function
+        Function which returns a DatabaseConnector connected to a migrated copy of
+        test.db
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    if mode == "async" and sys.version_info < (3, 7):
+        pytest.skip("asyncio.run requires python 3.7")
+    db_connector = get_migrated_test_db_copy(f"run_releases_status_daemons_{mode}")
+    script_path = tmp_path.joinpath("fail.py")
+    script_path.write_text("import time\ntime.sleep(1)\nraise SystemExit(1)\n")
+    bout_run_setup = SimpleNamespace(
+        submitter=LocalSubmitter(run_path=tmp_path),
+        db_connector=db_connector,
+        bout_paths=SimpleNamespace(project_path=get_test_data_path, materialized=True),
+        metadata_recorder=SimpleNamespace(latest_run_id=1),
+        executor=SimpleNamespace(restart_from=None),
+    )
+
+    def run_failing_script(setup: SimpleNamespace, _: bool = False) -> bool:
+        """
+        Submit the failing script instead of the BOUT++ run.
+
+        Parameters
+        ----------
+        setup : SimpleNamespace
+            The stand-in for the BoutRunSetup
+
+        Returns
+        -------
+        bool
+            True as the script is submitted
+        """
+        setup.submitter.submit_command(f"python3 {script_path}")
+        return True
+
+    monkeypatch.setattr(BoutRunner, "run_bout_run", staticmethod(run_failing_script))
+    run_graph = RunGraph()
+    # NOTE: Only the attributes used by the BoutRunner are given to the stand-in
+    run_graph.add_bout_run_node("bout_run_failing", bout_run_setup)  # type: ignore
+    runner = BoutRunner(run_graph, wait_time=0)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        if mode == "async":
+            asyncio.run(runner.run_async())
+        else:
+            runner.run(dispatch_when_ready=mode == "when_ready")
+
+    daemon_name = f"StatusDaemon({db_connector.db_path.name})"
+    assert all(thread.name != daemon_name for thread in threading.enumerate())
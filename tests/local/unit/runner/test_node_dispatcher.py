@@ -0,0 +1,74 @@
+"""Contains unittests for the NodeDispatcher."""
+
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from bout_runners.runner.node_dispatcher import NodeDispatcher
+from bout_runners.runner.run_graph import RunGraph
+from bout_runners.runner.run_status_tracker import RunStatusTracker
+from bout_runners.submitter.local_submitter import LocalSubmitter
+from tests.utils.dummy_functions import return_none
+
+
+@pytest.mark.parametrize("dispatch_when_ready", (False, True))
+def test_dispatch_unsubmitted_nodes(tmp_path: Path, dispatch_when_ready: bool) -> None:
+    """
+    Test that nodes which are not submitted release the nodes depending on them.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    dispatch_when_ready : bool
+        Whether to dispatch the nodes when they are ready
+    """
+    run_graph = RunGraph()
+    for name in ("first", "second", "third"):
+        run_graph.add_function_node(
+            name,
+            {"function": return_none, "args": None, "kwargs": None},
+            path=tmp_path.joinpath(f"{name}.py"),
+            submitter=LocalSubmitter(run_path=tmp_path),
+        )
+    run_graph.add_edge("first", "second")
+    run_graph.add_edge("second", "third")
+
+    submitted: List[str] = list()
+
+    def submit_node(node_name: str, force: bool) -> bool:
+        """
+        Record the node without submitting it.
+
+        Parameters
+        ----------
+        node_name : str
+            Name of the node
+        force : bool
+            Whether to force the run
+
+        Returns
+        -------
+        bool
+            Always False as nothing is submitted
+        """
+        assert force
+        submitted.append(node_name)
+        return False
+
+    node_dispatcher = NodeDispatcher(
+        run_graph, RunStatusTracker(run_graph, wait_time=0), submit_node
+    )
+    node_dispatcher.dispatch(
+        force=True,
+        raise_errors=True,
+        dispatch_when_ready=dispatch_when_ready,
+        use_job_arrays=False,
+    )
+
+    assert submitted == ["first", "second", "third"]
+    if dispatch_when_ready:
+        for name in submitted:
+            assert run_graph[name]["status"] == "completed"
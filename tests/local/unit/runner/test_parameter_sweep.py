@@ -0,0 +1,191 @@
+"""Contains unittests for the ParameterSweep."""
+
+
+from typing import Any, Callable, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.runner.parameter_sweep import ParameterSweep, Point
+
+
+def test_get_points() -> None:
+    """Test that grids, zipped lists and DataFrames are converted to points."""
+    grid: Mapping[str, Mapping[str, Sequence[Any]]] = {
+        "global": {"timestep": [0.1, 0.2]},
+        "mesh": {"nx": [4, 8, 16]},
+    }
+    grid_points = ParameterSweep.get_grid_points(grid)
+    assert len(grid_points) == 6
+    assert grid_points[0] == {"global": {"timestep": 0.1}, "mesh": {"nx": 4}}
+    assert grid_points[-1] == {"global": {"timestep": 0.2}, "mesh": {"nx": 16}}
+
+    zipped_points = ParameterSweep.get_zipped_points(
+        {"global": {"timestep": [0.1, 0.2]}, "mesh": {"nx": [4, 8]}}
+    )
+    assert zipped_points == [
+        {"global": {"timestep": 0.1}, "mesh": {"nx": 4}},
+        {"global": {"timestep": 0.2}, "mesh": {"nx": 8}},
+    ]
+    with pytest.raises(ValueError):
+        ParameterSweep.get_zipped_points(grid)
+
+    data_frame = pd.DataFrame({"global.timestep": [0.1, 0.2], "mesh.nx": [4, np.nan]})
+    data_frame_points = ParameterSweep.get_data_frame_points(data_frame)
+    assert data_frame_points == [
+        {"global": {"timestep": 0.1}, "mesh": {"nx": 4}},
+        {"global": {"timestep": 0.2}},
+    ]
+    assert isinstance(data_frame_points[0]["global"]["timestep"], float)
+    with pytest.raises(ValueError, match="'nout'"):
+        ParameterSweep.get_data_frame_points(pd.DataFrame({"nout": [1, 2]}))
+
+
+def test_add_grid(make_sweep: Callable[[str], ParameterSweep]) -> None:
+    """
+    Test that the runs are added and their parameters registered in bulk.
+
+    Parameters
+    ----------
+    make_sweep : function
+        Function making the sweep
+    """
+    sweep = make_sweep("grid")
+    grid: Mapping[str, Mapping[str, Sequence[Any]]] = {
+        "global": {"timestep": [0.1, 0.2]},
+        "mesh": {"nx": [4, 8, 16]},
+    }
+    run_groups = sweep.add_grid(grid)
+    assert len(run_groups) == 6
+    assert len(sweep.run_graph.nodes) == 6
+    assert len({run_group.bout_paths.bout_inp_dst_dir for run_group in run_groups}) == 6
+    for run_group in run_groups:
+        assert run_group.bout_paths.bout_inp_dst_dir.name.startswith("grid_")
+        assert run_group.bout_paths.bout_inp_dst_dir.joinpath("BOUT.inp").is_file()
+
+    db_reader = DatabaseReader(sweep.db_connector)
+
+    def count(table_name: str) -> int:
+        """
+        Return the number of rows in a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table
+
+        Returns
+        -------
+        int
+            The number of rows
+        """
+        query_str = f"SELECT COUNT(*) AS number_of_rows FROM {table_name}"
+        return int(db_reader.query(query_str).loc[:, "number_of_rows"].to_numpy()[0])
+
+    assert count("global") == 2
+    assert count("mesh") == 3
+    assert count("parameters") == 6
+
+    # The bulk registration gives the ids found by the per run registration
+    bout_run_setup = sweep.run_graph[run_groups[-1].bout_run_node_name][
+        "bout_run_setup"
+    ]
+    parameters_id = bout_run_setup.metadata_recorder._create_parameter_tables_entry(
+        bout_run_setup.final_parameters.get_final_parameters()
+    )
+    assert parameters_id == 6
+    assert count("parameters") == 6
+
+    # Points already registered are not registered again, and repeated points
+    # only give one run, whose run group is returned for every repetition
+    other_sweep = make_sweep("zipped")
+    other_run_groups = other_sweep.add_zipped(
+        {"global": {"timestep": [0.1, 0.1, 0.3]}, "mesh": {"nx": [4, 4, 4]}}
+    )
+    assert len(other_run_groups) == 3
+    assert other_run_groups[0] is other_run_groups[1]
+    assert other_run_groups[0] is not other_run_groups[2]
+    assert len(set(map(id, other_run_groups))) == 2
+    assert count("global") == 3
+    assert count("mesh") == 3
+    assert count("parameters") == 7
+
+
+def test_add_points_again(make_sweep: Callable[..., ParameterSweep]) -> None:
+    """
+    Test that points added in earlier calls are not given a second run.
+
+    Parameters
+    ----------
+    make_sweep : function
+        Function making the sweep
+    """
+    sweep = make_sweep("again")
+    point: Point = {"global": {"timestep": 0.1}, "mesh": {"nx": 4}}
+    (run_group,) = sweep.add_points([point])
+    run_groups = sweep.add_grid(
+        {"global": {"timestep": [0.1, 0.2]}, "mesh": {"nx": [4]}}
+    )
+    assert run_groups[0] is run_group
+    assert len(sweep.run_graph.nodes) == 2
+
+    # Another sweep with the same name would write to the same directories
+    other_sweep = make_sweep("again", run_graph=sweep.run_graph)
+    with pytest.raises(ValueError, match="already contains"):
+        other_sweep.add_points([point])
+    assert len(sweep.run_graph.nodes) == 2
+
+
+def test_parameter_sweep_bulk_queries(
+    make_sweep: Callable[[str], ParameterSweep],
+) -> None:
+    """
+    Test that building the runs of a large sweep queries each table in bulk.
+
+    Parameters
+    ----------
+    make_sweep : function
+        Function making the sweep
+    """
+    sweep = make_sweep("bulk")
+    points = pd.DataFrame(
+        {"global.timestep": np.linspace(0.1, 1.0, 1000), "mesh.nx": 4}
+    )
+    # NOTE: The statements are counted rather than timed, as the time depends
+    #       on the machine
+    statements: List[str] = list()
+    connection = sweep.db_connector.connection
+    connection.set_trace_callback(statements.append)
+    try:
+        run_groups = sweep.add_data_frame(points)
+    finally:
+        connection.set_trace_callback(None)
+    assert len(run_groups) == 1000
+
+    # The number of queries should not grow with the number of runs, except for
+    # the chunking of the lookups
+    db_reader = DatabaseReader(sweep.db_connector)
+    table_names = db_reader.query(
+        'SELECT name FROM sqlite_master WHERE type="table"'
+    ).loc[:, "name"]
+    number_of_chunks = -(-len(points.index) // (DatabaseReader.max_variables // 2))
+    queries = [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith(("SELECT", "WITH"))
+    ]
+    assert len(queries) <= len(table_names) * (number_of_chunks + 1)
+
+    # Every entry is inserted with one statement
+    inserts = [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith("INSERT")
+    ]
+    number_of_entries = sum(
+        int(db_reader.query(f"SELECT COUNT(*) FROM {table_name}").to_numpy()[0, 0])
+        for table_name in table_names
+    )
+    assert len(inserts) == number_of_entries
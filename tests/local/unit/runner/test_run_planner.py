@@ -0,0 +1,182 @@
+"""Contains unittests for the RunPlanner."""
+
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import pytest
+
+import bout_runners.metadata.metadata_recorder
+import bout_runners.runner.run_planner
+from bout_runners.database.database_reader import DatabaseReader
+from bout_runners.runner.bout_runner import BoutRunner
+from bout_runners.runner.parameter_sweep import ParameterSweep
+from bout_runners.runner.run_planner import RunPlanner
+from bout_runners.submitter.processor_split import ProcessorSplit
+
+
+@pytest.fixture(scope="function", name="make_recordable_sweep")
+def fixture_make_recordable_sweep(
+    make_sweep: Callable[[str], ParameterSweep], monkeypatch: pytest.MonkeyPatch
+) -> Callable[[str], ParameterSweep]:
+    """
+    Return the function making a sweep whose runs can be recorded without BOUT++.
+
+    The file modification is patched, as the project is never made
+
+    Parameters
+    ----------
+    make_sweep : function
+        Function making the sweep
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+
+    Returns
+    -------
+    function
+        Function making the sweep
+    """
+    file_modification = {
+        "project_makefile_modified": "2020-01-01T00:00:00",
+        "project_executable_modified": "2020-01-01T00:00:00",
+        "project_git_sha": "None",
+        "bout_lib_modified": "2020-01-01T00:00:00",
+        "bout_git_sha": "None",
+    }
+    for module in (
+        bout_runners.metadata.metadata_recorder,
+        bout_runners.runner.run_planner,
+    ):
+        monkeypatch.setattr(
+            module, "get_file_modification", lambda *_: dict(file_modification)
+        )
+    return make_sweep
+
+
+def record_runs(sweep: ParameterSweep, node_names: Tuple[str, ...]) -> None:
+    """
+    Record the runs of the nodes in the database as if they had been executed.
+
+    Parameters
+    ----------
+    sweep : ParameterSweep
+        The sweep the nodes belong to
+    node_names : tuple of str
+        The names of the bout_run nodes to record
+    """
+    for node_name in node_names:
+        bout_run_setup = sweep.run_graph[node_name]["bout_run_setup"]
+        bout_run_setup.metadata_recorder.capture_new_data_from_run(
+            bout_run_setup.executor.submitter.processor_split
+        )
+
+
+def test_skip_done_nodes(
+    make_recordable_sweep: Callable[[str], ParameterSweep],
+) -> None:
+    """
+    Test that the done runs and the nodes only depending on them are skipped.
+
+    Parameters
+    ----------
+    make_recordable_sweep : function
+        Function making the sweep
+    """
+    sweep = make_recordable_sweep("plan")
+    run_groups = sweep.add_zipped({"global": {"timestep": [0.1, 0.2, 0.3, 0.4]}})
+    function_dict: Dict[
+        str, Optional[Union[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]]
+    ] = {"function": print, "args": None, "kwargs": None}
+    post_processors = [
+        run_group.add_post_processor(function_dict) for run_group in run_groups
+    ]
+    bout_runs = [run_group.bout_run_node_name for run_group in run_groups]
+    run_graph = sweep.run_graph
+    run_graph.add_function_node("collect", function_dict=function_dict)
+    run_graph.add_waiting_for("collect", bout_runs[1:3])
+
+    record_runs(sweep, tuple(bout_runs[:2]))
+    # A run with another split is not the same run
+    bout_run_setup = run_graph[bout_runs[2]]["bout_run_setup"]
+    bout_run_setup.metadata_recorder.capture_new_data_from_run(
+        ProcessorSplit(number_of_processors=2, processors_per_node=2)
+    )
+
+    run_planner = RunPlanner(run_graph)
+    assert run_planner.get_done_nodes() == {bout_runs[0]: 1, bout_runs[1]: 2}
+
+    skipped_nodes = run_planner.skip_done_nodes()
+    assert set(skipped_nodes) == set(bout_runs[:2] + post_processors[:2])
+    for node_name in skipped_nodes:
+        assert run_graph[node_name]["status"] == "skipped"
+    # The node also waiting for a run which is not done is kept
+    assert run_graph["collect"]["status"] == "ready"
+    assert len(run_graph) == len(run_graph.nodes) - len(skipped_nodes)
+
+    # Nothing more is skipped once the done runs are skipped
+    assert RunPlanner(run_graph).skip_done_nodes() == tuple()
+
+
+def test_skipped_lazy_paths(
+    make_recordable_sweep: Callable[[str, bool], ParameterSweep],
+) -> None:
+    """
+    Test that the directories of skipped runs with lazy paths are never made.
+
+    Parameters
+    ----------
+    make_recordable_sweep : function
+        Function making the sweep
+    """
+    sweep = make_recordable_sweep("lazy", True)
+    run_groups = sweep.add_zipped({"global": {"timestep": [0.1, 0.2]}})
+    record_runs(sweep, tuple(run_group.bout_run_node_name for run_group in run_groups))
+
+    BoutRunner(sweep.run_graph).run(skip_done=True)
+    for run_group in run_groups:
+        assert sweep.run_graph[run_group.bout_run_node_name]["status"] == "skipped"
+        assert not run_group.bout_paths.materialized
+        assert not run_group.bout_paths.bout_inp_dst_dir.exists()
+
+
+def test_run_planner_bulk_queries(
+    make_recordable_sweep: Callable[[str], ParameterSweep],
+) -> None:
+    """
+    Test that planning a resumed sweep queries each table in bulk.
+
+    Parameters
+    ----------
+    make_recordable_sweep : function
+        Function making the sweep
+    """
+    sweep = make_recordable_sweep("benchmark")
+    run_groups = sweep.add_grid(
+        {
+            "global": {"timestep": [0.01 * (i + 1) for i in range(100)]},
+            "mesh": {"nx": list(range(10))},
+        }
+    )
+    bout_runs = tuple(run_group.bout_run_node_name for run_group in run_groups)
+    with sweep.db_connector.transaction():
+        record_runs(sweep, bout_runs[:900])
+
+    # NOTE: The statements are counted rather than timed, as the time depends
+    #       on the machine
+    statements: List[str] = list()
+    connection = sweep.db_connector.connection
+    connection.set_trace_callback(statements.append)
+    try:
+        skipped_nodes = RunPlanner(sweep.run_graph).skip_done_nodes()
+    finally:
+        connection.set_trace_callback(None)
+    assert set(skipped_nodes) == set(bout_runs[:900])
+
+    # The number of queries should not grow with the number of runs, except for
+    # the chunking of the lookups
+    number_of_tables = len(
+        DatabaseReader(sweep.db_connector)
+        .query('SELECT name FROM sqlite_master WHERE type="table"')
+        .index
+    )
+    number_of_chunks = -(-len(bout_runs) // (DatabaseReader.max_variables // 2))
+    assert len(statements) <= 1 + number_of_tables * number_of_chunks
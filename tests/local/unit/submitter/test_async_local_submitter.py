@@ -0,0 +1,64 @@
+"""Contains unittests for the asynchronous local submitter."""
+
+
+import asyncio
+import sys
+
+# NOTE: subprocess can be vulnerable if shell=True
+#       However, CalledProcessError has no known security vulnerabilities
+from subprocess import CalledProcessError  # nosec
+from typing import List
+
+import pytest
+
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.async_local_submitter import AsyncLocalSubmitter
+
+# NOTE: The AsyncLocalSubmitter requires python 3.8
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="The AsyncLocalSubmitter requires python 3.8"
+)
+
+
+@pytest.mark.timeout(60)
+def test_async_local_submitter() -> None:
+    """Test that AsyncLocalSubmitter can run a command and raise an error."""
+    submitter = AsyncLocalSubmitter()
+    submitter.submit_command("ls")
+    submitter.wait_until_completed()
+
+    submitter.errored()
+    assert isinstance(submitter.job_id, str)
+    assert submitter.return_code == 0
+    assert isinstance(submitter.std_out, str)
+    assert isinstance(submitter.std_err, str)
+
+    with pytest.raises(FileNotFoundError):
+        submitter.submit_command("not a real command")
+        submitter.wait_until_completed()
+        submitter.raise_error()
+
+    with pytest.raises(CalledProcessError):
+        submitter.submit_command("ls ThisPathDoesNotExist")
+        submitter.wait_until_completed()
+        submitter.raise_error()
+
+
+@pytest.mark.timeout(60)
+def test_wait_async() -> None:
+    """Test that several AsyncLocalSubmitters can be awaited concurrently."""
+    submitters = tuple(AsyncLocalSubmitter() for _ in range(3))
+    notified: List[AbstractSubmitter] = list()
+    for submitter in submitters:
+        submitter.add_completion_callback(notified.append)
+        submitter.submit_command("sleep 1")
+
+    async def wait_all() -> None:
+        await asyncio.gather(*(submitter.wait_async() for submitter in submitters))
+
+    asyncio.run(wait_all())
+
+    for submitter in submitters:
+        assert submitter.completed()
+        assert not submitter.errored()
+    assert len(notified) == len(submitters)
@@ -0,0 +1,144 @@
+"""Contains unittests for the local execution pool."""
+
+
+# NOTE: Only used to launch a process in the pool
+import subprocess  # nosec
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bout_runners.submitter.local_execution_pool import LocalExecutionPool
+from bout_runners.submitter.local_submitter import LocalSubmitter
+from bout_runners.submitter.processor_split import ProcessorSplit
+
+
+@pytest.mark.timeout(60)
+def test_local_execution_pool() -> None:
+    """Test that the pool admits submissions only when processors are free."""
+    pool = LocalExecutionPool(processor_budget=2)
+    submitters = dict()
+    for name, number_of_processors in (("first", 1), ("large", 2), ("small", 1)):
+        submitters[name] = LocalSubmitter(
+            processor_split=ProcessorSplit(
+                number_of_processors=number_of_processors,
+                processors_per_node=number_of_processors,
+            ),
+            execution_pool=pool,
+        )
+        submitters[name].submit_command("sleep 1")
+
+    # The large submission does not fit, but the small fits in the remaining budget
+    assert not submitters["first"].queued
+    assert submitters["large"].queued
+    assert submitters["large"].job_id is None
+    assert not submitters["small"].queued
+    assert pool.free_processors == 0
+    assert pool.number_of_queued == 1
+    assert not submitters["large"].completed()
+
+    submitters["large"].wait_until_completed()
+    assert submitters["large"].return_code == 0
+    assert isinstance(submitters["large"].queue_wait_time, float)
+    assert submitters["large"].queue_wait_time > 0
+    assert submitters["first"].completed()
+    assert submitters["small"].completed()
+    assert pool.free_processors == 2
+
+
+@pytest.mark.timeout(60)
+def test_oversized_submission() -> None:
+    """Test that submissions larger than the budget are admitted when idle."""
+    pool = LocalExecutionPool(processor_budget=1)
+    submitter = LocalSubmitter(
+        processor_split=ProcessorSplit(number_of_processors=2, processors_per_node=2),
+        execution_pool=pool,
+    )
+    submitter.submit_command("ls")
+    assert not submitter.queued
+    submitter.wait_until_completed()
+    assert submitter.return_code == 0
+
+    with pytest.raises(ValueError):
+        pool.processor_budget = 0
+
+
+@pytest.mark.timeout(60)
+def test_concurrent_polls() -> None:
+    """Test that the pool can be polled from several threads at once."""
+    pool = LocalExecutionPool(processor_budget=2)
+    submitters = [
+        LocalSubmitter(
+            processor_split=ProcessorSplit(
+                number_of_processors=1, processors_per_node=1
+            ),
+            execution_pool=pool,
+        )
+        for _ in range(16)
+    ]
+    for submitter in submitters:
+        submitter.submit_command("ls")
+
+    # NOTE: Every thread polls the shared pool until its submission completes
+    with ThreadPoolExecutor(max_workers=len(submitters)) as executor:
+        futures = [
+            executor.submit(submitter.wait_until_completed) for submitter in submitters
+        ]
+        for future in futures:
+            # Raise any error from the polling threads
+            future.result()
+    assert all(submitter.return_code == 0 for submitter in submitters)
+    assert pool.number_of_queued == 0
+    assert pool.free_processors == 2
+
+
+@pytest.mark.timeout(60)
+def test_queued_while_launching() -> None:
+    """Test that a submission is queued until its process has been launched."""
+    pool = LocalExecutionPool(processor_budget=1)
+    number_of_queued_while_launching = list()
+
+    def launch(_: float) -> subprocess.Popen:
+        """
+        Record the number of queued submissions, then start the process.
+
+        Returns
+        -------
+        subprocess.Popen
+            The started process
+        """
+        number_of_queued_while_launching.append(pool.number_of_queued)
+        return subprocess.Popen(("ls",), stdout=subprocess.DEVNULL)  # nosec
+
+    ticket = pool.submit(1, launch)
+    assert number_of_queued_while_launching == [1]
+    assert not pool.is_queued(ticket)
+    assert pool.number_of_queued == 0
+
+
+@pytest.mark.timeout(60)
+def test_failing_launch() -> None:
+    """Test that a failing launch is reported by its own submitter."""
+    pool = LocalExecutionPool(processor_budget=1)
+    submitters = dict()
+    for name, command in (
+        ("first", "sleep 1"),
+        ("failing", "this_command_does_not_exist"),
+        ("last", "ls"),
+    ):
+        submitters[name] = LocalSubmitter(execution_pool=pool)
+        submitters[name].submit_command(command)
+    assert submitters["failing"].queued
+    assert submitters["last"].queued
+
+    # NOTE: The first submitter launches the queued submissions when it completes
+    submitters["first"].wait_until_completed()
+    assert submitters["first"].return_code == 0
+    assert not submitters["failing"].queued
+    assert submitters["failing"].completed()
+    assert submitters["failing"].return_code == 1
+    assert "this_command_does_not_exist" in str(submitters["failing"].std_err)
+    with pytest.raises(subprocess.CalledProcessError):
+        submitters["failing"].wait_until_completed()
+    submitters["last"].wait_until_completed()
+    assert submitters["last"].return_code == 0
+    assert pool.number_of_queued == 0
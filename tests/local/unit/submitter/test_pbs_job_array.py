@@ -0,0 +1,123 @@
+"""Contains unittests for the PBS job array."""
+
+
+import os
+
+# NOTE: subprocess can be vulnerable if shell=True
+#       However, run is only used with trusted input
+import subprocess  # nosec
+from pathlib import Path
+
+from bout_runners.submitter.pbs_job_array import PBSJobArray
+from bout_runners.submitter.pbs_status_service import PBSStatusService
+from bout_runners.submitter.pbs_submitter import PBSSubmitter
+
+
+def test_create_submission_string() -> None:
+    """Test that the format of the job array submission string is correct."""
+    job_name = "test_create_submission_string_array"
+    submitter = PBSSubmitter("template", Path())
+    result = submitter.create_submission_string(
+        "ls",
+        waiting_for=("1[0].pbs", "1[1].pbs", "2.pbs"),
+        job_name=job_name,
+        number_of_array_tasks=3,
+    )
+    expected = (
+        "#!/bin/bash\n"
+        f"#PBS -N {job_name}\n"
+        "#PBS -J 0-2\n"
+        "#PBS -l nodes=1:ppn=1\n"
+        f"#PBS -o {job_name}_^array_index^.log\n"
+        f"#PBS -e {job_name}_^array_index^.err\n"
+        "#PBS -W depend=afterok:1[].pbs:2.pbs\n"
+        "\n"
+        "cd $PBS_O_WORKDIR\n"
+        "ls"
+    )
+    assert result == expected
+
+
+def test_get_dispatch_command(tmp_path: Path) -> None:
+    """
+    Test that the dispatch command executes the command of the array index.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    table_path = tmp_path.joinpath("table.commands")
+    table_path.write_text("echo zero\necho one\necho two\n")
+    env = dict(os.environ)
+    env["PBS_ARRAY_INDEX"] = "2"
+    result = subprocess.run(  # nosec
+        ["bash", "-c", PBSJobArray.get_dispatch_command(table_path)],
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert result.stdout.decode("utf8").strip() == "two"
+
+
+def test_submit(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that the members of a job array are given the job ids of the sub-jobs.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    scripts = list()
+
+    def mock_submit_script(_: PBSSubmitter, script_path: Path, script: str) -> str:
+        scripts.append((script_path, script))
+        return "1234[].pbs"
+
+    monkeypatch.setattr(PBSSubmitter, "submit_script", mock_submit_script)
+    monkeypatch.setattr(PBSSubmitter, "is_pbs_pro", classmethod(lambda _: True))
+
+    status_service = PBSStatusService(cache_ttl=3600)
+    submitters = tuple(
+        PBSSubmitter(f"member_{index}", tmp_path, status_service=status_service)
+        for index in range(2)
+    )
+    job_array = submitters[0].create_job_array()
+    assert job_array is not None
+    for submitter in submitters:
+        job_array.add(submitter)
+    for index, submitter in enumerate(submitters):
+        submitter.submit_command(f"echo {index}")
+
+    assert job_array.submit() == "1234[].pbs"
+    assert len(scripts) == 1
+    assert "#PBS -J 0-1\n" in scripts[0][1]
+    for index, submitter in enumerate(submitters):
+        assert submitter.job_id == f"1234[{index}].pbs"
+    assert status_service.number_of_tracked == 2
+
+    # A successor depends on the whole job array
+    successor = PBSSubmitter("successor", tmp_path, status_service=status_service)
+    successor.add_waiting_for(str(submitter.job_id) for submitter in submitters)
+    assert "#PBS -W depend=afterok:1234[].pbs\n" in successor.create_submission_string(
+        "ls", successor.waiting_for
+    )
+
+
+def test_no_job_array_on_torque(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that no job array is created if the PBS system is not PBS Pro.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    monkeypatch.setattr(PBSSubmitter, "is_pbs_pro", classmethod(lambda _: False))
+    submitter = PBSSubmitter("torque", tmp_path)
+    assert submitter.create_job_array() is None
@@ -0,0 +1,150 @@
+"""Contains unittests for the PBS status service."""
+
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Optional
+
+from bout_runners.submitter.pbs_status_service import PBSStatusService
+
+
+def test_parse_qstat(get_test_data_path: Path) -> None:
+    """
+    Test that the states and return codes are parsed from qstat.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    """
+    qstat_str = get_test_data_path.joinpath("test_qstat.json").read_text()
+    statuses = PBSStatusService.parse_qstat(qstat_str)
+    assert statuses == {
+        "1.pbs": ("F", 0),
+        "2.pbs": ("F", 255),
+        "3.pbs": ("R", None),
+        "4.pbs": (PBSStatusService.dequeued_state, None),
+    }
+    assert PBSStatusService.parse_qstat("") == dict()
+    assert PBSStatusService.parse_qstat("qstat: Unknown Job Id") == dict()
+
+
+def test_parse_trace(get_test_data_path: Path) -> None:
+    """
+    Test that the state and return code are parsed from tracejob.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    """
+    trace = get_test_data_path.joinpath("test_trace").read_text()
+    assert PBSStatusService.parse_trace(trace) == ("F", 0)
+    trace = trace.replace("Exit_status=0", "Exit_status=255")
+    assert PBSStatusService.parse_trace(trace) == ("F", 255)
+    lines = trace.split("\n")
+    assert PBSStatusService.parse_trace(
+        "\n".join(line for line in lines if "Exit_status" not in line)
+    ) == (PBSStatusService.dequeued_state, None)
+    assert PBSStatusService.parse_trace("\n".join(lines[:3])) == (None, None)
+
+
+def test_get_status(mock_pbs_scheduler: Callable) -> None:
+    """
+    Test that tracejob is only called for the jobs missing from qstat.
+
+    Parameters
+    ----------
+    mock_pbs_scheduler : function
+        Function which mocks the commands run by the PBSStatusService
+    """
+    commands = mock_pbs_scheduler(5, ("4.pbs",))
+    service = PBSStatusService(cache_ttl=3600)
+    for index in range(5):
+        service.track(f"{index}.pbs", datetime.now() - timedelta(days=2))
+
+    # 0.pbs gets the attributes of 1.pbs in test_qstat.json and so on
+    assert service.get_status("0.pbs") == ("F", 0)
+    assert service.get_status("2.pbs") == ("R", None)
+    assert service.get_status("3.pbs") == (PBSStatusService.dequeued_state, None)
+    assert service.get_status("4.pbs") == ("F", 0)
+    assert commands == [
+        "qstat -x -f -t -F json 0.pbs 1.pbs 2.pbs 3.pbs 4.pbs",
+        "tracejob -n 3 4.pbs",
+    ]
+    assert service.number_of_tracked == 1
+
+
+def test_benchmark_polling(mock_pbs_scheduler: Callable) -> None:
+    """
+    Benchmark polling all jobs at once against tracing every job.
+
+    Every command to the mocked scheduler has the same latency, so the polling
+    time is dominated by the number of commands as on a real cluster
+
+    Parameters
+    ----------
+    mock_pbs_scheduler : function
+        Function which mocks the commands run by the PBSStatusService
+    """
+    number_of_jobs = 100
+    job_ids = tuple(f"{index}.pbs" for index in range(number_of_jobs))
+    commands = mock_pbs_scheduler(number_of_jobs, ("7.pbs",), 0.005)
+    service = PBSStatusService(cache_ttl=3600)
+    start_time = datetime.now()
+
+    tic = perf_counter()
+    for job_id in job_ids:
+        service._trace(job_id, start_time)  # pylint: disable=protected-access
+    per_job_time = perf_counter() - tic
+    assert len(commands) == number_of_jobs
+
+    commands.clear()
+    for job_id in job_ids:
+        service.track(job_id, start_time)
+    tic = perf_counter()
+    for job_id in job_ids:
+        service.get_status(job_id)
+    batched_time = perf_counter() - tic
+    assert len(commands) == 2
+    assert batched_time < per_job_time
+
+
+def test_get_status_of_sub_jobs(monkeypatch) -> None:
+    """
+    Test that the sub-jobs of a job array are queried through the job array.
+
+    Parameters
+    ----------
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    commands = list()
+    qstat_str = json.dumps(
+        {
+            "Jobs": {
+                "1[].pbs": {"job_state": "B"},
+                "1[0].pbs": {"job_state": "X", "Exit_status": 0},
+                "1[1].pbs": {"job_state": "X", "Exit_status": 3},
+                "1[2].pbs": {"job_state": "R"},
+            }
+        }
+    )
+
+    def mock_run_command(command: str, _: Optional[Path] = None) -> str:
+        commands.append(command)
+        return qstat_str
+
+    monkeypatch.setattr(
+        PBSStatusService, "_run_command", staticmethod(mock_run_command)
+    )
+    service = PBSStatusService(cache_ttl=3600)
+    for index in range(3):
+        service.track(f"1[{index}].pbs", datetime.now())
+
+    assert service.get_status("1[0].pbs") == ("X", 0)
+    assert service.get_status("1[1].pbs") == ("X", 3)
+    assert service.get_status("1[2].pbs") == ("R", None)
+    assert commands == ["qstat -x -f -t -F json 1[].pbs"]
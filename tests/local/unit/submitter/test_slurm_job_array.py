@@ -0,0 +1,178 @@
+"""Contains unittests for the SLURM job array."""
+
+
+import os
+
+# NOTE: subprocess can be vulnerable if shell=True
+#       However, run is only used with trusted input
+import subprocess  # nosec
+from pathlib import Path
+
+from bout_runners.submitter.slurm_job_array import SLURMJobArray
+from bout_runners.submitter.slurm_status_service import SLURMStatusService
+from bout_runners.submitter.slurm_submitter import SLURMSubmitter
+
+
+def test_create_submission_string() -> None:
+    """Test that the format of the job array submission string is correct."""
+    job_name = "test_create_submission_string_array"
+    submitter = SLURMSubmitter("template", Path())
+    result = submitter.create_submission_string(
+        "ls", waiting_for=("1",), job_name=job_name, number_of_array_tasks=3
+    )
+    expected = (
+        "#!/bin/bash\n"
+        f"#SBATCH --job-name={job_name}\n"
+        "#SBATCH --array=0-2\n"
+        "#SBATCH --nodes=1\n"
+        "#SBATCH --tasks-per-node=1\n"
+        f"#SBATCH -o {job_name}_%A_%a.log\n"
+        f"#SBATCH -e {job_name}_%A_%a.err\n"
+        "#SBATCH --dependency=afterok:1\n"
+        "\n"
+        "cd $SLURM_SUBMIT_DIR\n"
+        "ls"
+    )
+    assert result == expected
+
+
+def test_get_dispatch_command(tmp_path: Path) -> None:
+    """
+    Test that the dispatch command executes the command of the array index.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    table_path = tmp_path.joinpath("table.commands")
+    table_path.write_text("echo zero\necho one\necho two\n")
+    result = subprocess.run(  # nosec
+        ["bash", "-c", SLURMJobArray.get_dispatch_command(table_path)],
+        env={**os.environ, "SLURM_ARRAY_TASK_ID": "1"},
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert result.stdout.decode("utf8").strip() == "one"
+
+
+def test_submit(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that the members of a job array are given the job ids of the tasks.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    scripts = list()
+
+    def mock_submit_script(_: SLURMSubmitter, script_path: Path, script: str) -> str:
+        scripts.append((script_path, script))
+        return "1234"
+
+    monkeypatch.setattr(SLURMSubmitter, "submit_script", mock_submit_script)
+
+    status_service = SLURMStatusService(cache_ttl=3600)
+    submitters = tuple(
+        SLURMSubmitter(f"member_{index}", tmp_path, status_service=status_service)
+        for index in range(3)
+    )
+    job_array = submitters[0].create_job_array()
+    for submitter in submitters:
+        job_array.add(submitter)
+    for index, submitter in enumerate(submitters):
+        submitter.submit_command(f"echo {index}")
+        assert submitter.job_id is None
+    assert len(scripts) == 0
+    assert job_array.number_of_tasks == 3
+
+    assert job_array.submit() == "1234"
+    assert len(scripts) == 1
+    assert scripts[0][0] == tmp_path.joinpath("member_0_array.sh")
+    assert "#SBATCH --array=0-2\n" in scripts[0][1]
+    assert (
+        tmp_path.joinpath("member_0_array.commands").read_text()
+        == "echo 0\necho 1\necho 2\n"
+    )
+    for index, submitter in enumerate(submitters):
+        assert submitter.job_id == f"1234_{index}"
+        assert submitter.job_array is job_array
+    assert status_service.number_of_tracked == 3
+
+    # Submitting again after the job array is submitted gives an ordinary job
+    monkeypatch.setattr(
+        SLURMSubmitter, "submit_script", lambda *_: "1235"  # type: ignore
+    )
+    submitters[0].submit_command("echo 0")
+    assert submitters[0].job_id == "1235"
+    assert submitters[0].job_array is None
+
+
+def test_submit_merges_waiting_for(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that the job array waits for the dependencies of all the commands.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    scripts = list()
+
+    def mock_submit_script(_: SLURMSubmitter, script_path: Path, script: str) -> str:
+        scripts.append(script)
+        return "1234"
+
+    monkeypatch.setattr(SLURMSubmitter, "submit_script", mock_submit_script)
+
+    submitters = tuple(
+        SLURMSubmitter(f"member_{index}", tmp_path) for index in range(3)
+    )
+    job_array = submitters[0].create_job_array()
+    for submitter, waiting_for in zip(submitters, (("1",), ("2", "1"), tuple())):
+        job_array.add(submitter)
+        submitter.add_waiting_for(waiting_for)
+        submitter.submit_command("echo")
+
+    assert job_array.submit() == "1234"
+    assert "#SBATCH --dependency=afterok:1:2\n" in scripts[0]
+
+
+def test_submit_single_task(tmp_path: Path, monkeypatch) -> None:
+    """
+    Test that a job array with a single task is submitted as an ordinary job.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    monkeypatch.setattr(
+        SLURMSubmitter, "submit_script", lambda *_: "1234"  # type: ignore
+    )
+    submitters = tuple(
+        SLURMSubmitter(
+            f"member_{index}",
+            tmp_path,
+            status_service=SLURMStatusService(cache_ttl=3600),
+        )
+        for index in range(2)
+    )
+    job_array = SLURMJobArray("single", tmp_path)
+    for submitter in submitters:
+        job_array.add(submitter)
+    submitters[0].submit_command("echo 0")
+
+    assert job_array.submit() is None
+    assert not job_array.submitted
+    assert submitters[0].job_id == "1234"
+    assert submitters[1].job_id is None
+    for submitter in submitters:
+        assert submitter.job_array is None
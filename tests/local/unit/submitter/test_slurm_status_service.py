@@ -0,0 +1,69 @@
+"""Contains unittests for the SLURM status service."""
+
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from bout_runners.submitter.slurm_status_service import SLURMStatusService
+
+
+def test_parse_sacct(get_test_data_path: Path) -> None:
+    """
+    Test that the states and return codes are parsed from sacct.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    """
+    sacct_str = get_test_data_path.joinpath("test_sacct_parsable").read_text()
+    statuses = SLURMStatusService.parse_sacct(sacct_str)
+    assert statuses == {
+        "1": ("COMPLETED", 0),
+        "2": ("FAILED", 2),
+        "3": ("CANCELLED", 0),
+        "4": ("RUNNING", None),
+        "5": ("PENDING", None),
+    }
+
+
+def test_get_status(get_test_data_path: Path, monkeypatch) -> None:
+    """
+    Test that all the tracked jobs are polled with one sacct call.
+
+    Parameters
+    ----------
+    get_test_data_path : Path
+        Path to the test data
+    monkeypatch : MonkeyPatch
+        MonkeyPatch object
+    """
+    sacct_str = get_test_data_path.joinpath("test_sacct_parsable").read_text()
+    commands: List[str] = list()
+
+    def mock_run_command(command: str, _: Optional[Path] = None) -> str:
+        commands.append(command)
+        return sacct_str
+
+    monkeypatch.setattr(
+        SLURMStatusService, "_run_command", staticmethod(mock_run_command)
+    )
+
+    service = SLURMStatusService(cache_ttl=3600)
+    submission_time = datetime(2020, 5, 1, 17, 7, 10)
+    for job_id in ("1", "2", "3", "4", "5"):
+        service.track(job_id, submission_time + timedelta(minutes=int(job_id)))
+
+    assert service.get_status("1") == ("COMPLETED", 0)
+    assert service.get_status("2") == ("FAILED", 2)
+    assert service.get_status("4") == ("RUNNING", None)
+    assert len(commands) == 1
+    assert "-j 1,2,3,4,5" in commands[0]
+    assert "--starttime 2020-05-01T16:08:10" in commands[0]
+
+    # Finished jobs are no longer polled
+    assert service.number_of_tracked == 2
+    service.refresh(force=True)
+    assert len(commands) == 2
+    assert "-j 4,5" in commands[1]
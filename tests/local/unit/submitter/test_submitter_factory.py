@@ -1,10 +1,15 @@
 """Contains unittests for the SubmitterFactory."""
 
 
+import configparser
+import sys
+
 import pytest
 
+from bout_runners.submitter.async_local_submitter import AsyncLocalSubmitter
 from bout_runners.submitter.local_submitter import LocalSubmitter
-from bout_runners.submitter.submitter_factory import get_submitter
+from bout_runners.submitter.submitter_factory import get_processor_budget, get_submitter
+from bout_runners.submitter.worker_pool_submitter import WorkerPoolSubmitter
 
 
 def test_submitter_factory() -> None:
@@ -12,5 +17,26 @@ def test_submitter_factory() -> None:
     submitter = get_submitter(name="local", argument_dict=dict())
     assert isinstance(submitter, LocalSubmitter)
 
+    if sys.version_info >= (3, 8):
+        submitter = get_submitter(name="async_local", argument_dict=dict())
+        assert isinstance(submitter, AsyncLocalSubmitter)
+    else:
+        with pytest.raises(NotImplementedError):
+            get_submitter(name="async_local", argument_dict=dict())
+
+    submitter = get_submitter(name="worker_pool", argument_dict=dict())
+    assert isinstance(submitter, WorkerPoolSubmitter)
+
     with pytest.raises(NotImplementedError):
         get_submitter(name="not a class", argument_dict=dict())
+
+
+def test_get_processor_budget() -> None:
+    """Test that the processor budget is read from the local section."""
+    config = configparser.ConfigParser()
+    config.read_dict({"local": {"number_of_processors": "1"}})
+    assert get_processor_budget(config["local"]) is None
+    config["local"]["processor_budget"] = "None"
+    assert get_processor_budget(config["local"]) is None
+    config["local"]["processor_budget"] = "4"
+    assert get_processor_budget(config["local"]) == 4
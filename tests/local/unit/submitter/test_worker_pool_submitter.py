@@ -0,0 +1,69 @@
+"""Contains unittests for the worker pool submitter."""
+
+
+from pathlib import Path
+
+# NOTE: subprocess can be vulnerable if shell=True
+#       However, CalledProcessError has no known security vulnerabilities
+from subprocess import CalledProcessError  # nosec
+from typing import List
+
+import pytest
+
+from bout_runners.submitter.abstract_submitter import AbstractSubmitter
+from bout_runners.submitter.worker_pool_submitter import WorkerPoolSubmitter
+from tests.utils.dummy_functions import print_working_directory, return_sum_of_two
+
+
+@pytest.mark.timeout(60)
+def test_submit_function(tmp_path: Path) -> None:
+    """
+    Test that WorkerPoolSubmitter calls functions in a reused worker.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    submitter = WorkerPoolSubmitter(run_path=tmp_path, max_workers=1)
+    notified: List[AbstractSubmitter] = list()
+    submitter.add_completion_callback(notified.append)
+    submitter.submit_function(print_working_directory)
+    submitter.wait_until_completed()
+
+    assert submitter.job_id is not None
+    assert submitter.job_id.startswith("pool_")
+    assert submitter.return_code == 0
+    assert submitter.std_out == str(tmp_path)
+    assert len(notified) == 1
+
+    # The second submission reuses the pool
+    executor = WorkerPoolSubmitter.get_executor()
+    submitter.submit_function(return_sum_of_two, (1, 2))
+    submitter.wait_until_completed()
+    assert WorkerPoolSubmitter.get_executor() is executor
+    assert not submitter.errored()
+
+    with pytest.raises(CalledProcessError):
+        submitter.submit_function(return_sum_of_two, (1,))
+        submitter.wait_until_completed()
+    assert submitter.std_err is not None
+    assert "TypeError" in submitter.std_err
+
+    WorkerPoolSubmitter.shutdown()
+
+
+@pytest.mark.timeout(60)
+def test_submit_command() -> None:
+    """Test that WorkerPoolSubmitter can run a command and raise an error."""
+    submitter = WorkerPoolSubmitter(max_workers=1, preload_modules=tuple())
+    submitter.submit_command("ls")
+    submitter.wait_until_completed()
+    assert submitter.return_code == 0
+    assert isinstance(submitter.std_out, str)
+
+    with pytest.raises(CalledProcessError):
+        submitter.submit_command("ls ThisPathDoesNotExist")
+        submitter.wait_until_completed()
+
+    WorkerPoolSubmitter.shutdown()
@@ -13,6 +13,7 @@ from bout_runners.configure_bout_runners import (
     set_log_file_directory,
     set_log_level,
     set_submitter_config_path,
+    set_use_wal,
 )
 from bout_runners.utils.logs import get_log_config
 from bout_runners.utils.paths import (
@@ -20,6 +21,7 @@ from bout_runners.utils.paths import (
     get_bout_runners_configuration,
     get_default_submitters_config_path,
     get_log_file_directory,
+    get_use_wal,
 )
 
 
@@ -200,3 +202,32 @@ def test_set_submitter_config_path(
 
     with pytest.raises(ValueError):
         set_submitter_config_path(new_path)
+
+
+def test_set_use_wal(get_mock_config_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """
+    Test that the use of the write-ahead log is changeable.
+
+    Parameters
+    ----------
+    get_mock_config_path : Path
+        The mocked config directory
+    monkeypatch : MonkeyPatch
+        MonkeyPatch from pytest
+    """
+    _ = get_mock_config_path
+    assert not get_use_wal()
+
+    # Test with parameter input
+    set_use_wal(True)
+    assert get_use_wal()
+
+    # Test with empty input
+    monkeypatch.setattr("builtins.input", lambda _: "")
+    set_use_wal()
+    assert get_use_wal()
+
+    # Test with non-empty input
+    monkeypatch.setattr("builtins.input", lambda _: "n")
+    set_use_wal()
+    assert not get_use_wal()
@@ -0,0 +1,38 @@
+"""Contains unittests for the inotify wrapper."""
+
+
+from pathlib import Path
+
+import pytest
+
+from bout_runners.utils.inotify import Inotify
+
+
+@pytest.mark.skipif(not Inotify.available(), reason="inotify is not available")
+def test_inotify(tmp_path: Path) -> None:
+    """
+    Test that file creation and appends are reported.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary path (pytest fixture)
+    """
+    inotify = Inotify()
+    inotify.add_watch(tmp_path)
+    assert inotify.watched_paths == (tmp_path,)
+    assert len(inotify.read_events(timeout=0)) == 0
+
+    log_path = tmp_path.joinpath("BOUT.log.0")
+    log_path.write_text("Run started")
+    events = inotify.read_events(timeout=1)
+    assert (tmp_path, "BOUT.log.0", Inotify.masks["IN_CREATE"]) in events
+
+    with log_path.open("a") as log_file:
+        log_file.write("Run finished")
+    events = inotify.read_events(timeout=1)
+    assert (tmp_path, "BOUT.log.0", Inotify.masks["IN_MODIFY"]) in events
+
+    inotify.remove_watch(tmp_path)
+    assert len(inotify.watched_paths) == 0
+    inotify.close()
@@ -0,0 +1,17 @@
+"""Contains unittests for the logs utils."""
+
+
+import inspect
+
+from bout_runners.utils.logs import get_stack_depth
+
+
+def test_get_stack_depth() -> None:
+    """Test that the stack depth is the length of the stack."""
+
+    def nested() -> None:
+        """Compare the depths in a deeper frame."""
+        assert get_stack_depth() == len(inspect.stack())
+
+    assert get_stack_depth() == len(inspect.stack())
+    nested()
@@ -0,0 +1,18 @@
+"""Contains unittests for the process_pools module."""
+
+
+import os
+
+from bout_runners.utils.process_pools import get_start_method, new_process_pool
+
+
+def test_get_start_method() -> None:
+    """Test that the processes of the pools are not forked."""
+    assert get_start_method() in ("forkserver", "spawn")
+
+
+def test_new_process_pool() -> None:
+    """Test that the pool runs the tasks in other processes."""
+    with new_process_pool(max_workers=2) as executor:
+        pid = executor.submit(os.getpid).result()
+    assert pid != os.getpid()
@@ -3,8 +3,9 @@
 
 import logging
 import shutil
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 
 def return_none(*args: Optional[Tuple], **kwargs: Optional[dict]) -> None:
@@ -82,3 +83,41 @@ def return_sum_of_three(number_1: int, number_2: int, number_3: int = 0) -> int:
         The sum
     """
     return number_1 + number_2 + number_3
+
+
+def write_file_after_sleep(path: Union[Path, str], seconds: float = 0) -> None:
+    """
+    Sleep, then write a file.
+
+    Parameters
+    ----------
+    path : Path or str
+        Path to the file to write
+    seconds : float
+        Number of seconds to sleep before writing the file
+    """
+    time.sleep(seconds)
+    with Path(path).open("w") as file:
+        file.write("Complete")
+
+
+def copy_file(source: Union[Path, str], destination: Union[Path, str]) -> None:
+    """
+    Copy the content of a file into another file.
+
+    Parameters
+    ----------
+    source : Path or str
+        Path to the file to read
+    destination : Path or str
+        Path to the file to write
+    """
+    with Path(source).open("r") as file:
+        content = file.read()
+    with Path(destination).open("w") as file:
+        file.write(content)
+
+
+def print_working_directory() -> None:
+    """Print the current working directory."""
+    print(Path.cwd())
@@ -357,6 +357,7 @@ def bout_runner_from_path_tester(
     _ = project_path
     file_state_restorer.add(project_path.joinpath("conduction.db"))
     file_state_restorer.add(project_path.joinpath("settings_run"))
+    file_state_restorer.add(project_path.joinpath("settings_cache"))
     with change_directory(project_path):
         runner = BoutRunner()
         bout_run_setup = runner.run_graph["bout_run_0"]["bout_run_setup"]
@@ -219,6 +219,10 @@ def make_run_group(
         executor.bout_paths.project_path.joinpath("settings_run"),
         force_mark_removal=True,
     )
+    file_state_restorer.add(
+        executor.bout_paths.project_path.joinpath("settings_cache"),
+        force_mark_removal=True,
+    )
     return run_group
 
 